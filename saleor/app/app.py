@@ -1,13 +1,17 @@
 from django.apps import AppConfig as DjangoAppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 
 
 class AppConfig(DjangoAppConfig):
     name = "saleor.app"
 
     def ready(self):
-        from .models import App, AppInstallation
+        from .models import App, AppInstallation, AppToken
         from .signals import delete_brand_images
+        from .token_cache import (
+            invalidate_app_token_cache,
+            invalidate_app_token_cache_on_app_save,
+        )
 
         # preventing duplicate signals
         post_delete.connect(
@@ -20,3 +24,13 @@ class AppConfig(DjangoAppConfig):
             sender=AppInstallation,
             dispatch_uid="delete_app_installation_brand_images",
         )
+        post_delete.connect(
+            invalidate_app_token_cache,
+            sender=AppToken,
+            dispatch_uid="invalidate_app_token_cache_on_app_token_delete",
+        )
+        post_save.connect(
+            invalidate_app_token_cache_on_app_save,
+            sender=App,
+            dispatch_uid="invalidate_app_token_cache_on_app_save",
+        )
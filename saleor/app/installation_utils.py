@@ -25,6 +25,7 @@ from ..thumbnail import ICON_MIME_TYPES
 from ..thumbnail.utils import get_filename_from_url
 from ..thumbnail.validators import validate_icon_image
 from ..webhook.models import Webhook, WebhookEvent
+from ..webhook.routing import invalidate_webhook_routing_table
 from .error_codes import AppErrorCode
 from .manifest_validations import clean_manifest_data
 from .models import App, AppExtension, AppInstallation
@@ -255,6 +256,7 @@ def install_app(app_installation: AppInstallation, activate: bool = False):
                 WebhookEvent(webhook=db_webhook, event_type=event_type)
             )
     WebhookEvent.objects.bulk_create(webhook_events)
+    invalidate_webhook_routing_table()
 
     _, token = app.tokens.create(name="Default token")  # type: ignore[call-arg] # calling create on a related manager # noqa: E501
 
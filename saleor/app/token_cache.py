@@ -0,0 +1,59 @@
+from typing import Dict, Iterable
+
+from django.core.cache import cache
+from django.utils.crypto import salted_hmac
+from pytimeparse import parse
+
+from ..core.utils.cache_version import CacheVersion
+
+APP_TOKENS_VERSION_KEY = "app_tokens_version"
+APP_TOKEN_CACHE_KEY = "app_token"
+APP_TOKEN_CACHE_TIMEOUT = parse("5 minutes")
+
+app_tokens_version = CacheVersion(APP_TOKENS_VERSION_KEY)
+
+
+def get_app_token_digest(raw_token: str) -> str:
+    """Return a keyed digest of the raw token, safe to be used as a cache key.
+
+    The digest is cheap to compute compared to the password hasher used to store
+    the tokens, and can't be reversed without the secret key.
+    """
+    return salted_hmac(APP_TOKEN_CACHE_KEY, raw_token, algorithm="sha256").hexdigest()
+
+
+def _get_cache_keys(raw_tokens: Iterable[str]) -> Dict[str, str]:
+    version = app_tokens_version.get()
+    return {
+        f"{APP_TOKEN_CACHE_KEY}:{version}:{get_app_token_digest(raw_token)}": raw_token
+        for raw_token in raw_tokens
+    }
+
+
+def get_cached_app_ids(raw_tokens: Iterable[str]) -> Dict[str, int]:
+    """Return the IDs of apps owning already verified tokens."""
+    cache_keys = _get_cache_keys(raw_tokens)
+    cached = cache.get_many(cache_keys.keys())
+    return {cache_keys[key]: app_id for key, app_id in cached.items()}
+
+
+def cache_app_ids(app_ids_by_raw_token: Dict[str, int]):
+    cache_keys = _get_cache_keys(app_ids_by_raw_token.keys())
+    cache.set_many(
+        {key: app_ids_by_raw_token[raw_token] for key, raw_token in cache_keys.items()},
+        timeout=APP_TOKEN_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_app_token_cache(**_kwargs):
+    """Discard all verified tokens.
+
+    The cache is keyed by digests of raw tokens, which are not known when a token
+    is deleted, so all tokens need to be verified again.
+    """
+    app_tokens_version.invalidate()
+
+
+def invalidate_app_token_cache_on_app_save(sender, instance, **kwargs):
+    if not instance.is_active:
+        invalidate_app_token_cache()
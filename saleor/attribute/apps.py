@@ -0,0 +1,31 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class AttributeAppConfig(AppConfig):
+    name = "saleor.attribute"
+
+    def ready(self):
+        from .models import AssignedProductAttributeValue, AssignedVariantAttributeValue
+        from .product_index import (
+            update_product_index_on_assigned_values_changed,
+            update_product_index_on_value_assignment_deleted,
+            update_product_index_on_value_assignment_saved,
+        )
+
+        for model in [AssignedProductAttributeValue, AssignedVariantAttributeValue]:
+            m2m_changed.connect(
+                update_product_index_on_assigned_values_changed,
+                sender=model,
+                dispatch_uid=f"update_product_index_{model.__name__}_m2m",
+            )
+            post_save.connect(
+                update_product_index_on_value_assignment_saved,
+                sender=model,
+                dispatch_uid=f"update_product_index_{model.__name__}_saved",
+            )
+            post_delete.connect(
+                update_product_index_on_value_assignment_deleted,
+                sender=model,
+                dispatch_uid=f"update_product_index_{model.__name__}_deleted",
+            )
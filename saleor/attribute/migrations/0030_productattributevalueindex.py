@@ -0,0 +1,85 @@
+# Generated by Django 3.2.20 on 2023-07-26 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0187_productvariantchannellisting_discounted_price_dirty"),
+        ("attribute", "0029_alter_attribute_unit"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductAttributeValueIndex",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "attribute",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_value_index",
+                        to="attribute.attribute",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attribute_value_index",
+                        to="product.product",
+                    ),
+                ),
+                (
+                    "value",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="product_index",
+                        to="attribute.attributevalue",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="productattributevalueindex",
+            index=models.Index(
+                fields=["value", "product"], name="attribute_p_value_i_471204_idx"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="productattributevalueindex",
+            unique_together={("product", "value")},
+        ),
+        migrations.RunSQL(
+            """
+            INSERT INTO attribute_productattributevalueindex (
+                product_id, attribute_id, value_id
+            )
+            SELECT assignment.product_id, value.attribute_id, value.id
+            FROM attribute_assignedproductattributevalue value_assignment
+            INNER JOIN attribute_assignedproductattribute assignment
+                ON assignment.id = value_assignment.assignment_id
+            INNER JOIN attribute_attributevalue value
+                ON value.id = value_assignment.value_id
+            UNION
+            SELECT variant.product_id, value.attribute_id, value.id
+            FROM attribute_assignedvariantattributevalue value_assignment
+            INNER JOIN attribute_assignedvariantattribute assignment
+                ON assignment.id = value_assignment.assignment_id
+            INNER JOIN product_productvariant variant
+                ON variant.id = assignment.variant_id
+            INNER JOIN attribute_attributevalue value
+                ON value.id = value_assignment.value_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -9,6 +9,7 @@ from .product import (
     AssignedProductAttribute,
     AssignedProductAttributeValue,
     AttributeProduct,
+    ProductAttributeValueIndex,
 )
 from .product_variant import (
     AssignedVariantAttribute,
@@ -27,6 +28,7 @@ __all__ = [
     "AssignedProductAttribute",
     "AssignedProductAttributeValue",
     "AttributeProduct",
+    "ProductAttributeValueIndex",
     "AssignedVariantAttribute",
     "AssignedVariantAttributeValue",
     "AttributeVariant",
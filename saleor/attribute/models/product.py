@@ -68,3 +68,28 @@ class AttributeProduct(SortableModel):
 
     def get_ordering_queryset(self):
         return self.product_type.attributeproduct.all()
+
+
+class ProductAttributeValueIndex(models.Model):
+    """Denormalized membership of attribute values assigned to a product.
+
+    Contains values assigned both to the product and to any of its variants, so
+    products can be filtered by attribute values without joining the assignments.
+    Kept up to date by signals on the value assignments.
+    """
+
+    product = models.ForeignKey(
+        Product, related_name="attribute_value_index", on_delete=models.CASCADE
+    )
+    attribute = models.ForeignKey(
+        "Attribute", related_name="product_value_index", on_delete=models.CASCADE
+    )
+    value = models.ForeignKey(
+        "AttributeValue", related_name="product_index", on_delete=models.CASCADE
+    )
+
+    class Meta:
+        unique_together = (("product", "value"),)
+        indexes = [
+            models.Index(fields=["value", "product"]),
+        ]
@@ -0,0 +1,149 @@
+"""Keep the denormalized index of attribute values assigned to products up to date.
+
+Every change of the value assignments of products and variants is reflected in
+`ProductAttributeValueIndex`, so filtering products by attribute values doesn't have
+to walk through the assignments of both products and their variants.
+"""
+from typing import Dict, Iterable, Optional, Tuple, Type, Union
+
+from django.db.models import Exists, OuterRef
+
+from .models import (
+    AssignedProductAttribute,
+    AssignedProductAttributeValue,
+    AssignedVariantAttribute,
+    AssignedVariantAttributeValue,
+    AttributeValue,
+    ProductAttributeValueIndex,
+)
+
+AssignmentModel = Union[Type[AssignedProductAttribute], Type[AssignedVariantAttribute]]
+
+
+def add_values_to_product_index(product_values: Iterable[Tuple[int, int]]):
+    """Add pairs of product and attribute value IDs to the index."""
+    product_values = set(product_values)
+    if not product_values:
+        return
+    value_attributes = dict(
+        AttributeValue.objects.filter(
+            pk__in={value_id for _, value_id in product_values}
+        ).values_list("pk", "attribute_id")
+    )
+    ProductAttributeValueIndex.objects.bulk_create(
+        [
+            ProductAttributeValueIndex(
+                product_id=product_id,
+                value_id=value_id,
+                attribute_id=value_attributes[value_id],
+            )
+            for product_id, value_id in product_values
+            if value_id in value_attributes
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def remove_unassigned_values_from_product_index(
+    product_ids: Optional[Iterable[int]] = None,
+    value_ids: Optional[Iterable[int]] = None,
+):
+    """Remove values that are no longer assigned to products or their variants.
+
+    Only the index entries of given products and values are checked.
+    """
+    product_assignments = AssignedProductAttributeValue.objects.filter(
+        value_id=OuterRef("value_id"), assignment__product_id=OuterRef("product_id")
+    )
+    variant_assignments = AssignedVariantAttributeValue.objects.filter(
+        value_id=OuterRef("value_id"),
+        assignment__variant__product_id=OuterRef("product_id"),
+    )
+    entries = ProductAttributeValueIndex.objects.all()
+    if product_ids is not None:
+        entries = entries.filter(product_id__in=product_ids)
+    if value_ids is not None:
+        entries = entries.filter(value_id__in=value_ids)
+    entries.filter(~Exists(product_assignments), ~Exists(variant_assignments)).delete()
+
+
+def _get_assignments_product_ids(
+    assignment_model: AssignmentModel, assignment_ids: Iterable[int]
+) -> Dict[int, int]:
+    product_lookup = (
+        "product_id"
+        if assignment_model is AssignedProductAttribute
+        else "variant__product_id"
+    )
+    return dict(
+        assignment_model.objects.filter(pk__in=assignment_ids).values_list(
+            "pk", product_lookup
+        )
+    )
+
+
+def _get_assignment_model(value_assignment_model) -> AssignmentModel:
+    return value_assignment_model._meta.get_field("assignment").related_model
+
+
+def update_product_index_on_assigned_values_changed(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Update the index when values of an assignment are added or removed."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    assignment_model = _get_assignment_model(sender)
+
+    if not reverse:
+        product_ids = list(
+            _get_assignments_product_ids(assignment_model, [instance.pk]).values()
+        )
+        if action == "post_add":
+            add_values_to_product_index(
+                (product_id, value_id)
+                for product_id in product_ids
+                for value_id in pk_set
+            )
+        else:
+            remove_unassigned_values_from_product_index(
+                product_ids, pk_set if action == "post_remove" else None
+            )
+        return
+
+    # The instance is an attribute value assigned to or removed from assignments.
+    if action == "post_clear":
+        remove_unassigned_values_from_product_index(value_ids=[instance.pk])
+        return
+    product_ids = list(_get_assignments_product_ids(assignment_model, pk_set).values())
+    if action == "post_add":
+        add_values_to_product_index(
+            (product_id, instance.pk) for product_id in product_ids
+        )
+    else:
+        remove_unassigned_values_from_product_index(product_ids, [instance.pk])
+
+
+def update_product_index_on_value_assignment_saved(sender, instance, created, **kwargs):
+    product_ids = list(
+        _get_assignments_product_ids(
+            _get_assignment_model(sender), [instance.assignment_id]
+        ).values()
+    )
+    if not created:
+        # The assigned value could have been changed.
+        remove_unassigned_values_from_product_index(product_ids)
+    add_values_to_product_index(
+        (product_id, instance.value_id) for product_id in product_ids
+    )
+
+
+def update_product_index_on_value_assignment_deleted(sender, instance, **kwargs):
+    product_ids = list(
+        _get_assignments_product_ids(
+            _get_assignment_model(sender), [instance.assignment_id]
+        ).values()
+    )
+    # Check the value for all products if the assignment doesn't exist anymore.
+    remove_unassigned_values_from_product_index(
+        product_ids or None, [instance.value_id]
+    )
@@ -0,0 +1,91 @@
+from ..models import (
+    AssignedVariantAttribute,
+    AttributeValue,
+    ProductAttributeValueIndex,
+)
+from ..utils import associate_attribute_values_to_instance
+
+
+def _get_indexed_values(product):
+    return set(
+        ProductAttributeValueIndex.objects.filter(product=product).values_list(
+            "attribute_id", "value_id"
+        )
+    )
+
+
+def test_product_index_contains_product_and_variant_values(product):
+    # given
+    product_value = product.attributes.get().values.get()
+    variant_value = product.variants.get().attributes.get().values.get()
+
+    # when
+    indexed_values = _get_indexed_values(product)
+
+    # then
+    assert indexed_values == {
+        (product_value.attribute_id, product_value.pk),
+        (variant_value.attribute_id, variant_value.pk),
+    }
+
+
+def test_product_index_updated_on_product_values_change(product):
+    # given
+    assignment = product.attributes.get()
+    old_value = assignment.values.get()
+    new_value = AttributeValue.objects.create(
+        attribute=assignment.attribute, name="New value", slug="new-value"
+    )
+
+    # when
+    associate_attribute_values_to_instance(product, assignment.attribute, new_value)
+
+    # then
+    indexed_value_ids = {value_id for _, value_id in _get_indexed_values(product)}
+    assert new_value.pk in indexed_value_ids
+    assert old_value.pk not in indexed_value_ids
+
+
+def test_product_index_keeps_value_assigned_to_another_variant(
+    product, product_variant_list
+):
+    # given
+    assignment = AssignedVariantAttribute.objects.get(variant__product=product)
+    value = assignment.values.get()
+    other_variant = product_variant_list[0]
+    associate_attribute_values_to_instance(other_variant, assignment.attribute, value)
+
+    # when
+    assignment.values.clear()
+
+    # then
+    assert (value.attribute_id, value.pk) in _get_indexed_values(product)
+
+    # when
+    other_variant.delete()
+
+    # then
+    assert (value.attribute_id, value.pk) not in _get_indexed_values(product)
+
+
+def test_product_index_updated_on_value_assignment_removed_from_value(product):
+    # given
+    assignment = product.attributes.get()
+    value = assignment.values.get()
+
+    # when
+    value.productassignments.remove(assignment)
+
+    # then
+    assert (value.attribute_id, value.pk) not in _get_indexed_values(product)
+
+
+def test_product_index_updated_on_attribute_value_deleted(product):
+    # given
+    value = product.attributes.get().values.get()
+
+    # when
+    AttributeValue.objects.filter(pk=value.pk).delete()
+
+    # then
+    assert not ProductAttributeValueIndex.objects.filter(value_id=value.pk).exists()
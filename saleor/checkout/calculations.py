@@ -17,7 +17,7 @@ from ..tax.utils import (
     get_tax_calculation_strategy_for_checkout,
     normalize_tax_rate_for_db,
 )
-from .models import Checkout
+from .models import Checkout, CheckoutLine
 from .payment_utils import update_checkout_payment_statuses
 
 if TYPE_CHECKING:
@@ -281,34 +281,25 @@ def _fetch_checkout_prices_if_expired(
             # Calculate net prices without taxes.
             _get_checkout_base_prices(checkout, checkout_info, lines)
 
-    checkout.price_expiration = timezone.now() + settings.CHECKOUT_PRICES_TTL
-    checkout.save(
-        update_fields=[
-            "voucher_code",
-            "total_net_amount",
-            "total_gross_amount",
-            "subtotal_net_amount",
-            "subtotal_gross_amount",
-            "shipping_price_net_amount",
-            "shipping_price_gross_amount",
-            "shipping_tax_rate",
-            "price_expiration",
-            "translated_discount_name",
-            "discount_amount",
-            "discount_name",
-            "currency",
-            "last_change",
-        ],
-        using=settings.DATABASE_CONNECTION_DEFAULT_NAME,
-    )
-    checkout.lines.bulk_update(
-        [line_info.line for line_info in lines],
-        [
-            "total_price_net_amount",
-            "total_price_gross_amount",
-            "tax_rate",
-        ],
-    )
+    # Save only prices that were changed, so the repeated recalculations, e.g. within
+    # a single request, don't write anything. The expiration is extended only along
+    # with changed prices or when it has already passed.
+    update_fields = checkout.get_changed_price_fields()
+    if update_fields or checkout.price_expiration <= timezone.now():
+        checkout.price_expiration = timezone.now() + settings.CHECKOUT_PRICES_TTL
+        checkout.save(
+            update_fields=update_fields + ["price_expiration", "last_change"],
+            using=settings.DATABASE_CONNECTION_DEFAULT_NAME,
+        )
+    lines_to_update = [
+        line_info.line
+        for line_info in lines
+        if line_info.line.get_changed_price_fields()
+    ]
+    if lines_to_update:
+        checkout.lines.bulk_update(lines_to_update, CheckoutLine.PRICE_FIELDS)
+        for line in lines_to_update:
+            line.mark_prices_as_saved()
     return checkout_info, lines
 
 
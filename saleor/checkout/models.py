@@ -2,7 +2,7 @@
 from datetime import date
 from decimal import Decimal
 from operator import attrgetter
-from typing import TYPE_CHECKING, Iterable, Optional, Union
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from django.conf import settings
@@ -36,9 +36,61 @@ def get_default_country():
     return settings.DEFAULT_COUNTRY
 
 
-class Checkout(models.Model):
+class ModelWithTrackedPrices(models.Model):
+    """Keep track of price fields' values stored in the database.
+
+    Price recalculation uses it to save only the prices that have actually changed.
+    """
+
+    PRICE_FIELDS: Tuple[str, ...] = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.mark_prices_as_saved()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.mark_prices_as_saved(kwargs.get("update_fields"))
+
+    def mark_prices_as_saved(self, fields: Optional[Iterable[str]] = None):
+        saved_prices = self.__dict__.setdefault("_saved_prices", {})
+        for field in self.PRICE_FIELDS:
+            if (fields is None or field in fields) and field in self.__dict__:
+                saved_prices[field] = self.__dict__[field]
+
+    def get_changed_price_fields(self) -> List[str]:
+        """Return price fields with values different from the saved ones."""
+        saved_prices = self.__dict__.get("_saved_prices", {})
+        return [
+            field
+            for field in self.PRICE_FIELDS
+            if field not in saved_prices or getattr(self, field) != saved_prices[field]
+        ]
+
+
+class Checkout(ModelWithTrackedPrices):
     """A shopping checkout."""
 
+    PRICE_FIELDS = (
+        "voucher_code",
+        "total_net_amount",
+        "total_gross_amount",
+        "subtotal_net_amount",
+        "subtotal_gross_amount",
+        "shipping_price_net_amount",
+        "shipping_price_gross_amount",
+        "shipping_tax_rate",
+        "translated_discount_name",
+        "discount_amount",
+        "discount_name",
+        "currency",
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     last_change = models.DateTimeField(auto_now=True, db_index=True)
     user = models.ForeignKey(
@@ -251,13 +303,15 @@ class Checkout(models.Model):
         return country_code
 
 
-class CheckoutLine(ModelWithMetadata):
+class CheckoutLine(ModelWithTrackedPrices, ModelWithMetadata):
     """A single checkout line.
 
     Multiple lines in the same checkout can refer to the same product variant if
     their `data` field is different.
     """
 
+    PRICE_FIELDS = ("total_price_net_amount", "total_price_gross_amount", "tax_rate")
+
     id = models.UUIDField(primary_key=True, editable=False, unique=True, default=uuid4)
     old_id = models.PositiveIntegerField(unique=True, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -3,6 +3,8 @@ from typing import Literal, Union
 from unittest.mock import Mock, patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from freezegun import freeze_time
 from prices import Money, TaxedMoney
@@ -482,3 +484,70 @@ def test_fetch_checkout_prices_when_tax_exemption_and_not_include_taxes_in_price
 
     assert checkout.total == shipping_price + all_lines_total_price
     assert checkout.subtotal == all_lines_total_price
+
+
+def _get_update_queries(queries, table):
+    return [
+        query["sql"]
+        for query in queries
+        if query["sql"].startswith(f'UPDATE "{table}"')
+    ]
+
+
+def test_fetch_checkout_data_saves_prices_only_once(fetch_kwargs):
+    # given
+    checkout = fetch_kwargs["checkout_info"].checkout
+    fetch_checkout_data(**fetch_kwargs, force_update=True)
+    price_expiration = checkout.price_expiration
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        fetch_checkout_data(**fetch_kwargs, force_update=True)
+
+    # then
+    assert not _get_update_queries(ctx.captured_queries, "checkout_checkout")
+    assert not _get_update_queries(ctx.captured_queries, "checkout_checkoutline")
+    checkout.refresh_from_db()
+    assert checkout.price_expiration == price_expiration
+
+
+def test_fetch_checkout_data_extends_expired_prices_without_changes(fetch_kwargs):
+    # given
+    checkout = fetch_kwargs["checkout_info"].checkout
+    fetch_checkout_data(**fetch_kwargs, force_update=True)
+    checkout.price_expiration = timezone.now()
+    checkout.save(update_fields=["price_expiration"])
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        fetch_checkout_data(**fetch_kwargs)
+
+    # then
+    (checkout_update,) = _get_update_queries(ctx.captured_queries, "checkout_checkout")
+    assert '"price_expiration"' in checkout_update
+    assert '"total_net_amount"' not in checkout_update
+    assert not _get_update_queries(ctx.captured_queries, "checkout_checkoutline")
+    checkout.refresh_from_db()
+    assert checkout.price_expiration > timezone.now()
+
+
+def test_fetch_checkout_data_saves_only_changed_lines(fetch_kwargs):
+    # given
+    lines_info = fetch_kwargs["lines"]
+    fetch_checkout_data(**fetch_kwargs, force_update=True)
+    line_info = lines_info[0]
+    line_info.line.quantity += 1
+    line_info.line.save(update_fields=["quantity"])
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        fetch_checkout_data(**fetch_kwargs, force_update=True)
+
+    # then
+    (line_update,) = _get_update_queries(ctx.captured_queries, "checkout_checkoutline")
+    assert str(line_info.line.pk) in line_update
+    assert all(str(info.line.pk) not in line_update for info in lines_info[1:])
+    line_info.line.refresh_from_db()
+    assert line_info.line.total_price_net_amount == (
+        line_info.line.quantity * line_info.channel_listing.price_amount
+    )
@@ -34,7 +34,10 @@ from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
 from ..shipping.utils import convert_to_shipping_method_data
 from ..warehouse.availability import check_stock_and_preorder_quantity
 from ..warehouse.models import Warehouse
-from ..warehouse.reservations import reserve_stocks_and_preorders
+from ..warehouse.reservations import (
+    release_stocks_reserved_by_lines,
+    reserve_stocks_and_preorders,
+)
 from . import AddressType, base_calculations, calculations
 from .error_codes import CheckoutErrorCode
 from .fetch import (
@@ -219,6 +222,7 @@ def add_variants_to_checkout(
             _append_line_to_create(to_create, checkout, variant, line_data, line)
 
     if to_delete:
+        release_stocks_reserved_by_lines(to_delete)
         CheckoutLine.objects.filter(pk__in=[line.pk for line in to_delete]).delete()
     if to_update:
         CheckoutLine.objects.bulk_update(
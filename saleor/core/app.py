@@ -12,7 +12,11 @@ class CoreAppConfig(AppConfig):
     name = "saleor.core"
 
     def ready(self):
+        from .cache_tags import connect_cache_tags_signals
+
         Field.register_lookup(PostgresILike)
+        if settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT:
+            connect_cache_tags_signals()
 
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
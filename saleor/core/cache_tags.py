@@ -0,0 +1,141 @@
+from typing import Dict, Iterable, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .utils.cache_version import CacheVersion
+
+CACHE_TAG_VERSION_KEY = "cache_tag_version"
+
+
+class CacheTag:
+    """Groups of cached data invalidated together."""
+
+    PRODUCT = "product"
+    CATEGORY = "category"
+    COLLECTION = "collection"
+    MENU = "menu"
+
+    ALL = [PRODUCT, CATEGORY, COLLECTION, MENU]
+
+
+# Stocks, allocations and reservations aren't listed, as they change on every
+# checkout and order, which would discard cached products all the time. Cached stock
+# quantities are stale for up to `GRAPHQL_RESPONSE_CACHE_TIMEOUT` seconds instead.
+_PRODUCT_MODELS = [
+    "product.Product",
+    "product.ProductTranslation",
+    "product.ProductChannelListing",
+    "product.ProductType",
+    "product.ProductVariant",
+    "product.ProductVariantTranslation",
+    "product.ProductVariantChannelListing",
+    "product.ProductMedia",
+    "product.VariantMedia",
+    "warehouse.Warehouse",
+    "discount.Sale",
+    "discount.SaleChannelListing",
+    "discount.Sale_categories",
+    "discount.Sale_collections",
+    "discount.Sale_products",
+    "discount.Sale_variants",
+]
+_CATEGORY_MODELS = ["product.Category", "product.CategoryTranslation"]
+_COLLECTION_MODELS = [
+    "product.Collection",
+    "product.CollectionTranslation",
+    "product.CollectionChannelListing",
+    "product.CollectionProduct",
+]
+_MENU_MODELS = ["menu.Menu", "menu.MenuItem", "menu.MenuItemTranslation"]
+_ALL_TAGS_MODELS = [
+    "attribute.Attribute",
+    "attribute.AttributeTranslation",
+    "attribute.AttributeValue",
+    "attribute.AttributeValueTranslation",
+    "attribute.AttributeProduct",
+    "attribute.AttributeVariant",
+    "attribute.AssignedProductAttribute",
+    "attribute.AssignedProductAttributeValue",
+    "attribute.AssignedVariantAttribute",
+    "attribute.AssignedVariantAttributeValue",
+    "channel.Channel",
+]
+
+# Tags invalidated when instances of the models are saved or deleted, given as
+# "app_label.ModelName". Categories and collections include their products, so
+# changing them invalidates products as well.
+MODEL_CACHE_TAGS: Dict[str, Tuple[str, ...]] = {
+    **{model: (CacheTag.PRODUCT,) for model in _PRODUCT_MODELS},
+    **{model: (CacheTag.CATEGORY, CacheTag.PRODUCT) for model in _CATEGORY_MODELS},
+    **{model: (CacheTag.COLLECTION, CacheTag.PRODUCT) for model in _COLLECTION_MODELS},
+    **{model: (CacheTag.MENU,) for model in _MENU_MODELS},
+    **{model: tuple(CacheTag.ALL) for model in _ALL_TAGS_MODELS},
+}
+
+_cache_tag_versions = {
+    tag: CacheVersion(f"{CACHE_TAG_VERSION_KEY}:{tag}") for tag in CacheTag.ALL
+}
+
+
+def get_cache_tags_versions(tags: Iterable[str]) -> Dict[str, str]:
+    return {tag: _cache_tag_versions[tag].get() for tag in sorted(set(tags))}
+
+
+def bump_cache_tags(tags: Iterable[str]):
+    for tag in set(tags):
+        _cache_tag_versions[tag].bump()
+
+
+def invalidate_cache_tags(tags: Iterable[str]):
+    """Discard cached data of the tags.
+
+    Writes that don't emit model signals, like bulk updates of discounted prices,
+    have to call it explicitly.
+    """
+    if not settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT:
+        return
+    for tag in set(tags):
+        _cache_tag_versions[tag].invalidate()
+
+
+def invalidate_model_cache_tags(sender, **kwargs):
+    if kwargs.get("action", "post_").startswith("pre_"):
+        # many-to-many relations are changed after `pre_` actions
+        return
+    invalidate_cache_tags(MODEL_CACHE_TAGS[sender._meta.label])
+
+
+_CACHE_TAGS_SIGNALS = {
+    "post_save": post_save,
+    "post_delete": post_delete,
+    # sent for changes of many-to-many relations of the listed through models
+    "m2m_changed": m2m_changed,
+}
+
+
+def connect_cache_tags_signals():
+    """Invalidate tags when instances of the listed models change.
+
+    Receivers disable fast deletes of the models, so they should be connected only
+    when the response cache is enabled.
+    """
+    for label in MODEL_CACHE_TAGS:
+        model = apps.get_model(label)
+        for signal_name, signal in _CACHE_TAGS_SIGNALS.items():
+            signal.connect(
+                invalidate_model_cache_tags,
+                sender=model,
+                dispatch_uid=f"invalidate_cache_tags_{signal_name}_{label}",
+            )
+
+
+def disconnect_cache_tags_signals():
+    for label in MODEL_CACHE_TAGS:
+        model = apps.get_model(label)
+        for signal_name, signal in _CACHE_TAGS_SIGNALS.items():
+            signal.disconnect(
+                sender=model,
+                dispatch_uid=f"invalidate_cache_tags_{signal_name}_{label}",
+            )
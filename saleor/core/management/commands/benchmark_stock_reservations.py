@@ -0,0 +1,95 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from ....channel.models import Channel
+from ....checkout.models import Checkout, CheckoutLine
+from ....core.exceptions import InsufficientStock
+from ....product.models import ProductVariant
+from ....warehouse.reservations import reserve_stocks
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure how many checkouts per second can reserve the same variant "
+        "concurrently. Created checkouts are deleted afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("sku", type=str, help="SKU of the reserved variant.")
+        parser.add_argument("channel", type=str, help="Slug of the channel.")
+        parser.add_argument("--checkouts", type=int, default=200)
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--quantity", type=int, default=1)
+        parser.add_argument(
+            "--slots",
+            type=int,
+            default=settings.STOCK_RESERVATION_SLOTS,
+            help="Number of reservation slots; 0 locks the whole stock.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            variant = ProductVariant.objects.get(sku=options["sku"])
+            channel = Channel.objects.get(slug=options["channel"])
+        except (ProductVariant.DoesNotExist, Channel.DoesNotExist) as e:
+            raise CommandError(str(e))
+        settings.STOCK_RESERVATION_SLOTS = options["slots"]
+        country_code = channel.default_country.code
+
+        checkouts = Checkout.objects.bulk_create(
+            [
+                Checkout(channel=channel, currency=channel.currency_code)
+                for _ in range(options["checkouts"])
+            ]
+        )
+        lines = CheckoutLine.objects.bulk_create(
+            [
+                CheckoutLine(
+                    checkout=checkout,
+                    variant=variant,
+                    quantity=options["quantity"],
+                    currency=channel.currency_code,
+                )
+                for checkout in checkouts
+            ]
+        )
+
+        def reserve(line):
+            try:
+                with transaction.atomic():
+                    reserve_stocks(
+                        [line],
+                        [variant],
+                        country_code,
+                        channel,
+                        timezone.now() + timedelta(minutes=5),
+                    )
+                return True
+            except InsufficientStock:
+                return False
+            finally:
+                connection.close()
+
+        try:
+            start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+                results = list(executor.map(reserve, lines))
+            duration = time.monotonic() - start
+        finally:
+            Checkout.objects.filter(
+                pk__in=[checkout.pk for checkout in checkouts]
+            ).delete()
+
+        reserved = sum(results)
+        self.stdout.write(
+            f"Reserved {reserved} of {len(lines)} checkouts "
+            f"({len(lines) - reserved} out of stock) in {duration:.2f}s "
+            f"using {options['slots']} slots: "
+            f"{len(lines) / duration:.1f} checkouts/s."
+        )
@@ -8,10 +8,7 @@ from ..celeryconf import app
 from ..order.models import Order
 from ..order.search import prepare_order_search_vector_value
 from ..product.models import Product
-from ..product.search import (
-    PRODUCT_FIELDS_TO_PREFETCH,
-    prepare_product_search_vector_value,
-)
+from ..product.search import prepare_products_search_vector_values
 from .postgres import FlatConcatSearchVector
 
 task_logger = get_task_logger(__name__)
@@ -86,7 +83,7 @@ def set_order_search_document_values(updated_count: int = 0) -> None:
 def set_product_search_document_values(updated_count: int = 0) -> None:
     products = list(
         Product.objects.filter(search_vector=None)
-        .prefetch_related(*PRODUCT_FIELDS_TO_PREFETCH)
+        .only("id")
         .order_by("-id")[:BATCH_SIZE]
     )
 
@@ -94,10 +91,13 @@ def set_product_search_document_values(updated_count: int = 0) -> None:
         task_logger.info("No products to update.")
         return
 
-    updated_count += set_search_vector_values(
-        products,
-        prepare_product_search_vector_value,
+    search_vectors = prepare_products_search_vector_values(
+        [product.id for product in products]
     )
+    for product in products:
+        product.search_vector = FlatConcatSearchVector(*search_vectors[product.id])
+    Product.objects.bulk_update(products, ["search_vector"])
+    updated_count += len(products)
 
     task_logger.info("Updated %d products", updated_count)
 
@@ -0,0 +1,36 @@
+from django.core.cache import cache
+
+from ..utils.cache_version import CacheVersion
+
+
+def test_cache_version_is_stable_until_bumped():
+    # given
+    cache.delete("test_cache_version")
+    version = CacheVersion("test_cache_version")
+
+    # when
+    first = version.get()
+    second = version.get()
+    version.bump()
+
+    # then
+    assert first == second
+    assert version.get() != first
+
+
+def test_cache_version_invalidate_bumps_after_commit(
+    django_capture_on_commit_callbacks,
+):
+    # given
+    version = CacheVersion("test_cache_version")
+    initial = version.get()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        version.invalidate()
+        invalidated = version.get()
+
+    # then
+    assert invalidated != initial
+    assert len(callbacks) == 1
+    assert version.get() not in {initial, invalidated}
@@ -0,0 +1,68 @@
+from ..utils.lru import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used_item():
+    # given
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # when
+    cache.set("c", 3)
+
+    # then
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_get_or_set_computes_value_once():
+    # given
+    cache = LRUCache(maxsize=10)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return "value"
+
+    # when
+    first = cache.get_or_set("key", compute)
+    second = cache.get_or_set("key", compute)
+
+    # then
+    assert first == second == "value"
+    assert len(calls) == 1
+
+
+def test_lru_cache_with_zero_size_stores_nothing():
+    # given
+    cache = LRUCache(maxsize=0)
+
+    # when
+    cache.set("a", 1)
+
+    # then
+    assert "a" not in cache
+    assert len(cache) == 0
+
+
+def test_lru_cache_delete_and_clear():
+    # given
+    cache = LRUCache(maxsize=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # when
+    cache.delete("a")
+
+    # then
+    assert "a" not in cache
+    assert "b" in cache
+
+    # when
+    cache.clear()
+
+    # then
+    assert len(cache) == 0
@@ -0,0 +1,40 @@
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+class CacheVersion:
+    """Version token stored in the cache and shared between processes.
+
+    Process-level caches remember the version they were built for and are rebuilt
+    once the stored version changes.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+
+    def get(self) -> str:
+        version = cache.get(self.key)
+        if version is None:
+            version = uuid.uuid4().hex
+            # Another process could set the version in the meantime; in that case
+            # use the stored one, so all processes agree on the current version.
+            if not cache.add(self.key, version, timeout=None):
+                version = cache.get(self.key, version)
+        return version
+
+    def bump(self):
+        cache.set(self.key, uuid.uuid4().hex, timeout=None)
+
+    def invalidate(self, **_kwargs):
+        """Mark all caches built for the current version as outdated.
+
+        The version is bumped right away, so the current process sees the change
+        within the ongoing transaction, and once again after the commit, to discard
+        caches built by other processes before the change became visible to them.
+
+        Can be connected directly as a model signal receiver.
+        """
+        self.bump()
+        transaction.on_commit(self.bump)
@@ -0,0 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Dict
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = Lock()
+
+
+def get_thread_pool_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Return the process-wide thread pool registered under the given name.
+
+    The pool is created on the first call, so threads are started only in
+    processes that actually use it.
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=name
+            )
+            _executors[name] = executor
+        return executor
@@ -1,12 +1,11 @@
 import datetime
 import json
 import shutil
-from tempfile import NamedTemporaryFile
-from unittest.mock import ANY, MagicMock, patch
+import threading
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import graphene
 import openpyxl
-import petl as etl
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
@@ -18,7 +17,7 @@ from ....graphql.product.filters import ProductFilter
 from ....product.models import Product, ProductChannelListing
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
+    ExportFileWriter,
     create_file_with_headers,
     export_gift_cards,
     export_gift_cards_in_batches,
@@ -60,8 +59,9 @@ def test_export_products(
         "channels": [],
     }
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     product_list[0].variants.update(sku=None)
 
@@ -81,9 +81,7 @@ def test_export_products(
         export_info,
         {"id", "name", "variants__id", "variants__sku"},
         ["id", "name", "variants__id", "variants__sku"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
@@ -109,8 +107,9 @@ def test_export_products_ids(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(user_export_file, {"ids": pks}, export_info, file_type)
@@ -128,9 +127,7 @@ def test_export_products_ids(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
@@ -160,8 +157,9 @@ def test_export_products_filter_is_published(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -185,9 +183,7 @@ def test_export_products_filter_is_published(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
@@ -216,8 +212,9 @@ def test_export_products_filter_collections(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(
@@ -237,7 +234,7 @@ def test_export_products_filter_collections(
     assert export_products_in_batches_mock.call_count == 1
     batch_args, _ = export_products_in_batches_mock.call_args
     assert set(batch_args[0].values_list("pk", flat=True)) == {product_list[-1].pk}
-    assert batch_args[1:] == (export_info, {"id"}, ["id"], ",", mock_file, file_type)
+    assert batch_args[1:] == (export_info, {"id"}, ["id"], mock_writer)
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
 
@@ -263,8 +260,9 @@ def test_export_products_by_app(
     }
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_products(app_export_file, {"all": ""}, export_info, file_type)
@@ -283,9 +281,7 @@ def test_export_products_by_app(
         export_info,
         {"id", "name"},
         ["id", "name"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "products")
@@ -309,8 +305,9 @@ def test_export_gift_cards(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(user_export_file, {"all": ""}, file_type)
@@ -325,9 +322,7 @@ def test_export_gift_cards(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
@@ -351,8 +346,9 @@ def test_export_gift_cards_by_app(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     # when
     export_gift_cards(app_export_file, {"all": ""}, file_type)
@@ -367,9 +363,7 @@ def test_export_gift_cards_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "gift cards")
@@ -393,8 +387,9 @@ def test_export_gift_cards_ids(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
     pks = [gift_card.pk]
 
     # when
@@ -408,9 +403,7 @@ def test_export_gift_cards_ids(
     assert set(args[0].values_list("pk", flat=True)) == set(pks)
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
@@ -435,8 +428,9 @@ def test_export_gift_cards_with_filter(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock(spec=ExportFileWriter)
+    mock_file = mock_writer.close.return_value
+    create_file_with_headers_mock.return_value = mock_writer
 
     gift_card_expiry_date.product = shippable_gift_card_product
     gift_card_used.product = shippable_gift_card_product
@@ -465,9 +459,7 @@ def test_export_gift_cards_with_filter(
     assert set(args[0].values_list("pk", flat=True)) == {gift_card_expiry_date.pk}
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
@@ -514,6 +506,11 @@ def get_product_queryset_filter(product_list):
     assert queryset.count() == len(product_list) - 1
 
 
+def _get_xlsx_rows(xlsx_file):
+    sheet_obj = openpyxl.load_workbook(xlsx_file).active
+    return [list(row) for row in sheet_obj.iter_rows(values_only=True)]
+
+
 def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     # given
     file_headers = ["id", "name", "collections"]
@@ -521,7 +518,8 @@ def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    csv_file = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    csv_file = writer.close()
 
     # then
     assert csv_file
@@ -530,6 +528,7 @@ def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
 
     assert ",".join(file_headers) in file_content
 
+    csv_file.close()
     shutil.rmtree(tmpdir)
 
 
@@ -540,19 +539,14 @@ def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    xlsx_file = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    xlsx_file = writer.close()
 
     # then
     assert xlsx_file
+    assert _get_xlsx_rows(xlsx_file) == [file_headers]
 
-    wb_obj = openpyxl.load_workbook(xlsx_file)
-
-    sheet_obj = wb_obj.active
-    max_col = sheet_obj.max_column
-    headers = [sheet_obj.cell(row=1, column=i).value for i in range(1, max_col + 1)]
-
-    assert headers == file_headers
-
+    xlsx_file.close()
     shutil.rmtree(tmpdir)
 
 
@@ -571,77 +565,56 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
+def test_export_file_writer_write_rows_for_csv(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
         {"id": "345", "name": "test2"},
     ]
     headers = ["id", "name", "collections"]
-    delimiter = ","
-
-    table = etl.fromdicts([{"id": "1", "name": "A"}], header=headers, missing=" ")
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=delimiter)
+    writer = ExportFileWriter(headers, ",", FileTypes.CSV)
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    writer.write_rows([{"id": "1", "name": "A"}], headers)
+    writer.write_rows(export_data, headers)
+    temp_file = writer.close()
 
     # then
-    user_export_file.refresh_from_db()
-
     file_content = temp_file.read().decode().split("\r\n")
-    assert ",".join(headers) in file_content
-    assert ",".join(export_data[0].values()) in file_content
-    assert (",".join(export_data[1].values()) + ", ") in file_content
+    assert file_content == [
+        ",".join(headers),
+        "1,A, ",
+        ",".join(export_data[0].values()),
+        ",".join(export_data[1].values()) + ", ",
+        "",
+    ]
 
     temp_file.close()
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
+def test_export_file_writer_write_rows_for_xlsx(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
         {"id": "345", "name": "test2"},
     ]
-    expected_headers = ["id", "name", "collections"]
-    delimiter = ","
-
-    table = etl.fromdicts(
-        [{"id": "1", "name": "A"}], header=expected_headers, missing=" "
-    )
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    headers = ["id", "name", "collections"]
+    writer = ExportFileWriter(headers, ",", FileTypes.XLSX)
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, delimiter)
+    writer.write_rows([{"id": "1", "name": "A"}], headers)
+    writer.write_rows(export_data, headers)
+    temp_file = writer.close()
 
     # then
-    user_export_file.refresh_from_db()
-
-    wb_obj = openpyxl.load_workbook(temp_file)
-
-    sheet_obj = wb_obj.active
-    max_col = sheet_obj.max_column
-    max_row = sheet_obj.max_row
-    expected_headers = expected_headers
-    headers = [sheet_obj.cell(row=1, column=i).value for i in range(1, max_col + 1)]
-    data = []
-    for i in range(2, max_row + 1):
-        row = []
-        for j in range(1, max_col + 1):
-            row.append(sheet_obj.cell(row=i, column=j).value)
-        data.append(row)
-
-    assert headers == expected_headers
-    assert list(export_data[0].values()) in data
-    row2 = list(export_data[1].values())
-    # add string with space for collections column
-    row2.append(" ")
-    assert row2 in data
+    assert _get_xlsx_rows(temp_file) == [
+        headers,
+        ["1", "A", " "],
+        list(export_data[0].values()),
+        # add string with space for collections column
+        list(export_data[1].values()) + [" "],
+    ]
 
     temp_file.close()
     shutil.rmtree(tmpdir)
@@ -669,10 +642,7 @@ def test_export_products_in_batches_for_csv(
     export_fields = ["id", "name", "variants__sku"]
     expected_headers = ["id", "name", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = ExportFileWriter(expected_headers, ",", FileTypes.CSV)
 
     # when
     export_products_in_batches(
@@ -680,12 +650,11 @@ def test_export_products_in_batches_for_csv(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.CSV,
+        writer,
     )
 
     # then
+    temp_file = writer.close()
 
     expected_data = []
     for product in qs.order_by("pk"):
@@ -706,6 +675,7 @@ def test_export_products_in_batches_for_csv(
     for row in expected_data:
         assert ",".join(row) in file_content
 
+    temp_file.close()
     shutil.rmtree(tmpdir)
 
 
@@ -739,10 +709,7 @@ def test_export_products_in_batches_for_xlsx(
     export_fields = ["id", "name", "description_as_str", "variants__sku"]
     expected_headers = ["id", "name", "description", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(expected_headers, ",", FileTypes.XLSX)
 
     # when
     export_products_in_batches(
@@ -750,12 +717,12 @@ def test_export_products_in_batches_for_xlsx(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.XLSX,
+        writer,
     )
 
     # then
+    temp_file = writer.close()
+
     expected_data = []
     for product in qs:
         product_data = []
@@ -768,26 +735,47 @@ def test_export_products_in_batches_for_xlsx(
             product_data.append(variant.sku)
             expected_data.append(product_data)
 
-    wb_obj = openpyxl.load_workbook(temp_file)
-
-    sheet_obj = wb_obj.active
-    max_col = sheet_obj.max_column
-    max_row = sheet_obj.max_row
-    headers = [sheet_obj.cell(row=1, column=i).value for i in range(1, max_col + 1)]
-    data = []
-    for i in range(2, max_row + 1):
-        row = []
-        for j in range(1, max_col + 1):
-            row.append(sheet_obj.cell(row=i, column=j).value)
-        data.append(row)
+    headers, *data = _get_xlsx_rows(temp_file)
 
     assert headers == expected_headers
     for row in expected_data:
         assert row in data
 
+    temp_file.close()
     shutil.rmtree(tmpdir)
 
 
+@patch("saleor.csv.utils.export.get_products_data")
+@patch("saleor.csv.utils.export.queryset_in_batches")
+@patch("saleor.csv.utils.export.Product")
+def test_export_products_in_batches_concurrently(
+    product_model_mock, queryset_in_batches_mock, get_products_data_mock, settings
+):
+    # given
+    settings.CSV_EXPORT_MAX_WORKERS = 2
+    batches = [[1, 2], [3], [4, 5], [6]]
+    threads = []
+
+    def get_products_data(batch_pks, *args):
+        threads.append(threading.get_ident())
+        return [{"id": pk} for pk in batch_pks]
+
+    product_model_mock.objects.filter.side_effect = lambda pk__in: pk__in
+    queryset_in_batches_mock.return_value = iter(batches)
+    get_products_data_mock.side_effect = get_products_data
+    writer = MagicMock(spec=ExportFileWriter)
+
+    # when
+    export_products_in_batches(Mock(), {}, {"id"}, ["id"], writer)
+
+    # then
+    assert writer.write_rows.call_args_list == [
+        call([{"id": pk} for pk in batch_pks], ["id"]) for batch_pks in batches
+    ]
+    assert len(threads) == len(batches)
+    assert threading.get_ident() not in threads
+
+
 @patch("saleor.csv.utils.export.BATCH_SIZE", 1)
 def test_export_gift_cards_in_batches_to_csv(
     gift_card,
@@ -798,20 +786,13 @@ def test_export_gift_cards_in_batches_to_csv(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = ExportFileWriter(["code"], ",", FileTypes.CSV)
 
     # when
-    export_gift_cards_in_batches(
-        gift_cards,
-        ["code"],
-        ",",
-        temp_file,
-        "csv",
-    )
+    export_gift_cards_in_batches(gift_cards, ["code"], writer)
 
     # then
+    temp_file = writer.close()
     file_content = temp_file.read().decode().split("\r\n")
 
     # ensure headers are in the file
@@ -820,6 +801,7 @@ def test_export_gift_cards_in_batches_to_csv(
     for card in gift_cards:
         assert card.code in file_content
 
+    temp_file.close()
     shutil.rmtree(tmpdir)
 
 
@@ -833,37 +815,20 @@ def test_export_gift_cards_in_batches_to_xlsx(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = ExportFileWriter(["code"], ",", FileTypes.XLSX)
 
     # when
-    export_gift_cards_in_batches(
-        gift_cards,
-        ["code"],
-        ",",
-        temp_file,
-        "xlsx",
-    )
+    export_gift_cards_in_batches(gift_cards, ["code"], writer)
 
     # then
-    wb_obj = openpyxl.load_workbook(temp_file)
-
-    sheet_obj = wb_obj.active
-    max_col = sheet_obj.max_column
-    max_row = sheet_obj.max_row
-    headers = [sheet_obj.cell(row=1, column=i).value for i in range(1, max_col + 1)]
-    data = []
-    for i in range(2, max_row + 1):
-        row = []
-        for j in range(1, max_col + 1):
-            row.append(sheet_obj.cell(row=i, column=j).value)
-        data.append(row)
+    temp_file = writer.close()
+    headers, *data = _get_xlsx_rows(temp_file)
 
     assert headers == ["code"]
     for card in gift_cards:
         assert [card.code] in data
 
+    temp_file.close()
     shutil.rmtree(tmpdir)
 
 
@@ -1,11 +1,30 @@
+import csv
+import io
 import uuid
+from collections import deque
 from datetime import date, datetime
 from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, Dict, List, Set, Union
-
-import petl as etl
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    TypeVar,
+    Union,
+)
+
+import openpyxl
+from django.conf import settings
+from django.db import close_old_connections
 from django.utils import timezone
 
+from ...core.utils.executors import get_thread_pool_executor
 from ...giftcard.models import GiftCard
 from ...product.models import Product
 from .. import FileTypes
@@ -21,6 +40,9 @@ if TYPE_CHECKING:
 
 BATCH_SIZE = 10000
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 def export_products(
     export_file: "ExportFile",
@@ -40,18 +62,17 @@ def export_products(
         data_headers,
     ) = get_product_export_fields_and_headers_info(export_info)
 
-    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
 
     export_products_in_batches(
         queryset,
         export_info,
         set(export_fields),
         data_headers,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
     )
 
+    temporary_file = writer.close()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
 
@@ -73,16 +94,11 @@ def export_gift_cards(
     queryset = queryset.filter(used_by_email__isnull=True)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
 
-    export_gift_cards_in_batches(
-        queryset,
-        export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
-    )
+    export_gift_cards_in_batches(queryset, export_fields, writer)
 
+    temporary_file = writer.close()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
 
@@ -137,17 +153,54 @@ def parse_input(data: Any) -> Dict[str, Union[str, dict]]:
     return data
 
 
-def create_file_with_headers(file_headers: List[str], delimiter: str, file_type: str):
-    table = etl.wrap([file_headers])
+class ExportFileWriter:
+    """Write rows of the exported data into a temporary CSV or XLSX file.
+
+    The file stays open for the whole export, so rows are appended without
+    rereading it. XLSX rows are written in the openpyxl write-only mode, which
+    keeps the memory usage constant regardless of the number of rows.
+    """
+
+    def __init__(self, file_headers: List[str], delimiter: str, file_type: str):
+        self.file_type = file_type
+        self.temporary_file = NamedTemporaryFile("wb+", suffix=f".{file_type}")
+
+        if file_type == FileTypes.CSV:
+            self._stream = io.TextIOWrapper(
+                self.temporary_file.file, encoding="utf-8", newline=""
+            )
+            self._append_row = csv.writer(self._stream, delimiter=delimiter).writerow
+        else:
+            self._workbook = openpyxl.Workbook(write_only=True)
+            self._append_row = self._workbook.create_sheet().append
+
+        self._append_row(file_headers)
+
+    def write_rows(
+        self, export_data: Iterable[Dict[str, Any]], headers: List[str]
+    ) -> None:
+        """Write rows with values of the given headers.
+
+        Missing values are written as a single space.
+        """
+        for data in export_data:
+            self._append_row([data.get(header, " ") for header in headers])
 
-    if file_type == FileTypes.CSV:
-        temp_file = NamedTemporaryFile("ab+", suffix=".csv")
-        etl.tocsv(table, temp_file.name, delimiter=delimiter)
-    else:
-        temp_file = NamedTemporaryFile("ab+", suffix=".xlsx")
-        etl.io.xlsx.toxlsx(table, temp_file.name)
+    def close(self) -> IO[bytes]:
+        """Finish writing and return the temporary file rewound to the beginning."""
+        if self.file_type == FileTypes.CSV:
+            self._stream.flush()
+            self._stream.detach()
+        else:
+            self._workbook.save(self.temporary_file.file)
+        self.temporary_file.seek(0)
+        return self.temporary_file
 
-    return temp_file
+
+def create_file_with_headers(
+    file_headers: List[str], delimiter: str, file_type: str
+) -> ExportFileWriter:
+    return ExportFileWriter(file_headers, delimiter, file_type)
 
 
 def export_products_in_batches(
@@ -155,44 +208,38 @@ def export_products_in_batches(
     export_info: Dict[str, list],
     export_fields: Set[str],
     headers: List[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
 ):
+    """Write data of products to the file in batches.
+
+    When `CSV_EXPORT_MAX_WORKERS` is set, data of consecutive batches is prepared
+    concurrently and written in the order of batches.
+    """
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
 
-    for batch_pks in queryset_in_batches(queryset):
-        product_batch = Product.objects.filter(pk__in=batch_pks).prefetch_related(
-            "attributes",
-            "variants",
-            "collections",
-            "media",
-            "product_type",
-            "category",
-        )
-
-        export_data = get_products_data(
+    def get_batch_data(batch_pks: List[int]) -> List[Dict[str, Union[str, bool]]]:
+        product_batch = Product.objects.filter(pk__in=batch_pks)
+        return get_products_data(
             product_batch, export_fields, attributes, warehouses, channels
         )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+    for export_data in map_in_order(get_batch_data, queryset_in_batches(queryset)):
+        writer.write_rows(export_data, headers)
 
 
 def export_gift_cards_in_batches(
     queryset: "QuerySet",
     export_fields: List[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
 ):
     for batch_pks in queryset_in_batches(queryset):
         gift_card_batch = GiftCard.objects.filter(pk__in=batch_pks)
 
-        export_data = list(gift_card_batch.values(*export_fields))
+        export_data = gift_card_batch.values(*export_fields).iterator()
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+        writer.write_rows(export_data, export_fields)
 
 
 def queryset_in_batches(queryset):
@@ -214,19 +261,34 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
-def append_to_file(
-    export_data: List[Dict[str, Union[str, bool]]],
-    headers: List[str],
-    temporary_file: Any,
-    file_type: str,
-    delimiter: str,
-):
-    table = etl.fromdicts(export_data, header=headers, missing=" ")
+def map_in_order(func: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+    """Apply the function to the items in worker threads and yield results in order.
 
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
+    At most `CSV_EXPORT_MAX_WORKERS` items are processed ahead of the consumer, so
+    the results of only that many batches are kept in memory at once.
+    """
+    max_workers = settings.CSV_EXPORT_MAX_WORKERS
+    if max_workers < 2:
+        yield from map(func, items)
+        return
+
+    executor = get_thread_pool_executor("csv-export", max_workers)
+    pending: Deque = deque()
+    for item in items:
+        pending.append(executor.submit(_call_in_thread, func, item))
+        if len(pending) >= max_workers:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _call_in_thread(func: Callable[[T], R], item: T) -> R:
+    try:
+        return func(item)
+    finally:
+        # Worker threads outlive the export task, so their connections are not
+        # closed by the task.
+        close_old_connections()
 
 
 def save_csv_file_in_export_file(
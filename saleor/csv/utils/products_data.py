@@ -72,7 +72,7 @@ def get_products_data(
         queryset, export_fields, attribute_ids, warehouse_ids, channel_ids
     )
 
-    for product_data in products_data:
+    for product_data in products_data.iterator():
         pk = product_data["id"]
         if export_variant_id:
             variant_pk = product_data.get("variants__id")
@@ -0,0 +1,26 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class DiscountAppConfig(AppConfig):
+    name = "saleor.discount"
+
+    def ready(self):
+        from ..channel.models import Channel
+        from ..product.models import Category
+        from .models import Sale, SaleChannelListing
+        from .sale_index import invalidate_sale_index
+
+        for model in [Sale, SaleChannelListing, Category, Channel]:
+            for signal in [post_save, post_delete]:
+                signal.connect(
+                    invalidate_sale_index,
+                    sender=model,
+                    dispatch_uid=f"invalidate_sale_index_{model.__name__}",
+                )
+        for field in ["categories", "collections", "products", "variants"]:
+            m2m_changed.connect(
+                invalidate_sale_index,
+                sender=getattr(Sale, field).through,
+                dispatch_uid=f"invalidate_sale_index_sale_{field}",
+            )
@@ -0,0 +1,191 @@
+import datetime
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils import timezone
+from pytimeparse import parse
+
+from ..core.utils.cache_version import CacheVersion
+from . import DiscountInfo
+from .models import Sale
+
+if TYPE_CHECKING:
+    from ..checkout.fetch import CheckoutLineInfo
+
+SALE_INDEX_VERSION_KEY = "sale_index_version"
+SALE_INDEX_CACHE_KEY = "sale_index"
+# Safety net for changes made without emitting model signals, e.g. bulk updates.
+SALE_INDEX_TIMEOUT = parse("5 minutes")
+
+sale_index_version = CacheVersion(SALE_INDEX_VERSION_KEY)
+
+SaleIdsMap = Dict[int, FrozenSet[int]]
+
+
+@dataclass(frozen=True)
+class SaleIndex:
+    """Catalogue of sales that haven't ended yet, indexed by the discounted objects.
+
+    Category ids of each sale include all descendants of the sale's categories, so
+    a product is discounted by a sale when its own, its variant's, its category's
+    or one of its collections' id is indexed for that sale.
+    """
+
+    discounts: Tuple[DiscountInfo, ...]
+    sale_ids_by_product: SaleIdsMap
+    sale_ids_by_variant: SaleIdsMap
+    sale_ids_by_category: SaleIdsMap
+    sale_ids_by_collection: SaleIdsMap
+
+    def get_discounts(self, date: datetime.datetime) -> List[DiscountInfo]:
+        """Return discounts of sales active at the given date."""
+        return [
+            discount for discount in self.discounts if is_sale_active(discount, date)
+        ]
+
+    def get_sale_ids_for_line(self, line_info: "CheckoutLineInfo") -> Set[int]:
+        sale_ids = set(self.sale_ids_by_product.get(line_info.product.pk, ()))
+        sale_ids.update(self.sale_ids_by_variant.get(line_info.variant.pk, ()))
+        sale_ids.update(
+            self.sale_ids_by_category.get(line_info.product.category_id, ())
+        )
+        for collection in line_info.collections:
+            sale_ids.update(self.sale_ids_by_collection.get(collection.pk, ()))
+        return sale_ids
+
+    def get_discounts_for_lines(
+        self, lines_info: Iterable["CheckoutLineInfo"], date: datetime.datetime
+    ) -> List[DiscountInfo]:
+        """Return discounts of active sales applicable to any of the given lines.
+
+        Catalogue ids of the returned discounts are limited to those used by lines.
+        """
+        lines_info = list(lines_info)
+        sale_ids: Set[int] = set()
+        for line_info in lines_info:
+            sale_ids.update(self.get_sale_ids_for_line(line_info))
+        if not sale_ids:
+            return []
+
+        product_ids = {line_info.product.pk for line_info in lines_info}
+        variant_ids = {line_info.variant.pk for line_info in lines_info}
+        category_ids = {line_info.product.category_id for line_info in lines_info}
+        collection_ids = {
+            collection.pk
+            for line_info in lines_info
+            for collection in line_info.collections
+        }
+        return [
+            DiscountInfo(
+                sale=discount.sale,
+                category_ids=discount.category_ids & category_ids,
+                channel_listings=discount.channel_listings,
+                collection_ids=discount.collection_ids & collection_ids,
+                product_ids=discount.product_ids & product_ids,
+                variants_ids=discount.variants_ids & variant_ids,
+            )
+            for discount in self.discounts
+            if discount.sale.pk in sale_ids and is_sale_active(discount, date)
+        ]
+
+
+_sale_index: Dict[str, Tuple[str, SaleIndex, float]] = {}
+_sale_index_lock = Lock()
+
+
+def is_sale_active(discount: DiscountInfo, date: datetime.datetime) -> bool:
+    sale = discount.sale
+    return sale.start_date <= date and (sale.end_date is None or sale.end_date >= date)
+
+
+def invalidate_sale_index(**_kwargs):
+    """Mark the sale index as outdated in all processes."""
+    sale_index_version.invalidate()
+
+
+def clear_sale_index():
+    with _sale_index_lock:
+        _sale_index.clear()
+
+
+def _invert(ids_by_sale: Dict[int, Set[int]]) -> SaleIdsMap:
+    sale_ids: DefaultDict[int, Set[int]] = defaultdict(set)
+    for sale_id, ids in ids_by_sale.items():
+        for id in ids:
+            sale_ids[id].add(sale_id)
+    return {id: frozenset(ids) for id, ids in sale_ids.items()}
+
+
+def build_sale_index() -> SaleIndex:
+    from .utils import (
+        fetch_categories,
+        fetch_collections,
+        fetch_products,
+        fetch_sale_channel_listings,
+        fetch_variants,
+    )
+
+    sales = list(
+        Sale.objects.filter(Q(end_date__isnull=True) | Q(end_date__gte=timezone.now()))
+    )
+    pks = {sale.pk for sale in sales}
+    channel_listings = fetch_sale_channel_listings(pks)
+    products = fetch_products(pks)
+    variants = fetch_variants(pks)
+    categories = fetch_categories(pks)
+    collections = fetch_collections(pks)
+    return SaleIndex(
+        discounts=tuple(
+            DiscountInfo(
+                sale=sale,
+                category_ids=categories[sale.pk],
+                channel_listings=channel_listings[sale.pk],
+                collection_ids=collections[sale.pk],
+                product_ids=products[sale.pk],
+                variants_ids=variants[sale.pk],
+            )
+            for sale in sales
+        ),
+        sale_ids_by_product=_invert(products),
+        sale_ids_by_variant=_invert(variants),
+        sale_ids_by_category=_invert(categories),
+        sale_ids_by_collection=_invert(collections),
+    )
+
+
+def get_sale_index() -> SaleIndex:
+    """Return the sale index for the current version.
+
+    The index is kept in process memory and in the cache shared between processes,
+    so it's built from the database only once per change of sales, their catalogues
+    or the category tree.
+    """
+    version = sale_index_version.get()
+    if cached := _sale_index.get(SALE_INDEX_CACHE_KEY):
+        cached_version, cached_index, check_time = cached
+        if cached_version == version and monotonic() - check_time <= SALE_INDEX_TIMEOUT:
+            return cached_index
+
+    cache_key = f"{SALE_INDEX_CACHE_KEY}:{version}"
+    index: Optional[SaleIndex] = cache.get(cache_key)
+    if index is None:
+        index = build_sale_index()
+        cache.set(cache_key, index, timeout=SALE_INDEX_TIMEOUT)
+    with _sale_index_lock:
+        _sale_index[SALE_INDEX_CACHE_KEY] = (version, index, monotonic())
+    return index
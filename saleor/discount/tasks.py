@@ -8,6 +8,7 @@ from celery.utils.log import get_task_logger
 from django.db.models import F, Q
 
 from ..celeryconf import app
+from ..core.cache_tags import CacheTag, invalidate_cache_tags
 from ..graphql.discount.mutations.utils import CATALOGUE_FIELD_TO_TYPE_NAME
 from ..plugins.manager import get_plugins_manager
 from ..product.tasks import update_products_discounted_prices_of_catalogues_task
@@ -48,6 +49,8 @@ def handle_sale_toggle():
 
     sale_ids = ", ".join([str(sale.id) for sale in sales])
     sales.update(notification_sent_datetime=datetime.now(pytz.UTC))
+    # prices of the sale products change once it starts or ends
+    invalidate_cache_tags([CacheTag.PRODUCT])
 
     task_logger.info("The sale_toggle webhook sent for sales with ids: %s", sale_ids)
 
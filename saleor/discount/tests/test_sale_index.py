@@ -0,0 +1,131 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
+
+from ..models import Sale
+from ..sale_index import (
+    build_sale_index,
+    clear_sale_index,
+    get_sale_index,
+    sale_index_version,
+)
+from ..utils import fetch_active_discounts, fetch_discounts
+
+
+def test_build_sale_index(sale, product, variant, category, collection):
+    # when
+    index = build_sale_index()
+
+    # then
+    assert [discount.sale for discount in index.discounts] == [sale]
+    assert index.sale_ids_by_product == {product.pk: {sale.pk}}
+    assert index.sale_ids_by_variant == {variant.pk: {sale.pk}}
+    assert index.sale_ids_by_category == {category.pk: {sale.pk}}
+    assert index.sale_ids_by_collection == {collection.pk: {sale.pk}}
+
+
+def test_build_sale_index_includes_subcategories(new_sale, categories_tree):
+    # given
+    child = categories_tree.children.first()
+    new_sale.categories.add(categories_tree)
+
+    # when
+    index = build_sale_index()
+
+    # then
+    assert index.sale_ids_by_category == {
+        categories_tree.pk: {new_sale.pk},
+        child.pk: {new_sale.pk},
+    }
+    assert index.discounts[0].category_ids == {categories_tree.pk, child.pk}
+
+
+def test_build_sale_index_skips_ended_sales(new_sale, product):
+    # given
+    new_sale.products.add(product)
+    new_sale.end_date = timezone.now() - timedelta(days=1)
+    new_sale.save(update_fields=["end_date"])
+
+    # when
+    index = build_sale_index()
+
+    # then
+    assert index.discounts == ()
+    assert index.sale_ids_by_product == {}
+
+
+def test_sale_index_get_discounts_filters_by_date(new_sale, product):
+    # given
+    now = timezone.now()
+    new_sale.products.add(product)
+    new_sale.start_date = now + timedelta(days=1)
+    new_sale.save(update_fields=["start_date"])
+    index = get_sale_index()
+
+    # when
+    current_discounts = index.get_discounts(now)
+    future_discounts = index.get_discounts(now + timedelta(days=2))
+
+    # then
+    assert current_discounts == []
+    assert [discount.sale for discount in future_discounts] == [new_sale]
+
+
+def test_fetch_active_discounts_matches_fetch_discounts(sale, new_sale, product):
+    # given
+    new_sale.products.add(product)
+
+    # when
+    discounts = fetch_active_discounts()
+
+    # then
+    assert discounts == fetch_discounts(timezone.now())
+
+
+@mock.patch("saleor.discount.sale_index.build_sale_index", wraps=build_sale_index)
+def test_get_sale_index_reuses_index_in_process(mocked_build_sale_index, sale):
+    # when
+    first_index = get_sale_index()
+    second_index = get_sale_index()
+
+    # then
+    assert first_index is second_index
+    mocked_build_sale_index.assert_called_once_with()
+
+
+def test_get_sale_index_reuses_index_from_cache(sale, django_assert_num_queries):
+    # given
+    index = get_sale_index()
+    clear_sale_index()
+
+    # when
+    with django_assert_num_queries(0):
+        cached_index = get_sale_index()
+
+    # then
+    assert cached_index == index
+
+
+def test_get_sale_index_rebuilt_after_sale_catalogue_change(new_sale, product):
+    # given
+    version = sale_index_version.get()
+    assert get_sale_index().sale_ids_by_product == {}
+
+    # when
+    new_sale.products.add(product)
+
+    # then
+    assert sale_index_version.get() != version
+    assert get_sale_index().sale_ids_by_product == {product.pk: {new_sale.pk}}
+
+
+def test_get_sale_index_rebuilt_after_sale_deleted(sale):
+    # given
+    assert get_sale_index().discounts
+
+    # when
+    Sale.objects.get(pk=sale.pk).delete()
+
+    # then
+    assert get_sale_index().discounts == ()
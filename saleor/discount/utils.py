@@ -20,7 +20,7 @@ from uuid import UUID
 
 from babel.numbers import get_currency_precision
 from django.conf import settings
-from django.db.models import F
+from django.db.models import F, Q
 from django.utils import timezone
 from prices import Money, TaxedMoney, fixed_discount, percentage_discount
 
@@ -36,6 +36,7 @@ from .models import (
     SaleTranslation,
     VoucherCustomer,
 )
+from .sale_index import get_sale_index
 
 if TYPE_CHECKING:
     from ..account.models import User
@@ -276,6 +277,7 @@ def fetch_categories(
     lines_info: Iterable["CheckoutLineInfo"] = [],
     database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
 ) -> Dict[int, Set[int]]:
+    """Return ids of sales' categories, including all their descendants."""
     from ..product.models import Category
 
     categories = (
@@ -287,19 +289,41 @@ def fetch_categories(
     category_map: Dict[int, Set[int]] = defaultdict(set)
     for sale_pk, category_pk in categories:
         category_map[sale_pk].add(category_pk)
-
+    if not category_map:
+        return defaultdict(set)
+
+    # Fetch descendants of all categories at once, instead of querying the tree
+    # for each sale separately.
+    trees = {
+        pk: (tree_id, lft, rght)
+        for pk, tree_id, lft, rght in Category.objects.using(database_connection_name)
+        .filter(pk__in=set().union(*category_map.values()))
+        .values_list("pk", "tree_id", "lft", "rght")
+    }
+    descendants_lookup = Q()
+    for tree_id, lft, rght in trees.values():
+        descendants_lookup |= Q(tree_id=tree_id, lft__gte=lft, rght__lte=rght)
+    descendants = Category.objects.using(database_connection_name).filter(
+        descendants_lookup
+    )
     used_category_pks = {line_info.product.category_id for line_info in lines_info}
+    if used_category_pks:
+        descendants = descendants.filter(pk__in=used_category_pks)
+    descendants_by_tree: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+    for pk, tree_id, lft in descendants.values_list("pk", "tree_id", "lft"):
+        descendants_by_tree[tree_id].append((pk, lft))
 
     subcategory_map: Dict[int, Set[int]] = defaultdict(set)
     for sale_pk, category_pks in category_map.items():
-        subcategories = Category.tree.filter(pk__in=category_pks).get_descendants(
-            include_self=True
-        )
-
-        if used_category_pks:
-            subcategories = subcategories.filter(pk__in=used_category_pks)
-
-        subcategory_map[sale_pk] = set(subcategories.values_list("pk", flat=True))
+        for category_pk in category_pks:
+            if category_pk not in trees:
+                continue
+            tree_id, lft, rght = trees[category_pk]
+            subcategory_map[sale_pk].update(
+                pk
+                for pk, descendant_lft in descendants_by_tree[tree_id]
+                if lft <= descendant_lft <= rght
+            )
     return subcategory_map
 
 
@@ -409,7 +433,7 @@ def fetch_discounts(date: datetime.date) -> List[DiscountInfo]:
 
 
 def fetch_active_discounts() -> List[DiscountInfo]:
-    return fetch_discounts(timezone.now())
+    return get_sale_index().get_discounts(timezone.now())
 
 
 def fetch_catalogue_info(instance: Sale) -> CatalogueInfo:
@@ -455,34 +479,7 @@ def fetch_active_sales_for_checkout(
     if not lines_info:
         return []
 
-    sales = list(Sale.objects.active(timezone.now()))
-
-    pks = {s.pk for s in sales}
-    channel_listings = fetch_sale_channel_listings(pks)
-    product_pks_by_sale_pk_map = fetch_products(pks, lines_info)
-    variant_pks_by_sale_pk_map = fetch_variants(pks, lines_info)
-    category_pks_by_sale_pk_map = fetch_categories(pks, lines_info)
-    collection_pks_by_sale_pk_map = fetch_collections(pks, lines_info)
-
-    discounts_info = []
-    for sale in sales:
-        category_ids = category_pks_by_sale_pk_map[sale.pk]
-        collection_ids = collection_pks_by_sale_pk_map[sale.pk]
-        product_ids = product_pks_by_sale_pk_map[sale.pk]
-        variants_ids = variant_pks_by_sale_pk_map[sale.pk]
-        if category_ids or collection_ids or product_ids or variants_ids:
-            discounts_info.append(
-                DiscountInfo(
-                    sale=sale,
-                    category_ids=category_ids,
-                    channel_listings=channel_listings[sale.pk],
-                    collection_ids=collection_ids,
-                    product_ids=product_ids,
-                    variants_ids=variants_ids,
-                )
-            )
-
-    return discounts_info
+    return get_sale_index().get_discounts_for_lines(lines_info, timezone.now())
 
 
 def is_sale_applicable_on_line(
@@ -7,6 +7,7 @@ from django.utils.functional import LazyObject
 from promise import Promise
 
 from ...app.models import App, AppExtension, AppToken
+from ...app.token_cache import cache_app_ids, get_cached_app_ids
 from ...core.auth import get_token_from_request
 from ...core.utils.lazyobjects import unwrap_lazy
 from ..core import SaleorContext
@@ -76,10 +77,21 @@ class AppByTokenLoader(DataLoader):
     context_key = "app_by_token"
 
     def batch_load(self, keys):
+        authed_apps = get_cached_app_ids(keys)
         last_4s_to_raw_token_map = defaultdict(list)
         for raw_token in keys:
-            last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
+            if raw_token not in authed_apps:
+                last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
+        if last_4s_to_raw_token_map:
+            verified_apps = self.verify_tokens(last_4s_to_raw_token_map)
+            cache_app_ids(verified_apps)
+            authed_apps.update(verified_apps)
 
+        apps = App.objects.filter(id__in=authed_apps.values(), is_active=True).in_bulk()
+
+        return [apps.get(authed_apps.get(key)) for key in keys]
+
+    def verify_tokens(self, last_4s_to_raw_token_map):
         # The app should always be taken from the default database.
         # The app is retrieved from the database before the mutation code is reached,
         # in case the replica database is set the app from the replica will be returned.
@@ -96,10 +108,7 @@ class AppByTokenLoader(DataLoader):
             for raw_token in last_4s_to_raw_token_map[token_last_4]:
                 if check_password(raw_token, auth_token):
                     authed_apps[raw_token] = app_id
-
-        apps = App.objects.filter(id__in=authed_apps.values(), is_active=True).in_bulk()
-
-        return [apps.get(authed_apps.get(key)) for key in keys]
+        return authed_apps
 
 
 class ThumbnailByAppIdSizeAndFormatLoader(BaseThumbnailBySizeAndFormatLoader):
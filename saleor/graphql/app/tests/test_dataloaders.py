@@ -0,0 +1,68 @@
+from unittest.mock import patch
+
+from ....app.models import AppToken
+from ..dataloaders import promise_app
+
+
+def _get_app_by_token(rf, raw_token):
+    request = rf.post("/graphql/", HTTP_AUTHORIZATION=f"Bearer {raw_token}")
+    request.dataloaders = {}
+    return promise_app(request).get()
+
+
+def test_promise_app_verifies_token_once(rf, app):
+    # given
+    _, raw_token = AppToken.objects.create_with_token(app=app)
+    assert _get_app_by_token(rf, raw_token) == app
+
+    # when
+    with patch(
+        "saleor.graphql.app.dataloaders.check_password"
+    ) as mocked_check_password:
+        fetched_app = _get_app_by_token(rf, raw_token)
+
+    # then
+    mocked_check_password.assert_not_called()
+    assert fetched_app == app
+
+
+def test_promise_app_invalid_token_not_cached(rf, app):
+    # given
+    _, raw_token = AppToken.objects.create_with_token(app=app)
+    invalid_token = f"{'x' * 26}{raw_token[-4:]}"
+    assert _get_app_by_token(rf, invalid_token) is None
+
+    # when
+    with patch(
+        "saleor.graphql.app.dataloaders.check_password", return_value=False
+    ) as mocked_check_password:
+        fetched_app = _get_app_by_token(rf, invalid_token)
+
+    # then
+    mocked_check_password.assert_called_once()
+    assert fetched_app is None
+
+
+def test_promise_app_after_token_deleted(rf, app):
+    # given
+    app_token, raw_token = AppToken.objects.create_with_token(app=app)
+    assert _get_app_by_token(rf, raw_token) == app
+
+    # when
+    app_token.delete()
+
+    # then
+    assert _get_app_by_token(rf, raw_token) is None
+
+
+def test_promise_app_after_app_deactivated(rf, app):
+    # given
+    _, raw_token = AppToken.objects.create_with_token(app=app)
+    assert _get_app_by_token(rf, raw_token) == app
+
+    # when
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # then
+    assert _get_app_by_token(rf, raw_token) is None
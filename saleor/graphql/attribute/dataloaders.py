@@ -21,6 +21,7 @@ class AttributeValuesByAttributeIdLoader(DataLoader):
 
 class AttributesByAttributeId(DataLoader):
     context_key = "attributes_by_id"
+    shared_cache_models = ("attribute.Attribute",)
 
     def batch_load(self, keys):
         attributes = Attribute.objects.using(self.database_connection_name).in_bulk(
@@ -21,6 +21,7 @@ from ..core.descriptions import (
     ADDED_IN_39,
     ADDED_IN_310,
     ADDED_IN_314,
+    ADDED_IN_316,
     DEPRECATED_IN_3X_FIELD,
 )
 from ..core.doc_category import DOC_CATEGORY_ATTRIBUTES
@@ -378,6 +379,39 @@ class SelectedAttribute(BaseObjectType):
         description = "Represents a custom attribute."
 
 
+class AttributeValueFacet(BaseObjectType):
+    value = graphene.Field(
+        AttributeValue, description="The attribute value.", required=True
+    )
+    count = graphene.Int(
+        description="Number of products with the value assigned to them or their "
+        "variants.",
+        required=True,
+    )
+
+    class Meta:
+        doc_category = DOC_CATEGORY_ATTRIBUTES
+        description = (
+            "Represents the number of products with an attribute value." + ADDED_IN_316
+        )
+
+
+class AttributeFacet(BaseObjectType):
+    attribute = graphene.Field(Attribute, description="The attribute.", required=True)
+    values = NonNullList(
+        AttributeValueFacet,
+        description="Values assigned to the products, with numbers of the products.",
+        required=True,
+    )
+
+    class Meta:
+        doc_category = DOC_CATEGORY_ATTRIBUTES
+        description = (
+            "Represents numbers of products with each value of an attribute."
+            + ADDED_IN_316
+        )
+
+
 class AttributeInput(BaseInputObjectType):
     slug = graphene.String(required=True, description=AttributeDescriptions.SLUG)
     values = NonNullList(
@@ -8,6 +8,7 @@ from ..order.dataloaders import OrderByIdLoader, OrderLineByIdLoader
 
 class ChannelByIdLoader(DataLoader):
     context_key = "channel_by_id"
+    shared_cache_models = ("channel.Channel",)
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(keys)
@@ -16,6 +17,7 @@ class ChannelByIdLoader(DataLoader):
 
 class ChannelBySlugLoader(DataLoader):
     context_key = "channel_by_slug"
+    shared_cache_models = ("channel.Channel",)
 
     def batch_load(self, keys):
         channels = Channel.objects.using(self.database_connection_name).in_bulk(
@@ -2,6 +2,7 @@ import graphene
 
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....checkout.utils import invalidate_checkout_prices
+from ....warehouse.reservations import release_stocks_reserved_by_lines
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
@@ -66,6 +67,7 @@ class CheckoutLineDelete(BaseMutation):
         )
 
         if line and line in checkout.lines.all():
+            release_stocks_reserved_by_lines([line])
             line.delete()
 
         manager = get_plugin_manager_promise(info.context).get()
@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ....checkout.utils import invalidate_checkout_prices
+from ....warehouse.reservations import release_stocks_reserved_by_lines
 from ....webhook.event_types import WebhookEventAsyncType
 from ...core import ResolveInfo
 from ...core.descriptions import ADDED_IN_34, DEPRECATED_IN_3X_INPUT
@@ -78,7 +79,9 @@ class CheckoutLinesDelete(BaseMutation):
             lines_ids, graphene_type="CheckoutLine", raise_error=True
         )
         cls.validate_lines(checkout, lines_to_delete)
-        checkout.lines.filter(id__in=lines_to_delete).delete()
+        checkout_lines = checkout.lines.filter(id__in=lines_to_delete)
+        release_stocks_reserved_by_lines(checkout_lines)
+        checkout_lines.delete()
 
         lines, _ = fetch_checkout_lines(checkout)
 
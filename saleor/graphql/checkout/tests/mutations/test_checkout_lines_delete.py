@@ -1,11 +1,15 @@
+from datetime import timedelta
 from unittest import mock
 
 import graphene
+from django.utils import timezone
 
 from .....checkout.error_codes import CheckoutErrorCode
 from .....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from .....checkout.utils import invalidate_checkout_prices
 from .....plugins.manager import get_plugins_manager
+from .....warehouse.models import Stock
+from .....warehouse.reservations import reserve_stocks
 from ....core.utils import to_global_id_or_none
 from ....tests.utils import get_graphql_content
 from ...mutations.utils import update_checkout_shipping_method_if_invalid
@@ -79,6 +83,35 @@ def test_checkout_lines_delete(
     assert mocked_invalidate_checkout_prices.call_count == 1
 
 
+def test_checkout_lines_delete_releases_reserved_stocks(
+    user_api_client, checkout_line, channel_USD
+):
+    # given
+    checkout = checkout_line.checkout
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        "US",
+        channel_USD,
+        timezone.now() + timedelta(minutes=5),
+    )
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    assert stock.quantity_reserved == checkout_line.quantity
+    variables = {
+        "id": to_global_id_or_none(checkout),
+        "linesIds": [graphene.Node.to_global_id("CheckoutLine", checkout_line.pk)],
+    }
+
+    # when
+    response = user_api_client.post_graphql(MUTATION_CHECKOUT_LINES_DELETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["checkoutLinesDelete"]["errors"]
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
+
+
 def test_checkout_lines_delete_invalid_checkout_id(
     user_api_client, checkout_with_items
 ):
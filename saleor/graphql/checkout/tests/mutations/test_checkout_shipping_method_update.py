@@ -14,7 +14,7 @@ from .....checkout.fetch import (
 from .....checkout.utils import PRIVATE_META_APP_SHIPPING_ID, invalidate_checkout_prices
 from .....plugins.base_plugin import ExcludedShippingMethod
 from .....plugins.manager import get_plugins_manager
-from .....shipping import models as shipping_models
+from .....shipping import PostalCodeRuleInclusionType
 from .....shipping.utils import convert_to_shipping_method_data
 from ....core.utils import to_global_id_or_none
 from ....tests.utils import get_graphql_content
@@ -239,9 +239,7 @@ def test_checkout_shipping_method_update_excluded_webhook(
 
 
 # Deprecated
-@patch("saleor.shipping.postal_codes.is_shipping_method_applicable_for_postal_code")
 def test_checkout_shipping_method_update_excluded_postal_code(
-    mock_is_shipping_method_available,
     staff_api_client,
     shipping_method,
     checkout_with_item,
@@ -251,7 +249,9 @@ def test_checkout_shipping_method_update_excluded_postal_code(
     checkout.shipping_address = address
     checkout.save(update_fields=["shipping_address"])
     query = MUTATION_UPDATE_SHIPPING_METHOD
-    mock_is_shipping_method_available.return_value = False
+    shipping_method.postal_code_rules.create(
+        start=address.postal_code, inclusion_type=PostalCodeRuleInclusionType.EXCLUDE
+    )
 
     method_id = graphene.Node.to_global_id("ShippingMethod", shipping_method.id)
 
@@ -268,10 +268,6 @@ def test_checkout_shipping_method_update_excluded_postal_code(
     assert errors[0]["field"] == "shippingMethod"
     assert errors[0]["code"] == CheckoutErrorCode.SHIPPING_METHOD_NOT_APPLICABLE.name
     assert checkout.shipping_method is None
-    assert (
-        mock_is_shipping_method_available.call_count
-        == shipping_models.ShippingMethod.objects.count()
-    )
 
 
 def test_checkout_shipping_method_update_with_not_all_required_shipping_address_data(
@@ -29,6 +29,8 @@ from ..channel.utils import get_default_channel_slug_or_graphql_error
 from ..core.enums import OrderDirection
 from ..core.types import BaseConnection, NonNullList
 from ..utils.sorting import sort_queryset_for_connection
+from .descriptions import ADDED_IN_316
+from .total_count import get_total_count
 
 if TYPE_CHECKING:
     from ..core import ResolveInfo
@@ -301,14 +303,20 @@ def connection_from_queryset_slice(
     )
 
     if "total_count" in connection_type._meta.fields:
+        strategy = getattr(connection_type, "total_count_strategy", None)
+        total_count = None
 
-        def get_total_count():
-            return qs.count()
+        def resolve_total_count():
+            nonlocal total_count
+            if total_count is None:
+                total_count = get_total_count(qs, strategy)
+            return total_count
 
         return connection_type(
             edges=edges,
             page_info=pageinfo_type(**page_info),
-            total_count=get_total_count,
+            total_count=lambda: resolve_total_count().count,
+            total_count_is_exact=lambda: resolve_total_count().is_exact,
         )
 
     return connection_type(
@@ -342,16 +350,20 @@ def create_connection_slice(
     else:
         queryset = iterable
 
-    queryset, sort_by = sort_queryset_for_connection(iterable=queryset, args=args)
+    sorted_queryset, sort_by = sort_queryset_for_connection(
+        iterable=queryset, args=args
+    )
     args["sort_by"] = sort_by
 
     slice = connection_from_queryset_slice(
-        queryset,
+        sorted_queryset,
         args,
         connection_type,
         edge_type or connection_type.Edge,
         pageinfo_type or graphene.relay.PageInfo,
     )
+    # Keep all the matching items for the fields aggregating over the collection.
+    slice.queryset = queryset
 
     if isinstance(iterable, ChannelQsContext):
         edges_with_context = []
@@ -443,6 +455,7 @@ def slice_connection_iterable(
 
     if "total_count" in connection_type._meta.fields:
         slice.total_count = _len
+        slice.total_count_is_exact = True
 
     return slice
 
@@ -656,18 +669,37 @@ class CountableConnection(NonNullConnection):
         abstract = True
 
     total_count = graphene.Int(description="A total count of items in the collection.")
+    total_count_is_exact = graphene.Boolean(
+        description=(
+            "Determine if `totalCount` is the exact number of items. Counts of large "
+            "collections can be estimated or served from cache." + ADDED_IN_316
+        )
+    )
+
+    @classmethod
+    def __init_subclass_with_meta__(cls, total_count_strategy=None, **options):
+        cls.total_count_strategy = total_count_strategy
+        super().__init_subclass_with_meta__(**options)
 
     @staticmethod
-    def resolve_total_count(root, _info):
+    def _get_root_value(root, name):
         try:
             if isinstance(root, dict):
-                total_count = root["total_count"]
+                value = root[name]
             else:
-                total_count = root.total_count
+                value = getattr(root, name)
         except (AttributeError, KeyError):
             return None
 
-        if callable(total_count):
-            return total_count()
+        if callable(value):
+            return value()
 
-        return total_count
+        return value
+
+    @staticmethod
+    def resolve_total_count(root, _info):
+        return CountableConnection._get_root_value(root, "total_count")
+
+    @staticmethod
+    def resolve_total_count_is_exact(root, _info):
+        return CountableConnection._get_root_value(root, "total_count_is_exact")
@@ -1,11 +1,27 @@
 from collections import defaultdict
-from typing import DefaultDict, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
+from threading import Lock
+from time import monotonic
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import opentracing
 import opentracing.tags
+from django.db.models.signals import post_delete, post_save
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
+from ...core.utils.cache_version import CacheVersion
+from ...core.utils.lru import LRUCache
 from ...thumbnail.models import Thumbnail
 from ...thumbnail.utils import get_thumbnail_format
 from . import SaleorContext
@@ -14,12 +30,46 @@ from .context import get_database_connection_name
 K = TypeVar("K")
 R = TypeVar("R")
 
+SHARED_CACHE_SIZE = 1000
+SHARED_CACHE_TIMEOUT = 60
+
+_shared_caches: Dict[Tuple[str, str], Tuple[str, LRUCache[Tuple[Any, float]]]] = {}
+_shared_caches_lock = Lock()
+
+
+def clear_shared_dataloader_caches():
+    with _shared_caches_lock:
+        _shared_caches.clear()
+
 
 class DataLoader(BaseLoader, Generic[K, R]):
     context_key: str
     context: SaleorContext
     database_connection_name: str
 
+    # Loaders of rarely changing reference data can share loaded values between
+    # requests of the process, by listing models as "app_label.ModelName". Shared
+    # values must not be modified. They are discarded when any of the models is
+    # saved or deleted, and after `shared_cache_timeout` seconds, which covers
+    # changes made without emitting signals, e.g. with `QuerySet.update`.
+    shared_cache_models: Tuple[str, ...] = ()
+    shared_cache_timeout: int = SHARED_CACHE_TIMEOUT
+    shared_cache_version: CacheVersion
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.shared_cache_models:
+            return
+        cls.shared_cache_version = CacheVersion(f"dataloader_version:{cls.context_key}")
+        for model in cls.shared_cache_models:
+            for signal in [post_save, post_delete]:
+                signal.connect(
+                    cls.shared_cache_version.invalidate,
+                    sender=model,
+                    weak=False,
+                    dispatch_uid=f"invalidate_{cls.context_key}_loader_{model}",
+                )
+
     def __new__(cls, context: SaleorContext):
         key = cls.context_key
         if key is None:
@@ -46,7 +96,10 @@ class DataLoader(BaseLoader, Generic[K, R]):
         ) as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "dataloaders")
-            results = self.batch_load(keys)
+            if self.uses_shared_cache():
+                results = self.batch_load_with_shared_cache(list(keys))
+            else:
+                results = self.batch_load(keys)
             if not isinstance(results, Promise):
                 return Promise.resolve(results)
             return results
@@ -54,6 +107,49 @@ class DataLoader(BaseLoader, Generic[K, R]):
     def batch_load(self, keys: Iterable[K]) -> Union[Promise[List[R]], List[R]]:
         raise NotImplementedError()
 
+    def uses_shared_cache(self) -> bool:
+        # Mutations disallow the replica and may modify loaded instances, so values
+        # are shared only between contexts that allow the replica.
+        return bool(self.shared_cache_models) and getattr(
+            self.context, "allow_replica", True
+        )
+
+    def get_shared_cache(self) -> LRUCache[Tuple[Any, float]]:
+        version = self.shared_cache_version.get()
+        cache_key = (self.context_key, self.database_connection_name)
+        with _shared_caches_lock:
+            cached = _shared_caches.get(cache_key)
+            if cached is None or cached[0] != version:
+                cached = (version, LRUCache(SHARED_CACHE_SIZE))
+                _shared_caches[cache_key] = cached
+        return cached[1]
+
+    def batch_load_with_shared_cache(
+        self, keys: List[K]
+    ) -> Union[Promise[List[R]], List[R]]:
+        shared_cache = self.get_shared_cache()
+        now = monotonic()
+        values: Dict[K, R] = {}
+        for key in keys:
+            cached = shared_cache.get(key)
+            if cached is not None and cached[1] > now:
+                values[key] = cached[0]
+        missing_keys = [key for key in keys if key not in values]
+        if not missing_keys:
+            return [values[key] for key in keys]
+
+        def store_loaded_values(loaded_values: List[R]) -> List[R]:
+            expires_at = monotonic() + self.shared_cache_timeout
+            for key, value in zip(missing_keys, loaded_values):
+                shared_cache.set(key, (value, expires_at))
+                values[key] = value
+            return [values[key] for key in keys]
+
+        results = self.batch_load(missing_keys)
+        if isinstance(results, Promise):
+            return results.then(store_loaded_values)
+        return store_loaded_values(results)
+
 
 class BaseThumbnailBySizeAndFormatLoader(
     DataLoader[Tuple[int, int, Optional[str]], Thumbnail]
@@ -0,0 +1,75 @@
+from unittest.mock import patch
+
+from ...channel.dataloaders import ChannelByIdLoader
+from .. import SaleorContext
+from ..dataloaders import SHARED_CACHE_TIMEOUT
+
+
+def _load_channel(channel_id, allow_replica=True):
+    context = SaleorContext()
+    context.allow_replica = allow_replica
+    return ChannelByIdLoader(context).load(channel_id).get()
+
+
+def test_shared_cache_reused_between_requests(channel_USD, django_assert_num_queries):
+    # given
+    _load_channel(channel_USD.pk)
+
+    # when
+    with django_assert_num_queries(0):
+        channel = _load_channel(channel_USD.pk)
+
+    # then
+    assert channel == channel_USD
+
+
+def test_shared_cache_invalidated_on_model_save(channel_USD):
+    # given
+    _load_channel(channel_USD.pk)
+
+    # when
+    channel_USD.name = "New name"
+    channel_USD.save(update_fields=["name"])
+
+    # then
+    assert _load_channel(channel_USD.pk).name == "New name"
+
+
+def test_shared_cache_invalidated_on_model_delete(channel_USD):
+    # given
+    channel_id = channel_USD.pk
+    _load_channel(channel_id)
+
+    # when
+    channel_USD.delete()
+
+    # then
+    assert _load_channel(channel_id) is None
+
+
+def test_shared_cache_expired(channel_USD, django_assert_num_queries):
+    # given
+    with patch("saleor.graphql.core.dataloaders.monotonic", return_value=0):
+        _load_channel(channel_USD.pk)
+
+    # when
+    with patch(
+        "saleor.graphql.core.dataloaders.monotonic",
+        return_value=SHARED_CACHE_TIMEOUT + 1,
+    ), django_assert_num_queries(1):
+        channel = _load_channel(channel_USD.pk)
+
+    # then
+    assert channel == channel_USD
+
+
+def test_shared_cache_not_used_without_replica(channel_USD, django_assert_num_queries):
+    # given
+    _load_channel(channel_USD.pk, allow_replica=False)
+
+    # when
+    with django_assert_num_queries(1):
+        channel = _load_channel(channel_USD.pk, allow_replica=False)
+
+    # then
+    assert channel == channel_USD
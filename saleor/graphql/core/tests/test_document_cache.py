@@ -0,0 +1,119 @@
+from unittest.mock import patch
+
+from graphql import get_default_backend
+
+from ...api import schema
+from ...document_cache import (
+    clear_document_cache,
+    get_document,
+    validate_cached_query_cost,
+)
+from ...query_cost_map import COST_MAP
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_PRODUCTS = """
+    query Products($first: Int, $channel: String) {
+        products(first: $first, channel: $channel) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+def test_get_document_parses_query_once():
+    # given
+    backend = get_default_backend()
+    clear_document_cache()
+    document = get_document(backend, schema, QUERY_PRODUCTS)
+
+    # when
+    with patch.object(backend, "document_from_string") as mocked_document_from_string:
+        cached_document = get_document(backend, schema, QUERY_PRODUCTS)
+
+    # then
+    mocked_document_from_string.assert_not_called()
+    assert cached_document is document
+
+
+def test_cached_document_validated_once(api_client, product, channel_USD):
+    # given
+    clear_document_cache()
+    variables = {"first": 10, "channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    with patch("saleor.graphql.document_cache.validate") as mocked_validate, patch(
+        "graphql.backend.core.validate"
+    ) as mocked_backend_validate:
+        response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"][0]["node"]["name"] == product.name
+    mocked_validate.assert_not_called()
+    mocked_backend_validate.assert_not_called()
+
+
+def test_cached_document_returns_validation_errors(api_client):
+    # given
+    query = "{ shop { invalidField } }"
+    clear_document_cache()
+    api_client.post_graphql(query, check_no_permissions=False)
+
+    # when
+    response = api_client.post_graphql(query, check_no_permissions=False)
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert "invalidField" in content["errors"][0]["message"]
+
+
+def test_validate_cached_query_cost_depends_on_cost_variables():
+    # given
+    clear_document_cache()
+    document = get_document(get_default_backend(), schema, QUERY_PRODUCTS)
+    cost, _ = validate_cached_query_cost(
+        schema, document, {"first": 10, "channel": "a"}, COST_MAP, 50000
+    )
+    assert document.cost_variables == {"first"}
+
+    # when
+    with patch(
+        "saleor.graphql.document_cache.run_cost_validator"
+    ) as mocked_run_cost_validator:
+        cached_cost, errors = validate_cached_query_cost(
+            schema, document, {"first": 10, "channel": "b"}, COST_MAP, 50000
+        )
+
+    # then
+    mocked_run_cost_validator.assert_not_called()
+    assert cached_cost == cost
+    assert errors is None
+    new_cost, _ = validate_cached_query_cost(
+        schema, document, {"first": 20, "channel": "a"}, COST_MAP, 50000
+    )
+    assert new_cost == cost * 2
+
+
+def test_validate_cached_query_cost_exceeded_for_cached_cost():
+    # given
+    clear_document_cache()
+    document = get_document(get_default_backend(), schema, QUERY_PRODUCTS)
+    variables = {"first": 10}
+    cost, _ = validate_cached_query_cost(schema, document, variables, COST_MAP, 50000)
+
+    # when
+    cached_cost, errors = validate_cached_query_cost(
+        schema, document, variables, COST_MAP, 1
+    )
+
+    # then
+    assert cached_cost == cost
+    assert errors[0].message == (
+        f"The query exceeds the maximum cost of 1. Actual cost is {cost}"
+    )
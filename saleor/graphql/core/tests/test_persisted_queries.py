@@ -0,0 +1,75 @@
+from ...document_cache import get_query_hash
+from ...persisted_queries import PERSISTED_QUERY_NOT_FOUND
+from ...tests.fixtures import API_PATH
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_SHOP = "{ shop { name } }"
+
+
+def _get_persisted_query_data(query_hash, query=None, version=1):
+    data = {
+        "extensions": {"persistedQuery": {"version": version, "sha256Hash": query_hash}}
+    }
+    if query:
+        data["query"] = query
+    return data
+
+
+def test_persisted_query_not_found(client):
+    # given
+    data = _get_persisted_query_data(get_query_hash("{ shop { description } }"))
+
+    # when
+    response = client.post(API_PATH, data, content_type="application/json")
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == PERSISTED_QUERY_NOT_FOUND
+    assert content["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_registered_and_used(client, site_settings):
+    # given
+    query_hash = get_query_hash(QUERY_SHOP)
+    data = _get_persisted_query_data(query_hash, query=QUERY_SHOP)
+    response = client.post(API_PATH, data, content_type="application/json")
+    assert get_graphql_content(response)["data"]["shop"]["name"]
+
+    # when
+    data = _get_persisted_query_data(query_hash)
+    response = client.post(API_PATH, data, content_type="application/json")
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_hash_mismatch(client):
+    # given
+    data = _get_persisted_query_data(get_query_hash("{ shop { description } }"))
+    data["query"] = QUERY_SHOP
+
+    # when
+    response = client.post(API_PATH, data, content_type="application/json")
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match the query."
+    )
+
+
+def test_persisted_query_unsupported_version(client):
+    # given
+    data = _get_persisted_query_data(
+        get_query_hash(QUERY_SHOP), query=QUERY_SHOP, version=2
+    )
+
+    # when
+    response = client.post(API_PATH, data, content_type="application/json")
+
+    # then
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Unsupported persisted query version."
@@ -0,0 +1,176 @@
+import pytest
+from graphql import get_default_backend
+
+from ....core.cache_tags import (
+    CacheTag,
+    connect_cache_tags_signals,
+    disconnect_cache_tags_signals,
+)
+from ....product.models import Product, ProductChannelListing
+from ....product.utils.variant_prices import update_products_discounted_price
+from ...api import schema
+from ...document_cache import get_document
+from ...response_cache import get_cache_tags
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCTS = """
+    query Products($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.parametrize(
+    "query,operation_name,tags",
+    [
+        (QUERY_PRODUCTS, None, {CacheTag.PRODUCT}),
+        (
+            "{ categories(first: 1) { edges { node { products(first: 1) "
+            "{ edges { node { name } } } } } } }",
+            None,
+            {CacheTag.CATEGORY, CacheTag.PRODUCT},
+        ),
+        (
+            "fragment Item on MenuItem { category { name } } "
+            "{ menu(slug: $slug) { items { ...Item } } }",
+            None,
+            {CacheTag.MENU, CacheTag.CATEGORY},
+        ),
+        (
+            "query Menu { menus(first: 1) { edges { node { name } } } } "
+            "query Me { me { email } }",
+            "Menu",
+            {CacheTag.MENU},
+        ),
+        ("{ __typename }", None, set()),
+        ("query Me { me { email } }", None, None),
+        ("{ products(first: 1) { totalCount } me { email } }", None, None),
+        ("mutation { tokenRefresh { token } }", None, None),
+        (f"{QUERY_PRODUCTS} query Me {{ me {{ email }} }}", None, None),
+    ],
+)
+def test_get_cache_tags(query, operation_name, tags):
+    # given
+    document = get_document(get_default_backend(), schema, query)
+
+    # when
+    result = get_cache_tags(document, operation_name)
+
+    # then
+    assert result == (frozenset(tags) if tags is not None else None)
+
+
+def _get_product_names(response):
+    content = get_graphql_content(response)
+    return [edge["node"]["name"] for edge in content["data"]["products"]["edges"]]
+
+
+def test_anonymous_catalog_query_response_cached(
+    settings, api_client, product, channel_USD
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    variables = {"channel": channel_USD.slug}
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+    assert _get_product_names(response) == [product.name]
+
+    # when
+    Product.objects.filter(pk=product.pk).update(name="New name")
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert _get_product_names(response) == [product.name]
+
+
+@pytest.fixture
+def cache_tags_signals():
+    connect_cache_tags_signals()
+    yield
+    disconnect_cache_tags_signals()
+
+
+def test_anonymous_catalog_query_response_invalidated_by_model_change(
+    settings, api_client, product, channel_USD, cache_tags_signals
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    product.name = "New name"
+    product.save(update_fields=["name"])
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert _get_product_names(response) == ["New name"]
+
+
+def test_anonymous_catalog_query_response_invalidated_by_bulk_update(
+    settings, api_client, product, channel_USD
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+    Product.objects.filter(pk=product.pk).update(name="New name")
+    ProductChannelListing.objects.filter(product=product).update(
+        discounted_price_amount=0
+    )
+
+    # when
+    update_products_discounted_price([product])
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert _get_product_names(response) == ["New name"]
+
+
+def test_anonymous_catalog_query_response_cached_per_variables(
+    settings, api_client, product, channel_USD, channel_PLN
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+    assert _get_product_names(response) == [product.name]
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_PLN.slug})
+
+    # then
+    assert _get_product_names(response) == []
+
+
+def test_authenticated_query_response_not_cached(
+    settings, staff_api_client, product, channel_USD
+):
+    # given
+    settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT = 60
+    variables = {"channel": channel_USD.slug}
+    staff_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    Product.objects.filter(pk=product.pk).update(name="New name")
+    response = staff_api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert _get_product_names(response) == ["New name"]
+
+
+def test_catalog_query_response_not_cached_by_default(api_client, product, channel_USD):
+    # given
+    variables = {"channel": channel_USD.slug}
+    api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # when
+    Product.objects.filter(pk=product.pk).update(name="New name")
+    response = api_client.post_graphql(QUERY_PRODUCTS, variables)
+
+    # then
+    assert _get_product_names(response) == ["New name"]
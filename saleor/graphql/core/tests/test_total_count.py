@@ -0,0 +1,200 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from ....order.models import Order
+from ...tests.utils import get_graphql_content
+from ..total_count import (
+    TotalCount,
+    TotalCountStrategy,
+    estimate_count,
+    get_total_count,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_total_count_cache():
+    cache.clear()
+
+
+def test_get_total_count_without_strategy(order_list):
+    # when
+    total_count = get_total_count(Order.objects.all())
+
+    # then
+    assert total_count == TotalCount(len(order_list), True)
+
+
+def test_get_total_count_served_from_cache(order_list):
+    # given
+    qs = Order.objects.all()
+    strategy = TotalCountStrategy(cache_timeout=60)
+    get_total_count(qs, strategy)
+    order_list[0].delete()
+
+    # when
+    total_count = get_total_count(qs, strategy)
+
+    # then
+    assert total_count == TotalCount(len(order_list), False)
+
+
+def test_get_total_count_cached_separately_for_different_filters(order_list):
+    # given
+    strategy = TotalCountStrategy(cache_timeout=60)
+    get_total_count(Order.objects.all(), strategy)
+
+    # when
+    total_count = get_total_count(Order.objects.filter(pk=order_list[0].pk), strategy)
+
+    # then
+    assert total_count == TotalCount(1, True)
+
+
+def test_get_total_count_for_query_without_results(order_list):
+    # given
+    strategy = TotalCountStrategy(cache_timeout=60, estimate_threshold=1)
+
+    # when
+    total_count = get_total_count(Order.objects.filter(pk__in=[]), strategy)
+
+    # then
+    assert total_count == TotalCount(0, True)
+
+
+@mock.patch("saleor.graphql.core.total_count.estimate_count")
+def test_get_total_count_estimated_above_threshold(mocked_estimate_count, order_list):
+    # given
+    mocked_estimate_count.return_value = 5000
+
+    # when
+    total_count = get_total_count(
+        Order.objects.all(), TotalCountStrategy(estimate_threshold=1000)
+    )
+
+    # then
+    assert total_count == TotalCount(5000, False)
+
+
+@mock.patch("saleor.graphql.core.total_count.estimate_count")
+def test_get_total_count_exact_below_threshold(mocked_estimate_count, order_list):
+    # given
+    mocked_estimate_count.return_value = 10
+
+    # when
+    total_count = get_total_count(
+        Order.objects.all(), TotalCountStrategy(estimate_threshold=1000)
+    )
+
+    # then
+    assert total_count == TotalCount(len(order_list), True)
+
+
+def test_get_total_count_strategy_uses_settings(settings, order_list):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = 60
+    qs = Order.objects.all()
+    get_total_count(qs, TotalCountStrategy())
+    order_list[0].delete()
+
+    # when
+    total_count = get_total_count(qs, TotalCountStrategy())
+
+    # then
+    assert total_count == TotalCount(len(order_list), False)
+
+
+def test_estimate_count(order_list):
+    # when
+    estimated_count = estimate_count(Order.objects.all())
+
+    # then
+    assert isinstance(estimated_count, int)
+
+
+ORDERS_TOTAL_COUNT_QUERY = """
+    query {
+        orders(first: 1) {
+            totalCount
+            totalCountIsExact
+        }
+    }
+"""
+
+
+def test_estimate_count_for_query_without_results(order_list):
+    # when
+    estimated_count = estimate_count(Order.objects.filter(pk__in=[]))
+
+    # then
+    assert estimated_count == 0
+
+
+@mock.patch("saleor.graphql.core.total_count.estimate_count")
+def test_orders_total_count_estimated(
+    mocked_estimate_count,
+    settings,
+    staff_api_client,
+    permission_group_manage_orders,
+    order_list,
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 1000
+    mocked_estimate_count.return_value = 5000
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+
+    # when
+    response = staff_api_client.post_graphql(ORDERS_TOTAL_COUNT_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["orders"] == {"totalCount": 5000, "totalCountIsExact": False}
+
+
+def test_orders_total_count_exact(
+    staff_api_client, permission_group_manage_orders, order_list
+):
+    # given
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+
+    # when
+    response = staff_api_client.post_graphql(ORDERS_TOTAL_COUNT_QUERY)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["orders"] == {
+        "totalCount": len(order_list),
+        "totalCountIsExact": True,
+    }
+
+
+PRODUCTS_TOTAL_COUNT_QUERY = """
+    query ($channel: String, $filter: ProductFilterInput) {
+        products(first: 10, channel: $channel, filter: $filter) {
+            totalCount
+            totalCountIsExact
+        }
+    }
+"""
+
+
+def test_products_total_count_with_filter_without_results(
+    settings, api_client, product, color_attribute, channel_USD
+):
+    # given
+    settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = 60
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 1
+    variables = {
+        "channel": channel_USD.slug,
+        "filter": {
+            "attributes": [{"slug": color_attribute.slug, "values": ["no-such-slug"]}]
+        },
+    }
+
+    # when
+    response = api_client.post_graphql(PRODUCTS_TOTAL_COUNT_QUERY, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["products"] == {"totalCount": 0, "totalCountIsExact": True}
@@ -1,3 +1,4 @@
+import threading
 from unittest import mock
 
 import graphene
@@ -8,9 +9,11 @@ from graphql.execution.base import ExecutionResult
 from .... import __version__ as saleor_version
 from ....demo.views import EXAMPLE_QUERY
 from ....graphql.utils import INTERNAL_ERROR_MESSAGE
+from ...api import schema
+from ...document_cache import clear_document_cache
 from ...tests.fixtures import API_PATH
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
-from ...views import generate_cache_key
+from ...views import GraphQLView, generate_cache_key
 
 
 def test_batch_queries(category, product, api_client, channel_USD):
@@ -142,6 +145,7 @@ def test_graphql_execution_exception(monkeypatch, api_client):
     def mocked_execute(*args, **kwargs):
         raise IOError("Spanish inquisition")
 
+    clear_document_cache()
     monkeypatch.setattr("graphql.backend.core.execute_and_validate", mocked_execute)
     response = api_client.post_graphql("{ shop { name }}")
     assert response.status_code == 400
@@ -286,10 +290,10 @@ query IntrospectionQuery {
 INTROSPECTION_RESULT = {"__schema": {"queryType": {"name": "Query"}}}
 
 
-@mock.patch("saleor.graphql.views.cache.set")
-@mock.patch("saleor.graphql.views.cache.get")
+@mock.patch("saleor.graphql.views.cache")
 @override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
-def test_introspection_query_is_cached(cache_get_mock, cache_set_mock, api_client):
+def test_introspection_query_is_cached(cache_mock, api_client):
+    cache_get_mock, cache_set_mock = cache_mock.get, cache_mock.set
     cache_get_mock.return_value = None
     cache_key = generate_cache_key(INTROSPECTION_QUERY)
     response = api_client.post_graphql(INTROSPECTION_QUERY)
@@ -301,12 +305,10 @@ def test_introspection_query_is_cached(cache_get_mock, cache_set_mock, api_clien
     )
 
 
-@mock.patch("saleor.graphql.views.cache.set")
-@mock.patch("saleor.graphql.views.cache.get")
+@mock.patch("saleor.graphql.views.cache")
 @override_settings(DEBUG=False, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
-def test_introspection_query_is_cached_only_once(
-    cache_get_mock, cache_set_mock, api_client
-):
+def test_introspection_query_is_cached_only_once(cache_mock, api_client):
+    cache_get_mock, cache_set_mock = cache_mock.get, cache_mock.set
     cache_get_mock.return_value = ExecutionResult(data=INTROSPECTION_RESULT)
     cache_key = generate_cache_key(INTROSPECTION_QUERY)
     response = api_client.post_graphql(INTROSPECTION_QUERY)
@@ -316,12 +318,10 @@ def test_introspection_query_is_cached_only_once(
     cache_set_mock.assert_not_called()
 
 
-@mock.patch("saleor.graphql.views.cache.set")
-@mock.patch("saleor.graphql.views.cache.get")
+@mock.patch("saleor.graphql.views.cache")
 @override_settings(DEBUG=True, OBSERVABILITY_REPORT_ALL_API_CALLS=False)
-def test_introspection_query_is_not_cached_in_debug_mode(
-    cache_get_mock, cache_set_mock, api_client
-):
+def test_introspection_query_is_not_cached_in_debug_mode(cache_mock, api_client):
+    cache_get_mock, cache_set_mock = cache_mock.get, cache_mock.set
     response = api_client.post_graphql(INTROSPECTION_QUERY)
     content = get_graphql_content(response)
     assert content["data"] == INTROSPECTION_RESULT
@@ -332,3 +332,115 @@ def test_introspection_query_is_not_cached_in_debug_mode(
 def test_generate_cache_key_use_saleor_version():
     cache_key = generate_cache_key(INTROSPECTION_QUERY)
     assert saleor_version in cache_key
+
+
+QUERY_SHOP_NAME = "query ShopName { shop { name } }"
+QUERY_SHOP_DOMAIN = "query ShopDomain { shop { domain { host } } }"
+MUTATION_SHOP_UPDATE = (
+    "mutation ShopUpdate { shopDomainUpdate(input: {}) { errors { field } } }"
+)
+
+
+@pytest.fixture
+def mocked_execute_graphql_request(monkeypatch):
+    executed = []
+
+    def execute_graphql_request(self, request, data):
+        executed.append((data["query"], threading.get_ident()))
+        return ExecutionResult(data={"query": data["query"]})
+
+    monkeypatch.setattr(GraphQLView, "execute_graphql_request", execute_graphql_request)
+    return executed
+
+
+def test_batch_queries_executed_concurrently(
+    settings, api_client, mocked_execute_graphql_request
+):
+    # given
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 2
+    data = [{"query": QUERY_SHOP_NAME}, {"query": QUERY_SHOP_DOMAIN}]
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content(response)
+    assert [entry["data"]["query"] for entry in content] == [
+        QUERY_SHOP_NAME,
+        QUERY_SHOP_DOMAIN,
+    ]
+    assert all(
+        thread_id != threading.get_ident()
+        for _, thread_id in mocked_execute_graphql_request
+    )
+
+
+def test_batch_mutations_executed_sequentially(
+    settings, api_client, mocked_execute_graphql_request
+):
+    # given
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 2
+    data = [
+        {"query": QUERY_SHOP_NAME},
+        {"query": QUERY_SHOP_DOMAIN},
+        {"query": MUTATION_SHOP_UPDATE},
+        {"query": QUERY_SHOP_NAME},
+    ]
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content(response)
+    assert [entry["data"]["query"] for entry in content] == [
+        entry["query"] for entry in data
+    ]
+    executed_threads = [thread_id for _, thread_id in mocked_execute_graphql_request]
+    assert executed_threads[0] != threading.get_ident()
+    assert executed_threads[1] != threading.get_ident()
+    assert executed_threads[2:] == [threading.get_ident()] * 2
+
+
+def test_batch_queries_executed_sequentially_by_default(
+    api_client, mocked_execute_graphql_request
+):
+    # given
+    data = [{"query": QUERY_SHOP_NAME}, {"query": QUERY_SHOP_DOMAIN}]
+
+    # when
+    response = api_client.post(data)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content) == 2
+    assert [thread_id for _, thread_id in mocked_execute_graphql_request] == [
+        threading.get_ident()
+    ] * 2
+
+
+@pytest.mark.parametrize(
+    "data,is_query",
+    [
+        ({"query": QUERY_SHOP_NAME}, True),
+        ({"query": MUTATION_SHOP_UPDATE}, False),
+        ({"query": f"{QUERY_SHOP_NAME} {MUTATION_SHOP_UPDATE}"}, False),
+        (
+            {
+                "query": f"{QUERY_SHOP_NAME} {MUTATION_SHOP_UPDATE}",
+                "operationName": "ShopName",
+            },
+            True,
+        ),
+        ({"query": "query { invalid"}, False),
+        ({"query": None}, False),
+    ],
+)
+def test_is_query_operation(data, is_query, rf):
+    # given
+    request = rf.post(API_PATH, content_type="application/json")
+
+    # when
+    result = GraphQLView(schema=schema).is_query_operation(request, data)
+
+    # then
+    assert result is is_query
@@ -0,0 +1,113 @@
+"""Total count of items in connections which are expensive to count exactly.
+
+Connections declaring a `total_count_strategy` can serve `totalCount` from a cache
+or from PostgreSQL planner estimates instead of running `COUNT(*)` with all the
+filters on every request. The cache key is built from the SQL of the counted
+queryset, so querysets restricted differently, e.g. by channel or permissions, are
+never served each other's counts. Counts served from cache or estimated are
+reported as not exact.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import QuerySet
+
+TOTAL_COUNT_CACHE_KEY = "connection_total_count"
+
+
+@dataclass(frozen=True)
+class TotalCountStrategy:
+    """Define how the total count of a connection is resolved.
+
+    Values left as `None` fall back to the `GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT` and
+    `GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD` settings; zero disables the feature.
+    """
+
+    # Number of seconds to keep counts in cache.
+    cache_timeout: Optional[int] = None
+    # Number of rows estimated by the planner above which the estimate is returned
+    # instead of the exact count.
+    estimate_threshold: Optional[int] = None
+
+    def get_cache_timeout(self) -> int:
+        if self.cache_timeout is not None:
+            return self.cache_timeout
+        return settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT
+
+    def get_estimate_threshold(self) -> int:
+        if self.estimate_threshold is not None:
+            return self.estimate_threshold
+        return settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD
+
+
+class TotalCount(NamedTuple):
+    count: int
+    is_exact: bool
+
+
+def _get_cache_key(qs: QuerySet) -> str:
+    sql, params = qs.query.sql_with_params()
+    query_hash = hashlib.md5(f"{sql}:{params!r}".encode("utf-8")).hexdigest()
+    return f"{TOTAL_COUNT_CACHE_KEY}:{qs.model._meta.label_lower}:{query_hash}"
+
+
+def estimate_count(qs: QuerySet) -> Optional[int]:
+    """Return the number of rows the PostgreSQL planner expects the query to return.
+
+    Return `None` when not using PostgreSQL.
+    """
+    connection = connections[qs.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = qs.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_total_count(
+    qs: QuerySet, strategy: Optional[TotalCountStrategy] = None
+) -> TotalCount:
+    """Count items of the queryset according to the strategy."""
+    if strategy is None or qs.query.is_empty():
+        return TotalCount(qs.count(), True)
+
+    qs = qs.order_by()
+    try:
+        # filters which can't match any row, e.g. `id__in=[]`, are only detected
+        # when the query is compiled
+        qs.query.sql_with_params()
+    except EmptyResultSet:
+        return TotalCount(0, True)
+
+    cache_timeout = strategy.get_cache_timeout()
+    cache_key = _get_cache_key(qs) if cache_timeout else None
+    if cache_key:
+        cached_count = cache.get(cache_key)
+        if cached_count is not None:
+            return TotalCount(cached_count, False)
+
+    total_count = None
+    estimate_threshold = strategy.get_estimate_threshold()
+    if estimate_threshold:
+        estimated_count = estimate_count(qs)
+        if estimated_count is not None and estimated_count >= estimate_threshold:
+            total_count = TotalCount(estimated_count, False)
+    if total_count is None:
+        total_count = TotalCount(qs.count(), True)
+
+    if cache_key:
+        cache.set(cache_key, total_count.count, timeout=cache_timeout)
+    return total_count
@@ -1,6 +1,6 @@
 from functools import reduce
 from operator import add, mul
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from graphql import (
     GraphQLError,
@@ -15,7 +15,10 @@ from graphql.language.ast import (
     FragmentDefinition,
     FragmentSpread,
     InlineFragment,
+    ListValue,
+    ObjectValue,
     OperationDefinition,
+    Variable,
 )
 from graphql.type import GraphQLField
 from graphql.validation import validate
@@ -56,6 +59,8 @@ class CostValidator(ValidationRule):
         self.default_complexity = default_complexity
         self.cost = 0
         self.operation_multipliers: List[Any] = []
+        # Names of the variables that the cost depends on.
+        self.cost_variables: Set[str] = set()
 
     def __call__(self, context: ValidationContext):
         self.context = context
@@ -175,11 +180,18 @@ class CostValidator(ValidationRule):
             return None
         cost_args = cost_args.copy()
         if "multipliers" in cost_args:
+            self.collect_cost_variables(node, cost_args["multipliers"])
             cost_args["multipliers"] = self.get_multipliers_from_string(
                 cost_args["multipliers"], field_args
             )
         return cost_args
 
+    def collect_cost_variables(self, node: Field, multipliers: List[str]):
+        argument_names = {multiplier.split(".")[0] for multiplier in multipliers}
+        for argument in node.arguments:
+            if argument.name.value in argument_names:
+                self.cost_variables.update(get_variable_names(argument.value))
+
     def get_multipliers_from_string(self, multipliers: List[str], field_args):
         accessors = [s.split(".") for s in multipliers]
         multipliers: Any = []
@@ -198,15 +210,7 @@ class CostValidator(ValidationRule):
         return [m for m in multipliers if m > 0]
 
     def get_cost_exceeded_error(self) -> "QueryCostError":
-        return QueryCostError(
-            cost_analysis_message(self.maximum_cost, self.cost),
-            extensions={
-                "cost": {
-                    "requestedQueryCost": self.cost,
-                    "maximumAvailable": self.maximum_cost,
-                }
-            },
-        )
+        return get_cost_exceeded_error(self.maximum_cost, self.cost)
 
     def enter(
         self,
@@ -256,6 +260,17 @@ def validate_cost_map(cost_map: Dict[str, Dict[str, Any]], schema: GraphQLSchema
                 )
 
 
+def get_variable_names(value: Any) -> Set[str]:
+    """Return names of the variables used in the argument value."""
+    if isinstance(value, Variable):
+        return {value.name.value}
+    if isinstance(value, ObjectValue):
+        return set().union(*(get_variable_names(field.value) for field in value.fields))
+    if isinstance(value, ListValue):
+        return set().union(*(get_variable_names(item) for item in value.values))
+    return set()
+
+
 def report_error(context: ValidationContext, error: Exception):
     context.report_error(GraphQLError(str(error)))
 
@@ -270,6 +285,18 @@ class QueryCostError(GraphQLError):
     pass
 
 
+def get_cost_exceeded_error(maximum_cost: int, cost: int) -> QueryCostError:
+    return QueryCostError(
+        cost_analysis_message(maximum_cost, cost),
+        extensions={
+            "cost": {
+                "requestedQueryCost": cost,
+                "maximumAvailable": maximum_cost,
+            }
+        },
+    )
+
+
 def cost_validator(
     maximum_cost: int,
     *,
@@ -287,23 +314,36 @@ def cost_validator(
     )
 
 
-def validate_query_cost(
+def run_cost_validator(
     schema,
     query,
     variables,
     cost_map,
     maximum_cost,
-):
+) -> Tuple[CostValidator, List[GraphQLError]]:
     validator = cost_validator(
         maximum_cost,
         variables=variables,
         cost_map=cost_map,
     )
-    error = validate(
+    errors = validate(
         schema,
         query.document_ast,
         [validator],  # type: ignore[list-item] # cost validator is an instance that pretends to be a class # noqa: E501
     )
+    return validator, errors
+
+
+def validate_query_cost(
+    schema,
+    query,
+    variables,
+    cost_map,
+    maximum_cost,
+):
+    validator, error = run_cost_validator(
+        schema, query, variables, cost_map, maximum_cost
+    )
     if error:
         return validator.cost, error
     return validator.cost, None
@@ -0,0 +1,109 @@
+import hashlib
+import json
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from graphql import GraphQLDocument, validate
+from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult
+
+from ..core.utils.lru import LRUCache
+from .core.validators.query_cost import (
+    QueryCostError,
+    get_cost_exceeded_error,
+    run_cost_validator,
+)
+
+DOCUMENT_CACHE_SIZE = 1000
+QUERY_COST_CACHE_SIZE = 100
+
+
+class CachedGraphQLDocument(GraphQLDocument):
+    """Parsed document kept between requests.
+
+    The document is validated against the schema only on the first execution.
+    Query costs are remembered for values of the variables that the cost depends
+    on, e.g. the `first` argument of connections; other variables don't affect it.
+    """
+
+    def __init__(self, document: GraphQLDocument):
+        super().__init__(
+            schema=document.schema,
+            document_string=document.document_string,
+            document_ast=document.document_ast,
+            execute=self.execute_validated,
+        )
+        self._execute = document.execute
+        self.validation_errors: Optional[List[GraphQLError]] = None
+        self.cost_variables: Optional[FrozenSet[str]] = None
+        self.query_costs: LRUCache[int] = LRUCache(QUERY_COST_CACHE_SIZE)
+
+    def execute_validated(self, *args, **kwargs):
+        if self.validation_errors is None:
+            self.validation_errors = validate(self.schema, self.document_ast)
+        if self.validation_errors:
+            return ExecutionResult(errors=self.validation_errors, invalid=True)
+        return self._execute(*args, validate=False, **kwargs)
+
+
+_documents: LRUCache[CachedGraphQLDocument] = LRUCache(DOCUMENT_CACHE_SIZE)
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+def get_document(backend, schema, query: str) -> CachedGraphQLDocument:
+    """Return the parsed document for the query.
+
+    Raises the same errors as the backend's `document_from_string` when the query
+    can't be parsed; such queries are not cached.
+    """
+    key = get_query_hash(query)
+    document = _documents.get(key)
+    if document is None or document.schema is not schema:
+        document = CachedGraphQLDocument(backend.document_from_string(schema, query))
+        _documents.set(key, document)
+    return document
+
+
+def clear_document_cache():
+    _documents.clear()
+
+
+def _get_query_cost_key(
+    cost_variables: FrozenSet[str], variables: Optional[Dict[str, Any]]
+) -> Tuple[Tuple[str, str], ...]:
+    variables = variables if isinstance(variables, dict) else {}
+    return tuple(
+        (name, json.dumps(variables.get(name), sort_keys=True, default=str))
+        for name in sorted(cost_variables)
+    )
+
+
+def validate_cached_query_cost(
+    schema,
+    document: CachedGraphQLDocument,
+    variables,
+    cost_map,
+    maximum_cost,
+) -> Tuple[int, Optional[List[GraphQLError]]]:
+    """Return the query cost, computing it only for new values of cost variables."""
+    if document.cost_variables is not None:
+        key = _get_query_cost_key(document.cost_variables, variables)
+        cost = document.query_costs.get(key)
+        if cost is not None:
+            if cost > maximum_cost:
+                return cost, [get_cost_exceeded_error(maximum_cost, cost)]
+            return cost, None
+
+    validator, errors = run_cost_validator(
+        schema, document, variables, cost_map, maximum_cost
+    )
+    # Other errors, e.g. invalid values of variables, are not cached, so they're
+    # reported again for the next requests.
+    if all(isinstance(error, QueryCostError) for error in errors):
+        cost_variables = frozenset(validator.cost_variables)
+        document.cost_variables = cost_variables
+        key = _get_query_cost_key(cost_variables, variables)
+        document.query_costs.set(key, validator.cost)
+    return validator.cost, errors or None
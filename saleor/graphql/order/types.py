@@ -82,6 +82,7 @@ from ..core.enums import LanguageCodeEnum
 from ..core.fields import PermissionsField
 from ..core.mutations import validation_error_to_error_type
 from ..core.scalars import PositiveDecimal
+from ..core.total_count import TotalCountStrategy
 from ..core.tracing import traced_resolver
 from ..core.types import (
     BaseObjectType,
@@ -2197,3 +2198,4 @@ class OrderCountableConnection(CountableConnection):
     class Meta:
         doc_category = DOC_CATEGORY_ORDERS
         node = Order
+        total_count_strategy = TotalCountStrategy()
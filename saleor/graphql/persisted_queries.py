@@ -0,0 +1,58 @@
+from typing import Any, Optional
+
+from django.core.cache import cache
+from graphql.error import GraphQLError
+from pytimeparse import parse
+
+from .document_cache import get_query_hash
+
+PERSISTED_QUERY_CACHE_KEY = "persisted_query"
+PERSISTED_QUERY_CACHE_TIMEOUT = parse("7 days")
+PERSISTED_QUERY_VERSION = 1
+
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+
+
+class PersistedQueryError(GraphQLError):
+    pass
+
+
+def _get_cache_key(query_hash: str) -> str:
+    return f"{PERSISTED_QUERY_CACHE_KEY}:{query_hash}"
+
+
+def get_persisted_query(query: Optional[str], extensions: Any) -> Optional[str]:
+    """Resolve the query sent with the automatic persisted queries protocol.
+
+    Clients send the SHA-256 hash of the query in the `persistedQuery` extension
+    instead of the query itself. When the hash is unknown, the
+    `PersistedQueryNotFound` error is returned and the client retries the request
+    with both the query and its hash, which stores the query for next requests.
+    Requests without the extension are returned unchanged.
+    """
+    if not isinstance(extensions, dict) or not extensions.get("persistedQuery"):
+        return query
+
+    persisted_query = extensions["persistedQuery"]
+    if (
+        not isinstance(persisted_query, dict)
+        or persisted_query.get("version") != PERSISTED_QUERY_VERSION
+    ):
+        raise PersistedQueryError("Unsupported persisted query version.")
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        raise PersistedQueryError("Persisted query hash is missing.")
+
+    if not query:
+        query = cache.get(_get_cache_key(query_hash))
+        if query is None:
+            raise PersistedQueryError(
+                PERSISTED_QUERY_NOT_FOUND,
+                extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+            )
+        return query
+
+    if not isinstance(query, str) or get_query_hash(query) != query_hash:
+        raise PersistedQueryError("Provided sha256Hash does not match the query.")
+    cache.set(_get_cache_key(query_hash), query, timeout=PERSISTED_QUERY_CACHE_TIMEOUT)
+    return query
@@ -131,6 +131,7 @@ class ProductChannelListingByProductIdAndChannelSlugLoader(
 
 class ProductTypeByIdLoader(DataLoader[int, ProductType]):
     context_key = "product_type_by_id"
+    shared_cache_models = ("product.ProductType",)
 
     def batch_load(self, keys):
         product_types = ProductType.objects.using(
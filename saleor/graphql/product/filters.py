@@ -6,21 +6,14 @@ from typing import DefaultDict, Dict, List, Optional, TypedDict
 import django_filters
 import graphene
 import pytz
-from django.db.models import Exists, FloatField, OuterRef, Q, Subquery, Sum
+from django.db.models import Exists, F, FloatField, OuterRef, Q, Subquery, Sum
 from django.db.models.expressions import ExpressionWrapper
 from django.db.models.fields import IntegerField
-from django.db.models.functions import Cast, Coalesce
+from django.db.models.functions import Cast
 from django.utils import timezone
 
 from ...attribute import AttributeInputType
-from ...attribute.models import (
-    AssignedProductAttribute,
-    AssignedProductAttributeValue,
-    AssignedVariantAttribute,
-    AssignedVariantAttributeValue,
-    Attribute,
-    AttributeValue,
-)
+from ...attribute.models import Attribute, AttributeValue, ProductAttributeValueIndex
 from ...channel.models import Channel
 from ...product import ProductTypeKind
 from ...product.models import (
@@ -34,7 +27,7 @@ from ...product.models import (
     ProductVariantChannelListing,
 )
 from ...product.search import search_products
-from ...warehouse.models import Allocation, Reservation, Stock, Warehouse
+from ...warehouse.models import Stock, Warehouse
 from ..channel.filters import get_channel_slug_from_filter_data
 from ..core.descriptions import ADDED_IN_38
 from ..core.doc_category import DOC_CATEGORY_PRODUCTS
@@ -207,63 +200,15 @@ def _clean_product_attributes_boolean_filter_input(filter_value, queries):
 def filter_products_by_attributes_values(qs, queries: T_PRODUCT_FILTER_QUERIES):
     filters = []
     for values in queries.values():
-        assigned_product_attribute_values = (
-            AssignedProductAttributeValue.objects.filter(value_id__in=values)
-        )
-        assigned_product_attributes = AssignedProductAttribute.objects.filter(
-            Exists(
-                assigned_product_attribute_values.filter(assignment_id=OuterRef("pk"))
-            )
-        )
-        product_attribute_filter = Q(
-            Exists(assigned_product_attributes.filter(product_id=OuterRef("pk")))
-        )
-
-        assigned_variant_attribute_values = (
-            AssignedVariantAttributeValue.objects.filter(value_id__in=values)
-        )
-        assigned_variant_attributes = AssignedVariantAttribute.objects.filter(
-            Exists(
-                assigned_variant_attribute_values.filter(assignment_id=OuterRef("pk"))
-            )
-        )
-        product_variants = ProductVariant.objects.filter(
-            Exists(assigned_variant_attributes.filter(variant_id=OuterRef("pk")))
-        )
-        variant_attribute_filter = Q(
-            Exists(product_variants.filter(product_id=OuterRef("pk")))
-        )
-
-        filters.append(product_attribute_filter | variant_attribute_filter)
+        product_values = ProductAttributeValueIndex.objects.filter(value_id__in=values)
+        filters.append(Exists(product_values.filter(product_id=OuterRef("pk"))))
 
     return qs.filter(*filters)
 
 
 def filter_products_by_attributes_values_qs(qs, values_qs):
-    assigned_product_attribute_values = AssignedProductAttributeValue.objects.filter(
-        value__in=values_qs
-    )
-    assigned_product_attributes = AssignedProductAttribute.objects.filter(
-        Exists(assigned_product_attribute_values.filter(assignment_id=OuterRef("pk")))
-    )
-    product_attribute_filter = Q(
-        Exists(assigned_product_attributes.filter(product_id=OuterRef("pk")))
-    )
-
-    assigned_variant_attribute_values = AssignedVariantAttributeValue.objects.filter(
-        value__in=values_qs
-    )
-    assigned_variant_attributes = AssignedVariantAttribute.objects.filter(
-        Exists(assigned_variant_attribute_values.filter(assignment_id=OuterRef("pk")))
-    )
-    product_variants = ProductVariant.objects.filter(
-        Exists(assigned_variant_attributes.filter(variant_id=OuterRef("pk")))
-    )
-    variant_attribute_filter = Q(
-        Exists(product_variants.filter(product_id=OuterRef("pk")))
-    )
-
-    return qs.filter(product_attribute_filter | variant_attribute_filter)
+    product_values = ProductAttributeValueIndex.objects.filter(value__in=values_qs)
+    return qs.filter(Exists(product_values.filter(product_id=OuterRef("pk"))))
 
 
 def filter_products_by_attributes(
@@ -358,30 +303,9 @@ def filter_products_by_collections(qs, collection_pks):
 
 
 def filter_products_by_stock_availability(qs, stock_availability, channel_slug):
-    allocations = (
-        Allocation.objects.values("stock_id")
-        .filter(quantity_allocated__gt=0, stock_id=OuterRef("pk"))
-        .values_list(Sum("quantity_allocated"))
-    )
-    allocated_subquery = Subquery(queryset=allocations, output_field=IntegerField())
-
-    reservations = (
-        Reservation.objects.values("stock_id")
-        .filter(
-            quantity_reserved__gt=0,
-            stock_id=OuterRef("pk"),
-            reserved_until__gt=timezone.now(),
-        )
-        .values_list(Sum("quantity_reserved"))
-    )
-    reservation_subquery = Subquery(queryset=reservations, output_field=IntegerField())
-
     stocks = (
         Stock.objects.for_channel_and_country(channel_slug)
-        .filter(
-            quantity__gt=Coalesce(allocated_subquery, 0)
-            + Coalesce(reservation_subquery, 0)
-        )
+        .filter(quantity__gt=F("quantity_allocated") + F("quantity_reserved"))
         .values("product_variant_id")
     )
     variants = ProductVariant.objects.filter(
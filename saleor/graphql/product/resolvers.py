@@ -1,11 +1,16 @@
-from django.db.models import Exists, OuterRef, Sum
+from collections import defaultdict
+from typing import Dict, List
 
+from django.db.models import Count, Exists, OuterRef, Sum
+
+from ...attribute.models import AttributeValue, ProductAttributeValueIndex
 from ...channel.models import Channel
 from ...order import OrderStatus
 from ...order.models import Order
 from ...permission.utils import has_one_of_permissions
 from ...product import models
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
+from ..attribute.resolvers import resolve_attributes
 from ..channel import ChannelQsContext
 from ..core import ResolveInfo
 from ..core.context import get_database_connection_name
@@ -99,6 +104,44 @@ def resolve_products(
     return ChannelQsContext(qs=qs, channel_slug=channel_slug)
 
 
+def resolve_attribute_facets(info: ResolveInfo, products, attribute_slugs):
+    """Count products with each value of given attributes in one pass over products."""
+    database_connection_name = get_database_connection_name(info.context)
+    attributes = list(
+        resolve_attributes(info)
+        .using(database_connection_name)
+        .filter(slug__in=attribute_slugs)
+    )
+    product_counts = dict(
+        ProductAttributeValueIndex.objects.using(database_connection_name)
+        .filter(
+            attribute_id__in=[attribute.pk for attribute in attributes],
+            product_id__in=products.values("pk"),
+        )
+        .values_list("value_id")
+        .annotate(Count("product_id"))
+        .order_by()
+    )
+    attribute_values: Dict[int, List[AttributeValue]] = defaultdict(list)
+    for value in AttributeValue.objects.using(database_connection_name).filter(
+        pk__in=product_counts.keys()
+    ):
+        attribute_values[value.attribute_id].append(value)
+
+    slug_order = {slug: index for index, slug in enumerate(attribute_slugs)}
+    attributes.sort(key=lambda attribute: slug_order[attribute.slug])
+    return [
+        {
+            "attribute": attribute,
+            "values": [
+                {"value": value, "count": product_counts[value.pk]}
+                for value in attribute_values[attribute.pk]
+            ],
+        }
+        for attribute in attributes
+    ]
+
+
 def resolve_product_type_by_id(id):
     return models.ProductType.objects.filter(pk=id).first()
 
@@ -1,6 +1,7 @@
 import graphene
 import pytest
 
+from .....plugins.snapshot import clear_plugins_snapshots
 from .....product.models import Collection
 from ....tests.utils import get_graphql_content
 
@@ -427,6 +428,7 @@ def test_collections_for_federation_query_count(
         ],
     }
 
+    clear_plugins_snapshots()
     with django_assert_num_queries(3):
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
@@ -442,6 +444,7 @@ def test_collections_for_federation_query_count(
         ],
     }
 
+    clear_plugins_snapshots()
     with django_assert_num_queries(3):
         response = api_client.post_graphql(query, variables)
         content = get_graphql_content(response)
@@ -0,0 +1,82 @@
+from .....attribute.models import AttributeValue
+from .....attribute.utils import associate_attribute_values_to_instance
+from ....tests.utils import get_graphql_content
+
+QUERY_PRODUCTS_ATTRIBUTE_FACETS = """
+    query ($channel: String, $filter: ProductFilterInput, $attributes: [String!]!) {
+        products(first: 1, channel: $channel, filter: $filter) {
+            attributeFacets(attributes: $attributes) {
+                attribute {
+                    slug
+                }
+                values {
+                    value {
+                        slug
+                    }
+                    count
+                }
+            }
+        }
+    }
+"""
+
+
+def _get_facets(response):
+    content = get_graphql_content(response)
+    return {
+        facet["attribute"]["slug"]: {
+            value["value"]["slug"]: value["count"] for value in facet["values"]
+        }
+        for facet in content["data"]["products"]["attributeFacets"]
+    }
+
+
+def test_products_attribute_facets(api_client, product_list, channel_USD):
+    # given
+    product = product_list[-1]
+    attribute = product.product_type.product_attributes.get()
+    blue = AttributeValue.objects.create(attribute=attribute, name="Blue", slug="blue")
+    associate_attribute_values_to_instance(product, attribute, blue)
+    variables = {"channel": channel_USD.slug, "attributes": [attribute.slug]}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_ATTRIBUTE_FACETS, variables)
+
+    # then
+    assert _get_facets(response) == {attribute.slug: {"red": 2, "blue": 1}}
+
+
+def test_products_attribute_facets_counted_for_filtered_products(
+    api_client, product_list, channel_USD
+):
+    # given
+    product = product_list[-1]
+    attribute = product.product_type.product_attributes.get()
+    blue = AttributeValue.objects.create(attribute=attribute, name="Blue", slug="blue")
+    associate_attribute_values_to_instance(product, attribute, blue)
+    variables = {
+        "channel": channel_USD.slug,
+        "attributes": [attribute.slug, "non-existing"],
+        "filter": {"attributes": [{"slug": attribute.slug, "values": ["blue"]}]},
+    }
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_ATTRIBUTE_FACETS, variables)
+
+    # then
+    assert _get_facets(response) == {attribute.slug: {"blue": 1}}
+
+
+def test_products_attribute_facets_of_variant_attributes(
+    api_client, product, channel_USD
+):
+    # given
+    attribute = product.product_type.variant_attributes.get()
+    value = attribute.values.get()
+    variables = {"channel": channel_USD.slug, "attributes": [attribute.slug]}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_ATTRIBUTE_FACETS, variables)
+
+    # then
+    assert _get_facets(response) == {attribute.slug: {value.slug: 1}}
@@ -1479,6 +1479,8 @@ def test_products_query_with_filter_stock_availability_as_staff(
         Allocation.objects.create(
             order_line=order_line, stock=stock, quantity_allocated=stock.quantity
         )
+        stock.quantity_allocated = stock.quantity
+        stock.save(update_fields=["quantity_allocated"])
     product = product_list[0]
     product.variants.first().channel_listings.filter(channel=channel_USD).update(
         price_amount=None
@@ -1538,6 +1540,11 @@ def test_products_query_with_filter_stock_availability_including_reservations(
             ),
         ]
     )
+    stocks[0].quantity_allocated = 50
+    stocks[0].save(update_fields=["quantity_allocated"])
+    Stock.objects.filter(
+        pk__in=[stock.pk for stock in stocks]
+    ).update_quantity_reserved()
     variables = {
         "filter": {"stockAvailability": "OUT_OF_STOCK"},
         "channel": channel_USD.slug,
@@ -1569,6 +1576,8 @@ def test_products_query_with_filter_stock_availability_as_user(
         Allocation.objects.create(
             order_line=order_line, stock=stock, quantity_allocated=stock.quantity
         )
+        stock.quantity_allocated = stock.quantity
+        stock.save(update_fields=["quantity_allocated"])
     product = product_list[0]
     product.variants.first().channel_listings.filter(channel=channel_USD).update(
         price_amount=None
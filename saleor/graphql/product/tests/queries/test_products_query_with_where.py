@@ -1094,6 +1094,8 @@ def test_products_filter_by_stock_availability(
         Allocation.objects.create(
             order_line=order_line, stock=stock, quantity_allocated=stock.quantity
         )
+        stock.quantity_allocated = stock.quantity
+        stock.save(update_fields=["quantity_allocated"])
     product_list.append(product)
 
     variables = {
@@ -1153,6 +1155,11 @@ def test_products_filter_by_stock_availability_including_reservations(
             ),
         ]
     )
+    stocks[0].quantity_allocated = 50
+    stocks[0].save(update_fields=["quantity_allocated"])
+    Stock.objects.filter(
+        pk__in=[stock.pk for stock in stocks]
+    ).update_quantity_reserved()
     variables = {
         "where": {"stockAvailability": "OUT_OF_STOCK"},
         "channel": channel_USD.slug,
@@ -1182,6 +1189,8 @@ def test_products_filter_by_stock_availability_as_user(
         Allocation.objects.create(
             order_line=order_line, stock=stock, quantity_allocated=stock.quantity
         )
+        stock.quantity_allocated = stock.quantity
+        stock.save(update_fields=["quantity_allocated"])
     product = product_list[0]
     product.variants.first().channel_listings.filter(channel=channel_USD).update(
         price_amount=None
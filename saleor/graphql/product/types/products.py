@@ -42,6 +42,7 @@ from ...attribute.types import (
     AssignedVariantAttribute,
     Attribute,
     AttributeCountableConnection,
+    AttributeFacet,
     SelectedAttribute,
 )
 from ...channel import ChannelContext, ChannelQsContext
@@ -58,6 +59,7 @@ from ...core.descriptions import (
     ADDED_IN_39,
     ADDED_IN_310,
     ADDED_IN_312,
+    ADDED_IN_316,
     DEPRECATED_IN_3X_FIELD,
     DEPRECATED_IN_3X_INPUT,
     RICH_CONTENT,
@@ -72,6 +74,7 @@ from ...core.fields import (
     PermissionsField,
 )
 from ...core.scalars import Date
+from ...core.total_count import TotalCountStrategy
 from ...core.tracing import traced_resolver
 from ...core.types import (
     BaseObjectType,
@@ -142,7 +145,11 @@ from ..dataloaders import (
     VariantsChannelListingByProductIdAndChannelSlugLoader,
 )
 from ..enums import ProductMediaType, ProductTypeKindEnum, VariantAttributeScope
-from ..resolvers import resolve_product_variants, resolve_products
+from ..resolvers import (
+    resolve_attribute_facets,
+    resolve_product_variants,
+    resolve_products,
+)
 from ..sorters import MediaSortingInput
 from .channels import ProductChannelListing, ProductVariantChannelListing
 from .digital_contents import DigitalContent
@@ -1577,9 +1584,30 @@ class Product(ChannelContextTypeWithMetadata[models.Product]):
 
 
 class ProductCountableConnection(CountableConnection):
+    attribute_facets = NonNullList(
+        AttributeFacet,
+        attributes=NonNullList(
+            graphene.String,
+            description="Slugs of the attributes to count the products for.",
+            required=True,
+        ),
+        description=(
+            "Numbers of products with each value of given attributes, counted among "
+            "all the products matching the filters." + ADDED_IN_316
+        ),
+    )
+
     class Meta:
         doc_category = DOC_CATEGORY_PRODUCTS
         node = Product
+        total_count_strategy = TotalCountStrategy()
+
+    @staticmethod
+    def resolve_attribute_facets(root, info, *, attributes):
+        queryset = getattr(root, "queryset", None)
+        if queryset is None:
+            return None
+        return resolve_attribute_facets(info, queryset, attributes)
 
 
 @federated_entity("id")
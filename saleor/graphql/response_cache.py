@@ -0,0 +1,166 @@
+import hashlib
+import json
+from typing import Dict, FrozenSet, Optional, Set
+
+from django.conf import settings
+from django.http import HttpRequest
+from graphql import GraphQLDocument
+from graphql.execution import ExecutionResult
+from graphql.language.ast import (
+    Field,
+    FragmentDefinition,
+    FragmentSpread,
+    InlineFragment,
+    OperationDefinition,
+)
+
+from .. import __version__ as saleor_version
+from ..core.auth import get_token_from_request
+from ..core.cache_tags import CacheTag, get_cache_tags_versions
+from .document_cache import get_query_hash
+
+RESPONSE_CACHE_KEY = "graphql_response"
+
+# Root fields of the anonymous queries that can be cached.
+CACHEABLE_ROOT_FIELDS = {
+    "__typename",
+    "categories",
+    "category",
+    "collection",
+    "collections",
+    "menu",
+    "menus",
+    "product",
+    "products",
+    "productVariant",
+    "productVariants",
+}
+
+# Cache tags of the data returned by the fields, both root and nested ones.
+FIELD_CACHE_TAGS = {
+    "ancestors": CacheTag.CATEGORY,
+    "categories": CacheTag.CATEGORY,
+    "category": CacheTag.CATEGORY,
+    "children": CacheTag.CATEGORY,
+    "parent": CacheTag.CATEGORY,
+    "collection": CacheTag.COLLECTION,
+    "collections": CacheTag.COLLECTION,
+    "menu": CacheTag.MENU,
+    "menus": CacheTag.MENU,
+    "product": CacheTag.PRODUCT,
+    "products": CacheTag.PRODUCT,
+    "productVariant": CacheTag.PRODUCT,
+    "productVariants": CacheTag.PRODUCT,
+    "variant": CacheTag.PRODUCT,
+    "variants": CacheTag.PRODUCT,
+}
+
+
+def _get_operation(
+    document: GraphQLDocument, operation_name: Optional[str]
+) -> Optional[OperationDefinition]:
+    operations = [
+        definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, OperationDefinition)
+        and (
+            not operation_name
+            or (definition.name and definition.name.value == operation_name)
+        )
+    ]
+    return operations[0] if len(operations) == 1 else None
+
+
+def _collect_cache_tags(
+    selection_set,
+    fragments: Dict[str, FragmentDefinition],
+    tags: Set[str],
+    visited_fragments: Set[str],
+):
+    if not selection_set:
+        return
+    for selection in selection_set.selections:
+        if isinstance(selection, Field):
+            if tag := FIELD_CACHE_TAGS.get(selection.name.value):
+                tags.add(tag)
+            _collect_cache_tags(
+                selection.selection_set, fragments, tags, visited_fragments
+            )
+        elif isinstance(selection, InlineFragment):
+            _collect_cache_tags(
+                selection.selection_set, fragments, tags, visited_fragments
+            )
+        elif isinstance(selection, FragmentSpread):
+            name = selection.name.value
+            if name in visited_fragments or name not in fragments:
+                continue
+            visited_fragments.add(name)
+            _collect_cache_tags(
+                fragments[name].selection_set, fragments, tags, visited_fragments
+            )
+
+
+def get_cache_tags(
+    document: GraphQLDocument, operation_name: Optional[str]
+) -> Optional[FrozenSet[str]]:
+    """Return the cache tags of the query, or `None` if it can't be cached.
+
+    Only queries selecting catalog root fields can be cached; nested fields extend
+    the tags, e.g. products of a category are tagged with both the category and
+    the product tags.
+    """
+    operation = _get_operation(document, operation_name)
+    if operation is None or operation.operation != "query":
+        return None
+    for selection in operation.selection_set.selections:
+        if (
+            not isinstance(selection, Field)
+            or selection.name.value not in CACHEABLE_ROOT_FIELDS
+        ):
+            return None
+    fragments = {
+        definition.name.value: definition
+        for definition in document.document_ast.definitions
+        if isinstance(definition, FragmentDefinition)
+    }
+    tags: Set[str] = set()
+    _collect_cache_tags(operation.selection_set, fragments, tags, set())
+    return frozenset(tags)
+
+
+def get_response_cache_key(
+    request: HttpRequest,
+    document: GraphQLDocument,
+    variables: Optional[dict],
+    operation_name: Optional[str],
+) -> Optional[str]:
+    """Return the cache key of the response, or `None` if it can't be cached.
+
+    Responses are cached only for anonymous requests, as the data returned to
+    staff users and apps depends on their permissions. Variables, which include
+    the channel, and the host used to build absolute URLs are part of the key.
+    Versions of the cache tags are part of the key as well, so changing any of
+    the tagged data discards the cached responses.
+    """
+    if not settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT or get_token_from_request(request):
+        return None
+    tags = get_cache_tags(document, operation_name)
+    if tags is None:
+        return None
+    key_data = json.dumps(
+        {
+            "variables": variables,
+            "operation_name": operation_name,
+            "host": request.get_host(),
+            "tags": get_cache_tags_versions(tags),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    key_hash = hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+    query_hash = get_query_hash(document.document_string)
+    return f"{RESPONSE_CACHE_KEY}:{saleor_version}:{query_hash}:{key_hash}"
+
+
+def is_response_cacheable(response: ExecutionResult) -> bool:
+    return not response.invalid and not response.errors
@@ -24,6 +24,7 @@ class ShippingMethodByIdLoader(DataLoader):
 
 class ShippingZoneByIdLoader(DataLoader):
     context_key = "shippingzone_by_id"
+    shared_cache_models = ("shipping.ShippingZone",)
 
     def batch_load(self, keys):
         shipping_zones = ShippingZone.objects.using(
@@ -37,6 +37,7 @@ class TaxConfigurationPerCountryByTaxConfigurationIDLoader(DataLoader):
 
 class TaxConfigurationByChannelId(DataLoader[int, TaxConfiguration]):
     context_key = "tax_configuration_by_channel_id"
+    shared_cache_models = ("tax.TaxConfiguration",)
 
     def batch_load(self, keys):
         tax_configs = TaxConfiguration.objects.using(
@@ -73,6 +74,7 @@ class TaxClassDefaultRateByCountryLoader(DataLoader):
 
 class TaxClassByIdLoader(DataLoader):
     context_key = "tax_class_by_id"
+    shared_cache_models = ("tax.TaxClass",)
 
     def batch_load(self, keys):
         tax_class_map = TaxClass.objects.using(self.database_connection_name).in_bulk(
@@ -14,6 +14,7 @@ from ...account.models import User
 from ...core.jwt import create_access_token
 from ...plugins.manager import get_plugins_manager
 from ...tests.utils import flush_post_commit_hooks
+from ..core.dataloaders import clear_shared_dataloader_caches
 from ..utils import handled_errors_logger, unhandled_errors_logger
 from .utils import assert_no_permission
 
@@ -124,6 +125,12 @@ class ApiClient(BaseApiClient):
         return result
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_dataloaders():
+    """Drop values loaded in other tests, as their data was rolled back."""
+    clear_shared_dataloader_caches()
+
+
 @pytest.fixture
 def app_api_client(app):
     return ApiClient(app=app)
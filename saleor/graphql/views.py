@@ -1,6 +1,9 @@
 import hashlib
 import importlib
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from copy import copy
 from inspect import isclass
 from typing import Any, Dict, List, Optional, Tuple, Union
 
@@ -8,7 +11,7 @@ import opentracing
 import opentracing.tags
 from django.conf import settings
 from django.core.cache import cache
-from django.db import connection
+from django.db import close_old_connections, connection
 from django.db.backends.postgresql.base import DatabaseWrapper
 from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
 from django.shortcuts import render
@@ -16,16 +19,22 @@ from django.views.generic import View
 from graphql import GraphQLDocument, get_default_backend
 from graphql.error import GraphQLError, GraphQLSyntaxError
 from graphql.execution import ExecutionResult
+from graphql.language.ast import OperationDefinition
 from jwt.exceptions import PyJWTError
 
 from .. import __version__ as saleor_version
 from ..core.exceptions import PermissionDenied, ReadOnlyException
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
+from ..core.utils.executors import get_thread_pool_executor
+from ..plugins.webhook.tasks import batch_async_webhook_deliveries
 from ..webhook import observability
+from ..webhook.observability.utils import ApiCall
 from .api import API_PATH, schema
 from .context import get_context_value
-from .core.validators.query_cost import validate_query_cost
+from .document_cache import get_document, validate_cached_query_cost
+from .persisted_queries import PersistedQueryError, get_persisted_query
 from .query_cost_map import COST_MAP
+from .response_cache import get_response_cache_key, is_response_cacheable
 from .utils import format_error, query_fingerprint, query_identifier
 
 INT_ERROR_MSG = "Int cannot represent non 32-bit signed integer value"
@@ -131,7 +140,7 @@ class GraphQLView(View):
             )
 
         if isinstance(data, list):
-            responses = [self.get_response(request, entry) for entry in data]
+            responses = self.get_batch_responses(request, data)
             result: Union[list, Optional[dict]] = [
                 response for response, code in responses
             ]
@@ -191,6 +200,90 @@ class GraphQLView(View):
                 api_call.report()
             return response
 
+    def get_batch_responses(
+        self, request: HttpRequest, data: list
+    ) -> List[Tuple[Optional[Dict[str, List[Any]]], int]]:
+        """Execute operations sent in a single batch.
+
+        When `GRAPHQL_BATCH_MAX_WORKERS` is set, consecutive query operations are
+        executed concurrently, each with its own copy of the request. Any other
+        operations, e.g. mutations, are executed sequentially in the batch order.
+        """
+        if settings.GRAPHQL_BATCH_MAX_WORKERS < 2:
+            return [self.get_response(request, entry) for entry in data]
+
+        responses: List[Tuple[Optional[Dict[str, List[Any]]], int]] = []
+        queries: List[dict] = []
+        for entry in data:
+            if self.is_query_operation(request, entry):
+                queries.append(entry)
+                continue
+            responses.extend(self.get_concurrent_responses(request, queries))
+            queries = []
+            responses.append(self.get_response(request, entry))
+        responses.extend(self.get_concurrent_responses(request, queries))
+        return responses
+
+    def get_concurrent_responses(
+        self, request: HttpRequest, data: List[dict]
+    ) -> List[Tuple[Optional[Dict[str, List[Any]]], int]]:
+        if len(data) < 2:
+            return [self.get_response(request, entry) for entry in data]
+        executor = get_batch_executor()
+        api_call = observability.get_api_call()
+        span = opentracing.global_tracer().active_span
+        futures = [
+            executor.submit(
+                self.get_response_in_thread, copy(request), entry, api_call, span
+            )
+            for entry in data
+        ]
+        return [future.result() for future in futures]
+
+    def get_response_in_thread(
+        self,
+        request: HttpRequest,
+        data: dict,
+        api_call: Optional[ApiCall],
+        parent_span: Optional[opentracing.Span],
+    ) -> Tuple[Optional[Dict[str, List[Any]]], int]:
+        scope = (
+            opentracing.global_tracer().scope_manager.activate(
+                parent_span, finish_on_close=False
+            )
+            if parent_span
+            else nullcontext()
+        )
+        try:
+            with scope, observability.report_api_call_in_thread(api_call):
+                return self.get_response(request, data)
+        finally:
+            # Worker threads outlive the request, so their connections are not
+            # closed by the request handler.
+            close_old_connections()
+
+    def is_query_operation(self, request: HttpRequest, data: dict) -> bool:
+        if not isinstance(data, dict):
+            return False
+        query, _, operation_name = self.get_graphql_params(request, data)
+        try:
+            query = get_persisted_query(query, data.get("extensions"))
+            if not isinstance(query, str):
+                return False
+            document = get_document(self.backend, self.schema, query)
+        except (ValueError, GraphQLError):
+            return False
+        operations = [
+            definition
+            for definition in document.document_ast.definitions
+            if isinstance(definition, OperationDefinition)
+            and (
+                not operation_name
+                or (definition.name and definition.name.value == operation_name)
+            )
+        ]
+        return len(operations) == 1 and operations[0].operation == "query"
+
     def get_response(
         self, request: HttpRequest, data: dict
     ) -> Tuple[Optional[Dict[str, List[Any]]], int]:
@@ -226,7 +319,8 @@ class GraphQLView(View):
 
         If no query was given or query is not a string, it returns an error.
         If the query is invalid, it returns an error as well.
-        Otherwise, it returns the parsed gql document.
+        Otherwise, it returns the parsed gql document. Documents are cached, so
+        repeated queries are parsed and validated only once.
         """
         if not query or not isinstance(query, str):
             return (
@@ -238,10 +332,7 @@ class GraphQLView(View):
 
         # Attempt to parse the query, if it fails, return the error
         try:
-            return (
-                self.backend.document_from_string(self.schema, query),
-                None,
-            )
+            return get_document(self.backend, self.schema, query), None
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
@@ -270,7 +361,12 @@ class GraphQLView(View):
 
             query, variables, operation_name = self.get_graphql_params(request, data)
 
-            document, error = self.parse_query(query)
+            try:
+                query = get_persisted_query(query, data.get("extensions"))
+            except PersistedQueryError as e:
+                document, error = None, ExecutionResult(errors=[e], invalid=True)
+            else:
+                document, error = self.parse_query(query)
             with observability.report_gql_operation() as operation:
                 operation.query = document
                 operation.name = operation_name
@@ -289,7 +385,7 @@ class GraphQLView(View):
             except GraphQLError as e:
                 return ExecutionResult(errors=[e], invalid=True)
 
-            query_cost, cost_errors = validate_query_cost(
+            query_cost, cost_errors = validate_cached_query_cost(
                 schema,
                 document,
                 variables,
@@ -316,24 +412,36 @@ class GraphQLView(View):
             try:
                 with connection.execute_wrapper(tracing_wrapper):
                     response = None
+                    response_cache_key = None
                     should_use_cache_for_scheme = query_contains_schema & (
                         not settings.DEBUG
                     )
                     if should_use_cache_for_scheme:
                         key = generate_cache_key(raw_query_string)
                         response = cache.get(key)
+                    elif response_cache_key := get_response_cache_key(
+                        request, document, variables, operation_name
+                    ):
+                        response = cache.get(response_cache_key)
 
                     if not response:
-                        response = document.execute(
-                            root=self.get_root_value(),
-                            variables=variables,
-                            operation_name=operation_name,
-                            context=context,
-                            middleware=self.middleware,
-                            **extra_options,
-                        )
+                        with batch_async_webhook_deliveries():
+                            response = document.execute(
+                                root=self.get_root_value(),
+                                variables=variables,
+                                operation_name=operation_name,
+                                context=context,
+                                middleware=self.middleware,
+                                **extra_options,
+                            )
                         if should_use_cache_for_scheme:
                             cache.set(key, response)
+                        elif response_cache_key and is_response_cacheable(response):
+                            cache.set(
+                                response_cache_key,
+                                response,
+                                timeout=settings.GRAPHQL_RESPONSE_CACHE_TIMEOUT,
+                            )
 
                     return set_query_cost_on_result(response, query_cost)
             except Exception as e:
@@ -436,6 +544,10 @@ def instantiate_middleware(middlewares):
         yield middleware
 
 
+def get_batch_executor() -> ThreadPoolExecutor:
+    return get_thread_pool_executor("graphql-batch", settings.GRAPHQL_BATCH_MAX_WORKERS)
+
+
 def generate_cache_key(raw_query: str) -> str:
     hashed_query = hashlib.sha256(str(raw_query).encode("utf-8")).hexdigest()
     return f"{saleor_version}-{hashed_query}"
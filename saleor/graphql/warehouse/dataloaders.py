@@ -548,6 +548,7 @@ class PreorderQuantityReservedByVariantChannelListingIdLoader(DataLoader[int, in
 
 class WarehouseByIdLoader(DataLoader):
     context_key = "warehouse_by_id"
+    shared_cache_models = ("warehouse.Warehouse",)
 
     def batch_load(self, keys: Iterable[UUID]) -> List[Optional[Warehouse]]:
         warehouses = (
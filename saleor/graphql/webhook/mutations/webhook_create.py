@@ -7,6 +7,7 @@ from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
 from ....webhook.error_codes import WebhookErrorCode
+from ....webhook.routing import invalidate_webhook_routing_table
 from ....webhook.validators import (
     HEADERS_LENGTH_LIMIT,
     HEADERS_NUMBER_LIMIT,
@@ -27,6 +28,7 @@ from ...core.types import BaseInputObjectType, NonNullList, WebhookError
 from ...core.utils import raise_validation_error
 from .. import enums
 from ..mixins import NotifyUserEventValidationMixin
+from ..subscription_payload import warm_subscription_document_cache
 from ..subscription_query import SubscriptionQuery
 from ..types import Webhook
 
@@ -177,6 +179,7 @@ class WebhookCreate(ModelMutation, NotifyUserEventValidationMixin):
     @classmethod
     def save(cls, _info: ResolveInfo, instance, cleaned_input):
         instance.save()
+        warm_subscription_document_cache(instance.subscription_query)
         events = set(cleaned_input.get("events", []))
         models.WebhookEvent.objects.bulk_create(
             [
@@ -184,3 +187,4 @@ class WebhookCreate(ModelMutation, NotifyUserEventValidationMixin):
                 for event in events
             ]
         )
+        invalidate_webhook_routing_table()
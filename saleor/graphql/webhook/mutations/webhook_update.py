@@ -3,6 +3,7 @@ import graphene
 from ....permission.auth_filters import AuthorizationFilters
 from ....permission.enums import AppPermission
 from ....webhook import models
+from ....webhook.routing import invalidate_webhook_routing_table
 from ....webhook.validators import HEADERS_LENGTH_LIMIT, HEADERS_NUMBER_LIMIT
 from ...app.dataloaders import get_app_promise
 from ...core import ResolveInfo
@@ -17,6 +18,7 @@ from ...core.fields import JSONString
 from ...core.types import BaseInputObjectType, NonNullList, WebhookError
 from .. import enums
 from ..mixins import NotifyUserEventValidationMixin
+from ..subscription_payload import warm_subscription_document_cache
 from ..types import Webhook
 from . import WebhookCreate
 
@@ -97,6 +99,7 @@ class WebhookUpdate(WebhookCreate, NotifyUserEventValidationMixin):
     @classmethod
     def save(cls, _info: ResolveInfo, instance, cleaned_input):
         instance.save()
+        warm_subscription_document_cache(instance.subscription_query)
         events = set(cleaned_input.get("events", []))
         cls.validate_events(events)
         if events:
@@ -107,6 +110,7 @@ class WebhookUpdate(WebhookCreate, NotifyUserEventValidationMixin):
                     for event in events
                 ]
             )
+            invalidate_webhook_routing_table()
 
     @classmethod
     def get_instance(cls, info: ResolveInfo, **data):
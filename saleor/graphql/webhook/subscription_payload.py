@@ -1,21 +1,31 @@
+import hashlib
+from functools import partial
 from typing import Any, Dict, List, Optional
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.utils import timezone
 from django.utils.functional import SimpleLazyObject
-from graphql import get_default_backend, parse
+from graphql import GraphQLDocument, parse, validate
 from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult, execute
 from promise import Promise
 
 from ...app.models import App
 from ...core.exceptions import PermissionDenied
+from ...core.utils.lru import LRUCache
 from ...settings import get_host
 from ..core import SaleorContext
 from ..utils import format_error
 
 logger = get_task_logger(__name__)
 
+SUBSCRIPTION_DOCUMENT_CACHE_SIZE = 1000
+
+_subscription_documents: LRUCache[GraphQLDocument] = LRUCache(
+    SUBSCRIPTION_DOCUMENT_CACHE_SIZE
+)
+
 
 def initialize_request(
     requestor=None,
@@ -49,6 +59,62 @@ def initialize_request(
     return request
 
 
+def _get_subscription_query_hash(subscription_query: str) -> str:
+    return hashlib.sha256(subscription_query.encode("utf-8")).hexdigest()
+
+
+def _return_validation_errors(errors, *_args, **_kwargs):
+    return ExecutionResult(errors=errors, invalid=True)
+
+
+def _build_subscription_document(schema, subscription_query: str) -> GraphQLDocument:
+    ast = parse(subscription_query)
+    # Validate the query only once; the cached document executes the AST directly.
+    if errors := validate(schema, ast):
+        execute_document = partial(_return_validation_errors, errors)
+    else:
+        execute_document = partial(execute, schema, ast)
+    return GraphQLDocument(
+        schema=schema,
+        document_string=subscription_query,
+        document_ast=ast,
+        execute=execute_document,
+    )
+
+
+def get_subscription_document(subscription_query: str) -> GraphQLDocument:
+    """Return a parsed and validated document for the subscription query.
+
+    Documents are cached in a bounded LRU keyed by the hash of the query, as the
+    same app-defined queries are used for every generated webhook payload.
+    Documents built for a different schema are discarded.
+    """
+    from ..api import schema
+
+    key = _get_subscription_query_hash(subscription_query)
+    document = _subscription_documents.get(key)
+    if document is None or document.schema is not schema:
+        document = _build_subscription_document(schema, subscription_query)
+        _subscription_documents.set(key, document)
+    return document
+
+
+def warm_subscription_document_cache(subscription_query: Optional[str]):
+    if not subscription_query:
+        return
+    try:
+        get_subscription_document(subscription_query)
+    except GraphQLError:
+        logger.warning(
+            "Unable to parse the subscription query.",
+            extra={"query": subscription_query},
+        )
+
+
+def clear_subscription_document_cache():
+    _subscription_documents.clear()
+
+
 def get_event_payload(event):
     # Queries that use dataloaders return Promise object for the "event" field. In that
     # case, we need to resolve them first.
@@ -80,15 +146,9 @@ def generate_payload_from_subscription(
     return: A payload ready to send via webhook. None if the function was not able to
     generate a payload
     """
-    from ..api import schema
     from ..context import get_context_value
 
-    graphql_backend = get_default_backend()
-    ast = parse(subscription_query)  # type: ignore
-    document = graphql_backend.document_from_string(
-        schema,
-        ast,
-    )
+    document = get_subscription_document(subscription_query)  # type: ignore
     app_id = app.pk if app else None
     request.app = app
     results = document.execute(
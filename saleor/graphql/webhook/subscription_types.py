@@ -25,7 +25,7 @@ from ...product.models import (
     ProductVariantTranslation,
 )
 from ...shipping.models import ShippingMethodTranslation
-from ...thumbnail.views import TYPE_TO_MODEL_DATA_MAPPING
+from ...thumbnail.models import TYPE_TO_MODEL_DATA_MAPPING
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..account.types import User as UserType
 from ..app.types import App as AppType
@@ -0,0 +1,119 @@
+from unittest import mock
+
+import pytest
+from graphql import parse, validate
+from graphql.error import GraphQLSyntaxError
+
+from ....plugins.webhook.tests.subscription_webhooks import subscription_queries
+from ....webhook.event_types import WebhookEventAsyncType
+from ..subscription_payload import (
+    clear_subscription_document_cache,
+    generate_payload_from_subscription,
+    get_subscription_document,
+    initialize_request,
+    warm_subscription_document_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_documents():
+    clear_subscription_document_cache()
+    yield
+    clear_subscription_document_cache()
+
+
+@mock.patch(
+    "saleor.graphql.webhook.subscription_payload.validate",
+    wraps=validate,
+)
+def test_get_subscription_document_parses_and_validates_once(mocked_validate):
+    # when
+    document = get_subscription_document(subscription_queries.ORDER_CREATED)
+    cached_document = get_subscription_document(subscription_queries.ORDER_CREATED)
+
+    # then
+    assert document is cached_document
+    assert document.document_string == subscription_queries.ORDER_CREATED
+    mocked_validate.assert_called_once()
+
+
+def test_get_subscription_document_for_different_queries():
+    # when
+    order_document = get_subscription_document(subscription_queries.ORDER_CREATED)
+    draft_document = get_subscription_document(subscription_queries.DRAFT_ORDER_CREATED)
+
+    # then
+    assert order_document is not draft_document
+
+
+def test_get_subscription_document_invalid_syntax():
+    # when & then
+    with pytest.raises(GraphQLSyntaxError):
+        get_subscription_document("subscription { event {")
+
+
+@mock.patch("saleor.graphql.webhook.subscription_payload.parse", wraps=parse)
+def test_warm_subscription_document_cache(mocked_parse):
+    # given
+    warm_subscription_document_cache(subscription_queries.ORDER_CREATED)
+
+    # when
+    get_subscription_document(subscription_queries.ORDER_CREATED)
+
+    # then
+    mocked_parse.assert_called_once_with(subscription_queries.ORDER_CREATED)
+
+
+def test_warm_subscription_document_cache_invalid_query():
+    # when
+    warm_subscription_document_cache("subscription { event {")
+
+    # then no error is raised
+
+
+def test_generate_payload_from_subscription_reuses_document(order, app):
+    # given
+    request = initialize_request()
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+    generate_payload_from_subscription(
+        event_type, order, subscription_queries.ORDER_CREATED, request, app
+    )
+
+    # when
+    with mock.patch(
+        "saleor.graphql.webhook.subscription_payload.parse"
+    ) as mocked_parse:
+        payload = generate_payload_from_subscription(
+            event_type,
+            order,
+            subscription_queries.ORDER_CREATED,
+            initialize_request(),
+            app,
+        )
+
+    # then
+    mocked_parse.assert_not_called()
+    assert payload["order"]["id"]
+
+
+def test_generate_payload_from_subscription_invalid_query(order, app):
+    # given
+    query = """
+    subscription {
+      event {
+        ... on OrderCreated {
+          order {
+            notExistingField
+          }
+        }
+      }
+    }
+    """
+
+    # when
+    payload = generate_payload_from_subscription(
+        WebhookEventAsyncType.ORDER_CREATED, order, query, initialize_request(), app
+    )
+
+    # then
+    assert payload is None
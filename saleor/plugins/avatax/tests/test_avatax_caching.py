@@ -1,5 +1,5 @@
 from decimal import Decimal
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, Mock
 
 from django.test import override_settings
 from prices import Money, TaxedMoney
@@ -11,9 +11,7 @@ from ..plugin import AvataxPlugin
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
-@patch("saleor.plugins.avatax.cache.set")
 def test_calculate_checkout_total_use_cache(
-    mock_cache_set,
     checkout_with_items_and_shipping,
     checkout_with_items_and_shipping_info,
     address,
@@ -35,13 +33,12 @@ def test_calculate_checkout_total_use_cache(
     avalara_request_data = generate_request_data_from_checkout(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
-    mocked_cache = Mock(
-        return_value=(
-            avalara_request_data,
-            avalara_response_for_checkout_with_items_and_shipping,
-        )
+    mocked_cache = Mock()
+    mocked_cache.get.return_value = (
+        avalara_request_data,
+        avalara_response_for_checkout_with_items_and_shipping,
     )
-    monkeypatch.setattr("saleor.plugins.avatax.cache.get", mocked_cache)
+    monkeypatch.setattr("saleor.plugins.avatax.cache", mocked_cache)
 
     # then
     result = manager.calculate_checkout_total(
@@ -52,8 +49,8 @@ def test_calculate_checkout_total_use_cache(
     assert result == TaxedMoney(net=Money("72.2", "USD"), gross=Money("75", "USD"))
 
     avalara_cache_key = CACHE_KEY + str(checkout.token)
-    mocked_cache.assert_called_with(avalara_cache_key)
-    mock_cache_set.assert_not_called()
+    mocked_cache.get.assert_called_with(avalara_cache_key)
+    mocked_cache.set.assert_not_called()
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
@@ -100,9 +97,7 @@ def test_calculate_checkout_total_save_avatax_response_in_cache(
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
-@patch("saleor.plugins.avatax.cache.set")
 def test_calculate_checkout_subtotal_use_cache(
-    mock_cache_set,
     checkout_with_items_and_shipping,
     checkout_with_items_and_shipping_info,
     address,
@@ -124,13 +119,12 @@ def test_calculate_checkout_subtotal_use_cache(
     avalara_request_data = generate_request_data_from_checkout(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
-    mocked_cache = Mock(
-        return_value=(
-            avalara_request_data,
-            avalara_response_for_checkout_with_items_and_shipping,
-        )
+    mocked_cache = Mock()
+    mocked_cache.get.return_value = (
+        avalara_request_data,
+        avalara_response_for_checkout_with_items_and_shipping,
     )
-    monkeypatch.setattr("saleor.plugins.avatax.cache.get", mocked_cache)
+    monkeypatch.setattr("saleor.plugins.avatax.cache", mocked_cache)
 
     # then
     result = manager.calculate_checkout_subtotal(
@@ -141,8 +135,8 @@ def test_calculate_checkout_subtotal_use_cache(
     assert result == TaxedMoney(net=Money("64.07", "USD"), gross=Money("65", "USD"))
 
     avalara_cache_key = CACHE_KEY + str(checkout.token)
-    mocked_cache.assert_called_with(avalara_cache_key)
-    mock_cache_set.assert_not_called()
+    mocked_cache.get.assert_called_with(avalara_cache_key)
+    mocked_cache.set.assert_not_called()
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
@@ -189,9 +183,7 @@ def test_calculate_checkout_subtotal_save_avatax_response_in_cache(
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
-@patch("saleor.plugins.avatax.cache.set")
 def test_calculate_checkout_shipping_use_cache(
-    mock_cache_set,
     checkout_with_items_and_shipping,
     checkout_with_items_and_shipping_info,
     address,
@@ -213,13 +205,12 @@ def test_calculate_checkout_shipping_use_cache(
     avalara_request_data = generate_request_data_from_checkout(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
-    mocked_cache = Mock(
-        return_value=(
-            avalara_request_data,
-            avalara_response_for_checkout_with_items_and_shipping,
-        )
+    mocked_cache = Mock()
+    mocked_cache.get.return_value = (
+        avalara_request_data,
+        avalara_response_for_checkout_with_items_and_shipping,
     )
-    monkeypatch.setattr("saleor.plugins.avatax.cache.get", mocked_cache)
+    monkeypatch.setattr("saleor.plugins.avatax.cache", mocked_cache)
 
     # then
     result = manager.calculate_checkout_shipping(
@@ -230,8 +221,8 @@ def test_calculate_checkout_shipping_use_cache(
     assert result == TaxedMoney(net=Money("8.13", "USD"), gross=Money("10", "USD"))
 
     avalara_cache_key = CACHE_KEY + str(checkout.token)
-    mocked_cache.assert_called_with(avalara_cache_key)
-    mock_cache_set.assert_not_called()
+    mocked_cache.get.assert_called_with(avalara_cache_key)
+    mocked_cache.set.assert_not_called()
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
@@ -278,9 +269,7 @@ def test_calculate_checkout_shipping_save_avatax_response_in_cache(
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
-@patch("saleor.plugins.avatax.cache.set")
 def test_calculate_checkout_line_total_use_cache(
-    mock_cache_set,
     checkout_with_items_and_shipping,
     checkout_with_items_and_shipping_info,
     address,
@@ -303,13 +292,12 @@ def test_calculate_checkout_line_total_use_cache(
     avalara_request_data = generate_request_data_from_checkout(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
-    mocked_cache = Mock(
-        return_value=(
-            avalara_request_data,
-            avalara_response_for_checkout_with_items_and_shipping,
-        )
+    mocked_cache = Mock()
+    mocked_cache.get.return_value = (
+        avalara_request_data,
+        avalara_response_for_checkout_with_items_and_shipping,
     )
-    monkeypatch.setattr("saleor.plugins.avatax.cache.get", mocked_cache)
+    monkeypatch.setattr("saleor.plugins.avatax.cache", mocked_cache)
 
     # then
     result = manager.calculate_checkout_line_total(
@@ -323,8 +311,8 @@ def test_calculate_checkout_line_total_use_cache(
     assert result == TaxedMoney(net=Money("4.07", "USD"), gross=Money("5", "USD"))
 
     avalara_cache_key = CACHE_KEY + str(checkout.token)
-    mocked_cache.assert_called_with(avalara_cache_key)
-    mock_cache_set.assert_not_called()
+    mocked_cache.get.assert_called_with(avalara_cache_key)
+    mocked_cache.set.assert_not_called()
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
@@ -372,9 +360,7 @@ def test_calculate_checkout_line_save_avatax_response_in_cache(
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
-@patch("saleor.plugins.avatax.cache.set")
 def test_calculate_checkout_line_unit_price_use_cache(
-    mock_cache_set,
     checkout_with_items_and_shipping,
     checkout_with_items_and_shipping_info,
     address,
@@ -397,13 +383,12 @@ def test_calculate_checkout_line_unit_price_use_cache(
     avalara_request_data = generate_request_data_from_checkout(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
-    mocked_cache = Mock(
-        return_value=(
-            avalara_request_data,
-            avalara_response_for_checkout_with_items_and_shipping,
-        )
+    mocked_cache = Mock()
+    mocked_cache.get.return_value = (
+        avalara_request_data,
+        avalara_response_for_checkout_with_items_and_shipping,
     )
-    monkeypatch.setattr("saleor.plugins.avatax.cache.get", mocked_cache)
+    monkeypatch.setattr("saleor.plugins.avatax.cache", mocked_cache)
 
     # then
     result = manager.calculate_checkout_line_unit_price(
@@ -417,8 +402,8 @@ def test_calculate_checkout_line_unit_price_use_cache(
     assert result == TaxedMoney(net=Money("4.07", "USD"), gross=Money("5", "USD"))
 
     avalara_cache_key = CACHE_KEY + str(checkout.token)
-    mocked_cache.assert_called_with(avalara_cache_key)
-    mock_cache_set.assert_not_called()
+    mocked_cache.get.assert_called_with(avalara_cache_key)
+    mocked_cache.set.assert_not_called()
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
@@ -472,9 +457,7 @@ def test_calculate_checkout_line_unit_price_save_avatax_response_in_cache(
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
-@patch("saleor.plugins.avatax.cache.set")
 def test_get_checkout_line_tax_rate_use_cache(
-    mock_cache_set,
     checkout_with_items_and_shipping,
     checkout_with_items_and_shipping_info,
     address,
@@ -497,13 +480,12 @@ def test_get_checkout_line_tax_rate_use_cache(
     avalara_request_data = generate_request_data_from_checkout(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
-    mocked_cache = Mock(
-        return_value=(
-            avalara_request_data,
-            avalara_response_for_checkout_with_items_and_shipping,
-        )
+    mocked_cache = Mock()
+    mocked_cache.get.return_value = (
+        avalara_request_data,
+        avalara_response_for_checkout_with_items_and_shipping,
     )
-    monkeypatch.setattr("saleor.plugins.avatax.cache.get", mocked_cache)
+    monkeypatch.setattr("saleor.plugins.avatax.cache", mocked_cache)
     fake_unit_price = TaxedMoney(net=Money("2", "USD"), gross=Money("10", "USD"))
 
     # then
@@ -519,8 +501,8 @@ def test_get_checkout_line_tax_rate_use_cache(
     assert result == Decimal("0.36")
 
     avalara_cache_key = CACHE_KEY + str(checkout.token)
-    mocked_cache.assert_called_with(avalara_cache_key)
-    mock_cache_set.assert_not_called()
+    mocked_cache.get.assert_called_with(avalara_cache_key)
+    mocked_cache.set.assert_not_called()
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
@@ -577,9 +559,7 @@ def test_get_checkout_line_tax_rate_save_avatax_response_in_cache(
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
-@patch("saleor.plugins.avatax.cache.set")
 def test_get_checkout_shipping_tax_rate_use_cache(
-    mock_cache_set,
     checkout_with_items_and_shipping,
     checkout_with_items_and_shipping_info,
     address,
@@ -601,13 +581,12 @@ def test_get_checkout_shipping_tax_rate_use_cache(
     avalara_request_data = generate_request_data_from_checkout(
         checkout_info, lines, plugin.config, transaction_token=[]
     )
-    mocked_cache = Mock(
-        return_value=(
-            avalara_request_data,
-            avalara_response_for_checkout_with_items_and_shipping,
-        )
+    mocked_cache = Mock()
+    mocked_cache.get.return_value = (
+        avalara_request_data,
+        avalara_response_for_checkout_with_items_and_shipping,
     )
-    monkeypatch.setattr("saleor.plugins.avatax.cache.get", mocked_cache)
+    monkeypatch.setattr("saleor.plugins.avatax.cache", mocked_cache)
     fake_shipping_price = TaxedMoney(net=Money("2", "USD"), gross=Money("10", "USD"))
 
     # then
@@ -619,8 +598,8 @@ def test_get_checkout_shipping_tax_rate_use_cache(
     assert result == Decimal("0.46")
 
     avalara_cache_key = CACHE_KEY + str(checkout.token)
-    mocked_cache.assert_called_with(avalara_cache_key)
-    mock_cache_set.assert_not_called()
+    mocked_cache.get.assert_called_with(avalara_cache_key)
+    mocked_cache.set.assert_not_called()
 
 
 @override_settings(PLUGINS=["saleor.plugins.avatax.plugin.AvataxPlugin"])
@@ -17,7 +17,6 @@ from typing import (
 import opentracing
 from django.conf import settings
 from django.http import HttpResponse, HttpResponseNotFound
-from django.utils.module_loading import import_string
 from graphene import Mutation
 from graphql import GraphQLError
 from graphql.execution import ExecutionResult
@@ -35,6 +34,7 @@ from ..order.interface import OrderTaxedPricesData
 from ..tax.utils import calculate_tax_rate
 from .base_plugin import ExcludedShippingMethod, ExternalAccessTokens
 from .models import PluginConfiguration
+from .snapshot import get_plugins_snapshot
 
 if TYPE_CHECKING:
     from ..account.models import Address, Group, User
@@ -124,56 +124,35 @@ class PluginsManager(PaymentInterface):
             self.global_plugins = []
             self.plugins_per_channel = defaultdict(list)
 
-            global_db_configs, channel_db_configs = self._get_db_plugin_configs()
-            channels = Channel.objects.all()
-
-            for plugin_path in plugins:
-                with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
-                    PluginClass = import_string(plugin_path)
-                    if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
+            snapshot = get_plugins_snapshot(plugins)
+            channels = snapshot.channels
+
+            for PluginClass in snapshot.plugin_classes:
+                if not getattr(PluginClass, "CONFIGURATION_PER_CHANNEL", False):
+                    plugin = self._load_plugin(
+                        PluginClass,
+                        snapshot.global_db_configs,
+                        requestor_getter=requestor_getter,
+                        allow_replica=allow_replica,
+                    )
+                    self.global_plugins.append(plugin)
+                    self.all_plugins.append(plugin)
+                else:
+                    for channel in channels:
+                        channel_configs = snapshot.channel_db_configs.get(channel, {})
                         plugin = self._load_plugin(
                             PluginClass,
-                            global_db_configs,
-                            requestor_getter=requestor_getter,
-                            allow_replica=allow_replica,
+                            channel_configs,
+                            channel,
+                            requestor_getter,
+                            allow_replica,
                         )
-                        self.global_plugins.append(plugin)
+                        self.plugins_per_channel[channel.slug].append(plugin)
                         self.all_plugins.append(plugin)
-                    else:
-                        for channel in channels:
-                            channel_configs = channel_db_configs.get(channel, {})
-                            plugin = self._load_plugin(
-                                PluginClass,
-                                channel_configs,
-                                channel,
-                                requestor_getter,
-                                allow_replica,
-                            )
-                            self.plugins_per_channel[channel.slug].append(plugin)
-                            self.all_plugins.append(plugin)
 
             for channel in channels:
                 self.plugins_per_channel[channel.slug].extend(self.global_plugins)
 
-    def _get_db_plugin_configs(self):
-        with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
-            qs = (
-                PluginConfiguration.objects.all()
-                .using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-                .prefetch_related("channel")
-            )
-            channel_configs: DefaultDict[Channel, Dict] = defaultdict(dict)
-            global_configs = {}
-            for db_plugin_config in qs:
-                channel = db_plugin_config.channel
-                if channel is None:
-                    global_configs[db_plugin_config.identifier] = db_plugin_config
-                else:
-                    channel_configs[channel][
-                        db_plugin_config.identifier
-                    ] = db_plugin_config
-            return global_configs, channel_configs
-
     def __run_method_on_plugins(
         self,
         method_name: str,
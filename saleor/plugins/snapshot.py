@@ -0,0 +1,110 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, DefaultDict, Dict, List, Optional, Tuple, Type
+
+import opentracing
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from ..channel.models import Channel
+from ..core.utils.cache_version import CacheVersion
+from .models import PluginConfiguration
+
+if TYPE_CHECKING:
+    from .base_plugin import BasePlugin
+
+PLUGINS_CONFIGURATION_VERSION_KEY = "plugins_configuration_version"
+
+plugins_configuration_version = CacheVersion(PLUGINS_CONFIGURATION_VERSION_KEY)
+
+_snapshots: Dict[Tuple[str, ...], "PluginsSnapshot"] = {}
+_snapshots_lock = Lock()
+
+
+@dataclass(frozen=True)
+class PluginsSnapshot:
+    """Immutable, process-wide view of the loaded plugins topology.
+
+    Holds everything that is needed to instantiate plugins for a request without
+    touching the database: imported plugin classes, database configurations and
+    channels. It's valid only for the configuration version it was built for.
+    """
+
+    version: str
+    plugin_classes: Tuple[Type["BasePlugin"], ...]
+    global_db_configs: Dict[str, PluginConfiguration]
+    channel_db_configs: Dict[Channel, Dict[str, PluginConfiguration]]
+    channels: Tuple[Channel, ...]
+
+
+def get_plugins_configuration_version() -> str:
+    return plugins_configuration_version.get()
+
+
+def invalidate_plugins_snapshot(**_kwargs):
+    """Mark all plugins snapshots as outdated."""
+    plugins_configuration_version.invalidate()
+
+
+def clear_plugins_snapshots():
+    with _snapshots_lock:
+        _snapshots.clear()
+
+
+def _get_db_plugin_configs() -> (
+    Tuple[Dict[str, PluginConfiguration], Dict[Channel, Dict[str, PluginConfiguration]]]
+):
+    with opentracing.global_tracer().start_active_span("_get_db_plugin_configs"):
+        qs = (
+            PluginConfiguration.objects.all()
+            .using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+            .prefetch_related("channel")
+        )
+        channel_configs: DefaultDict[
+            Channel, Dict[str, PluginConfiguration]
+        ] = defaultdict(dict)
+        global_configs = {}
+        for db_plugin_config in qs:
+            channel = db_plugin_config.channel
+            if channel is None:
+                global_configs[db_plugin_config.identifier] = db_plugin_config
+            else:
+                channel_configs[channel][db_plugin_config.identifier] = db_plugin_config
+        return global_configs, dict(channel_configs)
+
+
+def _build_plugins_snapshot(plugins: List[str], version: str) -> PluginsSnapshot:
+    with opentracing.global_tracer().start_active_span("build_plugins_snapshot"):
+        global_db_configs, channel_db_configs = _get_db_plugin_configs()
+        plugin_classes = []
+        for plugin_path in plugins:
+            with opentracing.global_tracer().start_active_span(f"{plugin_path}"):
+                plugin_classes.append(import_string(plugin_path))
+        return PluginsSnapshot(
+            version=version,
+            plugin_classes=tuple(plugin_classes),
+            global_db_configs=global_db_configs,
+            channel_db_configs=channel_db_configs,
+            channels=tuple(Channel.objects.all()),
+        )
+
+
+def get_plugins_snapshot(
+    plugins: List[str], version: Optional[str] = None
+) -> PluginsSnapshot:
+    """Return the plugins snapshot for the current configuration version.
+
+    The snapshot is rebuilt only when the configuration version changes, which
+    happens whenever a `PluginConfiguration` or a `Channel` is modified.
+    """
+    if version is None:
+        version = get_plugins_configuration_version()
+    key = tuple(plugins)
+    snapshot = _snapshots.get(key)
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+    snapshot = _build_plugins_snapshot(plugins, version)
+    with _snapshots_lock:
+        _snapshots[key] = snapshot
+    return snapshot
@@ -0,0 +1,122 @@
+from django.core.cache import cache
+
+from ...channel.models import Channel
+from ..manager import get_plugins_manager
+from ..models import PluginConfiguration
+from ..snapshot import (
+    PLUGINS_CONFIGURATION_VERSION_KEY,
+    get_plugins_configuration_version,
+    get_plugins_snapshot,
+)
+from .sample_plugins import ChannelPluginSample, PluginSample
+
+
+def test_get_plugins_manager_reuses_snapshot(
+    settings, channel_USD, django_assert_num_queries
+):
+    # given
+    settings.PLUGINS = [
+        "saleor.plugins.tests.sample_plugins.ChannelPluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+    ]
+    get_plugins_manager()
+
+    # when
+    with django_assert_num_queries(0):
+        manager = get_plugins_manager()
+
+    # then
+    assert len(manager.all_plugins) == 2
+    assert isinstance(manager.global_plugins[0], PluginSample)
+    assert isinstance(manager.plugins_per_channel[channel_USD.slug][0], PluginSample)
+
+
+def test_get_plugins_manager_returns_new_plugin_instances(settings, channel_USD):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    first_manager = get_plugins_manager()
+
+    # when
+    second_manager = get_plugins_manager(requestor_getter=lambda: None)
+
+    # then
+    assert first_manager.all_plugins[0] is not second_manager.all_plugins[0]
+    assert first_manager.all_plugins[0].requestor is None
+    assert second_manager.all_plugins[0].requestor is not None
+
+
+def test_snapshot_rebuilt_after_channel_created(settings, channel_USD):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    snapshot = get_plugins_snapshot(settings.PLUGINS)
+    assert len(snapshot.channels) == 1
+
+    # when
+    Channel.objects.create(name="Channel EUR", slug="channel-eur", currency_code="EUR")
+
+    # then
+    manager = get_plugins_manager()
+    assert {"channel-eur", channel_USD.slug} == set(manager.plugins_per_channel)
+    assert len(manager.all_plugins) == 2
+    assert all(isinstance(p, ChannelPluginSample) for p in manager.all_plugins)
+
+
+def test_snapshot_rebuilt_after_channel_deleted(settings, channel_USD, channel_PLN):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.ChannelPluginSample"]
+    get_plugins_manager()
+
+    # when
+    channel_PLN.delete()
+
+    # then
+    manager = get_plugins_manager()
+    assert set(manager.plugins_per_channel) == {channel_USD.slug}
+
+
+def test_snapshot_rebuilt_after_plugin_configuration_changed(settings, channel_USD):
+    # given
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    manager = get_plugins_manager()
+    assert manager.all_plugins[0].active is True
+
+    # when
+    PluginConfiguration.objects.create(
+        identifier=PluginSample.PLUGIN_ID, active=False, configuration=[]
+    )
+
+    # then
+    manager = get_plugins_manager()
+    assert manager.all_plugins[0].active is False
+
+
+def test_plugins_configuration_version_changes_on_plugin_configuration_save(
+    settings, channel_USD
+):
+    # given
+    version = get_plugins_configuration_version()
+    configuration = PluginConfiguration.objects.create(
+        identifier=PluginSample.PLUGIN_ID, active=True, configuration=[]
+    )
+    new_version = get_plugins_configuration_version()
+    assert new_version != version
+
+    # when
+    configuration.active = False
+    configuration.save(update_fields=["active"])
+
+    # then
+    assert get_plugins_configuration_version() != new_version
+
+
+def test_plugins_configuration_version_set_when_missing(settings):
+    # given
+    cache.delete(PLUGINS_CONFIGURATION_VERSION_KEY)
+
+    # when
+    version = get_plugins_configuration_version()
+
+    # then
+    assert version
+    assert cache.get(PLUGINS_CONFIGURATION_VERSION_KEY) == version
+    assert get_plugins_configuration_version() == version
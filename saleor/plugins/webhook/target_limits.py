@@ -0,0 +1,176 @@
+"""Per-target concurrency limits and circuit breaking of webhook requests.
+
+The state is kept in the cache, so it is shared by all workers when the cache is
+backed by Redis. Keys are scoped to the target URL, so a single failing app
+doesn't affect deliveries to the others.
+"""
+import hashlib
+import time
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Once the open duration passes, the circuit stays half-open until a request to the
+# target succeeds, but no longer than this many open durations.
+HALF_OPEN_DURATION_MULTIPLIER = 10
+
+# Time after which the adaptive concurrency limit of an inactive target is reset.
+CONCURRENCY_LIMIT_TIMEOUT = 3600
+
+
+def _get_cache_key(target_url: str, name: str) -> str:
+    target_hash = hashlib.sha256(target_url.encode("utf-8")).hexdigest()
+    return f"webhook_target:{target_hash}:{name}"
+
+
+def _increment(key: str, timeout: int) -> int:
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # The key expired between adding and incrementing it.
+        cache.set(key, 1, timeout=timeout)
+        return 1
+
+
+def _get_window_keys(target_url: str):
+    window = int(time.time() // settings.WEBHOOK_CIRCUIT_BREAKER_WINDOW)
+    return (
+        _get_cache_key(target_url, f"requests:{window}"),
+        _get_cache_key(target_url, f"failures:{window}"),
+    )
+
+
+def is_circuit_breaker_enabled() -> bool:
+    return settings.WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE > 0
+
+
+def acquire_circuit(target_url: str) -> bool:
+    """Return whether a request can be sent to the target.
+
+    When the circuit is open, no requests are sent to the target. Once the open
+    duration passes, the circuit is half-open and lets through a single request at
+    a time until one of them succeeds.
+    """
+    if not is_circuit_breaker_enabled():
+        return True
+    if cache.get(_get_cache_key(target_url, "open")):
+        return False
+    if cache.get(_get_cache_key(target_url, "half_open")):
+        return cache.add(
+            _get_cache_key(target_url, "probe"), 1, timeout=settings.WEBHOOK_TIMEOUT
+        )
+    return True
+
+
+def record_circuit_result(target_url: str, failed: bool):
+    """Count the result of a request and open the circuit if the target fails.
+
+    The circuit is opened when the rate of failed requests in the current window
+    reaches `WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE`, or right away when the request
+    sent through the half-open circuit fails.
+    """
+    if not is_circuit_breaker_enabled():
+        return
+
+    half_open_key = _get_cache_key(target_url, "half_open")
+    if cache.get(half_open_key):
+        cache.delete(_get_cache_key(target_url, "probe"))
+        if failed:
+            _open_circuit(target_url)
+        else:
+            cache.delete(half_open_key)
+        return
+
+    timeout = settings.WEBHOOK_CIRCUIT_BREAKER_WINDOW * 2
+    requests_key, failures_key = _get_window_keys(target_url)
+    requests_count = _increment(requests_key, timeout)
+    if not failed:
+        return
+    failures_count = _increment(failures_key, timeout)
+    if (
+        requests_count >= settings.WEBHOOK_CIRCUIT_BREAKER_MIN_REQUESTS
+        and failures_count / requests_count
+        >= settings.WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE
+    ):
+        _open_circuit(target_url)
+
+
+def _open_circuit(target_url: str):
+    open_duration = settings.WEBHOOK_CIRCUIT_BREAKER_OPEN_DURATION
+    cache.set(_get_cache_key(target_url, "open"), True, timeout=open_duration)
+    cache.set(
+        _get_cache_key(target_url, "half_open"),
+        True,
+        timeout=open_duration * HALF_OPEN_DURATION_MULTIPLIER,
+    )
+    cache.delete_many(_get_window_keys(target_url))
+
+
+def is_concurrency_limit_enabled() -> bool:
+    return settings.WEBHOOK_TARGET_MAX_CONCURRENCY > 0
+
+
+def get_concurrency_limit(target_url: str) -> int:
+    max_concurrency = settings.WEBHOOK_TARGET_MAX_CONCURRENCY
+    limit = cache.get(_get_cache_key(target_url, "limit"), max_concurrency)
+    return min(limit, max_concurrency)
+
+
+def _get_slot_keys(target_url: str) -> List[str]:
+    return [
+        _get_cache_key(target_url, f"slot:{slot}")
+        for slot in range(settings.WEBHOOK_TARGET_MAX_CONCURRENCY)
+    ]
+
+
+def acquire_concurrency_slot(target_url: str) -> Optional[int]:
+    """Reserve a slot for a request to the target if it's below the limit.
+
+    Return the number of the reserved slot, or `None` when the target has too many
+    requests in progress. Each slot is a separate key expiring after twice the
+    webhook timeout, so slots of workers that were killed before releasing them are
+    not lost forever, while slots of running requests are kept. Workers acquiring
+    slots at the same time may exceed the adapted limit, but never
+    `WEBHOOK_TARGET_MAX_CONCURRENCY`.
+    """
+    if not is_concurrency_limit_enabled():
+        return 0
+    slot_keys = _get_slot_keys(target_url)
+    taken_slot_keys = cache.get_many(slot_keys)
+    if len(taken_slot_keys) >= get_concurrency_limit(target_url):
+        return None
+    for slot, key in enumerate(slot_keys):
+        if key in taken_slot_keys:
+            continue
+        if cache.add(key, True, timeout=settings.WEBHOOK_TIMEOUT * 2):
+            return slot
+    return None
+
+
+def release_concurrency_slot(target_url: str, slot: int):
+    if not is_concurrency_limit_enabled():
+        return
+    cache.delete(_get_cache_key(target_url, f"slot:{slot}"))
+
+
+def record_concurrency_result(target_url: str, failed: bool):
+    """Adapt the concurrency limit of the target to its responses.
+
+    The limit is halved on each failed request and raised by one on each
+    successful one, up to `WEBHOOK_TARGET_MAX_CONCURRENCY`.
+    """
+    if not is_concurrency_limit_enabled():
+        return
+    limit = get_concurrency_limit(target_url)
+    if failed:
+        new_limit = max(1, limit // 2)
+    else:
+        new_limit = min(settings.WEBHOOK_TARGET_MAX_CONCURRENCY, limit + 1)
+    if new_limit != limit:
+        cache.set(
+            _get_cache_key(target_url, "limit"),
+            new_limit,
+            timeout=CONCURRENCY_LIMIT_TIMEOUT,
+        )
@@ -1,13 +1,27 @@
 import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from json import JSONDecodeError
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from time import monotonic
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from urllib.parse import unquote, urlparse, urlunparse
 
 import boto3
-import requests
+from asgiref.local import Local
 from botocore.exceptions import ClientError
 from celery import group
 from celery.exceptions import MaxRetriesExceededError, Retry
@@ -21,7 +35,7 @@ from requests.exceptions import RequestException
 from ...app.headers import AppHeaders, DeprecatedAppHeaders
 from ...celeryconf import app
 from ...core import EventDeliveryStatus
-from ...core.models import EventDelivery, EventPayload
+from ...core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ...core.tracing import webhooks_opentracing_trace
 from ...core.utils import build_absolute_uri
 from ...core.utils.events import call_event
@@ -45,15 +59,23 @@ from ...webhook.payloads import generate_transaction_action_request_payload
 from ...webhook.utils import get_webhooks_for_event
 from . import signature_for_payload
 from .const import WEBHOOK_CACHE_DEFAULT_TIMEOUT
+from .target_limits import (
+    acquire_circuit,
+    acquire_concurrency_slot,
+    record_circuit_result,
+    record_concurrency_result,
+    release_concurrency_slot,
+)
+from .transport import webhook_http_transport
 from .utils import (
     attempt_update,
     catch_duration_time,
     clear_successful_delivery,
     create_attempt,
-    create_event_delivery_list_for_webhooks,
     delivery_update,
     generate_cache_key_for_webhook,
     get_delivery_for_webhook,
+    save_event_deliveries,
 )
 
 if TYPE_CHECKING:
@@ -62,6 +84,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 task_logger = get_task_logger(__name__)
 
+_async_deliveries_batch = Local()
+
 
 class WebhookSchemes(str, Enum):
     HTTP = "http"
@@ -94,13 +118,23 @@ def create_deliveries_for_subscriptions(
     :param requestor: used in subscription webhooks to generate meta data for payload.
     :return: List of event deliveries to send via webhook tasks.
     """
+    return save_event_deliveries(
+        prepare_deliveries_for_subscriptions(
+            event_type, subscribable_object, webhooks, requestor
+        )
+    )
+
+
+def prepare_deliveries_for_subscriptions(
+    event_type, subscribable_object, webhooks, requestor=None
+) -> List[EventDelivery]:
+    """Return unsaved event deliveries with payloads based on subscription query."""
     if event_type not in WEBHOOK_TYPES_MAP:
         logger.info(
             "Skipping subscription webhook. Event %s is not subscribable.", event_type
         )
         return []
 
-    event_payloads = []
     event_deliveries = []
     for webhook in webhooks:
         data = generate_payload_from_subscription(
@@ -119,19 +153,15 @@ def create_deliveries_for_subscriptions(
                 "No payload was generated with subscription for event: %s" % event_type
             )
             continue
-        event_payload = EventPayload(payload=json.dumps({**data}))
-        event_payloads.append(event_payload)
         event_deliveries.append(
             EventDelivery(
                 status=EventDeliveryStatus.PENDING,
                 event_type=event_type,
-                payload=event_payload,
+                payload=EventPayload(payload=json.dumps({**data})),
                 webhook=webhook,
             )
         )
-
-    EventPayload.objects.bulk_create(event_payloads)
-    return EventDelivery.objects.bulk_create(event_deliveries)
+    return event_deliveries
 
 
 def create_delivery_for_subscription_sync_event(
@@ -189,6 +219,9 @@ def trigger_webhooks_async(
 ):
     """Trigger async webhooks - both regular and subscription.
 
+    Within `batch_async_webhook_deliveries` block, deliveries are saved and enqueued
+    once the block ends.
+
     :param data: used as payload in regular webhooks.
     :param event_type: used in both webhook types as event type.
     :param webhooks: used in both webhook types, queryset of async webhooks.
@@ -198,17 +231,19 @@ def trigger_webhooks_async(
     regular_webhooks, subscription_webhooks = group_webhooks_by_subscription(webhooks)
     deliveries = []
     if regular_webhooks:
-        payload = EventPayload.objects.create(payload=data)
+        payload = EventPayload(payload=data)
         deliveries.extend(
-            create_event_delivery_list_for_webhooks(
-                webhooks=regular_webhooks,
-                event_payload=payload,
+            EventDelivery(
+                status=EventDeliveryStatus.PENDING,
                 event_type=event_type,
+                payload=payload,
+                webhook=webhook,
             )
+            for webhook in regular_webhooks
         )
     if subscription_webhooks:
         deliveries.extend(
-            create_deliveries_for_subscriptions(
+            prepare_deliveries_for_subscriptions(
                 event_type=event_type,
                 subscribable_object=subscribable_object,
                 webhooks=subscription_webhooks,
@@ -216,10 +251,48 @@ def trigger_webhooks_async(
             )
         )
 
-    for delivery in deliveries:
+    batch = getattr(_async_deliveries_batch, "deliveries", None)
+    if batch is not None:
+        batch.extend(deliveries)
+        return
+
+    for delivery in save_event_deliveries(deliveries):
         send_webhook_request_async.delay(delivery.id)
 
 
+@contextmanager
+def batch_async_webhook_deliveries():
+    """Defer sending async webhooks triggered within the block until it ends.
+
+    Deliveries of all triggered events are saved with a single query and sent by
+    tasks handling `WEBHOOK_ASYNC_BATCH_SIZE` deliveries each, instead of a task
+    per delivery. Does nothing when the batch size is not set.
+    """
+    batch_size = settings.WEBHOOK_ASYNC_BATCH_SIZE
+    if (
+        not batch_size
+        or getattr(_async_deliveries_batch, "deliveries", None) is not None
+    ):
+        yield
+        return
+
+    deliveries: List[EventDelivery] = []
+    _async_deliveries_batch.deliveries = deliveries
+    try:
+        yield
+    finally:
+        _async_deliveries_batch.deliveries = None
+        if deliveries:
+            delivery_ids = [
+                delivery.id for delivery in save_event_deliveries(deliveries)
+            ]
+            tasks = [
+                send_webhook_requests_async.s(delivery_ids[i : i + batch_size])
+                for i in range(0, len(delivery_ids), batch_size)
+            ]
+            group(tasks).apply_async()
+
+
 def group_webhooks_by_subscription(webhooks):
     subscription = [webhook for webhook in webhooks if webhook.subscription_query]
     regular = [webhook for webhook in webhooks if not webhook.subscription_query]
@@ -302,23 +375,18 @@ def trigger_webhook_sync(
 R = TypeVar("R")
 
 
-def trigger_all_webhooks_sync(
+def _create_deliveries_sync(
+    webhooks,
     event_type: str,
     generate_payload: Callable,
-    parse_response: Callable[[Any], Optional[R]],
     subscribable_object=None,
     requestor=None,
     allow_replica=True,
-) -> Optional[R]:
-    """Send all synchronous webhook request for given event type.
+) -> Iterator[Optional[EventDelivery]]:
+    """Lazily create deliveries of the event for the given webhooks.
 
-    Requests are send sequentially.
-    If the current webhook does not return expected response,
-    the next one is send.
-    If no webhook responds with expected response,
-    this function returns None.
+    Yields None when the payload of a subscription webhook can't be generated.
     """
-    webhooks = get_webhooks_for_event(event_type)
     request_context = None
     event_payload = None
     for webhook in webhooks:
@@ -331,31 +399,154 @@ def trigger_all_webhooks_sync(
                     event_type=event_type,
                 )
 
-            delivery = create_delivery_for_subscription_sync_event(
+            yield create_delivery_for_subscription_sync_event(
                 event_type=event_type,
                 subscribable_object=subscribable_object,
                 webhook=webhook,
                 request=request_context,
                 requestor=requestor,
             )
-            if not delivery:
-                return None
         else:
             if event_payload is None:
                 event_payload = EventPayload.objects.create(payload=generate_payload())
-            delivery = EventDelivery.objects.create(
+            yield EventDelivery.objects.create(
                 status=EventDeliveryStatus.PENDING,
                 event_type=event_type,
                 payload=event_payload,
                 webhook=webhook,
             )
 
+
+def trigger_all_webhooks_sync(
+    event_type: str,
+    generate_payload: Callable,
+    parse_response: Callable[[Any], Optional[R]],
+    subscribable_object=None,
+    requestor=None,
+    allow_replica=True,
+) -> Optional[R]:
+    """Send all synchronous webhook request for given event type.
+
+    Requests are send sequentially.
+    If the current webhook does not return expected response,
+    the next one is send.
+    If no webhook responds with expected response,
+    this function returns None.
+
+    When `WEBHOOK_SYNC_MAX_WORKERS` is set, requests to all webhooks are sent
+    concurrently instead, see `send_webhook_requests_sync_concurrently`.
+    """
+    webhooks = get_webhooks_for_event(event_type)
+    deliveries = _create_deliveries_sync(
+        webhooks,
+        event_type,
+        generate_payload,
+        subscribable_object=subscribable_object,
+        requestor=requestor,
+        allow_replica=allow_replica,
+    )
+    if settings.WEBHOOK_SYNC_MAX_WORKERS > 1 and len(webhooks) > 1:
+        # as with sequential requests, webhooks following the one whose payload
+        # can't be generated are not called
+        created_deliveries = []
+        for delivery in deliveries:
+            if not delivery:
+                break
+            created_deliveries.append(delivery)
+        if not created_deliveries:
+            return None
+        return send_webhook_requests_sync_concurrently(
+            created_deliveries, parse_response
+        )
+
+    for delivery in deliveries:
+        if not delivery:
+            return None
         response_data = send_webhook_request_sync(delivery)
         if parsed_response := parse_response(response_data):
             return parsed_response
     return None
 
 
+def send_webhook_requests_sync_concurrently(
+    deliveries: List[EventDelivery],
+    parse_response: Callable[[Any], Optional[R]],
+    timeout=settings.WEBHOOK_SYNC_TIMEOUT,
+) -> Optional[R]:
+    """Send requests for all deliveries at once and return the first valid response.
+
+    Only the HTTP requests are made in worker threads; deliveries and attempts are
+    stored in the calling thread, as it may run inside a transaction. Responses are
+    checked in the order of deliveries, so the first webhook that returns expected
+    response wins, as with sequential requests.
+
+    Requests run in a pool owned by the call, so requests that are no longer waited
+    for don't hold workers of other calls. Requests still running once the response
+    is found, or once the timeout passes, are abandoned and their attempts are
+    marked as failed.
+    """
+    domain = Site.objects.get_current().domain
+    deadline = monotonic() + timeout
+    executor = ThreadPoolExecutor(
+        max_workers=min(settings.WEBHOOK_SYNC_MAX_WORKERS, len(deliveries)),
+        thread_name_prefix="webhooks-sync",
+    )
+    pending: List[Tuple[EventDelivery, EventDeliveryAttempt, Future]] = []
+    try:
+        for delivery in deliveries:
+            message, signature = _prepare_webhook_request_sync(delivery)
+            attempt = create_attempt(delivery=delivery, task_id=None)
+            webhook = delivery.webhook
+            future = executor.submit(
+                _send_prepared_webhook_request_sync,
+                webhook,
+                webhook.app,
+                delivery.event_type,
+                message,
+                domain,
+                signature,
+                timeout=timeout,
+            )
+            pending.append((delivery, attempt, future))
+
+        for index, (delivery, attempt, future) in enumerate(pending):
+            try:
+                response = future.result(timeout=max(deadline - monotonic(), 0))
+            except FutureTimeoutError:
+                _abandon_webhook_request_sync(delivery, attempt, future)
+                continue
+            response_data = _handle_webhook_response_sync(delivery, attempt, response)
+            if response.status != EventDeliveryStatus.SUCCESS:
+                response_data = None
+            if parsed_response := parse_response(response_data):
+                for other_delivery, other_attempt, other_future in pending[index + 1 :]:
+                    _abandon_webhook_request_sync(
+                        other_delivery, other_attempt, other_future
+                    )
+                return parsed_response
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _abandon_webhook_request_sync(delivery, attempt, future: Future):
+    if not future.cancel() and future.done():
+        # the request already finished, so its result is stored as usual
+        _handle_webhook_response_sync(delivery, attempt, future.result())
+        return
+    logger.info(
+        "[Webhook] Abandoned request to %r. ID of failed DeliveryAttempt: %r . ",
+        delivery.webhook.target_url,
+        attempt.id,
+    )
+    response = WebhookResponse(
+        content="Request abandoned", status=EventDeliveryStatus.FAILED
+    )
+    attempt_update(attempt, response)
+    delivery_update(delivery, response.status)
+    observability.report_event_delivery_attempt(attempt)
+
+
 def send_webhook_using_http(
     target_url,
     message,
@@ -392,8 +583,15 @@ def send_webhook_using_http(
     if custom_headers:
         headers.update(custom_headers)
 
+    if not acquire_circuit(target_url):
+        return WebhookResponse(
+            content="Requests to the target are suspended after repeated failures.",
+            status=EventDeliveryStatus.FAILED,
+            request_headers=headers,
+        )
+
     try:
-        response = requests.post(
+        response = webhook_http_transport.post(
             target_url,
             data=message,
             headers=headers,
@@ -401,6 +599,7 @@ def send_webhook_using_http(
             allow_redirects=False,
         )
     except RequestException as e:
+        record_target_result(target_url, failed=True)
         if e.response:
             result = WebhookResponse(
                 content=e.response.text,
@@ -417,6 +616,7 @@ def send_webhook_using_http(
             )
         return result
 
+    record_target_result(target_url, failed=is_target_failure(response.status_code))
     return WebhookResponse(
         content=response.text,
         request_headers=headers,
@@ -429,6 +629,16 @@ def send_webhook_using_http(
     )
 
 
+def is_target_failure(status_code: int) -> bool:
+    """Return whether the response means that the target can't handle requests."""
+    return status_code >= 500 or status_code == 429
+
+
+def record_target_result(target_url: str, failed: bool):
+    record_circuit_result(target_url, failed)
+    record_concurrency_result(target_url, failed)
+
+
 def send_webhook_using_aws_sqs(
     target_url, message, domain, signature, event_type, **kwargs
 ):
@@ -579,49 +789,72 @@ def handle_webhook_retry(
     return is_success
 
 
+def _send_webhook_request_async(delivery) -> WebhookResponse:
+    webhook = delivery.webhook
+    domain = Site.objects.get_current().domain
+    if not delivery.payload:
+        raise ValueError("Event delivery id: %r has no payload." % delivery.id)
+    data = delivery.payload.payload
+    with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
+        return send_webhook_using_scheme_method(
+            webhook.target_url,
+            domain,
+            webhook.secret_key,
+            delivery.event_type,
+            data,
+            webhook.custom_headers,
+        )
+
+
+def _send_webhook_request_async_in_slot(delivery, slot: int) -> WebhookResponse:
+    """Send the request and release the concurrency slot acquired for its target."""
+    try:
+        return _send_webhook_request_async(delivery)
+    finally:
+        release_concurrency_slot(delivery.webhook.target_url, slot)
+
+
+def _log_webhook_request_async_success(delivery):
+    task_logger.info(
+        "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
+        delivery.webhook.id,
+        delivery.webhook.target_url,
+        delivery.event_type,
+        delivery.id,
+    )
+
+
 @app.task(
     queue=settings.WEBHOOK_CELERY_QUEUE_NAME,
     bind=True,
     retry_backoff=10,
     retry_kwargs={"max_retries": 5},
 )
-def send_webhook_request_async(self, event_delivery_id):
+def send_webhook_request_async(self, event_delivery_id, deferrals=0):
     delivery = get_delivery_for_webhook(event_delivery_id)
     if not delivery:
         return None
 
-    webhook = delivery.webhook
-    domain = Site.objects.get_current().domain
+    target_url = delivery.webhook.target_url
+    slot = acquire_concurrency_slot(target_url)
+    if slot is None:
+        defer_webhook_request_async(
+            delivery, retries=self.request.retries, deferrals=deferrals
+        )
+        return None
+
     attempt = create_attempt(delivery, self.request.id)
     delivery_status = EventDeliveryStatus.SUCCESS
     try:
-        if not delivery.payload:
-            raise ValueError(
-                "Event delivery id: %r has no payload." % event_delivery_id
-            )
-        data = delivery.payload.payload
-        with webhooks_opentracing_trace(delivery.event_type, domain, app=webhook.app):
-            response = send_webhook_using_scheme_method(
-                webhook.target_url,
-                domain,
-                webhook.secret_key,
-                delivery.event_type,
-                data,
-                webhook.custom_headers,
-            )
-
+        response = _send_webhook_request_async_in_slot(delivery, slot)
         attempt_update(attempt, response)
         if response.status == EventDeliveryStatus.FAILED:
-            handle_webhook_retry(self, webhook, response.content, delivery, attempt)
+            handle_webhook_retry(
+                self, delivery.webhook, response.content, delivery, attempt
+            )
             delivery_status = EventDeliveryStatus.FAILED
         elif response.status == EventDeliveryStatus.SUCCESS:
-            task_logger.info(
-                "[Webhook ID:%r] Payload sent to %r for event %r. Delivery id: %r",
-                webhook.id,
-                webhook.target_url,
-                delivery.event_type,
-                delivery.id,
-            )
+            _log_webhook_request_async_success(delivery)
         delivery_update(delivery, delivery_status)
     except ValueError as e:
         response = WebhookResponse(content=str(e), status=EventDeliveryStatus.FAILED)
@@ -631,15 +864,95 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
-def _send_webhook_request_sync(
-    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
-) -> Tuple[WebhookResponse, Optional[Dict[Any, Any]]]:
-    event_payload = delivery.payload
-    data = event_payload.payload
+def defer_webhook_request_async(delivery, retries=0, deferrals=0):
+    """Reschedule the delivery as its target has too many requests in progress.
+
+    The deferred delivery keeps its number of retries, as no request was sent. Once
+    it was deferred `WEBHOOK_TARGET_MAX_DEFERRALS` times, it's marked as failed.
+    """
+    if deferrals >= settings.WEBHOOK_TARGET_MAX_DEFERRALS:
+        task_logger.warning(
+            "[Webhook ID: %r] Failed request to %r as it had too many requests in "
+            "progress for too long. Delivery id: %r",
+            delivery.webhook.id,
+            delivery.webhook.target_url,
+            delivery.id,
+        )
+        delivery_update(delivery, EventDeliveryStatus.FAILED)
+        return
+    task_logger.info(
+        "[Webhook ID: %r] Deferred request to %r as it has too many requests in "
+        "progress. Delivery id: %r",
+        delivery.webhook.id,
+        delivery.webhook.target_url,
+        delivery.id,
+    )
+    send_webhook_request_async.apply_async(
+        (delivery.id,),
+        {"deferrals": deferrals + 1},
+        countdown=settings.WEBHOOK_TARGET_DEFER_DELAY,
+        retries=retries,
+    )
+
+
+@app.task(queue=settings.WEBHOOK_CELERY_QUEUE_NAME, bind=True)
+def send_webhook_requests_async(self, event_delivery_ids):
+    """Send several deliveries in a single task.
+
+    Failed deliveries are marked as failed and handed over to
+    `send_webhook_request_async`, so they are retried one by one, without resending
+    the rest of the batch.
+    """
+    for event_delivery_id in event_delivery_ids:
+        delivery = get_delivery_for_webhook(event_delivery_id)
+        if not delivery:
+            continue
+
+        target_url = delivery.webhook.target_url
+        slot = acquire_concurrency_slot(target_url)
+        if slot is None:
+            defer_webhook_request_async(delivery)
+            continue
+
+        attempt = create_attempt(delivery, self.request.id)
+        try:
+            response = _send_webhook_request_async_in_slot(delivery, slot)
+        except ValueError as e:
+            response = WebhookResponse(
+                content=str(e), status=EventDeliveryStatus.FAILED
+            )
+            attempt_update(attempt, response)
+            delivery_update(delivery=delivery, status=EventDeliveryStatus.FAILED)
+        else:
+            attempt_update(attempt, response)
+            if response.status == EventDeliveryStatus.FAILED:
+                task_logger.info(
+                    "[Webhook ID: %r] Failed request to %r: %r for event: %r."
+                    " Delivery attempt id: %r",
+                    delivery.webhook.id,
+                    delivery.webhook.target_url,
+                    response.content,
+                    delivery.event_type,
+                    attempt.id,
+                )
+                # the request sent in the batch counts as the first try
+                send_webhook_request_async.apply_async(
+                    (delivery.id,),
+                    countdown=send_webhook_request_async.retry_backoff,
+                    retries=1,
+                )
+            else:
+                _log_webhook_request_async_success(delivery)
+            delivery_update(delivery, response.status)
+        observability.report_event_delivery_attempt(attempt)
+        clear_successful_delivery(delivery)
+
+
+def _prepare_webhook_request_sync(delivery) -> Tuple[bytes, str]:
+    """Return the message and its signature to send for the given delivery."""
     webhook = delivery.webhook
     parts = urlparse(webhook.target_url)
-    domain = Site.objects.get_current().domain
-    message = data.encode("utf-8")
+    message = delivery.payload.payload.encode("utf-8")
     signature = signature_for_payload(message, webhook.secret_key)
 
     if parts.scheme.lower() not in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
@@ -651,26 +964,38 @@ def _send_webhook_request_sync(
         webhook.target_url,
         delivery.event_type,
     )
-    if attempt is None:
-        attempt = create_attempt(delivery=delivery, task_id=None)
-    response = WebhookResponse(content="")
-    response_data = None
+    return message, signature
+
+
+def _send_prepared_webhook_request_sync(
+    webhook: "Webhook",
+    app,
+    event_type: str,
+    message: bytes,
+    domain: str,
+    signature: str,
+    timeout=settings.WEBHOOK_SYNC_TIMEOUT,
+) -> WebhookResponse:
+    with webhooks_opentracing_trace(event_type, domain, sync=True, app=app):
+        return send_webhook_using_http(
+            webhook.target_url,
+            message,
+            domain,
+            signature,
+            event_type,
+            timeout=timeout,
+            custom_headers=webhook.custom_headers,
+        )
 
-    try:
-        with webhooks_opentracing_trace(
-            delivery.event_type, domain, sync=True, app=webhook.app
-        ):
-            response = send_webhook_using_http(
-                webhook.target_url,
-                message,
-                domain,
-                signature,
-                delivery.event_type,
-                timeout=timeout,
-                custom_headers=webhook.custom_headers,
-            )
-            response_data = json.loads(response.content)
 
+def _handle_webhook_response_sync(
+    delivery, attempt, response: WebhookResponse
+) -> Optional[Dict[Any, Any]]:
+    """Parse the webhook response and store its result in the delivery."""
+    webhook = delivery.webhook
+    response_data = None
+    try:
+        response_data = json.loads(response.content)
     except JSONDecodeError as e:
         logger.info(
             "[Webhook] Failed parsing JSON response from %r: %r."
@@ -701,6 +1026,27 @@ def _send_webhook_request_sync(
     delivery_update(delivery, response.status)
     observability.report_event_delivery_attempt(attempt)
     clear_successful_delivery(delivery)
+    return response_data
+
+
+def _send_webhook_request_sync(
+    delivery, timeout=settings.WEBHOOK_SYNC_TIMEOUT, attempt=None
+) -> Tuple[WebhookResponse, Optional[Dict[Any, Any]]]:
+    webhook = delivery.webhook
+    domain = Site.objects.get_current().domain
+    message, signature = _prepare_webhook_request_sync(delivery)
+    if attempt is None:
+        attempt = create_attempt(delivery=delivery, task_id=None)
+    response = _send_prepared_webhook_request_sync(
+        webhook,
+        webhook.app,
+        delivery.event_type,
+        message,
+        domain,
+        signature,
+        timeout=timeout,
+    )
+    response_data = _handle_webhook_response_sync(delivery, attempt, response)
     return response, response_data
 
 
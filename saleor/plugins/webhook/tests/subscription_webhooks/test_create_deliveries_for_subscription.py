@@ -4,6 +4,7 @@ from unittest.mock import patch
 import graphene
 import pytest
 from freezegun import freeze_time
+from graphql.execution import ExecutionResult
 
 from .....channel.models import Channel
 from .....giftcard.models import GiftCard
@@ -2563,18 +2564,20 @@ def test_create_deliveries_for_subscriptions_unsubscribable_event(
     assert len(deliveries) == 0
 
 
-@patch("saleor.graphql.webhook.subscription_payload.get_default_backend")
+@patch("saleor.graphql.webhook.subscription_payload.get_subscription_document")
 @patch.object(logger, "info")
 def test_create_deliveries_for_subscriptions_document_executed_with_error(
     mocked_task_logger,
-    mocked_backend,
+    mocked_get_document,
     product,
     subscription_product_updated_webhook,
 ):
     # given
     webhooks = [subscription_product_updated_webhook]
     event_type = WebhookEventAsyncType.ORDER_CREATED
-    mocked_backend.document_from_string.execute.errors = "errors"
+    mocked_get_document.return_value.execute.return_value = ExecutionResult(
+        errors=["errors"], invalid=True
+    )
     # when
     deliveries = create_deliveries_for_subscriptions(event_type, product, webhooks)
     # then
@@ -39,16 +39,17 @@ def test_get_shipping_methods_for_checkout_set_cache(
     assert mocked_cache_set.called
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.set")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_get_shipping_methods_no_webhook_response_does_not_set_cache(
     mocked_webhook,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     checkout_with_item,
     shipping_app,
 ):
     # given
+    mocked_cache.get.return_value = None
     mocked_webhook.return_value = None
     plugin = webhook_plugin()
 
@@ -57,20 +58,20 @@ def test_get_shipping_methods_no_webhook_response_does_not_set_cache(
 
     # then
     assert mocked_webhook.called
-    assert not mocked_cache_set.called
+    assert not mocked_cache.set.called
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.get")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_get_shipping_methods_for_checkout_use_cache(
     mocked_webhook,
-    mocked_cache_get,
+    mocked_cache,
     webhook_plugin,
     checkout_with_item,
     shipping_app,
 ):
     # given
-    mocked_cache_get.return_value = [
+    mocked_cache.get.return_value = [
         {
             "id": "method-1",
             "name": "Standard Shipping",
@@ -85,20 +86,20 @@ def test_get_shipping_methods_for_checkout_use_cache(
 
     # then
     assert not mocked_webhook.called
-    assert mocked_cache_get.called
+    assert mocked_cache.get.called
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.get")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_get_shipping_methods_for_checkout_use_cache_for_empty_list(
     mocked_webhook,
-    mocked_cache_get,
+    mocked_cache,
     webhook_plugin,
     checkout_with_item,
     shipping_app,
 ):
     # given
-    mocked_cache_get.return_value = []
+    mocked_cache.get.return_value = []
     plugin = webhook_plugin()
 
     # when
@@ -106,16 +107,14 @@ def test_get_shipping_methods_for_checkout_use_cache_for_empty_list(
 
     # then
     assert not mocked_webhook.called
-    assert mocked_cache_get.called
+    assert mocked_cache.get.called
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.cache.get")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_checkout_change_invalidates_cache_key(
     mocked_webhook,
-    mocked_cache_get,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     checkout_with_item,
     shipping_app,
@@ -130,7 +129,7 @@ def test_checkout_change_invalidates_cache_key(
         }
     ]
     mocked_webhook.return_value = mocked_webhook_response
-    mocked_cache_get.return_value = None
+    mocked_cache.get.return_value = None
 
     payload = generate_checkout_payload(checkout_with_item)
     key_data = get_cache_data_for_shipping_list_methods_for_checkout(payload)
@@ -158,21 +157,19 @@ def test_checkout_change_invalidates_cache_key(
 
     # then
     assert cache_key != new_cache_key
-    mocked_cache_get.assert_called_once_with(new_cache_key)
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.get.assert_called_once_with(new_cache_key)
+    mocked_cache.set.assert_called_once_with(
         new_cache_key,
         mocked_webhook_response,
         timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
     )
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.cache.get")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_ignore_selected_fields_on_generating_cache_key(
     mocked_webhook,
-    mocked_cache_get,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     checkout_with_item,
     shipping_app,
@@ -187,7 +184,7 @@ def test_ignore_selected_fields_on_generating_cache_key(
         }
     ]
     mocked_webhook.return_value = mocked_webhook_response
-    mocked_cache_get.return_value = None
+    mocked_cache.get.return_value = None
 
     payload = generate_checkout_payload(checkout_with_item)
     key_data = get_cache_data_for_shipping_list_methods_for_checkout(payload)
@@ -215,8 +212,8 @@ def test_ignore_selected_fields_on_generating_cache_key(
 
     # then
     assert cache_key == new_cache_key
-    mocked_cache_get.assert_called_once_with(new_cache_key)
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.get.assert_called_once_with(new_cache_key)
+    mocked_cache.set.assert_called_once_with(
         new_cache_key,
         mocked_webhook_response,
         timeout=CACHE_TIME_SHIPPING_LIST_METHODS_FOR_CHECKOUT,
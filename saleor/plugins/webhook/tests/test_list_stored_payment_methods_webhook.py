@@ -25,13 +25,11 @@ subscription {
 """
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.cache.get")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_list_stored_payment_methods_with_static_payload(
     mock_request,
-    mocked_cache_get,
-    mocked_cache_set,
+    mocked_cache,
     channel_USD,
     customer_user,
     webhook_plugin,
@@ -40,7 +38,7 @@ def test_list_stored_payment_methods_with_static_payload(
 ):
     # given
     mock_request.return_value = webhook_list_stored_payment_methods_response
-    mocked_cache_get.return_value = None
+    mocked_cache.get.return_value = None
     webhook = list_stored_payment_methods_app.webhooks.first()
 
     plugin = webhook_plugin()
@@ -67,8 +65,8 @@ def test_list_stored_payment_methods_with_static_payload(
     delivery = EventDelivery.objects.get()
     mock_request.assert_called_once_with(delivery, timeout=WEBHOOK_SYNC_TIMEOUT)
 
-    mocked_cache_get.assert_called_once_with(expected_cache_key)
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.get.assert_called_once_with(expected_cache_key)
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         webhook_list_stored_payment_methods_response,
         timeout=WEBHOOK_CACHE_DEFAULT_TIMEOUT,
@@ -82,13 +80,11 @@ def test_list_stored_payment_methods_with_static_payload(
     )
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.cache.get")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_list_stored_payment_methods_with_subscription_payload(
     mock_request,
-    mocked_cache_get,
-    mocked_cache_set,
+    mocked_cache,
     channel_USD,
     customer_user,
     webhook_plugin,
@@ -97,7 +93,7 @@ def test_list_stored_payment_methods_with_subscription_payload(
 ):
     # given
     mock_request.return_value = webhook_list_stored_payment_methods_response
-    mocked_cache_get.return_value = None
+    mocked_cache.get.return_value = None
 
     webhook = list_stored_payment_methods_app.webhooks.first()
     webhook.subscription_query = LIST_STORED_PAYMENT_METHODS
@@ -127,8 +123,8 @@ def test_list_stored_payment_methods_with_subscription_payload(
     delivery = EventDelivery.objects.get()
     mock_request.assert_called_once_with(delivery, timeout=WEBHOOK_SYNC_TIMEOUT)
 
-    mocked_cache_get.assert_called_once_with(expected_cache_key)
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.get.assert_called_once_with(expected_cache_key)
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         webhook_list_stored_payment_methods_response,
         timeout=WEBHOOK_CACHE_DEFAULT_TIMEOUT,
@@ -142,13 +138,11 @@ def test_list_stored_payment_methods_with_subscription_payload(
     )
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.cache.get")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_list_stored_payment_methods_uses_cache_if_available(
     mock_request,
-    mocked_cache_get,
-    mocked_cache_set,
+    mocked_cache,
     channel_USD,
     customer_user,
     webhook_plugin,
@@ -157,7 +151,7 @@ def test_list_stored_payment_methods_uses_cache_if_available(
 ):
     # given
     mock_request.return_value = webhook_list_stored_payment_methods_response
-    mocked_cache_get.return_value = webhook_list_stored_payment_methods_response
+    mocked_cache.get.return_value = webhook_list_stored_payment_methods_response
 
     webhook = list_stored_payment_methods_app.webhooks.first()
     webhook.subscription_query = LIST_STORED_PAYMENT_METHODS
@@ -184,9 +178,9 @@ def test_list_stored_payment_methods_uses_cache_if_available(
     response = plugin.list_stored_payment_methods(data, [])
 
     # then
-    mocked_cache_get.assert_called_once_with(expected_cache_key)
+    mocked_cache.get.assert_called_once_with(expected_cache_key)
     assert not mock_request.called
-    assert not mocked_cache_set.called
+    assert not mocked_cache.set.called
 
     assert response
     assert response == get_list_stored_payment_methods_from_response(
@@ -196,13 +190,11 @@ def test_list_stored_payment_methods_uses_cache_if_available(
     )
 
 
-@mock.patch("saleor.plugins.webhook.tasks.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.cache.get")
+@mock.patch("saleor.plugins.webhook.tasks.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 def test_list_stored_payment_methods_app_returns_incorrect_response(
     mock_request,
-    mocked_cache_get,
-    mocked_cache_set,
+    mocked_cache,
     channel_USD,
     customer_user,
     webhook_plugin,
@@ -211,7 +203,7 @@ def test_list_stored_payment_methods_app_returns_incorrect_response(
 ):
     # given
     mock_request.return_value = None
-    mocked_cache_get.return_value = None
+    mocked_cache.get.return_value = None
 
     webhook = list_stored_payment_methods_app.webhooks.first()
     webhook.subscription_query = LIST_STORED_PAYMENT_METHODS
@@ -241,7 +233,7 @@ def test_list_stored_payment_methods_app_returns_incorrect_response(
     delivery = EventDelivery.objects.get()
     mock_request.assert_called_once_with(delivery, timeout=WEBHOOK_SYNC_TIMEOUT)
 
-    mocked_cache_get.assert_called_once_with(expected_cache_key)
-    assert not mocked_cache_set.called
+    mocked_cache.get.assert_called_once_with(expected_cache_key)
+    assert not mocked_cache.set.called
 
     assert response == []
@@ -1,5 +1,6 @@
 import datetime
 import json
+import threading
 from collections import namedtuple
 from unittest import mock
 
@@ -17,7 +18,12 @@ from ....payment.utils import create_payment_information
 from ....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ....webhook.models import Webhook, WebhookEvent
 from .. import signature_for_payload
-from ..tasks import send_webhook_request_sync, trigger_webhook_sync
+from ..tasks import (
+    WebhookResponse,
+    send_webhook_request_sync,
+    trigger_all_webhooks_sync,
+    trigger_webhook_sync,
+)
 from ..utils import (
     parse_list_payment_gateways_response,
     parse_payment_action_response,
@@ -79,8 +85,198 @@ def test_trigger_webhook_sync_with_subscription(
     mock_request.assert_called_once_with(fake_delivery)
 
 
+@pytest.fixture
+def payment_app_with_two_webhooks(payment_app):
+    webhook = Webhook.objects.create(
+        name="payment-webhook-2",
+        app=payment_app,
+        target_url="https://payment-gateway-2.com/api/",
+    )
+    webhook.events.create(event_type=WebhookEventSyncType.PAYMENT_LIST_GATEWAYS)
+    return payment_app
+
+
+def _webhook_responses_by_url(responses, threads=None):
+    def send_webhook_using_http(target_url, *args, **kwargs):
+        if threads is not None:
+            threads.append(threading.current_thread().name)
+        return WebhookResponse(content=json.dumps(responses[target_url]))
+
+    return send_webhook_using_http
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_all_webhooks_sync_concurrently(
+    mock_send, payment_app_with_two_webhooks, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 2
+    mock_send.side_effect = _webhook_responses_by_url(
+        {
+            "https://payment-gateway.com/api/": {"id": "first"},
+            "https://payment-gateway-2.com/api/": {"id": "second"},
+        }
+    )
+
+    # when
+    response = trigger_all_webhooks_sync(
+        WebhookEventSyncType.PAYMENT_LIST_GATEWAYS,
+        lambda: "{}",
+        lambda data: data,
+    )
+
+    # then
+    assert response == {"id": "first"}
+    assert mock_send.call_count == 2
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_all_webhooks_sync_concurrently_marks_abandoned_attempts_as_failed(
+    mock_send, payment_app_with_two_webhooks, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 2
+    second_url = "https://payment-gateway-2.com/api/"
+    release_second_request = threading.Event()
+
+    def send_webhook_using_http(target_url, *args, **kwargs):
+        if target_url == second_url:
+            release_second_request.wait(timeout=5)
+        return WebhookResponse(content=json.dumps({"id": target_url}))
+
+    mock_send.side_effect = send_webhook_using_http
+
+    # when
+    response = trigger_all_webhooks_sync(
+        WebhookEventSyncType.PAYMENT_LIST_GATEWAYS,
+        lambda: "{}",
+        lambda data: data,
+    )
+    release_second_request.set()
+
+    # then
+    assert response == {"id": "https://payment-gateway.com/api/"}
+    delivery = EventDelivery.objects.get()
+    assert delivery.webhook.target_url == second_url
+    assert delivery.status == EventDeliveryStatus.FAILED
+    attempt = delivery.attempts.get()
+    assert attempt.status == EventDeliveryStatus.FAILED
+    assert attempt.response == "Request abandoned"
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_all_webhooks_sync_concurrently_uses_next_valid_response(
+    mock_send, payment_app_with_two_webhooks, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 2
+    mock_send.side_effect = _webhook_responses_by_url(
+        {
+            "https://payment-gateway.com/api/": {},
+            "https://payment-gateway-2.com/api/": {"id": "second"},
+        }
+    )
+
+    # when
+    response = trigger_all_webhooks_sync(
+        WebhookEventSyncType.PAYMENT_LIST_GATEWAYS,
+        lambda: "{}",
+        lambda data: data,
+    )
+
+    # then
+    assert response == {"id": "second"}
+    assert mock_send.call_count == 2
+    assert not EventDelivery.objects.exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_all_webhooks_sync_concurrently_sends_requests_in_threads(
+    mock_send, payment_app_with_two_webhooks, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 2
+    threads = []
+    mock_send.side_effect = _webhook_responses_by_url(
+        {
+            "https://payment-gateway.com/api/": {},
+            "https://payment-gateway-2.com/api/": {},
+        },
+        threads,
+    )
+
+    # when
+    response = trigger_all_webhooks_sync(
+        WebhookEventSyncType.PAYMENT_LIST_GATEWAYS,
+        lambda: "{}",
+        lambda data: data,
+    )
+
+    # then
+    assert response is None
+    assert len(threads) == 2
+    assert all(thread.startswith("webhooks-sync") for thread in threads)
+
+
+@mock.patch("saleor.plugins.webhook.tasks.create_delivery_for_subscription_sync_event")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_all_webhooks_sync_concurrently_stops_at_failed_payload(
+    mock_send, mock_delivery_create, payment_app_with_two_webhooks, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 2
+    second_webhook = payment_app_with_two_webhooks.webhooks.get(
+        target_url="https://payment-gateway-2.com/api/"
+    )
+    second_webhook.subscription_query = "subscription { event { __typename } }"
+    second_webhook.save(update_fields=["subscription_query"])
+    mock_delivery_create.return_value = None
+    mock_send.side_effect = _webhook_responses_by_url(
+        {"https://payment-gateway.com/api/": {"id": "first"}}
+    )
+
+    # when
+    response = trigger_all_webhooks_sync(
+        WebhookEventSyncType.PAYMENT_LIST_GATEWAYS,
+        lambda: "{}",
+        lambda data: data,
+    )
+
+    # then
+    assert response == {"id": "first"}
+    mock_send.assert_called_once()
+    assert mock_send.call_args.args[0] == "https://payment-gateway.com/api/"
+    mock_delivery_create.assert_called_once()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_http")
+def test_trigger_all_webhooks_sync_concurrently_disabled(
+    mock_send, payment_app_with_two_webhooks, settings
+):
+    # given
+    settings.WEBHOOK_SYNC_MAX_WORKERS = 0
+    mock_send.side_effect = _webhook_responses_by_url(
+        {
+            "https://payment-gateway.com/api/": {"id": "first"},
+            "https://payment-gateway-2.com/api/": {"id": "second"},
+        }
+    )
+
+    # when
+    response = trigger_all_webhooks_sync(
+        WebhookEventSyncType.PAYMENT_LIST_GATEWAYS,
+        lambda: "{}",
+        lambda data: data,
+    )
+
+    # then
+    assert response == {"id": "first"}
+    mock_send.assert_called_once()
+    assert mock_send.call_args.args[0] == "https://payment-gateway.com/api/"
+
+
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_send_webhook_request_sync_failed_attempt(
     mock_post, mock_observability, app, event_delivery
 ):
@@ -112,7 +308,7 @@ def test_send_webhook_request_sync_failed_attempt(
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 @mock.patch("saleor.plugins.webhook.tasks.clear_successful_delivery")
 def test_send_webhook_request_sync_successful_attempt(
     mock_clear_delivery, mock_post, mock_observability, app, event_delivery
@@ -147,7 +343,10 @@ def test_send_webhook_request_sync_successful_attempt(
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post", side_effect=RequestException)
+@mock.patch(
+    "saleor.plugins.webhook.tasks.webhook_http_transport.post",
+    side_effect=RequestException,
+)
 def test_send_webhook_request_sync_request_exception(
     mock_post, mock_observability, app, event_delivery
 ):
@@ -179,7 +378,7 @@ def test_send_webhook_request_sync_request_exception(
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_send_webhook_request_sync_when_exception_with_response(
     mock_post, mock_observability, app, event_delivery
 ):
@@ -200,7 +399,7 @@ def test_send_webhook_request_sync_when_exception_with_response(
 
 
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_send_webhook_request_sync_json_parsing_error(
     mock_post, mock_observability, app, event_delivery
 ):
@@ -231,7 +430,7 @@ def test_send_webhook_request_sync_json_parsing_error(
     mock_observability.assert_called_once_with(attempt)
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_send_webhook_request_with_proper_timeout(mock_post, event_delivery, app):
     mock_post().text = '{"key": "response_text"}'
     mock_post().headers = {"header_key": "header_val"}
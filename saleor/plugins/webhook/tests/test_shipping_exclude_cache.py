@@ -7,8 +7,7 @@ from ...base_plugin import ExcludedShippingMethod
 from ..const import CACHE_EXCLUDED_SHIPPING_KEY, CACHE_EXCLUDED_SHIPPING_TIME
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.get")
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
@@ -16,8 +15,7 @@ from ..const import CACHE_EXCLUDED_SHIPPING_KEY, CACHE_EXCLUDED_SHIPPING_TIME
 def test_excluded_shipping_methods_for_order_use_cache(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
-    mocked_cache_get,
+    mocked_cache,
     webhook_plugin,
     order_with_lines,
     available_shipping_methods_factory,
@@ -39,7 +37,7 @@ def test_excluded_shipping_methods_for_order_use_cache(
     payload = json.dumps({"order": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
-    mocked_cache_get.return_value = (payload, [{"id": "1", "reason": webhook_reason}])
+    mocked_cache.get.return_value = (payload, [{"id": "1", "reason": webhook_reason}])
 
     plugin = webhook_plugin()
     available_shipping_methods = available_shipping_methods_factory(num_methods=2)
@@ -57,11 +55,10 @@ def test_excluded_shipping_methods_for_order_use_cache(
     # then
     assert not mocked_webhook.called
 
-    assert not mocked_cache_set.called
+    assert not mocked_cache.set.called
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.get")
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
@@ -69,8 +66,7 @@ def test_excluded_shipping_methods_for_order_use_cache(
 def test_excluded_shipping_methods_for_order_stores_in_cache_when_empty(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
-    mocked_cache_get,
+    mocked_cache,
     webhook_plugin,
     order_with_lines,
     available_shipping_methods_factory,
@@ -92,7 +88,7 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_empty(
     payload = json.dumps({"order": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
-    mocked_cache_get.return_value = None
+    mocked_cache.get.return_value = None
 
     plugin = webhook_plugin()
     available_shipping_methods = available_shipping_methods_factory(num_methods=2)
@@ -114,15 +110,14 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_empty(
 
     expected_excluded_shipping_method = [{"id": "1", "reason": webhook_reason}]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
     )
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.get")
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
@@ -130,8 +125,7 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_empty(
 def test_excluded_shipping_methods_for_order_stores_in_cache_when_payload_is_different(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
-    mocked_cache_get,
+    mocked_cache,
     webhook_plugin,
     order_with_lines,
     available_shipping_methods_factory,
@@ -153,7 +147,7 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_payload_is_dif
     payload = json.dumps({"order": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
-    mocked_cache_get.return_value = (
+    mocked_cache.get.return_value = (
         {"order": "different-payload"},
         [{"id": "1", "reason": webhook_reason}],
     )
@@ -178,15 +172,14 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_payload_is_dif
 
     expected_excluded_shipping_method = [{"id": "1", "reason": webhook_reason}]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
     )
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.get")
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
@@ -195,8 +188,7 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_payload_is_dif
 def test_excluded_shipping_methods_for_checkout_use_cache(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
-    mocked_cache_get,
+    mocked_cache,
     webhook_plugin,
     checkout_with_items,
     available_shipping_methods_factory,
@@ -219,7 +211,7 @@ def test_excluded_shipping_methods_for_checkout_use_cache(
     payload = json.dumps({"checkout": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
-    mocked_cache_get.return_value = (payload, [{"id": "1", "reason": webhook_reason}])
+    mocked_cache.get.return_value = (payload, [{"id": "1", "reason": webhook_reason}])
 
     plugin = webhook_plugin()
     available_shipping_methods = available_shipping_methods_factory(num_methods=2)
@@ -238,11 +230,10 @@ def test_excluded_shipping_methods_for_checkout_use_cache(
     # then
     assert not mocked_webhook.called
 
-    assert not mocked_cache_set.called
+    assert not mocked_cache.set.called
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.get")
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
@@ -251,8 +242,7 @@ def test_excluded_shipping_methods_for_checkout_use_cache(
 def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_empty(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
-    mocked_cache_get,
+    mocked_cache,
     webhook_plugin,
     checkout_with_items,
     available_shipping_methods_factory,
@@ -275,7 +265,7 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_empty(
     payload = json.dumps({"checkout": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
-    mocked_cache_get.return_value = None
+    mocked_cache.get.return_value = None
 
     plugin = webhook_plugin()
     available_shipping_methods = available_shipping_methods_factory(num_methods=2)
@@ -298,15 +288,14 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_empty(
 
     expected_excluded_shipping_method = [{"id": "1", "reason": webhook_reason}]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
     )
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.get")
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
@@ -315,8 +304,7 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_empty(
 def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_payload_different(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
-    mocked_cache_get,
+    mocked_cache,
     webhook_plugin,
     checkout_with_items,
     available_shipping_methods_factory,
@@ -339,7 +327,7 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_payload_dif
     payload = json.dumps({"checkout": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
-    mocked_cache_get.return_value = (
+    mocked_cache.get.return_value = (
         {"checkout": "different_payload"},
         [{"id": "1", "reason": webhook_reason}],
     )
@@ -363,7 +351,7 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_payload_dif
 
     expected_excluded_shipping_method = [{"id": "1", "reason": webhook_reason}]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
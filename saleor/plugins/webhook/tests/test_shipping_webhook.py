@@ -66,7 +66,7 @@ CHECKOUT_QUERY_SHIPPING_METHOD = """
 """
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
@@ -74,13 +74,14 @@ CHECKOUT_QUERY_SHIPPING_METHOD = """
 def test_excluded_shipping_methods_for_order(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     order_with_lines,
     available_shipping_methods_factory,
     shipping_app_factory,
 ):
     # given
+    mocked_cache.get.return_value = None
     shipping_app = shipping_app_factory()
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
@@ -126,14 +127,14 @@ def test_excluded_shipping_methods_for_order(
 
     expected_excluded_shipping_method = [{"id": "1", "reason": webhook_reason}]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
     )
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
@@ -141,13 +142,14 @@ def test_excluded_shipping_methods_for_order(
 def test_multiple_app_with_excluded_shipping_methods_for_order(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     order_with_lines,
     available_shipping_methods_factory,
     shipping_app_factory,
 ):
     # given
+    mocked_cache.get.return_value = None
     shipping_app = shipping_app_factory()
     second_shipping_app = shipping_app_factory(app_name="shipping-app2")
     webhook_reason = "Order contains dangerous products."
@@ -218,14 +220,14 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
         {"id": "2", "reason": webhook_second_reason},
     ]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
     )
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
@@ -233,13 +235,14 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
 def test_multiple_webhooks_on_the_same_app_with_excluded_shipping_methods_for_order(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     order_with_lines,
     available_shipping_methods_factory,
     shipping_app_factory,
 ):
     # given
+    mocked_cache.get.return_value = None
     shipping_app = shipping_app_factory()
     event_type = WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS
 
@@ -318,7 +321,7 @@ def test_multiple_webhooks_on_the_same_app_with_excluded_shipping_methods_for_or
         {"id": "2", "reason": webhook_second_reason},
     ]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
@@ -521,7 +524,7 @@ def test_trigger_webhook_sync(mock_request, shipping_app):
     mock_request.assert_called_once_with(event_delivery)
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
@@ -530,13 +533,14 @@ def test_trigger_webhook_sync(mock_request, shipping_app):
 def test_excluded_shipping_methods_for_checkout_webhook(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     checkout_with_items,
     available_shipping_methods_factory,
     shipping_app_factory,
 ):
     # given
+    mocked_cache.get.return_value = None
     shipping_app = shipping_app_factory()
     webhook_reason = "Checkout contains dangerous products."
     other_reason = "Shipping is not applicable for this checkout."
@@ -582,7 +586,7 @@ def test_excluded_shipping_methods_for_checkout_webhook(
 
     expected_excluded_shipping_method = [{"id": "1", "reason": webhook_reason}]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
@@ -634,7 +638,7 @@ def test_excluded_shipping_methods_for_checkout(
     mocked_webhook.assert_called_once()
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
@@ -643,13 +647,14 @@ def test_excluded_shipping_methods_for_checkout(
 def test_multiple_app_with_excluded_shipping_methods_for_checkout(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     checkout_with_items,
     available_shipping_methods_factory,
     shipping_app_factory,
 ):
     # given
+    mocked_cache.get.return_value = None
     shipping_app = shipping_app_factory()
     second_shipping_app = shipping_app_factory()
     webhook_reason = "Checkout contains dangerous products."
@@ -720,14 +725,14 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
         {"id": "2", "reason": webhook_second_reason},
     ]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
     )
 
 
-@mock.patch("saleor.plugins.webhook.shipping.cache.set")
+@mock.patch("saleor.plugins.webhook.shipping.cache")
 @mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
@@ -736,13 +741,14 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
 def test_multiple_webhooks_on_the_same_app_with_excluded_shipping_methods_for_checkout(
     mocked_payload,
     mocked_webhook,
-    mocked_cache_set,
+    mocked_cache,
     webhook_plugin,
     checkout_with_items,
     available_shipping_methods_factory,
     shipping_app_factory,
 ):
     # given
+    mocked_cache.get.return_value = None
     shipping_app = shipping_app_factory()
     event_type = WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS
 
@@ -820,7 +826,7 @@ def test_multiple_webhooks_on_the_same_app_with_excluded_shipping_methods_for_ch
         {"id": "2", "reason": webhook_second_reason},
     ]
 
-    mocked_cache_set.assert_called_once_with(
+    mocked_cache.set.assert_called_once_with(
         expected_cache_key,
         (payload, expected_excluded_shipping_method),
         CACHE_EXCLUDED_SHIPPING_TIME,
@@ -0,0 +1,305 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from ....core import EventDeliveryStatus
+from ....core.models import EventDelivery
+from ..target_limits import (
+    _get_cache_key,
+    acquire_circuit,
+    acquire_concurrency_slot,
+    get_concurrency_limit,
+    record_circuit_result,
+    record_concurrency_result,
+    release_concurrency_slot,
+)
+from ..tasks import (
+    WebhookResponse,
+    send_webhook_request_async,
+    send_webhook_requests_async,
+    send_webhook_using_http,
+)
+
+TARGET_URL = "http://www.example.com/webhook"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def circuit_breaker_settings(settings):
+    settings.WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE = 0.5
+    settings.WEBHOOK_CIRCUIT_BREAKER_MIN_REQUESTS = 4
+    return settings
+
+
+def _open_circuit_and_wait(target_url):
+    for _ in range(4):
+        record_circuit_result(target_url, failed=True)
+    # simulate the expiry of the open duration
+    cache.delete(_get_cache_key(target_url, "open"))
+
+
+def test_circuit_opened_when_failure_rate_reached(circuit_breaker_settings):
+    # given
+    record_circuit_result(TARGET_URL, failed=False)
+    record_circuit_result(TARGET_URL, failed=True)
+    record_circuit_result(TARGET_URL, failed=False)
+    assert acquire_circuit(TARGET_URL)
+
+    # when
+    record_circuit_result(TARGET_URL, failed=True)
+
+    # then
+    assert not acquire_circuit(TARGET_URL)
+    assert acquire_circuit("http://www.example.com/other-webhook")
+
+
+def test_circuit_not_opened_below_min_requests(circuit_breaker_settings):
+    # when
+    for _ in range(3):
+        record_circuit_result(TARGET_URL, failed=True)
+
+    # then
+    assert acquire_circuit(TARGET_URL)
+
+
+def test_half_open_circuit_lets_single_request_through(circuit_breaker_settings):
+    # given
+    _open_circuit_and_wait(TARGET_URL)
+
+    # when
+    first_acquired = acquire_circuit(TARGET_URL)
+    second_acquired = acquire_circuit(TARGET_URL)
+
+    # then
+    assert first_acquired
+    assert not second_acquired
+
+
+def test_half_open_circuit_closed_on_success(circuit_breaker_settings):
+    # given
+    _open_circuit_and_wait(TARGET_URL)
+    acquire_circuit(TARGET_URL)
+
+    # when
+    record_circuit_result(TARGET_URL, failed=False)
+
+    # then
+    assert acquire_circuit(TARGET_URL)
+    assert acquire_circuit(TARGET_URL)
+
+
+def test_half_open_circuit_opened_on_failure(circuit_breaker_settings):
+    # given
+    _open_circuit_and_wait(TARGET_URL)
+    acquire_circuit(TARGET_URL)
+
+    # when
+    record_circuit_result(TARGET_URL, failed=True)
+
+    # then
+    assert not acquire_circuit(TARGET_URL)
+
+
+def test_circuit_breaker_disabled(settings):
+    # given
+    settings.WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE = 0
+
+    # when
+    for _ in range(30):
+        record_circuit_result(TARGET_URL, failed=True)
+
+    # then
+    assert acquire_circuit(TARGET_URL)
+
+
+def test_concurrency_slots_limited(settings):
+    # given
+    settings.WEBHOOK_TARGET_MAX_CONCURRENCY = 2
+    first_slot = acquire_concurrency_slot(TARGET_URL)
+    second_slot = acquire_concurrency_slot(TARGET_URL)
+    assert {first_slot, second_slot} == {0, 1}
+
+    # when
+    slot = acquire_concurrency_slot(TARGET_URL)
+
+    # then
+    assert slot is None
+    release_concurrency_slot(TARGET_URL, first_slot)
+    assert acquire_concurrency_slot(TARGET_URL) == first_slot
+
+
+def test_expired_concurrency_slot_does_not_free_other_slots(settings):
+    # given
+    settings.WEBHOOK_TARGET_MAX_CONCURRENCY = 2
+    first_slot = acquire_concurrency_slot(TARGET_URL)
+    acquire_concurrency_slot(TARGET_URL)
+    # simulate the expiry of the slot of a killed worker
+    cache.delete(_get_cache_key(TARGET_URL, f"slot:{first_slot}"))
+
+    # when
+    slot = acquire_concurrency_slot(TARGET_URL)
+
+    # then
+    assert slot == first_slot
+    assert acquire_concurrency_slot(TARGET_URL) is None
+
+
+def test_concurrency_slots_limited_by_adapted_limit(settings):
+    # given
+    settings.WEBHOOK_TARGET_MAX_CONCURRENCY = 4
+    acquire_concurrency_slot(TARGET_URL)
+    acquire_concurrency_slot(TARGET_URL)
+
+    # when
+    record_concurrency_result(TARGET_URL, failed=True)
+
+    # then
+    assert acquire_concurrency_slot(TARGET_URL) is None
+
+
+def test_concurrency_limit_adapted_to_results(settings):
+    # given
+    settings.WEBHOOK_TARGET_MAX_CONCURRENCY = 8
+
+    # when
+    record_concurrency_result(TARGET_URL, failed=True)
+    record_concurrency_result(TARGET_URL, failed=True)
+
+    # then
+    assert get_concurrency_limit(TARGET_URL) == 2
+
+    # when
+    record_concurrency_result(TARGET_URL, failed=False)
+
+    # then
+    assert get_concurrency_limit(TARGET_URL) == 3
+
+
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
+def test_send_webhook_using_http_fails_fast_when_circuit_open(
+    mocked_post, circuit_breaker_settings
+):
+    # given
+    for _ in range(4):
+        record_circuit_result(TARGET_URL, failed=True)
+
+    # when
+    response = send_webhook_using_http(
+        TARGET_URL, b"{}", "example.com", "signature", "order_created"
+    )
+
+    # then
+    mocked_post.assert_not_called()
+    assert response.status == EventDeliveryStatus.FAILED
+
+
+@pytest.mark.parametrize("status_code", [500, 429])
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
+def test_send_webhook_using_http_records_target_failure(
+    mocked_post, status_code, circuit_breaker_settings
+):
+    # given
+    mocked_post.return_value = mock.Mock(
+        status_code=status_code, ok=False, text="", headers={}
+    )
+
+    # when
+    for _ in range(4):
+        send_webhook_using_http(
+            TARGET_URL, b"{}", "example.com", "signature", "order_created"
+        )
+
+    # then
+    assert not acquire_circuit(TARGET_URL)
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.apply_async")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_request_async_deferred_when_target_busy(
+    mocked_send, mocked_apply_async, event_delivery, settings
+):
+    # given
+    settings.WEBHOOK_TARGET_MAX_CONCURRENCY = 1
+    acquire_concurrency_slot(event_delivery.webhook.target_url)
+
+    # when
+    send_webhook_request_async(event_delivery.pk)
+
+    # then
+    mocked_send.assert_not_called()
+    mocked_apply_async.assert_called_once_with(
+        (event_delivery.pk,),
+        {"deferrals": 1},
+        countdown=settings.WEBHOOK_TARGET_DEFER_DELAY,
+        retries=0,
+    )
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.PENDING
+    assert not event_delivery.attempts.exists()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.apply_async")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_request_async_failed_after_max_deferrals(
+    mocked_send, mocked_apply_async, event_delivery, settings
+):
+    # given
+    settings.WEBHOOK_TARGET_MAX_CONCURRENCY = 1
+    settings.WEBHOOK_TARGET_MAX_DEFERRALS = 3
+    acquire_concurrency_slot(event_delivery.webhook.target_url)
+
+    # when
+    send_webhook_request_async(event_delivery.pk, deferrals=3)
+
+    # then
+    mocked_send.assert_not_called()
+    mocked_apply_async.assert_not_called()
+    event_delivery.refresh_from_db()
+    assert event_delivery.status == EventDeliveryStatus.FAILED
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.apply_async")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_async_defers_deliveries_over_limit(
+    mocked_send, mocked_apply_async, event_payload, webhook, settings
+):
+    # given
+    settings.WEBHOOK_TARGET_MAX_CONCURRENCY = 1
+    acquire_concurrency_slot(webhook.target_url)
+    delivery = EventDelivery.objects.create(
+        event_type="order_created", payload=event_payload, webhook=webhook
+    )
+
+    # when
+    send_webhook_requests_async([delivery.pk])
+
+    # then
+    mocked_send.assert_not_called()
+    mocked_apply_async.assert_called_once_with(
+        (delivery.pk,),
+        {"deferrals": 1},
+        countdown=settings.WEBHOOK_TARGET_DEFER_DELAY,
+        retries=0,
+    )
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_request_async_releases_concurrency_slot(
+    mocked_send, event_delivery, settings
+):
+    # given
+    settings.WEBHOOK_TARGET_MAX_CONCURRENCY = 1
+    mocked_send.return_value = WebhookResponse(content="")
+
+    # when
+    send_webhook_request_async(event_delivery.pk)
+
+    # then
+    mocked_send.assert_called_once()
+    assert acquire_concurrency_slot(event_delivery.webhook.target_url) == 0
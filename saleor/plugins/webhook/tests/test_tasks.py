@@ -14,9 +14,16 @@ from ....payment.interface import TransactionActionData
 from ....payment.models import TransactionEvent
 from ....payment.transaction_item_calculations import recalculate_transaction_amounts
 from ....tests.utils import flush_post_commit_hooks
-from ....webhook.event_types import WebhookEventSyncType
+from ....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ....webhook.payloads import generate_transaction_action_request_payload
-from ..tasks import handle_transaction_request_task, trigger_transaction_request
+from ..tasks import (
+    WebhookResponse,
+    batch_async_webhook_deliveries,
+    handle_transaction_request_task,
+    send_webhook_requests_async,
+    trigger_transaction_request,
+    trigger_webhooks_async,
+)
 
 
 @pytest.fixture
@@ -162,7 +169,7 @@ def test_trigger_transaction_request_with_webhook_subscription(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_handle_transaction_request_task_with_only_psp_reference(
     mocked_post_request,
     transaction_item_generator,
@@ -228,7 +235,7 @@ def test_handle_transaction_request_task_with_only_psp_reference(
 @pytest.mark.parametrize("status_code", [500, 501, 510])
 @freeze_time("2022-06-11 12:50")
 @mock.patch("saleor.plugins.webhook.tasks.handle_webhook_retry")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_handle_transaction_request_task_with_server_error(
     mocked_post_request,
     mocked_webhook_retry,
@@ -284,7 +291,7 @@ def test_handle_transaction_request_task_with_server_error(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_handle_transaction_request_task_with_missing_psp_reference(
     mocked_post_request,
     transaction_item_created_by_app,
@@ -362,7 +369,7 @@ def test_handle_transaction_request_task_with_missing_psp_reference(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_handle_transaction_request_task_with_missing_required_event_field(
     mocked_post_request,
     transaction_item_created_by_app,
@@ -445,7 +452,7 @@ def test_handle_transaction_request_task_with_missing_required_event_field(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_handle_transaction_request_task_with_result_event(
     mocked_post_request,
     transaction_item_generator,
@@ -543,7 +550,7 @@ def test_handle_transaction_request_task_with_result_event(
 
 
 @freeze_time("2022-06-11T17:50:00+00:00")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_handle_transaction_request_task_with_only_required_fields_for_result_event(
     mocked_post_request,
     transaction_item_generator,
@@ -639,7 +646,7 @@ def test_handle_transaction_request_task_with_only_required_fields_for_result_ev
     "saleor.payment.utils.recalculate_transaction_amounts",
     wraps=recalculate_transaction_amounts,
 )
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_handle_transaction_request_task_calls_recalculation_of_amounts(
     mocked_post_request,
     mocked_recalculation,
@@ -709,7 +716,7 @@ def test_handle_transaction_request_task_calls_recalculation_of_amounts(
 
 
 @freeze_time("2022-06-11 12:50")
-@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+@mock.patch("saleor.plugins.webhook.tasks.webhook_http_transport.post")
 def test_handle_transaction_request_task_with_available_actions(
     mocked_post_request,
     transaction_item_generator,
@@ -805,3 +812,85 @@ def test_handle_transaction_request_task_with_available_actions(
         headers=mock.ANY,
         timeout=mock.ANY,
     )
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_requests_async.s")
+@mock.patch("saleor.plugins.webhook.tasks.group")
+def test_batch_async_webhook_deliveries(
+    mocked_group, mocked_task_signature, mocked_send_request, webhook, settings
+):
+    # given
+    settings.WEBHOOK_ASYNC_BATCH_SIZE = 2
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+
+    # when
+    with batch_async_webhook_deliveries():
+        for i in range(3):
+            trigger_webhooks_async(json.dumps({"number": i}), event_type, [webhook])
+        assert not EventDelivery.objects.exists()
+
+    # then
+    deliveries = list(EventDelivery.objects.order_by("pk"))
+    assert len(deliveries) == 3
+    assert EventPayload.objects.count() == 3
+    assert mocked_task_signature.mock_calls == [
+        mock.call([deliveries[0].pk, deliveries[1].pk]),
+        mock.call([deliveries[2].pk]),
+    ]
+    mocked_group.assert_called_once_with(
+        [mocked_task_signature.return_value, mocked_task_signature.return_value]
+    )
+    mocked_group.return_value.apply_async.assert_called_once_with()
+    mocked_send_request.assert_not_called()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.delay")
+@mock.patch("saleor.plugins.webhook.tasks.group")
+def test_batch_async_webhook_deliveries_disabled(
+    mocked_group, mocked_send_request, webhook, settings
+):
+    # given
+    settings.WEBHOOK_ASYNC_BATCH_SIZE = 0
+    event_type = WebhookEventAsyncType.ORDER_CREATED
+
+    # when
+    with batch_async_webhook_deliveries():
+        trigger_webhooks_async(json.dumps({"number": 1}), event_type, [webhook])
+        delivery = EventDelivery.objects.get()
+
+    # then
+    mocked_send_request.assert_called_once_with(delivery.pk)
+    mocked_group.assert_not_called()
+
+
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_async.apply_async")
+@mock.patch("saleor.plugins.webhook.tasks.send_webhook_using_scheme_method")
+def test_send_webhook_requests_async(mocked_send, mocked_retry, event_payload, webhook):
+    # given
+    deliveries = EventDelivery.objects.bulk_create(
+        [
+            EventDelivery(
+                event_type=WebhookEventAsyncType.ORDER_CREATED,
+                payload=event_payload,
+                webhook=webhook,
+            )
+            for _ in range(2)
+        ]
+    )
+    mocked_send.side_effect = [
+        WebhookResponse(content="", status=EventDeliveryStatus.SUCCESS),
+        WebhookResponse(content="error", status=EventDeliveryStatus.FAILED),
+    ]
+
+    # when
+    send_webhook_requests_async([delivery.pk for delivery in deliveries])
+
+    # then
+    assert mocked_send.call_count == 2
+    successful_delivery, failed_delivery = deliveries
+    assert not EventDelivery.objects.filter(pk=successful_delivery.pk).exists()
+    failed_delivery.refresh_from_db()
+    assert failed_delivery.status == EventDeliveryStatus.FAILED
+    assert failed_delivery.attempts.get().status == EventDeliveryStatus.FAILED
+    mocked_retry.assert_called_once_with((failed_delivery.pk,), countdown=10, retries=1)
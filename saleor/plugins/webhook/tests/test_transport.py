@@ -0,0 +1,78 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ..transport import WebhookHTTPTransport
+
+# Requests are sent to a local server to check the reuse of real connections.
+pytestmark = pytest.mark.enable_socket
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    received_cookies: list = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.received_cookies.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.send_header("Set-Cookie", "session=secret")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def webhook_server():
+    WebhookHandler.received_cookies = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_reuses_connection_to_origin(webhook_server):
+    # given
+    transport = WebhookHTTPTransport(max_origins=10, max_connections_per_origin=2)
+
+    # when
+    for path in ["/first", "/second"]:
+        response = transport.post(f"{webhook_server}{path}", data=b"{}", timeout=5)
+        assert response.status_code == 200
+
+    # then
+    assert transport.get_metrics() == {
+        webhook_server: {"connections": 1, "requests": 2, "idle_connections": 1}
+    }
+
+
+def test_transport_does_not_send_cookies_set_by_target(webhook_server):
+    # given
+    transport = WebhookHTTPTransport(max_origins=10, max_connections_per_origin=2)
+
+    # when
+    transport.post(webhook_server, data=b"{}", timeout=5)
+    transport.post(webhook_server, data=b"{}", timeout=5)
+
+    # then
+    assert WebhookHandler.received_cookies == [None, None]
+
+
+def test_transport_reset_drops_pooled_connections(webhook_server):
+    # given
+    transport = WebhookHTTPTransport(max_origins=10, max_connections_per_origin=2)
+    transport.post(webhook_server, data=b"{}", timeout=5)
+
+    # when
+    transport.reset()
+
+    # then
+    assert transport.get_metrics() == {}
+    transport.post(webhook_server, data=b"{}", timeout=5)
+    assert transport.get_metrics()[webhook_server]["connections"] == 1
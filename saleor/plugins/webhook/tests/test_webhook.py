@@ -1810,7 +1810,10 @@ def test_send_webhook_request_async_when_delivery_attempt_failed(
     mocked_observability.assert_called_once_with(attempt, None)
 
 
-@mock.patch("saleor.plugins.webhook.tasks.requests.post", side_effect=RequestException)
+@mock.patch(
+    "saleor.plugins.webhook.tasks.webhook_http_transport.post",
+    side_effect=RequestException,
+)
 @mock.patch("saleor.plugins.webhook.tasks.observability.report_event_delivery_attempt")
 def test_send_webhook_request_async_with_request_exception(
     mocked_observability, mocked_post, event_delivery, webhook_response_failed
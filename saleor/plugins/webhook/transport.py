@@ -0,0 +1,88 @@
+import os
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Dict, Optional
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+
+class WebhookHTTPTransport:
+    """Keep-alive HTTP connections to webhook targets shared by the process.
+
+    Connections are pooled per target origin (scheme, host and port), so
+    consecutive deliveries to the same app reuse an open connection instead of
+    paying for a DNS lookup, TCP connection and TLS handshake each time. The
+    session is created on the first request and dropped in forked processes, as
+    connections can't be shared between them.
+    """
+
+    def __init__(self, max_origins: int, max_connections_per_origin: int):
+        self.max_origins = max_origins
+        self.max_connections_per_origin = max_connections_per_origin
+        self._adapter: Optional[HTTPAdapter] = None
+        self._session: Optional[requests.Session] = None
+        self._lock = Lock()
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self._get_session().post(url, **kwargs)
+
+    def get_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Return usage of the connection pool of each target origin.
+
+        `connections` is the number of connections opened so far, `requests` the
+        number of requests sent and `idle_connections` the number of open
+        connections waiting for the next request.
+        """
+        adapter = self._adapter
+        if adapter is None:
+            return {}
+        pools = adapter.poolmanager.pools
+        metrics = {}
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            origin = f"{key.key_scheme}://{key.key_host}:{key.key_port}"
+            idle_connections = pool.pool.queue if pool.pool else []
+            metrics[origin] = {
+                "connections": pool.num_connections,
+                "requests": pool.num_requests,
+                "idle_connections": sum(
+                    1 for conn in list(idle_connections) if conn is not None
+                ),
+            }
+        return metrics
+
+    def reset(self):
+        """Forget the pooled connections without closing them."""
+        self._adapter = None
+        self._session = None
+        self._lock = Lock()
+
+    def _get_session(self) -> requests.Session:
+        session = self._session
+        if session is not None:
+            return session
+        with self._lock:
+            if self._session is None:
+                self._adapter = HTTPAdapter(
+                    pool_connections=self.max_origins,
+                    pool_maxsize=self.max_connections_per_origin,
+                )
+                session = requests.Session()
+                session.mount("http://", self._adapter)
+                session.mount("https://", self._adapter)
+                # Responses of one app must not affect requests sent to the others.
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                self._session = session
+            return self._session
+
+
+webhook_http_transport = WebhookHTTPTransport(
+    max_origins=settings.WEBHOOK_HTTP_POOL_MAX_ORIGINS,
+    max_connections_per_origin=settings.WEBHOOK_HTTP_POOL_MAX_CONNECTIONS,
+)
+
+os.register_at_fork(after_in_child=webhook_http_transport.reset)
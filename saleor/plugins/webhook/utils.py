@@ -219,6 +219,17 @@ def create_event_delivery_list_for_webhooks(
     return event_deliveries
 
 
+def save_event_deliveries(deliveries: List[EventDelivery]) -> List[EventDelivery]:
+    """Save new deliveries along with their payloads using one query per model."""
+    payloads = {
+        id(delivery.payload): delivery.payload
+        for delivery in deliveries
+        if delivery.payload and delivery.payload.pk is None
+    }
+    EventPayload.objects.bulk_create(payloads.values())
+    return EventDelivery.objects.bulk_create(deliveries)
+
+
 def create_attempt(
     delivery: "EventDelivery",
     task_id: Optional[str] = None,
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...tasks import reindex_products_search_vector
+
+
+class Command(BaseCommand):
+    help = (
+        "Schedules updating the search vectors of all the products in tasks run in "
+        "parallel for ranges of product IDs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--parts",
+            type=int,
+            default=4,
+            help="Number of ranges of product IDs updated in parallel.",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore checkpoints of the previous run and start from scratch.",
+        )
+
+    def handle(self, *args, **options):
+        if options["parts"] < 1:
+            raise CommandError("The number of parts must be positive.")
+        ranges = reindex_products_search_vector(options["parts"], options["restart"])
+        for start_id, end_id in ranges:
+            self.stdout.write(
+                f"Scheduled products with IDs from {start_id} to {end_id}"
+            )
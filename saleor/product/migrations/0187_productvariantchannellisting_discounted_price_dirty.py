@@ -0,0 +1,17 @@
+# Generated by Django 3.2.19 on 2023-07-20 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0186_remove_product_charge_taxes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productvariantchannellisting",
+            name="discounted_price_dirty",
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+    ]
@@ -524,6 +524,8 @@ class ProductVariantChannelListing(models.Model):
 
     preorder_quantity_threshold = models.IntegerField(blank=True, null=True)
 
+    discounted_price_dirty = models.BooleanField(default=False, db_index=True)
+
     objects = managers.ProductVariantChannelListingManager()
 
     class Meta:
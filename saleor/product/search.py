@@ -1,13 +1,20 @@
-from typing import TYPE_CHECKING, List
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, DefaultDict, Dict, Iterable, List, Optional
 
 from django.conf import settings
 from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import transaction
 from django.db.models import F, Q, Value, prefetch_related_objects
 
 from ..attribute import AttributeInputType
+from ..attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttributeValue,
+)
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.editorjs import clean_editor_js
-from .models import Product
+from .models import Product, ProductVariant
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -21,36 +28,203 @@ PRODUCT_FIELDS_TO_PREFETCH = [
 ]
 
 PRODUCTS_BATCH_SIZE = 300
-# Setting threshold to 300 results in about 350MB of memory usage
-# when testing locally. Should be adjusted after some time by running
-# update task on a large dataset and measuring the total time, memory usage
-# and time of a single SQL statement.
+# Search vector inputs of a batch are read as flat rows, without building model
+# instances, so memory usage grows with the number of variants and attribute values
+# of the batch. Should be adjusted after some time by running update task on a large
+# dataset and measuring the total time, memory usage and time of a single SQL
+# statement.
+
+ATTRIBUTE_VALUE_SEARCH_FIELDS = [
+    "value__name",
+    "value__rich_text",
+    "value__plain_text",
+    "value__date_time",
+    "assignment__assignment__attribute__input_type",
+    "assignment__assignment__attribute__unit",
+]
 
 
-def _prep_product_search_vector_index(products):
-    prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
+def _prep_product_search_vector_index(products, clear_dirty_flag=True):
+    search_vectors = prepare_products_search_vector_values(
+        [product.id for product in products]
+    )
     for product in products:
-        product.search_vector = FlatConcatSearchVector(
-            *prepare_product_search_vector_value(product, already_prefetched=True)
-        )
+        product.search_vector = FlatConcatSearchVector(*search_vectors[product.id])
         product.search_index_dirty = False
 
-    Product.objects.bulk_update(
-        products, ["search_vector", "updated_at", "search_index_dirty"]
-    )
+    fields = ["search_vector", "search_index_dirty"]
+    Product.objects.bulk_update(products, fields if clear_dirty_flag else fields[:1])
 
 
 def update_products_search_vector(products: "QuerySet", use_batches=True):
+    products = products.only("id")
     if use_batches:
         last_id = 0
         while True:
-            products_batch = list(products.filter(id__gt=last_id)[:PRODUCTS_BATCH_SIZE])
+            products_batch = list(
+                products.order_by("id").filter(id__gt=last_id)[:PRODUCTS_BATCH_SIZE]
+            )
             if not products_batch:
                 break
             last_id = products_batch[-1].id
             _prep_product_search_vector_index(products_batch)
     else:
-        _prep_product_search_vector_index(products)
+        _prep_product_search_vector_index(list(products))
+
+
+def update_dirty_products_search_vector() -> int:
+    """Update search vectors of a batch of products marked as dirty.
+
+    Products already being updated by another worker are skipped. Flags are cleared
+    before the update, so products marked again in the meantime are updated in the
+    next batch, and set back when the update fails. Return the number of updated
+    products.
+    """
+    with transaction.atomic():
+        products = list(
+            Product.objects.select_for_update(skip_locked=True)
+            .filter(search_index_dirty=True)
+            .order_by("id")
+            .only("id")[:PRODUCTS_BATCH_SIZE]
+        )
+        product_ids = [product.id for product in products]
+        Product.objects.filter(id__in=product_ids).update(search_index_dirty=False)
+    if products:
+        try:
+            _prep_product_search_vector_index(products, clear_dirty_flag=False)
+        except Exception:
+            Product.objects.filter(id__in=product_ids).update(search_index_dirty=True)
+            raise
+    return len(products)
+
+
+def update_products_search_vector_in_range(
+    start_id: int, end_id: int, checkpoint: int, time_limit: Optional[float] = None
+) -> Optional[int]:
+    """Update search vectors of products with IDs from the range in batches.
+
+    Processing starts after the `checkpoint` ID and stops once the range is done or
+    the `time_limit` in seconds is reached. Return the ID of the last updated product
+    to continue from, or `None` when the whole range is done.
+    """
+    deadline = time.monotonic() + time_limit if time_limit is not None else None
+    products = Product.objects.filter(id__gte=start_id, id__lte=end_id).only("id")
+    while True:
+        products_batch = list(
+            products.filter(id__gt=checkpoint).order_by("id")[:PRODUCTS_BATCH_SIZE]
+        )
+        if not products_batch:
+            return None
+        _prep_product_search_vector_index(products_batch)
+        checkpoint = products_batch[-1].id
+        if deadline is not None and time.monotonic() >= deadline:
+            return checkpoint
+
+
+def prepare_products_search_vector_values(
+    product_ids: Iterable[int],
+) -> Dict[int, List[NoValidationSearchVector]]:
+    """Prepare `search_vector` values for many products at once.
+
+    Return the same values as `prepare_product_search_vector_value`, but read them
+    with a few queries of flat rows instead of prefetching the related objects.
+    """
+    product_ids = list(product_ids)
+    variants: DefaultDict[int, list] = defaultdict(list)
+    for product_id, variant_id, sku, name in (
+        ProductVariant.objects.filter(product_id__in=product_ids)
+        .order_by("product_id", "sort_order", "sku")
+        .values_list("product_id", "id", "sku", "name")
+        .iterator()
+    ):
+        if len(variants[product_id]) < settings.PRODUCT_MAX_INDEXED_VARIANTS:
+            variants[product_id].append((variant_id, sku, name))
+
+    product_attributes = _get_assigned_attribute_values_search_vectors(
+        AssignedProductAttributeValue.objects.filter(
+            assignment__product_id__in=product_ids
+        ),
+        "assignment__product_id",
+    )
+    variant_attributes = _get_assigned_attribute_values_search_vectors(
+        AssignedVariantAttributeValue.objects.filter(
+            assignment__variant_id__in=[
+                variant_id
+                for product_variants in variants.values()
+                for variant_id, _, _ in product_variants
+            ]
+        ),
+        "assignment__variant_id",
+    )
+
+    search_vectors = {}
+    for product_id, name, description in Product.objects.filter(
+        id__in=product_ids
+    ).values_list("id", "name", "description_plaintext"):
+        product_variants = variants[product_id]
+        variants_search_vectors = [
+            NoValidationSearchVector(
+                Value(sku), Value(variant_name), config="simple", weight="A"
+            )
+            if sku
+            else NoValidationSearchVector(
+                Value(variant_name), config="simple", weight="A"
+            )
+            for _, sku, variant_name in product_variants
+            if sku or variant_name
+        ]
+        if variants_search_vectors:
+            for variant_id, _, _ in product_variants:
+                variants_search_vectors += variant_attributes[variant_id]
+        search_vectors[product_id] = [
+            NoValidationSearchVector(Value(name), config="simple", weight="A"),
+            NoValidationSearchVector(Value(description), config="simple", weight="C"),
+            *product_attributes[product_id],
+            *variants_search_vectors,
+        ]
+    return search_vectors
+
+
+def _get_assigned_attribute_values_search_vectors(
+    assigned_values: "QuerySet", instance_lookup: str
+) -> DefaultDict[int, List[NoValidationSearchVector]]:
+    """Return search vectors of attribute values assigned to products or variants.
+
+    The limits of indexed attributes and values are applied per product or variant.
+    """
+    search_vectors: DefaultDict[int, List[NoValidationSearchVector]] = defaultdict(list)
+    assignments_count: DefaultDict[int, int] = defaultdict(int)
+    values_count: DefaultDict[int, int] = defaultdict(int)
+    for row in (
+        assigned_values.order_by(
+            instance_lookup, "assignment_id", "value__sort_order", "value_id"
+        )
+        .values(instance_lookup, "assignment_id", *ATTRIBUTE_VALUE_SEARCH_FIELDS)
+        .iterator()
+    ):
+        instance_id = row[instance_lookup]
+        assignment_id = row["assignment_id"]
+        if not values_count[assignment_id]:
+            if (
+                assignments_count[instance_id]
+                >= settings.PRODUCT_MAX_INDEXED_ATTRIBUTES
+            ):
+                continue
+            assignments_count[instance_id] += 1
+        if values_count[assignment_id] >= settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES:
+            continue
+        values_count[assignment_id] += 1
+        search_vector = generate_attribute_value_search_vector_value(
+            row["assignment__assignment__attribute__input_type"],
+            row["assignment__assignment__attribute__unit"],
+            row["value__name"],
+            row["value__rich_text"],
+            row["value__plain_text"],
+            row["value__date_time"],
+        )
+        if search_vector is not None:
+            search_vectors[instance_id].append(search_vector)
+    return search_vectors
 
 
 def update_product_search_vector(product: "Product"):
@@ -111,54 +285,50 @@ def generate_attributes_search_vector_value(
     search_vectors = []
     for assigned_attribute in assigned_attributes:
         attribute = assigned_attribute.assignment.attribute
-
-        input_type = attribute.input_type
         values = assigned_attribute.values.all()[
             : settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES
         ]
-        if input_type in [AttributeInputType.DROPDOWN, AttributeInputType.MULTISELECT]:
-            search_vectors += [
-                NoValidationSearchVector(Value(value.name), config="simple", weight="B")
-                for value in values
-            ]
-        elif input_type == AttributeInputType.RICH_TEXT:
-            search_vectors += [
-                NoValidationSearchVector(
-                    Value(clean_editor_js(value.rich_text, to_string=True)),
-                    config="simple",
-                    weight="B",
-                )
-                for value in values
-            ]
-        elif input_type == AttributeInputType.PLAIN_TEXT:
-            search_vectors += [
-                NoValidationSearchVector(
-                    Value(value.plain_text), config="simple", weight="B"
-                )
-                for value in values
-            ]
-        elif input_type == AttributeInputType.NUMERIC:
-            unit = attribute.unit
-            search_vectors += [
-                NoValidationSearchVector(
-                    Value(value.name + " " + unit if unit else value.name),
-                    config="simple",
-                    weight="B",
-                )
-                for value in values
-            ]
-        elif input_type in [AttributeInputType.DATE, AttributeInputType.DATE_TIME]:
-            search_vectors += [
-                NoValidationSearchVector(
-                    Value(value.date_time.strftime("%Y-%m-%d %H:%M:%S")),
-                    config="simple",
-                    weight="B",
-                )
-                for value in values
-            ]
+        for value in values:
+            search_vector = generate_attribute_value_search_vector_value(
+                attribute.input_type,
+                attribute.unit,
+                value.name,
+                value.rich_text,
+                value.plain_text,
+                value.date_time,
+            )
+            if search_vector is not None:
+                search_vectors.append(search_vector)
     return search_vectors
 
 
+def generate_attribute_value_search_vector_value(
+    input_type: str,
+    unit: Optional[str],
+    name: str,
+    rich_text: Optional[dict],
+    plain_text: Optional[str],
+    date_time,
+) -> Optional[NoValidationSearchVector]:
+    """Prepare `search_vector` value for a single attribute value.
+
+    Return `None` for values of input types that aren't searchable.
+    """
+    if input_type in [AttributeInputType.DROPDOWN, AttributeInputType.MULTISELECT]:
+        text = name
+    elif input_type == AttributeInputType.RICH_TEXT:
+        text = clean_editor_js(rich_text, to_string=True)
+    elif input_type == AttributeInputType.PLAIN_TEXT:
+        text = plain_text
+    elif input_type == AttributeInputType.NUMERIC:
+        text = name + " " + unit if unit else name
+    elif input_type in [AttributeInputType.DATE, AttributeInputType.DATE_TIME]:
+        text = date_time.strftime("%Y-%m-%d %H:%M:%S")
+    else:
+        return None
+    return NoValidationSearchVector(Value(text), config="simple", weight="B")
+
+
 def search_products(qs, value):
     if value:
         query = SearchQuery(value, search_type="websearch", config="simple")
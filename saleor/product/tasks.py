@@ -1,9 +1,13 @@
 import logging
+import math
+import time
 from typing import Iterable, List, Optional
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Max, Min
 from django.utils import timezone
 
 from ..attribute.models import Attribute
@@ -12,12 +16,18 @@ from ..core.exceptions import PreorderAllocationError
 from ..discount.models import Sale
 from ..warehouse.management import deactivate_preorder_for_variant
 from .models import Product, ProductType, ProductVariant
-from .search import PRODUCTS_BATCH_SIZE, update_products_search_vector
+from .search import (
+    PRODUCTS_BATCH_SIZE,
+    update_dirty_products_search_vector,
+    update_products_search_vector_in_range,
+)
 from .utils.variant_prices import (
+    get_products_of_catalogues,
+    get_products_of_sale,
+    mark_products_discounted_prices_dirty,
+    update_dirty_products_discounted_prices,
     update_products_discounted_price,
     update_products_discounted_prices,
-    update_products_discounted_prices_of_catalogues,
-    update_products_discounted_prices_of_sale,
 )
 from .utils.variants import generate_and_set_variant_name
 
@@ -26,6 +36,15 @@ task_logger = get_task_logger(__name__)
 
 VARIANTS_UPDATE_BATCH = 500
 
+# A single reindex task stops after the time limit and continues in a new task
+SEARCH_VECTOR_REINDEX_TASK_TIME_LIMIT = 60
+SEARCH_VECTOR_REINDEX_CHECKPOINT_TIMEOUT = 60 * 60 * 24
+
+# Held while the recalculation of dirty discounted prices is queued, so producers
+# don't queue it again; it expires in case the queued task is lost.
+DISCOUNTED_PRICES_UPDATE_LOCK_KEY = "update_dirty_products_discounted_prices_lock"
+DISCOUNTED_PRICES_UPDATE_LOCK_TIMEOUT = 60 * 5
+
 
 def _variants_in_batches(variants_qs):
     """Slice a variants queryset into batches."""
@@ -93,9 +112,12 @@ def update_products_discounted_prices_of_catalogues_task(
     collection_ids: Optional[List[int]] = None,
     variant_ids: Optional[List[int]] = None,
 ):
-    update_products_discounted_prices_of_catalogues(
+    products = get_products_of_catalogues(
         product_ids, category_ids, collection_ids, variant_ids
     )
+    if products is not None:
+        mark_products_discounted_prices_dirty(products)
+        schedule_dirty_products_discounted_prices_update()
 
 
 @app.task
@@ -105,7 +127,48 @@ def update_products_discounted_prices_of_sale_task(discount_pk: int):
     except ObjectDoesNotExist:
         logging.warning(f"Cannot find discount with id: {discount_pk}.")
         return
-    update_products_discounted_prices_of_sale(discount)
+    mark_products_discounted_prices_dirty(get_products_of_sale(discount))
+    schedule_dirty_products_discounted_prices_update()
+
+
+def schedule_dirty_products_discounted_prices_update():
+    """Queue the recalculation of dirty listings unless it's already queued.
+
+    Listings marked while the last batch is being recalculated are picked up by the
+    beat task.
+    """
+    if cache.add(
+        DISCOUNTED_PRICES_UPDATE_LOCK_KEY,
+        True,
+        timeout=DISCOUNTED_PRICES_UPDATE_LOCK_TIMEOUT,
+    ):
+        update_dirty_products_discounted_prices_task.delay()
+
+
+@app.task
+def update_dirty_products_discounted_prices_task():
+    """Recalculate discounted prices of products queued for recalculation.
+
+    Each run handles a single batch and schedules the next one while any dirty
+    listings are left, so a large change is spread over many short tasks.
+    """
+    updated_count, remaining_count = update_dirty_products_discounted_prices()
+    if updated_count:
+        task_logger.info(
+            "Updated discounted prices of %s products, %s variant channel listings "
+            "left.",
+            updated_count,
+            remaining_count,
+        )
+    if remaining_count:
+        cache.set(
+            DISCOUNTED_PRICES_UPDATE_LOCK_KEY,
+            True,
+            timeout=DISCOUNTED_PRICES_UPDATE_LOCK_TIMEOUT,
+        )
+        update_dirty_products_discounted_prices_task.delay()
+    else:
+        cache.delete(DISCOUNTED_PRICES_UPDATE_LOCK_KEY)
 
 
 @app.task
@@ -136,7 +199,68 @@ def _get_preorder_variants_to_clean():
     expires=settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC,
 )
 def update_products_search_vector_task():
-    products = Product.objects.filter(search_index_dirty=True).order_by()[
-        :PRODUCTS_BATCH_SIZE
+    """Update search vectors of products marked as dirty.
+
+    Batches are processed until no dirty products are left, or until the next run
+    is scheduled by the beat.
+    """
+    deadline = time.monotonic() + settings.BEAT_UPDATE_SEARCH_EXPIRE_AFTER_SEC
+    while update_dirty_products_search_vector() == PRODUCTS_BATCH_SIZE:
+        if time.monotonic() >= deadline:
+            break
+
+
+def _get_search_vector_reindex_checkpoint_key(start_id: int, end_id: int) -> str:
+    return f"product_search_vector_reindex:{start_id}:{end_id}"
+
+
+@app.task(queue=settings.UPDATE_SEARCH_VECTOR_INDEX_QUEUE_NAME)
+def update_products_search_vector_in_range_task(start_id: int, end_id: int):
+    """Update search vectors of products with IDs in the given range.
+
+    The ID of the last updated product is kept as a checkpoint, so the task
+    reschedules itself to continue after the time limit, and a restarted task
+    doesn't repeat the work already done.
+    """
+    checkpoint_key = _get_search_vector_reindex_checkpoint_key(start_id, end_id)
+    checkpoint = cache.get(checkpoint_key, start_id - 1)
+    checkpoint = update_products_search_vector_in_range(
+        start_id,
+        end_id,
+        checkpoint,
+        time_limit=SEARCH_VECTOR_REINDEX_TASK_TIME_LIMIT,
+    )
+    if checkpoint is None:
+        cache.delete(checkpoint_key)
+        task_logger.info(
+            "Updated search vectors of products with IDs from %s to %s.",
+            start_id,
+            end_id,
+        )
+        return
+    cache.set(
+        checkpoint_key, checkpoint, timeout=SEARCH_VECTOR_REINDEX_CHECKPOINT_TIMEOUT
+    )
+    update_products_search_vector_in_range_task.delay(start_id, end_id)
+
+
+def reindex_products_search_vector(parts: int, restart: bool = False) -> List[tuple]:
+    """Split updating search vectors of all products into tasks run in parallel.
+
+    Each task handles a range of product IDs of similar size. Unless `restart` is
+    set, tasks continue from the checkpoints left by the previous run. Return the
+    scheduled ranges.
+    """
+    ids = Product.objects.aggregate(min_id=Min("id"), max_id=Max("id"))
+    if ids["min_id"] is None:
+        return []
+    step = math.ceil((ids["max_id"] - ids["min_id"] + 1) / parts)
+    ranges = [
+        (start_id, min(start_id + step - 1, ids["max_id"]))
+        for start_id in range(ids["min_id"], ids["max_id"] + 1, step)
     ]
-    update_products_search_vector(products, use_batches=False)
+    for start_id, end_id in ranges:
+        if restart:
+            cache.delete(_get_search_vector_reindex_checkpoint_key(start_id, end_id))
+        update_products_search_vector_in_range_task.delay(start_id, end_id)
+    return ranges
@@ -4,11 +4,11 @@ from django.core.management import call_command
 from prices import Money
 
 from ...discount.models import Sale, SaleChannelListing
-from ..tasks import (
+from ..tasks import update_products_discounted_prices_task
+from ..utils.variant_prices import (
+    update_products_discounted_price,
     update_products_discounted_prices_of_catalogues,
-    update_products_discounted_prices_task,
 )
-from ..utils.variant_prices import update_products_discounted_price
 
 
 def test_update_product_discounted_price(product, channel_USD):
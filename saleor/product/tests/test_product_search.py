@@ -1,5 +1,14 @@
+from unittest.mock import patch
+
+import pytest
+
 from ..models import Product
-from ..search import update_product_search_vector, update_products_search_vector
+from ..search import (
+    update_dirty_products_search_vector,
+    update_product_search_vector,
+    update_products_search_vector,
+    update_products_search_vector_in_range,
+)
 
 
 def test_update_product_search_vector(product_type, category):
@@ -35,3 +44,99 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+@pytest.mark.parametrize(
+    "product_fixture",
+    [
+        "product_with_variant_with_two_attributes",
+        "product_with_multiple_values_attributes",
+        "product_with_rich_text_attribute",
+    ],
+)
+def test_update_products_search_vector_same_as_for_single_product(
+    product_fixture, request
+):
+    # given
+    product = request.getfixturevalue(product_fixture)
+    if isinstance(product, list):
+        product = product[0]
+    update_product_search_vector(product)
+    product.refresh_from_db()
+    expected_search_vector = product.search_vector
+    Product.objects.filter(pk=product.pk).update(search_vector=None)
+
+    # when
+    update_products_search_vector(Product.objects.filter(pk=product.pk))
+
+    # then
+    product.refresh_from_db()
+    assert product.search_vector == expected_search_vector
+
+
+def test_update_dirty_products_search_vector(product_list):
+    # given
+    dirty_product, *other_products = product_list
+    Product.objects.update(search_vector=None)
+    Product.objects.filter(pk=dirty_product.pk).update(search_index_dirty=True)
+
+    # when
+    updated_count = update_dirty_products_search_vector()
+
+    # then
+    assert updated_count == 1
+    dirty_product.refresh_from_db()
+    assert dirty_product.search_vector
+    assert dirty_product.search_index_dirty is False
+    assert not Product.objects.filter(
+        pk__in=[product.pk for product in other_products], search_vector__isnull=False
+    ).exists()
+
+
+@patch("saleor.product.search.prepare_products_search_vector_values")
+def test_update_dirty_products_search_vector_failure_keeps_products_dirty(
+    prepare_products_search_vector_values_mock, product_list
+):
+    # given
+    prepare_products_search_vector_values_mock.side_effect = ValueError()
+    Product.objects.update(search_index_dirty=True)
+
+    # when
+    with pytest.raises(ValueError):
+        update_dirty_products_search_vector()
+
+    # then
+    assert not Product.objects.filter(search_index_dirty=False).exists()
+
+
+def test_update_products_search_vector_in_range(product_list):
+    # given
+    Product.objects.update(search_vector=None)
+    first_id, second_id, third_id = sorted(product.pk for product in product_list)
+
+    # when
+    checkpoint = update_products_search_vector_in_range(first_id, second_id, first_id)
+
+    # then
+    assert checkpoint is None
+    assert list(
+        Product.objects.filter(search_vector__isnull=False).values_list("pk", flat=True)
+    ) == [second_id]
+
+
+@patch("saleor.product.search.PRODUCTS_BATCH_SIZE", 1)
+def test_update_products_search_vector_in_range_stops_at_time_limit(product_list):
+    # given
+    Product.objects.update(search_vector=None)
+    first_id, second_id, third_id = sorted(product.pk for product in product_list)
+
+    # when
+    checkpoint = update_products_search_vector_in_range(
+        first_id, third_id, first_id - 1, time_limit=0
+    )
+
+    # then
+    assert checkpoint == first_id
+    assert list(
+        Product.objects.filter(search_vector__isnull=False).values_list("pk", flat=True)
+    ) == [first_id]
@@ -2,20 +2,36 @@ import logging
 from datetime import timedelta
 from unittest.mock import patch
 
+import pytest
+from django.core.cache import cache
 from django.utils import timezone
+from prices import Money
 
+from ..models import Product, ProductVariantChannelListing
 from ..tasks import (
+    DISCOUNTED_PRICES_UPDATE_LOCK_KEY,
     _get_preorder_variants_to_clean,
+    _get_search_vector_reindex_checkpoint_key,
+    reindex_products_search_vector,
+    update_dirty_products_discounted_prices_task,
     update_product_discounted_price_task,
+    update_products_discounted_prices_of_catalogues_task,
     update_products_discounted_prices_of_sale_task,
+    update_products_search_vector_in_range_task,
     update_products_search_vector_task,
     update_variants_names,
 )
 
 
-@patch("saleor.product.utils.variant_prices." "update_products_discounted_prices")
+@pytest.fixture(autouse=True)
+def release_discounted_prices_update_lock():
+    yield
+    cache.delete(DISCOUNTED_PRICES_UPDATE_LOCK_KEY)
+
+
+@patch("saleor.product.tasks.update_dirty_products_discounted_prices_task.delay")
 def test_update_products_discounted_prices_of_sale_task(
-    update_products_discounted_prices_mock,
+    update_dirty_products_discounted_prices_task_mock,
     new_sale,
     product_list,
     product,
@@ -33,17 +49,139 @@ def test_update_products_discounted_prices_of_sale_task(
     update_products_discounted_prices_of_sale_task(new_sale.id)
 
     # then
-    update_products_discounted_prices_mock.assert_called_once()
-    args, kwargs = update_products_discounted_prices_mock.call_args
-
+    update_dirty_products_discounted_prices_task_mock.assert_called_once_with()
     expected_products = [product] + product_list
-    assert len(args[0]) == len(expected_products)
-    assert {product.id for product in args[0]} == {
+    dirty_listings = ProductVariantChannelListing.objects.filter(
+        discounted_price_dirty=True
+    )
+    assert {listing.variant.product_id for listing in dirty_listings} == {
         instance.id for instance in expected_products
     }
 
 
-@patch("saleor.product.tasks.update_products_discounted_prices_of_sale")
+@patch("saleor.product.tasks.update_dirty_products_discounted_prices_task.delay")
+def test_update_products_discounted_prices_of_catalogues_task_for_variants(
+    update_dirty_products_discounted_prices_task_mock, product_list
+):
+    # given
+    variant = product_list[0].variants.first()
+
+    # when
+    update_products_discounted_prices_of_catalogues_task(variant_ids=[variant.pk])
+
+    # then
+    update_dirty_products_discounted_prices_task_mock.assert_called_once_with()
+    dirty_listings = ProductVariantChannelListing.objects.filter(
+        discounted_price_dirty=True
+    )
+    assert {listing.variant.product_id for listing in dirty_listings} == {
+        product_list[0].id
+    }
+
+
+@patch("saleor.product.tasks.update_dirty_products_discounted_prices_task.delay")
+def test_update_products_discounted_prices_of_catalogues_task_no_catalogues(
+    update_dirty_products_discounted_prices_task_mock, product
+):
+    # when
+    update_products_discounted_prices_of_catalogues_task()
+
+    # then
+    update_dirty_products_discounted_prices_task_mock.assert_not_called()
+    assert not ProductVariantChannelListing.objects.filter(
+        discounted_price_dirty=True
+    ).exists()
+
+
+def test_update_dirty_products_discounted_prices_task(new_sale, product_list):
+    # given
+    product = product_list[0]
+    new_sale.products.add(product)
+    ProductVariantChannelListing.objects.update(discounted_price_dirty=True)
+
+    # when
+    update_dirty_products_discounted_prices_task()
+
+    # then
+    assert not ProductVariantChannelListing.objects.filter(
+        discounted_price_dirty=True
+    ).exists()
+    variant_listing = product.variants.first().channel_listings.get()
+    assert variant_listing.discounted_price == variant_listing.price - Money(
+        new_sale.channel_listings.get().discount_value, "USD"
+    )
+
+
+@patch("saleor.product.tasks.update_dirty_products_discounted_prices_task.delay")
+@patch("saleor.product.utils.variant_prices.DISCOUNTED_PRICES_BATCH_SIZE", 2)
+def test_update_dirty_products_discounted_prices_task_schedules_next_batch(
+    update_dirty_products_discounted_prices_task_mock, product_list
+):
+    # given
+    ProductVariantChannelListing.objects.update(discounted_price_dirty=True)
+
+    # when
+    update_dirty_products_discounted_prices_task()
+
+    # then
+    update_dirty_products_discounted_prices_task_mock.assert_called_once_with()
+    dirty_listings = ProductVariantChannelListing.objects.filter(
+        discounted_price_dirty=True
+    )
+    assert {listing.variant.product_id for listing in dirty_listings} == {
+        product_list[2].id
+    }
+
+
+@patch("saleor.product.tasks.update_dirty_products_discounted_prices_task.delay")
+def test_update_products_discounted_prices_of_sale_task_already_scheduled(
+    update_dirty_products_discounted_prices_task_mock, new_sale, product
+):
+    # given
+    new_sale.products.add(product)
+    cache.set(DISCOUNTED_PRICES_UPDATE_LOCK_KEY, True)
+
+    # when
+    update_products_discounted_prices_of_sale_task(new_sale.id)
+
+    # then
+    update_dirty_products_discounted_prices_task_mock.assert_not_called()
+    assert ProductVariantChannelListing.objects.filter(
+        discounted_price_dirty=True
+    ).exists()
+
+
+def test_update_dirty_products_discounted_prices_task_releases_lock(product):
+    # given
+    cache.set(DISCOUNTED_PRICES_UPDATE_LOCK_KEY, True)
+    ProductVariantChannelListing.objects.update(discounted_price_dirty=True)
+
+    # when
+    update_dirty_products_discounted_prices_task()
+
+    # then
+    assert cache.get(DISCOUNTED_PRICES_UPDATE_LOCK_KEY) is None
+
+
+@patch("saleor.product.utils.variant_prices.update_products_discounted_price")
+def test_update_dirty_products_discounted_prices_task_failure_keeps_listings_dirty(
+    update_products_discounted_price_mock, product
+):
+    # given
+    update_products_discounted_price_mock.side_effect = ValueError()
+    ProductVariantChannelListing.objects.update(discounted_price_dirty=True)
+
+    # when
+    with pytest.raises(ValueError):
+        update_dirty_products_discounted_prices_task()
+
+    # then
+    assert not ProductVariantChannelListing.objects.filter(
+        discounted_price_dirty=False
+    ).exists()
+
+
+@patch("saleor.product.tasks.mark_products_discounted_prices_dirty")
 def test_update_products_discounted_prices_of_sale_task_discount_does_not_exist(
     update_product_prices_mock, caplog
 ):
@@ -97,7 +235,7 @@ def test_update_variants_names(
     assert {arg.pk for arg in args[1]} == {size_attribute.pk}
 
 
-@patch("saleor.product.tasks.update_products_discounted_prices_of_sale")
+@patch("saleor.product.tasks.mark_products_discounted_prices_dirty")
 def test_update_variants_names_product_type_does_not_exist(
     update_variants_names_mock, caplog
 ):
@@ -147,3 +285,56 @@ def test_update_products_search_vector_task(product):
 
     # then
     assert product.search_index_dirty is False
+
+
+def test_update_products_search_vector_in_range_task_continues_from_checkpoint(
+    product_list,
+):
+    # given
+    Product.objects.update(search_vector=None)
+    first_id, second_id, third_id = sorted(product.pk for product in product_list)
+    checkpoint_key = _get_search_vector_reindex_checkpoint_key(first_id, third_id)
+    cache.set(checkpoint_key, first_id)
+
+    # when
+    update_products_search_vector_in_range_task(first_id, third_id)
+
+    # then
+    assert list(
+        Product.objects.filter(search_vector__isnull=False)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    ) == [second_id, third_id]
+    assert cache.get(checkpoint_key) is None
+
+
+@patch("saleor.product.tasks.update_products_search_vector_in_range")
+@patch("saleor.product.tasks.update_products_search_vector_in_range_task.delay")
+def test_update_products_search_vector_in_range_task_saves_checkpoint(
+    mocked_delay, mocked_update_in_range, product_list
+):
+    # given
+    first_id, second_id, third_id = sorted(product.pk for product in product_list)
+    mocked_update_in_range.return_value = second_id
+
+    # when
+    update_products_search_vector_in_range_task(first_id, third_id)
+
+    # then
+    checkpoint_key = _get_search_vector_reindex_checkpoint_key(first_id, third_id)
+    assert cache.get(checkpoint_key) == second_id
+    mocked_delay.assert_called_once_with(first_id, third_id)
+    cache.delete(checkpoint_key)
+
+
+@patch("saleor.product.tasks.update_products_search_vector_in_range_task.delay")
+def test_reindex_products_search_vector(mocked_delay, product_list):
+    # given
+    first_id, second_id, third_id = sorted(product.pk for product in product_list)
+
+    # when
+    ranges = reindex_products_search_vector(parts=2)
+
+    # then
+    assert ranges == [(first_id, second_id), (third_id, third_id)]
+    assert [call.args for call in mocked_delay.call_args_list] == ranges
@@ -1,11 +1,13 @@
 from collections import defaultdict
-from typing import Dict, Iterable, List, Set, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 
+from django.db import transaction
 from django.db.models import Exists, OuterRef
 from django.db.models.query_utils import Q
 from prices import Money
 
 from ...channel.models import Channel
+from ...core.cache_tags import CacheTag, invalidate_cache_tags
 from ...discount import DiscountInfo
 from ...discount.models import Sale
 from ...discount.utils import calculate_discounted_price, fetch_active_discounts
@@ -18,6 +20,11 @@ from ..models import (
     ProductVariantChannelListing,
 )
 
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+DISCOUNTED_PRICES_BATCH_SIZE = 500
+
 
 def update_products_discounted_price(products: Iterable[Product], discounts=None):
     """Update Products and ProductVariants discounted prices.
@@ -48,7 +55,7 @@ def update_products_discounted_price(products: Iterable[Product], discounts=None
     changed_variants_listings_to_update = []
     product_channel_listings = ProductChannelListing.objects.filter(
         Exists(product_qs.filter(id=OuterRef("product_id")))
-    )
+    ).select_related("product", "channel")
     for product_channel_listing in product_channel_listings:
         product_id = product_channel_listing.product_id
         channel_id = product_channel_listing.channel_id
@@ -87,6 +94,8 @@ def update_products_discounted_price(products: Iterable[Product], discounts=None
         ProductVariantChannelListing.objects.bulk_update(
             changed_variants_listings_to_update, ["discounted_price_amount"]
         )
+    if changed_products_listings_to_update or changed_variants_listings_to_update:
+        invalidate_cache_tags([CacheTag.PRODUCT])
 
 
 def _get_product_to_variant_channel_listings_per_channel_map(
@@ -170,12 +179,12 @@ def update_products_discounted_prices(products, discounts=None):
         discounts = fetch_active_discounts()
 
     for product_batch in _products_in_batches(products):
-        update_products_discounted_price(product_batch)
+        update_products_discounted_price(product_batch, discounts)
 
 
-def update_products_discounted_prices_of_catalogues(
+def get_products_of_catalogues(
     product_ids=None, category_ids=None, collection_ids=None, variant_ids=None
-):
+) -> Optional["QuerySet[Product]"]:
     lookup = Q()
     if product_ids:
         lookup |= Q(pk__in=product_ids)
@@ -188,16 +197,15 @@ def update_products_discounted_prices_of_catalogues(
         )
         lookup |= Q(Exists(collection_products.filter(product_id=OuterRef("id"))))
     if variant_ids:
-        lookup |= Q(Exists(ProductVariant.objects.filter(product_id=OuterRef("id"))))
+        variants = ProductVariant.objects.filter(id__in=variant_ids)
+        lookup |= Q(Exists(variants.filter(product_id=OuterRef("id"))))
 
-    if lookup:
-        products = Product.objects.filter(lookup)
-
-        update_products_discounted_prices(products)
+    if not lookup:
+        return None
+    return Product.objects.filter(lookup)
 
 
-def update_products_discounted_prices_of_sale(sale: Sale):
-    """Recalculate discounted prices of related sale products."""
+def get_products_of_sale(sale: Sale) -> "QuerySet[Product]":
     product_lookup = Q()
     product_lookup |= Q(Exists(sale.variants.filter(product_id=OuterRef("id"))))
     product_lookup |= Q(Exists(sale.categories.filter(id=OuterRef("category_id"))))
@@ -206,6 +214,72 @@ def update_products_discounted_prices_of_sale(sale: Sale):
     )
     product_lookup |= Q(Exists(collection_products.filter(product_id=OuterRef("id"))))
 
-    products = sale.products.all() | Product.objects.filter(product_lookup)
+    return sale.products.all() | Product.objects.filter(product_lookup)
 
-    update_products_discounted_prices(products)
+
+def update_products_discounted_prices_of_catalogues(
+    product_ids=None, category_ids=None, collection_ids=None, variant_ids=None
+):
+    products = get_products_of_catalogues(
+        product_ids, category_ids, collection_ids, variant_ids
+    )
+    if products is not None:
+        update_products_discounted_prices(products)
+
+
+def update_products_discounted_prices_of_sale(sale: Sale):
+    """Recalculate discounted prices of related sale products."""
+    update_products_discounted_prices(get_products_of_sale(sale))
+
+
+def mark_products_discounted_prices_dirty(products: "QuerySet[Product]") -> int:
+    """Queue variant channel listings of the given products for recalculation.
+
+    Listings are marked with a single query; the ones that are already waiting for
+    recalculation are skipped, so overlapping changes are recalculated only once.
+    Return the number of newly marked listings.
+    """
+    variants = ProductVariant.objects.filter(
+        Exists(products.filter(id=OuterRef("product_id")))
+    )
+    return ProductVariantChannelListing.objects.filter(
+        Exists(variants.filter(id=OuterRef("variant_id"))),
+        discounted_price_dirty=False,
+    ).update(discounted_price_dirty=True)
+
+
+def update_dirty_products_discounted_prices(discounts=None) -> Tuple[int, int]:
+    """Recalculate discounted prices of products of a batch of dirty listings.
+
+    Listings already claimed by another worker are skipped. Flags are cleared
+    before the recalculation, so listings marked again in the meantime are
+    recalculated in the next batch, and are set back if the recalculation fails.
+    Return the number of recalculated products and the number of listings still
+    waiting for recalculation.
+    """
+    dirty_listings = ProductVariantChannelListing.objects.filter(
+        discounted_price_dirty=True
+    )
+    with transaction.atomic():
+        claimed_listings = list(
+            dirty_listings.select_for_update(skip_locked=True, of=("self",))
+            .order_by("variant__product_id", "id")
+            .values_list("id", "variant__product_id")[:DISCOUNTED_PRICES_BATCH_SIZE]
+        )
+        listing_ids = [listing_id for listing_id, _ in claimed_listings]
+        ProductVariantChannelListing.objects.filter(id__in=listing_ids).update(
+            discounted_price_dirty=False
+        )
+    product_ids = sorted({product_id for _, product_id in claimed_listings})
+    if product_ids:
+        try:
+            if discounts is None:
+                discounts = fetch_active_discounts()
+            products = Product.objects.filter(id__in=product_ids).only("id")
+            update_products_discounted_price(products, discounts)
+        except Exception:
+            ProductVariantChannelListing.objects.filter(id__in=listing_ids).update(
+                discounted_price_dirty=True
+            )
+            raise
+    return len(product_ids), dirty_listings.count()
@@ -486,6 +486,26 @@ elif GS_MEDIA_BUCKET_NAME:
 elif AZURE_CONTAINER:
     DEFAULT_FILE_STORAGE = "saleor.core.storages.AzureMediaStorage"
 
+# Thumbnails created in the background once an image is uploaded, so they don't have
+# to be generated on the first request. Set THUMBNAIL_PREGENERATE_SIZES in env to
+# a comma separated list of sizes, e.g. "256,512", to enable.
+# THUMBNAIL_PREGENERATE_FORMATS lists formats created in each size, "original" keeps
+# the format of the uploaded image.
+THUMBNAIL_PREGENERATE_SIZES = [
+    int(size)
+    for size in get_list(os.environ.get("THUMBNAIL_PREGENERATE_SIZES", ""))
+    if size
+]
+THUMBNAIL_PREGENERATE_FORMATS = get_list(
+    os.environ.get("THUMBNAIL_PREGENERATE_FORMATS", "original")
+)
+
+# Only one request creates a missing thumbnail at a time, others wait up to
+# THUMBNAIL_LOCK_WAIT seconds for it and are redirected to the original image
+# otherwise. THUMBNAIL_LOCK_TIMEOUT is the time after which an abandoned lock expires.
+THUMBNAIL_LOCK_WAIT = float(os.environ.get("THUMBNAIL_LOCK_WAIT", 2))
+THUMBNAIL_LOCK_TIMEOUT = int(os.environ.get("THUMBNAIL_LOCK_TIMEOUT", 60))
+
 PLACEHOLDER_IMAGES = {
     32: "images/placeholder32.png",
     64: "images/placeholder64.png",
@@ -582,6 +602,10 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.giftcard.tasks.deactivate_expired_cards_task",
         "schedule": crontab(hour=0, minute=0),
     },
+    "update-stocks-quantity-reserved": {
+        "task": "saleor.warehouse.tasks.update_stocks_quantity_reserved_task",
+        "schedule": timedelta(minutes=1),
+    },
     "update-stocks-quantity-allocated": {
         "task": "saleor.warehouse.tasks.update_stocks_quantity_allocated_task",
         "schedule": crontab(hour=0, minute=0),
@@ -608,6 +632,11 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.order.tasks.expire_orders_task",
         "schedule": BEAT_EXPIRE_ORDERS_AFTER_TIMEDELTA,
     },
+    "update-dirty-products-discounted-prices": {
+        "task": "saleor.product.tasks.update_dirty_products_discounted_prices_task",
+        "schedule": timedelta(minutes=1),
+        "options": {"expires": 60},
+    },
 }
 
 # The maximum wait time between each is_due() call on schedulers
@@ -693,6 +722,30 @@ GRAPHQL_QUERY_MAX_COMPLEXITY = int(
     os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 50000)
 )
 
+# Number of threads used to execute query operations sent in a single batch
+# concurrently. Mutations are always executed sequentially.
+# Set GRAPHQL_BATCH_MAX_WORKERS to more than 1 in env to enable.
+GRAPHQL_BATCH_MAX_WORKERS = int(os.environ.get("GRAPHQL_BATCH_MAX_WORKERS", 0))
+
+# Number of seconds to cache responses of anonymous catalog queries, e.g. products
+# or categories. Cached responses are invalidated by changes of the catalog, except
+# stock quantities, which can be stale for up to this many seconds. Set
+# GRAPHQL_RESPONSE_CACHE_TIMEOUT in env to enable.
+GRAPHQL_RESPONSE_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_RESPONSE_CACHE_TIMEOUT", 0)
+)
+
+# Connections with a total count strategy, e.g. orders or products, keep their
+# `totalCount` in cache for GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT seconds, and return
+# the PostgreSQL planner estimate instead of counting exactly when it exceeds
+# GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD rows. Set them in env to enable.
+GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT", 0)
+)
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 0)
+)
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -735,11 +788,76 @@ PLUGINS = BUILTIN_PLUGINS + EXTERNAL_PLUGINS
 WEBHOOK_TIMEOUT = 10
 WEBHOOK_SYNC_TIMEOUT = 20
 
+# Maximum number of sync webhook requests of a single event sent concurrently. When
+# an event has many subscribed webhooks, requests to all of them are sent at once
+# instead of one by one. Set WEBHOOK_SYNC_MAX_WORKERS to more than 1 in env to enable.
+WEBHOOK_SYNC_MAX_WORKERS = int(os.environ.get("WEBHOOK_SYNC_MAX_WORKERS", 0))
+
+# Webhook requests sent over HTTP reuse keep-alive connections pooled per target
+# origin. The pools of the least recently used origins are closed once there are
+# more than WEBHOOK_HTTP_POOL_MAX_ORIGINS of them. Up to
+# WEBHOOK_HTTP_POOL_MAX_CONNECTIONS idle connections are kept open per origin.
+WEBHOOK_HTTP_POOL_MAX_ORIGINS = int(
+    os.environ.get("WEBHOOK_HTTP_POOL_MAX_ORIGINS", 100)
+)
+WEBHOOK_HTTP_POOL_MAX_CONNECTIONS = int(
+    os.environ.get("WEBHOOK_HTTP_POOL_MAX_CONNECTIONS", 10)
+)
+
+# Number of async webhook deliveries sent by a single Celery task. When set, deliveries
+# triggered while handling an API request are saved together once the request is
+# executed and enqueued in batches of this size. Set WEBHOOK_ASYNC_BATCH_SIZE in env
+# to enable.
+WEBHOOK_ASYNC_BATCH_SIZE = int(os.environ.get("WEBHOOK_ASYNC_BATCH_SIZE", 0))
+
+# Number of threads preparing data of consecutive batches of exported products
+# concurrently. Batches are still written to the file in order. Set
+# CSV_EXPORT_MAX_WORKERS to more than 1 in env to enable.
+CSV_EXPORT_MAX_WORKERS = int(os.environ.get("CSV_EXPORT_MAX_WORKERS", 0))
+
+# Maximum number of async webhook requests sent to a single target URL at once by all
+# workers. Deliveries over the limit are rescheduled after WEBHOOK_TARGET_DEFER_DELAY
+# seconds without using up their retries, up to WEBHOOK_TARGET_MAX_DEFERRALS times,
+# after which they are marked as failed. The limit is halved when the target fails
+# and raised back on successful responses. Set WEBHOOK_TARGET_MAX_CONCURRENCY in env
+# to enable.
+WEBHOOK_TARGET_MAX_CONCURRENCY = int(
+    os.environ.get("WEBHOOK_TARGET_MAX_CONCURRENCY", 0)
+)
+WEBHOOK_TARGET_DEFER_DELAY = int(os.environ.get("WEBHOOK_TARGET_DEFER_DELAY", 5))
+WEBHOOK_TARGET_MAX_DEFERRALS = int(os.environ.get("WEBHOOK_TARGET_MAX_DEFERRALS", 60))
+
+# Webhook requests to a target URL fail right away, without being sent, for
+# WEBHOOK_CIRCUIT_BREAKER_OPEN_DURATION seconds once the share of failed requests to
+# it in a WEBHOOK_CIRCUIT_BREAKER_WINDOW seconds long window reaches
+# WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE, counting at least
+# WEBHOOK_CIRCUIT_BREAKER_MIN_REQUESTS requests. Then requests are sent one at a time
+# until one of them succeeds. Async deliveries are retried as after any failed
+# request. Set WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE in env, e.g. to 0.5, to enable.
+WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE = float(
+    os.environ.get("WEBHOOK_CIRCUIT_BREAKER_FAILURE_RATE", 0)
+)
+WEBHOOK_CIRCUIT_BREAKER_MIN_REQUESTS = int(
+    os.environ.get("WEBHOOK_CIRCUIT_BREAKER_MIN_REQUESTS", 20)
+)
+WEBHOOK_CIRCUIT_BREAKER_WINDOW = int(
+    os.environ.get("WEBHOOK_CIRCUIT_BREAKER_WINDOW", 60)
+)
+WEBHOOK_CIRCUIT_BREAKER_OPEN_DURATION = int(
+    os.environ.get("WEBHOOK_CIRCUIT_BREAKER_OPEN_DURATION", 30)
+)
+
 # Since we split checkout complete logic into two separate transactions, in order to
 # mimic stock lock, we apply short reservation for the stocks. The value represents
 # time of the reservation in seconds.
 RESERVE_DURATION = 45
 
+# Number of slots the stock quantity is split into for checkout reservations. Each
+# reservation locks a single free slot instead of the whole stock, so concurrent
+# checkouts of the same variant rarely wait for each other. Set
+# STOCK_RESERVATION_SLOTS in env to enable.
+STOCK_RESERVATION_SLOTS = int(os.environ.get("STOCK_RESERVATION_SLOTS", 0))
+
 # Initialize a simple and basic Jaeger Tracing integration
 # for open-tracing if enabled.
 #
@@ -0,0 +1,41 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class ShippingAppConfig(AppConfig):
+    name = "saleor.shipping"
+
+    def ready(self):
+        from .models import (
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+            ShippingZone,
+        )
+        from .rates import shipping_rates_version
+
+        # compiled shipping rate tables are rebuilt on any change of the models
+        # they are compiled from
+        for model in [
+            ShippingZone,
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+        ]:
+            for signal in [post_save, post_delete]:
+                signal.connect(
+                    shipping_rates_version.invalidate,
+                    sender=model,
+                    weak=False,
+                    dispatch_uid=f"invalidate_shipping_rates_{model.__name__}",
+                )
+        for through_model in [
+            ShippingZone.channels.through,
+            ShippingMethod.excluded_products.through,
+        ]:
+            m2m_changed.connect(
+                shipping_rates_version.invalidate,
+                sender=through_model,
+                weak=False,
+                dispatch_uid=f"invalidate_shipping_rates_{through_model.__name__}",
+            )
@@ -20,7 +20,7 @@ from ..core.weight import convert_weight, get_default_weight_unit, zero_weight
 from ..permission.enums import ShippingPermissions
 from ..tax.models import TaxClass
 from . import PostalCodeRuleInclusionType, ShippingMethodType
-from .postal_codes import filter_shipping_methods_by_postal_code_rules
+from .rates import get_shipping_rate_table
 
 if TYPE_CHECKING:
     from ..checkout.fetch import CheckoutLineInfo
@@ -128,6 +128,10 @@ class ShippingMethodQueryset(models.QuerySet["ShippingMethod"]):
 
         It is based on the given country code, and by shipping methods that are
         applicable to the given price, weight and products.
+
+        To resolve the shipping methods of a checkout or an order, use
+        `applicable_shipping_methods_for_instance`, which doesn't query the database
+        for the shipping rates.
         """
         qs = self.filter(
             shipping_zone__countries__contains=country_code,
@@ -171,18 +175,17 @@ class ShippingMethodQueryset(models.QuerySet["ShippingMethod"]):
         instance_product_ids = {
             line.variant.product_id for line in lines if line.variant
         }
-        applicable_methods = self.applicable_shipping_methods(
+        rate_table = get_shipping_rate_table(channel_id, country_code)
+        applicable_method_ids = rate_table.get_applicable_shipping_method_ids(
             price=price,
-            channel_id=channel_id,
             weight=instance.get_total_weight(lines),
-            country_code=country_code or instance.shipping_address.country.code,
             product_ids=instance_product_ids,
-        ).prefetch_related("postal_code_rules")
-
-        return filter_shipping_methods_by_postal_code_rules(
-            applicable_methods, instance.shipping_address
+            address=instance.shipping_address,
         )
 
+        qs = self.filter(id__in=applicable_method_ids)
+        return self.applicable_shipping_methods_by_channel(qs, channel_id)
+
 
 ShippingMethodManager = models.Manager.from_queryset(ShippingMethodQueryset)
 
@@ -42,13 +42,16 @@ def compare_values(code, start, end):
     return start <= code <= end
 
 
+UK_POSTAL_CODE_PATTERN = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
+IRISH_POSTAL_CODE_PATTERN = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
+
+
 def check_uk_postal_code(code, start, end):
     """Check postal code for uk, split the code by regex.
 
     Example postal codes: BH20 2BC  (UK), IM16 7HF  (Isle of Man).
     """
-    pattern = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = group_values(UK_POSTAL_CODE_PATTERN, code, start, end)
     # replace second item of each tuple with it's value casted to int
     code, start, end = cast_tuple_index_to_type(1, int, code, start, end)
     return compare_values(code, start, end)
@@ -59,8 +62,7 @@ def check_irish_postal_code(code, start, end):
 
     Example postal codes: A65 2F0A, A61 2F0G.
     """
-    pattern = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = group_values(IRISH_POSTAL_CODE_PATTERN, code, start, end)
     return compare_values(code, start, end)
 
 
@@ -83,6 +85,41 @@ def check_postal_code_in_range(country, code, start, end):
     return country_func_map.get(country, check_any_postal_code)(code, start, end)
 
 
+def parse_uk_postal_code(code):
+    """Split the UK postal code into comparable sections, as `check_uk_postal_code`."""
+    (groups,) = group_values(UK_POSTAL_CODE_PATTERN, code)
+    if not groups:
+        return None
+    (groups,) = cast_tuple_index_to_type(1, int, groups)
+    return groups
+
+
+def parse_irish_postal_code(code):
+    """Split the Irish postal code into sections, as `check_irish_postal_code`."""
+    (groups,) = group_values(IRISH_POSTAL_CODE_PATTERN, code)
+    return groups
+
+
+def parse_any_postal_code(code):
+    return code or None
+
+
+def get_postal_code_parser(country):
+    """Return the function converting postal codes of the country to sort keys.
+
+    Postal codes are in range when their keys are between the keys of the range
+    bounds, None is returned for codes that can't be compared.
+    """
+    country_func_map = {
+        "GB": parse_uk_postal_code,  # United Kingdom
+        "IM": parse_uk_postal_code,  # Isle of Man
+        "GG": parse_uk_postal_code,  # Guernsey
+        "JE": parse_uk_postal_code,  # Jersey
+        "IE": parse_irish_postal_code,  # Ireland
+    }
+    return country_func_map.get(country, parse_any_postal_code)
+
+
 def check_shipping_method_for_postal_code(customer_shipping_address, method):
     country = customer_shipping_address.country.code
     postal_code = customer_shipping_address.postal_code
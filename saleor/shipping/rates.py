@@ -0,0 +1,257 @@
+"""Shipping rate tables compiled per channel and country.
+
+Resolving the shipping methods applicable to a checkout or an order joins shipping
+zones, methods, channel listings and excluded products, and then checks the postal
+code rules of each method. As the shipping configuration rarely changes, it is
+compiled once per channel and country into a table kept in the process memory,
+so the resolution doesn't hit the database.
+
+Tables are versioned with `CacheVersion`, invalidated on every change of the shipping
+configuration, so all processes drop their tables at once.
+"""
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from measurement.measures import Weight
+from prices import Money
+
+from ..core.utils.cache_version import CacheVersion
+from . import PostalCodeRuleInclusionType, ShippingMethodType
+from .postal_codes import check_postal_code_in_range, get_postal_code_parser
+
+if TYPE_CHECKING:
+    from ..account.models import Address
+
+SHIPPING_RATES_VERSION_KEY = "shipping_rates_version"
+
+shipping_rates_version = CacheVersion(SHIPPING_RATES_VERSION_KEY)
+
+# Time after which a compiled table is rebuilt even if the version didn't change,
+# in case the change was rolled back after the table was compiled.
+SHIPPING_RATES_TABLE_TIMEOUT = 300
+
+PostalCodeRule = Tuple[str, Optional[str], str]
+
+
+class PostalCodeRules:
+    """Postal code rules of a shipping method compiled for a country.
+
+    The ranges are sorted by their start, with the highest end of the preceding
+    ranges kept for each of them, so a postal code is matched with a binary search.
+    """
+
+    def __init__(self, country_code: str, rules: Iterable[PostalCodeRule]):
+        self.country_code = country_code
+        self.rules = list(rules)
+        inclusion_types = {inclusion_type for _, _, inclusion_type in self.rules}
+        # shipping methods with both kinds of rules are not supported
+        self.inclusion_type = (
+            inclusion_types.pop() if len(inclusion_types) == 1 else None
+        )
+
+        parse = get_postal_code_parser(country_code)
+        ranges = []
+        for start, end, _ in self.rules:
+            start_key = parse(start)
+            if start_key:
+                ranges.append((start_key, parse(end) if end else None))
+        ranges.sort(key=lambda range: range[0])
+
+        self.starts = [start for start, _ in ranges]
+        # the highest end of the ranges up to the index, None means no upper bound
+        self.max_ends: List = []
+        max_end = None
+        unbounded = False
+        for _, end in ranges:
+            if end is None:
+                unbounded = True
+            elif max_end is None or end > max_end:
+                max_end = end
+            self.max_ends.append(None if unbounded else max_end)
+
+    def contains(self, country_code: str, postal_code: str) -> bool:
+        """Return whether the postal code is in any of the ranges."""
+        if country_code != self.country_code:
+            return any(
+                check_postal_code_in_range(country_code, postal_code, start, end)
+                for start, end, _ in self.rules
+            )
+        code_key = get_postal_code_parser(country_code)(postal_code)
+        if not code_key:
+            return False
+        index = bisect_right(self.starts, code_key)
+        if index == 0:
+            return False
+        max_end = self.max_ends[index - 1]
+        return max_end is None or code_key <= max_end
+
+    def is_applicable(self, address: "Address") -> bool:
+        """Return if the shipping method is applicable with the postal code rules."""
+        if self.inclusion_type is None:
+            return False
+        matched = self.contains(address.country.code, address.postal_code)
+        if self.inclusion_type == PostalCodeRuleInclusionType.INCLUDE:
+            return matched
+        return not matched
+
+
+@dataclass(frozen=True)
+class CompiledShippingMethod:
+    id: int
+    type: str
+    currency: str
+    price_amount: Decimal
+    minimum_order_price_amount: Optional[Decimal]
+    maximum_order_price_amount: Optional[Decimal]
+    minimum_order_weight: Optional[Weight]
+    maximum_order_weight: Optional[Weight]
+    excluded_product_ids: FrozenSet[int]
+    postal_code_rules: Optional[PostalCodeRules]
+
+    def is_applicable(
+        self,
+        price: Money,
+        weight: Weight,
+        product_ids: Iterable[int],
+        address: Optional["Address"],
+    ) -> bool:
+        if self.currency != price.currency:
+            return False
+        if self.type == ShippingMethodType.PRICE_BASED:
+            min_price = self.minimum_order_price_amount
+            max_price = self.maximum_order_price_amount
+            if min_price is not None and price.amount < min_price:
+                return False
+            if max_price is not None and price.amount > max_price:
+                return False
+        elif self.type == ShippingMethodType.WEIGHT_BASED:
+            min_weight = self.minimum_order_weight
+            max_weight = self.maximum_order_weight
+            if min_weight is not None and weight < min_weight:
+                return False
+            if max_weight is not None and weight > max_weight:
+                return False
+        else:
+            return False
+        if not self.excluded_product_ids.isdisjoint(product_ids):
+            return False
+        if self.postal_code_rules and address:
+            return self.postal_code_rules.is_applicable(address)
+        return True
+
+
+class ShippingRateTable:
+    """Shipping methods available in a channel for a country, sorted by price."""
+
+    def __init__(self, methods: Iterable[CompiledShippingMethod]):
+        self.methods = sorted(
+            methods, key=lambda method: (method.price_amount, method.id)
+        )
+
+    def get_applicable_shipping_method_ids(
+        self,
+        price: Money,
+        weight: Weight,
+        product_ids: Iterable[int],
+        address: Optional["Address"] = None,
+    ) -> List[int]:
+        """Return IDs of the shipping methods applicable for the given order data.
+
+        Postal code rules are checked only when the shipping address is given.
+        """
+        product_ids = set(product_ids)
+        return [
+            method.id
+            for method in self.methods
+            if method.is_applicable(price, weight, product_ids, address)
+        ]
+
+
+def compile_shipping_rate_table(channel_id: int, country_code: str):
+    from .models import (
+        ShippingMethod,
+        ShippingMethodChannelListing,
+        ShippingMethodPostalCodeRule,
+    )
+
+    listings = list(
+        ShippingMethodChannelListing.objects.filter(
+            channel_id=channel_id,
+            shipping_method__shipping_zone__countries__contains=country_code,
+            shipping_method__shipping_zone__channels__id=channel_id,
+        ).select_related("shipping_method")
+    )
+    method_ids = [listing.shipping_method_id for listing in listings]
+
+    postal_code_rules: Dict[int, List[PostalCodeRule]] = defaultdict(list)
+    for method_id, start, end, inclusion_type in (
+        ShippingMethodPostalCodeRule.objects.filter(shipping_method_id__in=method_ids)
+        .order_by("pk")
+        .values_list("shipping_method_id", "start", "end", "inclusion_type")
+    ):
+        postal_code_rules[method_id].append((start, end, inclusion_type))
+
+    excluded_product_ids: Dict[int, set] = defaultdict(set)
+    for (
+        method_id,
+        product_id,
+    ) in ShippingMethod.excluded_products.through.objects.filter(
+        shippingmethod_id__in=method_ids
+    ).values_list(
+        "shippingmethod_id", "product_id"
+    ):
+        excluded_product_ids[method_id].add(product_id)
+
+    methods = []
+    for listing in listings:
+        method = listing.shipping_method
+        rules = postal_code_rules.get(method.id)
+        methods.append(
+            CompiledShippingMethod(
+                id=method.id,
+                type=method.type,
+                currency=listing.currency,
+                price_amount=listing.price_amount,
+                minimum_order_price_amount=listing.minimum_order_price_amount,
+                maximum_order_price_amount=listing.maximum_order_price_amount,
+                minimum_order_weight=method.minimum_order_weight,
+                maximum_order_weight=method.maximum_order_weight,
+                excluded_product_ids=frozenset(excluded_product_ids[method.id]),
+                postal_code_rules=(
+                    PostalCodeRules(country_code, rules) if rules else None
+                ),
+            )
+        )
+    return ShippingRateTable(methods)
+
+
+# compiled tables by channel ID and country code, along with their version and
+# the time after which they are rebuilt
+_shipping_rate_tables: Dict[Tuple[int, str], Tuple[str, float, ShippingRateTable]] = {}
+
+
+def get_shipping_rate_table(channel_id: int, country_code: str) -> ShippingRateTable:
+    """Return the shipping rate table of the channel and country.
+
+    The table is compiled when it doesn't exist yet or the shipping configuration
+    changed since it was compiled.
+    """
+    key = (channel_id, country_code)
+    version = shipping_rates_version.get()
+    cached = _shipping_rate_tables.get(key)
+    if cached:
+        cached_version, expires_at, table = cached
+        if cached_version == version and expires_at > time.monotonic():
+            return table
+
+    table = compile_shipping_rate_table(channel_id, country_code)
+    _shipping_rate_tables[key] = (
+        version,
+        time.monotonic() + SHIPPING_RATES_TABLE_TIMEOUT,
+        table,
+    )
+    return table
@@ -0,0 +1,232 @@
+import pytest
+from measurement.measures import Weight
+from prices import Money
+
+from ...account.models import Address
+from .. import PostalCodeRuleInclusionType, ShippingMethodType
+from ..models import ShippingMethodChannelListing, ShippingZone
+from ..postal_codes import is_shipping_method_applicable_for_postal_code
+from ..rates import PostalCodeRules, get_shipping_rate_table
+
+
+@pytest.fixture
+def price_and_weight_methods(other_channel_USD):
+    shipping_zone = ShippingZone.objects.create(countries=["PL"])
+    shipping_zone.channels.add(other_channel_USD)
+    price_method = shipping_zone.shipping_methods.create(
+        type=ShippingMethodType.PRICE_BASED,
+    )
+    ShippingMethodChannelListing.objects.create(
+        minimum_order_price=Money("1.0", "USD"),
+        maximum_order_price=Money("10.0", "USD"),
+        price=Money("3.0", "USD"),
+        shipping_method=price_method,
+        channel=other_channel_USD,
+        currency=other_channel_USD.currency_code,
+    )
+    weight_method = shipping_zone.shipping_methods.create(
+        minimum_order_weight=Weight(kg=1),
+        maximum_order_weight=Weight(kg=10),
+        type=ShippingMethodType.WEIGHT_BASED,
+    )
+    ShippingMethodChannelListing.objects.create(
+        price=Money("2.0", "USD"),
+        shipping_method=weight_method,
+        channel=other_channel_USD,
+        currency=other_channel_USD.currency_code,
+    )
+    return price_method, weight_method
+
+
+@pytest.mark.parametrize(
+    "price, weight, expected_methods",
+    [
+        (Money("5.0", "USD"), Weight(kg=5), ["weight", "price"]),
+        (Money("50.0", "USD"), Weight(kg=5), ["weight"]),
+        (Money("5.0", "USD"), Weight(g=500), ["price"]),
+        (Money("5.0", "EUR"), Weight(kg=5), []),
+    ],
+)
+def test_shipping_rate_table_applicable_methods(
+    price, weight, expected_methods, price_and_weight_methods, other_channel_USD
+):
+    # given
+    price_method, weight_method = price_and_weight_methods
+    methods = {"price": price_method.id, "weight": weight_method.id}
+
+    # when
+    table = get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # then
+    method_ids = table.get_applicable_shipping_method_ids(price, weight, [])
+    assert method_ids == [methods[name] for name in expected_methods]
+
+
+def test_shipping_rate_table_for_country_outside_shipping_zone(
+    price_and_weight_methods, other_channel_USD
+):
+    # when
+    table = get_shipping_rate_table(other_channel_USD.id, "US")
+
+    # then
+    assert not table.get_applicable_shipping_method_ids(
+        Money("5.0", "USD"), Weight(kg=5), []
+    )
+
+
+def test_shipping_rate_table_with_excluded_products(
+    price_and_weight_methods, other_channel_USD, product, product_with_single_variant
+):
+    # given
+    price_method, weight_method = price_and_weight_methods
+    price_method.excluded_products.add(product)
+
+    # when
+    table = get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # then
+    assert table.get_applicable_shipping_method_ids(
+        Money("5.0", "USD"), Weight(kg=5), [product.id]
+    ) == [weight_method.id]
+    assert table.get_applicable_shipping_method_ids(
+        Money("5.0", "USD"), Weight(kg=5), [product_with_single_variant.id]
+    ) == [weight_method.id, price_method.id]
+
+
+def test_shipping_rate_table_reused_until_shipping_changes(
+    price_and_weight_methods, other_channel_USD, django_assert_num_queries
+):
+    # given
+    price_method, weight_method = price_and_weight_methods
+    table = get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # when
+    with django_assert_num_queries(0):
+        cached_table = get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # then
+    assert cached_table is table
+
+    # when
+    listing = weight_method.channel_listings.get()
+    listing.price_amount = 5
+    listing.save(update_fields=["price_amount"])
+    table = get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # then
+    assert table is not cached_table
+    assert table.get_applicable_shipping_method_ids(
+        Money("5.0", "USD"), Weight(kg=5), []
+    ) == [price_method.id, weight_method.id]
+
+
+def test_shipping_rate_table_recompiled_on_postal_code_rule_change(
+    price_and_weight_methods, other_channel_USD, address
+):
+    # given
+    price_method, weight_method = price_and_weight_methods
+    address.country = "PL"
+    address.postal_code = "53-601"
+    get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # when
+    price_method.postal_code_rules.create(start="53-000", end="54-000")
+    table = get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # then
+    assert table.get_applicable_shipping_method_ids(
+        Money("5.0", "USD"), Weight(kg=5), [], address
+    ) == [weight_method.id]
+
+
+def test_shipping_rate_table_recompiled_on_excluded_products_change(
+    price_and_weight_methods, other_channel_USD, product
+):
+    # given
+    price_method, weight_method = price_and_weight_methods
+    get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # when
+    price_method.excluded_products.add(product)
+    table = get_shipping_rate_table(other_channel_USD.id, "PL")
+
+    # then
+    assert table.get_applicable_shipping_method_ids(
+        Money("5.0", "USD"), Weight(kg=5), [product.id]
+    ) == [weight_method.id]
+
+
+@pytest.mark.parametrize(
+    "country, rules",
+    [
+        (
+            "PL",
+            [("50-000", "52-000"), ("51-500", "53-000"), ("60-000", None)],
+        ),
+        ("PL", [("54-000", "53-000"), ("53-500", "53-700")]),
+        ("GB", [("BH2 1AA", "BH4 9ZZ"), ("BH16 7HA", "BH17 7HG")]),
+        ("GB", [("BH16 7HC", None), ("BH2 1AA", "BH2 9ZZ")]),
+        ("IE", [("A65 2F0A", "A65 2F0C"), ("D02 AF30", None)]),
+    ],
+)
+@pytest.mark.parametrize(
+    "inclusion_type",
+    [PostalCodeRuleInclusionType.INCLUDE, PostalCodeRuleInclusionType.EXCLUDE],
+)
+@pytest.mark.parametrize(
+    "postal_code",
+    [
+        "49-000",
+        "51-700",
+        "52-500",
+        "53-600",
+        "70-000",
+        "BH3 2BC",
+        "BH20 2BC",
+        "BH16 7HF",
+        "BH18 1AA",
+        "A65 2F0B",
+        "A65 2F0D",
+        "D02 AF31",
+        "",
+    ],
+)
+def test_postal_code_rules_match_postal_code_checks(
+    country, rules, inclusion_type, postal_code, shipping_method
+):
+    # given
+    for start, end in rules:
+        shipping_method.postal_code_rules.create(
+            start=start, end=end, inclusion_type=inclusion_type
+        )
+    address = Address(country=country, postal_code=postal_code)
+    postal_code_rules = PostalCodeRules(
+        country,
+        [(start, end, inclusion_type) for start, end in rules],
+    )
+
+    # when
+    is_applicable = postal_code_rules.is_applicable(address)
+
+    # then
+    assert is_applicable is is_shipping_method_applicable_for_postal_code(
+        address, shipping_method
+    )
+
+
+def test_postal_code_rules_with_mixed_inclusion_types():
+    # given
+    address = Address(country="PL", postal_code="53-601")
+    postal_code_rules = PostalCodeRules(
+        "PL",
+        [
+            ("53-000", "54-000", PostalCodeRuleInclusionType.INCLUDE),
+            ("60-000", None, PostalCodeRuleInclusionType.EXCLUDE),
+        ],
+    )
+
+    # when
+    is_applicable = postal_code_rules.is_applicable(address)
+
+    # then
+    assert is_applicable is False
@@ -28,6 +28,7 @@ from prices import Money, TaxedMoney, fixed_discount
 
 from ..account.models import Address, Group, StaffNotificationRecipient, User
 from ..app.models import App, AppExtension, AppInstallation
+from ..app.token_cache import app_tokens_version
 from ..app.types import AppExtensionMount, AppType
 from ..attribute import AttributeEntityType, AttributeInputType, AttributeType
 from ..attribute.models import (
@@ -42,6 +43,7 @@ from ..checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ..checkout.models import Checkout, CheckoutLine, CheckoutMetadata
 from ..checkout.utils import add_variant_to_checkout, add_voucher_to_checkout
 from ..core import EventDeliveryStatus, JobStatus
+from ..core.cache_tags import CacheTag, bump_cache_tags
 from ..core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ..core.payments import PaymentInterface
 from ..core.postgres import FlatConcatSearchVector
@@ -61,6 +63,7 @@ from ..discount.models import (
     VoucherCustomer,
     VoucherTranslation,
 )
+from ..discount.sale_index import clear_sale_index, sale_index_version
 from ..giftcard import GiftCardEvents
 from ..giftcard.models import GiftCard, GiftCardEvent, GiftCardTag
 from ..menu.models import Menu, MenuItem, MenuItemTranslation
@@ -93,6 +96,7 @@ from ..payment.utils import create_manual_adjustment_events
 from ..permission.enums import get_permissions
 from ..permission.models import Permission
 from ..plugins.manager import get_plugins_manager
+from ..plugins.snapshot import clear_plugins_snapshots
 from ..plugins.webhook.tasks import WebhookResponse
 from ..plugins.webhook.tests.subscription_webhooks import subscription_queries
 from ..plugins.webhook.utils import to_payment_app_id
@@ -140,6 +144,7 @@ from ..warehouse.models import (
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.models import Webhook, WebhookEvent
 from ..webhook.observability import WebhookData
+from ..webhook.routing import clear_webhook_routing_table, webhook_routing_version
 from .utils import dummy_editorjs
 
 
@@ -236,6 +241,50 @@ def setup_dummy_gateways(settings):
     return settings
 
 
+@pytest.fixture(autouse=True)
+def clear_plugins_snapshot():
+    """Drop plugins snapshots built in other tests.
+
+    Database changes are rolled back between tests without emitting any signals,
+    so the snapshot built in a previous test may point to non-existing objects.
+    """
+    clear_plugins_snapshots()
+
+
+@pytest.fixture(autouse=True)
+def reset_webhook_routing_table():
+    """Drop the webhook routing table built in other tests.
+
+    Webhooks created in a previous test are rolled back without emitting any
+    signals, so the cached table would still route events to them.
+    """
+    webhook_routing_version.bump()
+    clear_webhook_routing_table()
+
+
+@pytest.fixture(autouse=True)
+def reset_sale_index():
+    """Drop the sale index built in other tests.
+
+    Sales created in a previous test are rolled back without emitting any signals,
+    so the cached index would still discount products with them.
+    """
+    sale_index_version.bump()
+    clear_sale_index()
+
+
+@pytest.fixture(autouse=True)
+def reset_cache_tags():
+    """Discard responses cached in other tests, as their data was rolled back."""
+    bump_cache_tags(CacheTag.ALL)
+
+
+@pytest.fixture(autouse=True)
+def reset_app_token_cache():
+    """Drop tokens verified in other tests, as their apps were rolled back."""
+    app_tokens_version.bump()
+
+
 @pytest.fixture
 def sample_gateway(settings):
     settings.PLUGINS += [
@@ -1,16 +1,31 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save, pre_save
 
 
 class ThumbnailAppConfig(AppConfig):
     name = "saleor.thumbnail"
 
     def ready(self):
-        from .models import Thumbnail
-        from .signals import delete_thumbnail_image
+        from .models import TYPE_TO_MODEL_DATA_MAPPING, Thumbnail
+        from .signals import (
+            create_thumbnails_for_saved_image,
+            delete_thumbnail_image,
+            mark_image_changed,
+        )
 
         post_delete.connect(
             delete_thumbnail_image,
             sender=Thumbnail,
             dispatch_uid="delete_thumbnail_image",
         )
+        for object_type, model_data in TYPE_TO_MODEL_DATA_MAPPING.items():
+            pre_save.connect(
+                mark_image_changed,
+                sender=model_data.model,
+                dispatch_uid=f"mark_image_changed_{object_type}",
+            )
+            post_save.connect(
+                create_thumbnails_for_saved_image,
+                sender=model_data.model,
+                dispatch_uid=f"create_thumbnails_for_saved_image_{object_type}",
+            )
@@ -1,6 +1,44 @@
+from django.conf import settings
+from django.db import transaction
+
 from ..core.tasks import delete_from_storage_task
+from .models import TYPE_TO_MODEL_DATA_MAPPING
+from .tasks import create_thumbnails_task
 
 
 def delete_thumbnail_image(sender, instance, **kwargs):
     if image := instance.image:
         delete_from_storage_task.delay(image.name)
+
+
+def mark_image_changed(sender, instance, update_fields=None, **kwargs):
+    """Mark the instance if the saved image differs from the one in the database."""
+    if not settings.THUMBNAIL_PREGENERATE_SIZES:
+        return
+    image_field = TYPE_TO_MODEL_DATA_MAPPING[sender.__name__].image_field
+    if update_fields is not None and image_field not in update_fields:
+        return
+    image = getattr(instance, image_field)
+    if not image:
+        return
+    # a new file is uploaded when the instance is saved, so it differs even if the
+    # name is the same
+    if not instance._state.adding and image._committed:
+        saved_image = (
+            sender._default_manager.filter(pk=instance.pk)
+            .values_list(image_field, flat=True)
+            .first()
+        )
+        if saved_image == image.name:
+            return
+    instance._image_changed = True
+
+
+def create_thumbnails_for_saved_image(sender, instance, **kwargs):
+    """Schedule creating the pre-generated thumbnails of the changed instance image."""
+    if not instance.__dict__.pop("_image_changed", False):
+        return
+    object_type = sender.__name__
+    transaction.on_commit(
+        lambda: create_thumbnails_task.delay(object_type, instance.pk)
+    )
@@ -0,0 +1,121 @@
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+
+from ..celeryconf import app
+from ..core.utils.events import call_event
+from ..plugins.manager import get_plugins_manager
+from . import ALLOWED_ICON_THUMBNAIL_FORMATS, ALLOWED_THUMBNAIL_FORMATS
+from .models import (
+    ICON_TYPE_TO_MODEL_DATA_MAPPING,
+    TYPE_TO_MODEL_DATA_MAPPING,
+    ModelData,
+    Thumbnail,
+)
+from .utils import (
+    ProcessedIconImage,
+    ProcessedImage,
+    acquire_thumbnail_lock,
+    get_thumbnail_format,
+    get_thumbnail_lock_key,
+    get_thumbnail_size,
+    prepare_thumbnail_file_name,
+    release_thumbnail_lock,
+)
+
+
+def get_pregenerated_thumbnails(object_type: str) -> List[Tuple[int, Optional[str]]]:
+    """Return sizes and formats of thumbnails created once an image is uploaded.
+
+    Formats that are not supported for the given object type are skipped.
+    """
+    if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
+        allowed_formats = ALLOWED_ICON_THUMBNAIL_FORMATS
+    else:
+        allowed_formats = ALLOWED_THUMBNAIL_FORMATS
+
+    formats: List[Optional[str]] = []
+    for format in settings.THUMBNAIL_PREGENERATE_FORMATS:
+        thumbnail_format = get_thumbnail_format(format)
+        if thumbnail_format in formats:
+            continue
+        if thumbnail_format is None or thumbnail_format in allowed_formats:
+            formats.append(thumbnail_format)
+
+    sizes = {get_thumbnail_size(size) for size in settings.THUMBNAIL_PREGENERATE_SIZES}
+    return [(size, format) for size in sorted(sizes) for format in formats]
+
+
+@app.task
+def create_thumbnails_task(object_type: str, instance_pk: int):
+    """Create the missing pre-generated thumbnails of the instance image.
+
+    The image is decoded only once for all the thumbnails.
+    """
+    model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
+    instance = model_data.model.objects.filter(pk=instance_pk).first()
+    if not instance:
+        return
+    image = getattr(instance, model_data.image_field)
+    if not bool(image):
+        return
+
+    # skip thumbnails that are being created by on-demand requests
+    locked_thumbnails = {}
+    for size, format in get_pregenerated_thumbnails(object_type):
+        lock_key = get_thumbnail_lock_key(
+            model_data.thumbnail_field, instance.pk, size, format
+        )
+        if acquire_thumbnail_lock(lock_key):
+            locked_thumbnails[(size, format)] = lock_key
+
+    try:
+        # existing thumbnails are checked once the locks are acquired, as they
+        # might have been created by a request that held the lock
+        existing_thumbnails = set(
+            Thumbnail.objects.filter(
+                **{model_data.thumbnail_field: instance}
+            ).values_list("size", "format")
+        )
+        thumbnails_to_create = [
+            size_and_format
+            for size_and_format in locked_thumbnails
+            if size_and_format not in existing_thumbnails
+        ]
+        if thumbnails_to_create:
+            _create_thumbnails(object_type, model_data, instance, thumbnails_to_create)
+    finally:
+        for lock_key in locked_thumbnails.values():
+            release_thumbnail_lock(lock_key)
+
+
+def _create_thumbnails(
+    object_type: str,
+    model_data: ModelData,
+    instance,
+    thumbnails_to_create: List[Tuple[int, Optional[str]]],
+):
+    image = getattr(instance, model_data.image_field)
+    if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
+        processed_image: ProcessedImage = ProcessedIconImage(
+            image.name, size=max(size for size, _ in thumbnails_to_create)
+        )
+    else:
+        processed_image = ProcessedImage(
+            image.name, size=max(size for size, _ in thumbnails_to_create)
+        )
+
+    manager = get_plugins_manager()
+    for size, format, thumbnail_file in processed_image.create_thumbnails(
+        thumbnails_to_create
+    ):
+        thumbnail_file_name = prepare_thumbnail_file_name(image.name, size, format)
+        thumbnail = Thumbnail(
+            size=size, format=format, **{model_data.thumbnail_field: instance}
+        )
+        thumbnail.image.save(thumbnail_file_name, thumbnail_file)
+
+        # set additional `instance` attribute, to easily get instance data
+        # for ThumbnailCreated subscription type
+        setattr(thumbnail, "instance", instance)
+        call_event(manager.thumbnail_created, thumbnail)
@@ -0,0 +1,218 @@
+from unittest.mock import patch
+
+from .. import ThumbnailFormat
+from ..models import Thumbnail
+from ..tasks import create_thumbnails_task, get_pregenerated_thumbnails
+from ..utils import acquire_thumbnail_lock, get_thumbnail_lock_key
+
+
+def test_get_pregenerated_thumbnails(settings):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [60, 256, 250]
+    settings.THUMBNAIL_PREGENERATE_FORMATS = ["original", "avif", "webp"]
+
+    # when
+    thumbnails = get_pregenerated_thumbnails("Category")
+
+    # then
+    assert thumbnails == [
+        (64, None),
+        (64, ThumbnailFormat.AVIF),
+        (64, ThumbnailFormat.WEBP),
+        (256, None),
+        (256, ThumbnailFormat.AVIF),
+        (256, ThumbnailFormat.WEBP),
+    ]
+
+
+def test_get_pregenerated_thumbnails_for_icon(settings):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [256]
+    settings.THUMBNAIL_PREGENERATE_FORMATS = ["original", "avif", "webp"]
+
+    # when
+    thumbnails = get_pregenerated_thumbnails("App")
+
+    # then
+    assert thumbnails == [(256, None), (256, ThumbnailFormat.WEBP)]
+
+
+@patch("saleor.plugins.manager.PluginsManager.thumbnail_created")
+def test_create_thumbnails_task(
+    thumbnail_created_mock,
+    category_with_image,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [64, 128]
+    settings.THUMBNAIL_PREGENERATE_FORMATS = ["original", "webp"]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        create_thumbnails_task("Category", category_with_image.pk)
+
+    # then
+    thumbnails = Thumbnail.objects.filter(category=category_with_image)
+    assert set(thumbnails.values_list("size", "format")) == {
+        (64, None),
+        (64, ThumbnailFormat.WEBP),
+        (128, None),
+        (128, ThumbnailFormat.WEBP),
+    }
+    assert thumbnail_created_mock.call_count == 4
+
+
+@patch("saleor.thumbnail.tasks.ProcessedImage.create_thumbnails")
+def test_create_thumbnails_task_skips_existing_thumbnails(
+    create_thumbnails_mock, category_with_image, settings
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [64, 128]
+    settings.THUMBNAIL_PREGENERATE_FORMATS = ["original"]
+    Thumbnail.objects.create(
+        category=category_with_image,
+        size=64,
+        image=category_with_image.background_image,
+    )
+    create_thumbnails_mock.return_value = []
+
+    # when
+    create_thumbnails_task("Category", category_with_image.pk)
+
+    # then
+    create_thumbnails_mock.assert_called_once_with([(128, None)])
+
+
+@patch("saleor.thumbnail.tasks.ProcessedImage.create_thumbnails")
+def test_create_thumbnails_task_skips_locked_thumbnails(
+    create_thumbnails_mock, category_with_image, settings, clear_cache
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [64, 128]
+    settings.THUMBNAIL_PREGENERATE_FORMATS = ["original"]
+    lock_key = get_thumbnail_lock_key("category", category_with_image.pk, 64, None)
+    acquire_thumbnail_lock(lock_key)
+    create_thumbnails_mock.return_value = []
+
+    # when
+    create_thumbnails_task("Category", category_with_image.pk)
+
+    # then
+    create_thumbnails_mock.assert_called_once_with([(128, None)])
+    assert not acquire_thumbnail_lock(lock_key)
+    assert acquire_thumbnail_lock(
+        get_thumbnail_lock_key("category", category_with_image.pk, 128, None)
+    )
+
+
+@patch("saleor.thumbnail.tasks.ProcessedImage.create_thumbnails")
+def test_create_thumbnails_task_for_instance_without_image(
+    create_thumbnails_mock, category, settings
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [64]
+
+    # when
+    create_thumbnails_task("Category", category.pk)
+
+    # then
+    create_thumbnails_mock.assert_not_called()
+    assert not Thumbnail.objects.exists()
+
+
+@patch("saleor.thumbnail.signals.create_thumbnails_task.delay")
+def test_thumbnails_created_on_image_save(
+    create_thumbnails_mock,
+    category,
+    image,
+    media_root,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [64]
+    category.background_image = image
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        category.save(update_fields=["background_image"])
+
+    # then
+    create_thumbnails_mock.assert_called_once_with("Category", category.pk)
+
+
+@patch("saleor.thumbnail.signals.create_thumbnails_task.delay")
+def test_thumbnails_not_created_when_image_not_saved(
+    create_thumbnails_mock,
+    category_with_image,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [64]
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        category_with_image.save(update_fields=["name"])
+
+    # then
+    create_thumbnails_mock.assert_not_called()
+
+
+@patch("saleor.thumbnail.signals.create_thumbnails_task.delay")
+def test_thumbnails_not_created_when_image_not_changed(
+    create_thumbnails_mock,
+    category_with_image,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [64]
+    category_with_image.name = "New name"
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        category_with_image.save()
+
+    # then
+    create_thumbnails_mock.assert_not_called()
+
+
+@patch("saleor.thumbnail.signals.create_thumbnails_task.delay")
+def test_thumbnails_created_when_image_replaced(
+    create_thumbnails_mock,
+    category_with_image,
+    image,
+    media_root,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [64]
+    category_with_image.background_image = image
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        category_with_image.save()
+
+    # then
+    create_thumbnails_mock.assert_called_once_with("Category", category_with_image.pk)
+
+
+@patch("saleor.thumbnail.signals.create_thumbnails_task.delay")
+def test_thumbnails_not_created_when_disabled(
+    create_thumbnails_mock,
+    category_with_image,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = []
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        category_with_image.save()
+
+    # then
+    create_thumbnails_mock.assert_not_called()
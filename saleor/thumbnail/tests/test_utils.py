@@ -1,8 +1,11 @@
-from unittest.mock import MagicMock
+from io import BytesIO
+from unittest.mock import MagicMock, patch
 
 import graphene
 import pytest
 from django.core.files import File
+from PIL import Image
+from PIL.JpegImagePlugin import JpegImageFile
 
 from .. import FILE_NAME_MAX_LENGTH, ThumbnailFormat
 from ..models import Thumbnail
@@ -115,6 +118,40 @@ def test_processed_image_preprocess_method_called(category_with_image, thumb_for
     preprocess_mock.assert_called_once()
 
 
+def test_processed_image_create_thumbnails():
+    # given
+    image_data = BytesIO()
+    Image.new("RGB", size=(2000, 1000)).save(image_data, format="JPEG")
+    image_data.seek(0)
+    processed_image = ProcessedImage(File(image_data, name="image.jpg"), 256)
+    original_draft = JpegImageFile.draft
+
+    # when
+    with patch.object(
+        JpegImageFile, "draft", autospec=True, side_effect=original_draft
+    ) as draft_mock:
+        thumbnails = list(
+            processed_image.create_thumbnails(
+                [(128, None), (256, None), (128, ThumbnailFormat.WEBP)]
+            )
+        )
+
+    # then
+    draft_mock.assert_called_once_with(draft_mock.call_args.args[0], None, (256, 256))
+    thumbnail_images = [
+        (size, format, Image.open(image_file))
+        for size, format, image_file in thumbnails
+    ]
+    assert [
+        (size, format, image.format, image.size)
+        for size, format, image in thumbnail_images
+    ] == [
+        (256, None, "JPEG", (256, 128)),
+        (128, None, "JPEG", (128, 64)),
+        (128, ThumbnailFormat.WEBP, "WEBP", (128, 64)),
+    ]
+
+
 def test_get_filename_from_url_unique():
     # given
     file_format = "jpg"
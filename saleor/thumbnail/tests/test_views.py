@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import graphene
 from PIL import Image
 
 from .. import IconThumbnailFormat, ThumbnailFormat
 from ..models import Thumbnail
+from ..utils import acquire_thumbnail_lock, get_thumbnail_lock_key
 
 
 def test_handle_thumbnail_view_with_format(client, category_with_image, settings):
@@ -369,3 +372,79 @@ def test_handle_thumbnail_view_for_app_installation_logo_default_thumbnail_exist
     assert response.status_code == 302
     assert response.url == thumbnail.image.url
     assert Thumbnail.objects.count() == thumbnail_count
+
+
+def test_handle_thumbnail_view_releases_lock(
+    client, category_with_image, settings, clear_cache
+):
+    # given
+    size = 64
+    category_id = graphene.Node.to_global_id("Category", category_with_image.id)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert Thumbnail.objects.filter(category=category_with_image).count() == 1
+    lock_key = get_thumbnail_lock_key("category", category_with_image.pk, size, None)
+    assert acquire_thumbnail_lock(lock_key)
+
+
+@patch("saleor.thumbnail.views.ProcessedImage.create_thumbnail")
+def test_handle_thumbnail_view_lock_held_redirects_to_original_image(
+    create_thumbnail_mock, client, category_with_image, settings, clear_cache
+):
+    # given
+    size = 64
+    settings.THUMBNAIL_LOCK_WAIT = 0
+    category_id = graphene.Node.to_global_id("Category", category_with_image.id)
+    acquire_thumbnail_lock(
+        get_thumbnail_lock_key("category", category_with_image.pk, size, None)
+    )
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == category_with_image.background_image.url
+    assert "no-cache" in response["Cache-Control"]
+    create_thumbnail_mock.assert_not_called()
+    assert not Thumbnail.objects.exists()
+
+
+@patch("saleor.thumbnail.views.time.sleep")
+@patch("saleor.thumbnail.views.ProcessedImage.create_thumbnail")
+def test_handle_thumbnail_view_lock_held_waits_for_thumbnail(
+    create_thumbnail_mock,
+    sleep_mock,
+    client,
+    category_with_image,
+    settings,
+    image,
+    media_root,
+    clear_cache,
+):
+    # given
+    size = 64
+    settings.THUMBNAIL_LOCK_WAIT = 10
+    category_id = graphene.Node.to_global_id("Category", category_with_image.id)
+    acquire_thumbnail_lock(
+        get_thumbnail_lock_key("category", category_with_image.pk, size, None)
+    )
+
+    # the thumbnail is created by the request that holds the lock
+    def create_thumbnail(*args):
+        Thumbnail.objects.create(category=category_with_image, size=size, image=image)
+
+    sleep_mock.side_effect = create_thumbnail
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    thumbnail = Thumbnail.objects.get(category=category_with_image)
+    assert response.status_code == 302
+    assert response.url == thumbnail.image.url
+    create_thumbnail_mock.assert_not_called()
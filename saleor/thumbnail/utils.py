@@ -1,10 +1,13 @@
 import os
 import secrets
+from collections import defaultdict
 from io import BytesIO
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import graphene
 import magic
+from django.conf import settings
+from django.core.cache import cache
 from django.core.files import File
 from django.core.files.storage import default_storage
 from django.urls import reverse
@@ -87,6 +90,25 @@ def prepare_thumbnail_file_name(
     return file_path + f"_thumbnail_{size}." + file_ext
 
 
+def get_thumbnail_lock_key(
+    thumbnail_field: str, instance_pk: int, size: int, format: Optional[str]
+) -> str:
+    return f"thumbnail:{thumbnail_field}:{instance_pk}:{size}:{format or ''}"
+
+
+def acquire_thumbnail_lock(lock_key: str) -> bool:
+    """Acquire the lock for creating the thumbnail, return False if it's held.
+
+    The lock expires after `THUMBNAIL_LOCK_TIMEOUT` seconds, so a crashed worker
+    doesn't block the thumbnail creation forever.
+    """
+    return cache.add(lock_key, True, timeout=settings.THUMBNAIL_LOCK_TIMEOUT)
+
+
+def release_thumbnail_lock(lock_key: str):
+    cache.delete(lock_key)
+
+
 class ProcessedImage:
     EXIF_ORIENTATION_KEY = 274
     # Whether to create progressive JPEGs. Read more about progressive JPEGs
@@ -168,7 +190,19 @@ class ProcessedImage:
         format = self.format or image_format
         save_kwargs = {"format": format}
 
-        # Ensuring image is properly rotated
+        image = self.rotate_image(image)
+
+        # Ensure any embedded ICC profile is preserved
+        save_kwargs["icc_profile"] = image.info.get("icc_profile")
+
+        if hasattr(self, f"preprocess_{format}"):
+            image, addl_save_kwargs = getattr(self, f"preprocess_{format}")(image=image)
+            save_kwargs.update(addl_save_kwargs)
+
+        return image, save_kwargs
+
+    def rotate_image(self, image):
+        """Return the image rotated according to its EXIF orientation."""
         if hasattr(image, "_getexif"):
             exif_datadict = image._getexif()  # returns None if no EXIF data
             if exif_datadict is not None:
@@ -180,15 +214,7 @@ class ProcessedImage:
                     image = image.transpose(Image.ROTATE_270)
                 elif orientation == 8:
                     image = image.transpose(Image.ROTATE_90)
-
-        # Ensure any embedded ICC profile is preserved
-        save_kwargs["icc_profile"] = image.info.get("icc_profile")
-
-        if hasattr(self, f"preprocess_{format}"):
-            image, addl_save_kwargs = getattr(self, f"preprocess_{format}")(image=image)
-            save_kwargs.update(addl_save_kwargs)
-
-        return image, save_kwargs
+        return image
 
     def preprocess_AVIF(self, image):
         """Receive a PIL Image instance of an AVIF and return 2-tuple."""
@@ -237,6 +263,38 @@ class ProcessedImage:
         image_file.seek(0)
         return image_file, save_kwargs["format"]
 
+    def create_thumbnails(
+        self, sizes_and_formats: Iterable[Tuple[int, Optional[str]]]
+    ) -> Iterator[Tuple[int, Optional[str], BytesIO]]:
+        """Create thumbnails in all the given sizes and formats from a single decode.
+
+        JPEG images are decoded in the draft mode at the smallest scale that still
+        covers the biggest size. Each size is then resized from the previous,
+        bigger one. Yields the size, format and file of each thumbnail.
+        """
+        formats_per_size: Dict[int, List[Optional[str]]] = defaultdict(list)
+        for size, format in sizes_and_formats:
+            formats_per_size[size].append(format)
+        if not formats_per_size:
+            return
+
+        image, image_format = self.retrieve_image()
+        max_size = max(formats_per_size)
+        if image_format == "JPEG":
+            image.draft(None, (max_size, max_size))
+        image = self.rotate_image(image)
+
+        for size in sorted(formats_per_size, reverse=True):
+            image = image.copy()
+            image.thumbnail((size, size))
+            for format in formats_per_size[size]:
+                processed_image = self.__class__(
+                    self.image_source, size, format, self.storage
+                )
+                thumbnail, save_kwargs = processed_image.preprocess(image, image_format)
+                image_file, _ = processed_image.process_image(thumbnail, save_kwargs)
+                yield size, format, image_file
+
 
 class ProcessedIconImage(ProcessedImage):
     LOSSLESS_WEBP = True
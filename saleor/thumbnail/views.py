@@ -1,41 +1,35 @@
-from collections import namedtuple
+import time
 from typing import Optional
 
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import HttpResponseNotFound, HttpResponseRedirect
+from django.utils.cache import add_never_cache_headers
 from graphql.error import GraphQLError
 
-from ..account.models import User
-from ..app.models import App, AppInstallation
 from ..core.utils.events import call_event
 from ..graphql.core.utils import from_global_id_or_error
 from ..plugins.manager import get_plugins_manager
-from ..product.models import Category, Collection, ProductMedia
-from ..thumbnail.models import Thumbnail
+from ..thumbnail.models import (
+    ICON_TYPE_TO_MODEL_DATA_MAPPING,
+    TYPE_TO_MODEL_DATA_MAPPING,
+    UUID_IDENTIFIABLE_TYPES,
+    ModelData,
+    Thumbnail,
+)
 from . import ALLOWED_ICON_THUMBNAIL_FORMATS, ALLOWED_THUMBNAIL_FORMATS
 from .utils import (
     ProcessedIconImage,
     ProcessedImage,
+    acquire_thumbnail_lock,
+    get_thumbnail_lock_key,
     get_thumbnail_size,
     prepare_thumbnail_file_name,
+    release_thumbnail_lock,
 )
 
-ModelData = namedtuple("ModelData", ["model", "image_field", "thumbnail_field"])
-
-ICON_TYPE_TO_MODEL_DATA_MAPPING = {
-    "App": ModelData(App, "brand_logo_default", "app"),
-    "AppInstallation": ModelData(
-        AppInstallation, "brand_logo_default", "app_installation"
-    ),
-}
-TYPE_TO_MODEL_DATA_MAPPING = {
-    "User": ModelData(User, "avatar", "user"),
-    "Category": ModelData(Category, "background_image", "category"),
-    "Collection": ModelData(Collection, "background_image", "collection"),
-    "ProductMedia": ModelData(ProductMedia, "image", "product_media"),
-    **ICON_TYPE_TO_MODEL_DATA_MAPPING,
-}
-UUID_IDENTIFIABLE_TYPES = ["User", "App", "AppInstallation"]
+# seconds between checks whether the thumbnail created by another request exists
+THUMBNAIL_LOCK_POLL_INTERVAL = 0.1
 
 
 def handle_thumbnail(
@@ -45,6 +39,9 @@ def handle_thumbnail(
 
     If the provided size is not in the available resolution list, the thumbnail with
     the closest available size is created and returned, if it does not exist.
+
+    Concurrent requests for the same missing thumbnail create it only once, the
+    others wait for it or are redirected to the original image.
     """
     # try to find corresponding instance based on given instance_id
     try:
@@ -92,6 +89,53 @@ def handle_thumbnail(
     if not bool(image):
         return HttpResponseNotFound("There is no image for provided instance.")
 
+    lock_key = get_thumbnail_lock_key(
+        model_data.thumbnail_field, instance.pk, size_px, format
+    )
+    thumbnail_lookup = {
+        "format": format,
+        "size": size_px,
+        model_data.thumbnail_field: instance,
+    }
+    if not acquire_thumbnail_lock(lock_key):
+        # the thumbnail is being created by another request, wait for the result
+        if thumbnail := _wait_for_thumbnail(thumbnail_lookup):
+            return HttpResponseRedirect(thumbnail.image.url)
+        response = HttpResponseRedirect(image.url)
+        add_never_cache_headers(response)
+        return response
+
+    try:
+        # the thumbnail might have been created before the lock was acquired
+        if thumbnail := Thumbnail.objects.filter(**thumbnail_lookup).first():
+            return HttpResponseRedirect(thumbnail.image.url)
+        thumbnail = _create_thumbnail(
+            object_type, model_data, instance, size_px, format
+        )
+    finally:
+        release_thumbnail_lock(lock_key)
+
+    return HttpResponseRedirect(thumbnail.image.url)
+
+
+def _wait_for_thumbnail(thumbnail_lookup: dict) -> Optional[Thumbnail]:
+    deadline = time.monotonic() + settings.THUMBNAIL_LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(THUMBNAIL_LOCK_POLL_INTERVAL)
+        if thumbnail := Thumbnail.objects.filter(**thumbnail_lookup).first():
+            return thumbnail
+    return None
+
+
+def _create_thumbnail(
+    object_type: str,
+    model_data: ModelData,
+    instance,
+    size_px: int,
+    format: Optional[str],
+) -> Thumbnail:
+    image = getattr(instance, model_data.image_field)
+
     # prepare thumbnail
     if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
         processed_image: ProcessedImage = ProcessedIconImage(
@@ -116,4 +160,4 @@ def handle_thumbnail(
     manager = get_plugins_manager()
     call_event(manager.thumbnail_created, thumbnail)
 
-    return HttpResponseRedirect(thumbnail.image.url)
+    return thumbnail
@@ -30,6 +30,7 @@ from .models import (
     Stock,
     Warehouse,
 )
+from .reservation_slots import lock_reservation_slots, rebalance_reservation_slots
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -81,13 +82,24 @@ def allocate_stocks(
         else Stock.objects.for_channel_and_country(channel_slug, country_code)
     )
 
+    stocks = stocks.filter(**filter_lookup)
+    lock_reservation_slots(stocks.values("pk"))
     stocks = list(
         stocks.select_for_update(of=("self",))
-        .filter(**filter_lookup)
         .order_by("pk")
-        .values("id", "product_variant", "pk", "quantity", "warehouse_id")
+        .values(
+            "id",
+            "product_variant",
+            "pk",
+            "quantity",
+            "quantity_reserved",
+            "warehouse_id",
+        )
     )
     stocks_id = (stock.pop("id") for stock in stocks)
+    stocks_with_reservations = [
+        stock["pk"] for stock in stocks if stock.pop("quantity_reserved")
+    ]
 
     quantity_reservation_for_stocks: Dict = _prepare_stock_to_reserved_quantity_map(
         checkout_lines, check_reservations, stocks_id
@@ -137,6 +149,12 @@ def allocate_stocks(
     if insufficient_stock:
         raise InsufficientStock(insufficient_stock)
 
+    if check_reservations and stocks_with_reservations:
+        # reservations of the checkout lines are replaced by the allocations
+        Stock.objects.filter(pk__in=stocks_with_reservations).update_quantity_reserved(
+            checkout_lines
+        )
+
     if allocations:
         stocks_to_update = []
         for alloc in Allocation.objects.bulk_create(allocations):
@@ -146,6 +164,9 @@ def allocate_stocks(
             )
             stocks_to_update.append(stock)
         Stock.objects.bulk_update(stocks_to_update, ["quantity_allocated"])
+        rebalance_reservation_slots(
+            {stock.pk for stock in stocks_to_update}, checkout_lines
+        )
 
         for allocation in allocations:
             allocated_stock = (
@@ -0,0 +1,54 @@
+# Generated by Django 3.2.19 on 2023-07-24 11:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("warehouse", "0033_warehouse_external_reference"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReservationSlot",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.PositiveSmallIntegerField()),
+                ("quantity", models.PositiveIntegerField(default=0)),
+                ("stock_quantity", models.IntegerField(default=0)),
+                ("stock_quantity_allocated", models.IntegerField(default=0)),
+                (
+                    "stock",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reservation_slots",
+                        to="warehouse.stock",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("pk",),
+                "unique_together": {("stock", "number")},
+            },
+        ),
+        migrations.AddField(
+            model_name="reservation",
+            name="slot",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="reservations",
+                to="warehouse.reservationslot",
+            ),
+        ),
+    ]
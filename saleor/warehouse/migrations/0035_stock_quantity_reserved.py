@@ -0,0 +1,41 @@
+# Generated by Django 3.2.20 on 2023-07-27 10:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("warehouse", "0034_reservationslot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stock",
+            name="quantity_reserved",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="stock",
+            name="quantity_reserved_valid_until",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunSQL(
+            """
+            UPDATE warehouse_stock stock
+            SET
+                quantity_reserved = reserved.quantity,
+                quantity_reserved_valid_until = reserved.valid_until
+            FROM (
+                SELECT
+                    stock_id,
+                    SUM(quantity_reserved) AS quantity,
+                    MIN(reserved_until) AS valid_until
+                FROM warehouse_reservation
+                WHERE quantity_reserved > 0 AND reserved_until > NOW()
+                GROUP BY stock_id
+            ) reserved
+            WHERE stock.id = reserved.stock_id;
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -12,7 +12,17 @@ from typing import (
 )
 
 from django.db import models
-from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q, Sum
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    IntegerField,
+    Min,
+    OuterRef,
+    Prefetch,
+    Q,
+    Sum,
+)
 from django.db.models.expressions import Subquery
 from django.db.models.functions import Coalesce
 from django.db.models.query import QuerySet
@@ -257,6 +267,40 @@ class StockQuerySet(models.QuerySet["Stock"]):
             )
         )
 
+    def update_quantity_reserved(
+        self, checkout_lines: Optional[Iterable[CheckoutLine]] = None
+    ) -> int:
+        """Recalculate the quantity reserved by not expired reservations of stocks.
+
+        Reservations of given checkout lines are skipped, as they're about to be
+        replaced. The moment the first of the counted reservations expires is stored
+        as well, so the quantity can be recalculated once it gets outdated.
+        """
+        reservations = (
+            Reservation.objects.filter(stock_id=OuterRef("pk"), quantity_reserved__gt=0)
+            .not_expired()
+            .exclude_checkout_lines(checkout_lines)
+            .order_by()
+            .values("stock_id")
+        )
+        updated = self.update(
+            quantity_reserved=Coalesce(
+                Subquery(
+                    reservations.annotate(total=Sum("quantity_reserved")).values(
+                        "total"
+                    ),
+                    output_field=IntegerField(),
+                ),
+                0,
+            ),
+            quantity_reserved_valid_until=Subquery(
+                reservations.annotate(valid_until=Min("reserved_until")).values(
+                    "valid_until"
+                )
+            ),
+        )
+        return updated
+
     def for_channel_and_click_and_collect(self, channel_slug: str):
         """Return the stocks for a given channel for a click and collect.
 
@@ -381,6 +425,10 @@ class Stock(models.Model):
     )
     quantity = models.IntegerField(default=0)
     quantity_allocated = models.IntegerField(default=0)
+    quantity_reserved = models.IntegerField(default=0)
+    quantity_reserved_valid_until = models.DateTimeField(
+        null=True, blank=True, db_index=True
+    )
 
     objects = StockManager()
 
@@ -511,6 +559,30 @@ class PreorderReservation(models.Model):
         ordering = ("pk",)
 
 
+class ReservationSlot(models.Model):
+    """A share of the stock quantity that can be reserved without locking the stock.
+
+    Quantity of the slot is the upper limit of quantity reserved within it. Slots are
+    valid only for the stock quantities they were distributed for.
+    """
+
+    stock = models.ForeignKey(
+        Stock,
+        null=False,
+        blank=False,
+        on_delete=models.CASCADE,
+        related_name="reservation_slots",
+    )
+    number = models.PositiveSmallIntegerField()
+    quantity = models.PositiveIntegerField(default=0)
+    stock_quantity = models.IntegerField(default=0)
+    stock_quantity_allocated = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = [["stock", "number"]]
+        ordering = ("pk",)
+
+
 class Reservation(models.Model):
     checkout_line = models.ForeignKey(
         CheckoutLine,
@@ -528,6 +600,13 @@ class Reservation(models.Model):
     )
     quantity_reserved = models.PositiveIntegerField(default=0)
     reserved_until = models.DateTimeField()
+    slot = models.ForeignKey(
+        ReservationSlot,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="reservations",
+    )
 
     objects = ReservationManager()
 
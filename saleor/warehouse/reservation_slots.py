@@ -0,0 +1,220 @@
+"""Reservation slots split the stock quantity into independently locked shares.
+
+Checkout reservations normally lock the stock row for the whole transaction, so
+concurrent checkouts of the same variant wait for each other. When the
+`STOCK_RESERVATION_SLOTS` setting is enabled, a reservation locks only a single free
+slot of the stock instead; the stock is locked just when the slots have to be
+redistributed, and its reserved quantity is recalculated by the beat task. The sum of
+slots' quantities never exceeds the quantity available at the time of distribution,
+so reservations can't exceed the available quantity.
+"""
+from collections import defaultdict
+from datetime import datetime
+from typing import TYPE_CHECKING, DefaultDict, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+
+from .models import Allocation, Reservation, ReservationSlot, Stock
+
+if TYPE_CHECKING:
+    from ..channel.models import Channel
+    from ..checkout.models import CheckoutLine
+    from ..product.models import ProductVariant
+
+
+class _SlotsExhausted(Exception):
+    pass
+
+
+def lock_reservation_slots(stocks: "Iterable[int]"):
+    """Wait for reservations made in slots of given stocks and lock the slots.
+
+    Must be called before the stocks are locked.
+    """
+    if not settings.STOCK_RESERVATION_SLOTS:
+        return
+    list(
+        ReservationSlot.objects.select_for_update()
+        .filter(stock_id__in=stocks)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+
+
+def rebalance_reservation_slots(
+    stock_ids: Iterable[int],
+    checkout_lines: Optional[Iterable["CheckoutLine"]] = None,
+):
+    """Distribute the available quantity of stocks evenly between their slots.
+
+    Slots keep the quantity already reserved within them. Reservations of given
+    checkout lines are skipped, as they're about to be replaced by allocations.
+    Both the stocks and their slots must be locked.
+    """
+    slots_count = settings.STOCK_RESERVATION_SLOTS
+    if not slots_count:
+        return
+
+    stock_ids = list(stock_ids)
+    quantity_allocated: DefaultDict[int, int] = defaultdict(int)
+    for stock_id, quantity in (
+        Allocation.objects.filter(stock_id__in=stock_ids)
+        .values_list("stock_id")
+        .annotate(Sum("quantity_allocated"))
+    ):
+        quantity_allocated[stock_id] = quantity or 0
+
+    quantity_reserved_outside_slots: DefaultDict[int, int] = defaultdict(int)
+    quantity_reserved_in_slots: DefaultDict[int, int] = defaultdict(int)
+    for stock_id, slot_id, quantity in (
+        Reservation.objects.filter(stock_id__in=stock_ids, quantity_reserved__gt=0)
+        .not_expired()
+        .exclude_checkout_lines(checkout_lines)
+        .values_list("stock_id", "slot_id")
+        .annotate(Sum("quantity_reserved"))
+    ):
+        if slot_id is None:
+            quantity_reserved_outside_slots[stock_id] += quantity
+        else:
+            quantity_reserved_in_slots[slot_id] += quantity
+
+    stock_slots: DefaultDict[int, Dict[int, ReservationSlot]] = defaultdict(dict)
+    for slot in ReservationSlot.objects.filter(stock_id__in=stock_ids):
+        stock_slots[slot.stock_id][slot.number] = slot
+
+    slots_to_create: List[ReservationSlot] = []
+    slots_to_update: List[ReservationSlot] = []
+    for stock in Stock.objects.filter(pk__in=stock_ids):
+        slots = stock_slots[stock.pk]
+        for number in range(slots_count):
+            if number not in slots:
+                slots[number] = ReservationSlot(stock=stock, number=number)
+                slots_to_create.append(slots[number])
+            else:
+                slots_to_update.append(slots[number])
+
+        quantity_free = max(
+            stock.quantity
+            - quantity_allocated[stock.pk]
+            - quantity_reserved_outside_slots[stock.pk]
+            - sum(quantity_reserved_in_slots[slot.pk] for slot in slots.values()),
+            0,
+        )
+        share, remainder = divmod(quantity_free, slots_count)
+        for number, slot in slots.items():
+            slot.quantity = quantity_reserved_in_slots[slot.pk] if slot.pk else 0
+            if number < slots_count:
+                slot.quantity += share + (1 if number < remainder else 0)
+            slot.stock_quantity = stock.quantity
+            slot.stock_quantity_allocated = stock.quantity_allocated
+
+    ReservationSlot.objects.bulk_create(slots_to_create)
+    ReservationSlot.objects.bulk_update(
+        slots_to_update, ["quantity", "stock_quantity", "stock_quantity_allocated"]
+    )
+
+
+def _lock_free_slot(
+    line: "CheckoutLine", stocks: List[dict], quantity_pending: Dict[int, int]
+) -> Optional[ReservationSlot]:
+    """Lock a slot of given stocks with enough free quantity for the line.
+
+    Slots locked by other transactions are skipped instead of waited for.
+    `quantity_pending` holds quantities of slots reserved for the previous lines.
+    """
+    for stock in stocks:
+        checked_slot_ids: List[int] = []
+        while True:
+            slot = (
+                ReservationSlot.objects.select_for_update(skip_locked=True)
+                .filter(
+                    stock_id=stock["pk"],
+                    stock_quantity=stock["quantity"],
+                    stock_quantity_allocated=stock["quantity_allocated"],
+                    quantity__gte=line.quantity,
+                )
+                .exclude(pk__in=checked_slot_ids)
+                .order_by("?")
+                .first()
+            )
+            if slot is None:
+                break
+            checked_slot_ids.append(slot.pk)
+            quantity_reserved = (
+                Reservation.objects.filter(slot=slot)
+                .not_expired()
+                .exclude(checkout_line=line)
+                .aggregate(Sum("quantity_reserved"))["quantity_reserved__sum"]
+                or 0
+            )
+            quantity_reserved += quantity_pending.get(slot.pk, 0)
+            if slot.quantity - quantity_reserved >= line.quantity:
+                return slot
+    return None
+
+
+def reserve_stocks_in_slots(
+    checkout_lines: Iterable["CheckoutLine"],
+    variants: Iterable["ProductVariant"],
+    country_code: str,
+    channel: "Channel",
+    reserved_until: datetime,
+) -> bool:
+    """Reserve stocks for given checkout lines within reservation slots.
+
+    The whole quantity of each line has to fit in a single slot. Return `False`,
+    without reserving anything, if any of the lines doesn't fit in free slots.
+    """
+    from .management import sort_stocks
+
+    stocks = list(
+        Stock.objects.get_variants_stocks_for_country(
+            country_code, channel.slug, variants
+        )
+        .order_by("pk")
+        .values(
+            "pk", "product_variant", "quantity", "quantity_allocated", "warehouse_id"
+        )
+    )
+    stocks = sort_stocks(
+        channel.allocation_strategy,
+        stocks,
+        channel,
+        {stock["pk"]: stock["quantity_allocated"] for stock in stocks},
+    )
+    variant_to_stocks: DefaultDict[int, List[dict]] = defaultdict(list)
+    for stock in stocks:
+        variant_to_stocks[stock["product_variant"]].append(stock)
+
+    try:
+        # Slots locked for lines that were reserved are released on rollback, so
+        # they aren't kept locked when falling back to locking the stocks.
+        with transaction.atomic():
+            reservations = []
+            quantity_pending: Dict[int, int] = defaultdict(int)
+            for line in checkout_lines:
+                slot = _lock_free_slot(
+                    line, variant_to_stocks[line.variant_id], quantity_pending
+                )
+                if slot is None:
+                    raise _SlotsExhausted()
+                quantity_pending[slot.pk] += line.quantity
+                reservations.append(
+                    Reservation(
+                        checkout_line=line,
+                        stock_id=slot.stock_id,
+                        slot=slot,
+                        quantity_reserved=line.quantity,
+                        reserved_until=reserved_until,
+                    )
+                )
+            replaced_reservations = Reservation.objects.filter(
+                checkout_line__in=checkout_lines
+            )
+            replaced_reservations.delete()
+            Reservation.objects.bulk_create(reservations)
+    except _SlotsExhausted:
+        return False
+    return True
@@ -2,7 +2,8 @@ from collections import defaultdict, namedtuple
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
-from django.db.models import F, Sum
+from django.conf import settings
+from django.db.models import Exists, F, OuterRef, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
@@ -11,6 +12,11 @@ from ..core.tracing import traced_atomic_transaction
 from ..product.models import ProductVariant, ProductVariantChannelListing
 from .management import sort_stocks
 from .models import Allocation, PreorderReservation, Reservation, Stock
+from .reservation_slots import (
+    lock_reservation_slots,
+    rebalance_reservation_slots,
+    reserve_stocks_in_slots,
+)
 
 if TYPE_CHECKING:
     from ..channel.models import Channel
@@ -59,6 +65,8 @@ def reserve_stocks_and_preorders(
 
         # Refresh reserved_until for already existing lines
         if lines_to_update_reservation_time:
+            # the quantity reserved of stocks is recalculated by the beat task once
+            # the previous time of the reservations passes
             Reservation.objects.filter(
                 checkout_line__in=lines_to_update_reservation_time
             ).update(reserved_until=reserved_until)
@@ -100,9 +108,21 @@ def reserve_stocks(
     if not checkout_lines:
         return
 
+    if (
+        replace
+        and settings.STOCK_RESERVATION_SLOTS
+        and reserve_stocks_in_slots(
+            checkout_lines, variants, country_code, channel, reserved_until
+        )
+    ):
+        return
+
+    variants_stocks = Stock.objects.get_variants_stocks_for_country(
+        country_code, channel.slug, variants
+    )
+    lock_reservation_slots(variants_stocks.values("pk"))
     stocks = list(
-        Stock.objects.select_for_update(of=("self",))
-        .get_variants_stocks_for_country(country_code, channel.slug, variants)
+        variants_stocks.select_for_update(of=("self",))
         .order_by("pk")
         .values("id", "product_variant", "pk", "quantity", "warehouse_id")
     )
@@ -169,9 +189,21 @@ def reserve_stocks(
         raise InsufficientStock(insufficient_stocks)
 
     if reservations:
+        stocks_to_update = set(stocks_id)
         if replace:
-            Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
+            replaced_reservations = Reservation.objects.filter(
+                checkout_line__in=checkout_lines
+            )
+            if not settings.STOCK_RESERVATION_SLOTS:
+                stocks_to_update.update(
+                    replaced_reservations.values_list("stock_id", flat=True)
+                )
+            replaced_reservations.delete()
         Reservation.objects.bulk_create(reservations)
+        # with reservation slots, the quantity reserved is updated by the beat task
+        if not settings.STOCK_RESERVATION_SLOTS:
+            Stock.objects.filter(pk__in=stocks_to_update).update_quantity_reserved()
+    rebalance_reservation_slots(stocks_id)
 
 
 def _create_stock_reservations(
@@ -368,6 +400,22 @@ def _create_preorder_reservation(
     return insufficient_stocks, None
 
 
+def release_stocks_reserved_by_lines(checkout_lines: Iterable["CheckoutLine"]):
+    """Drop reservations of checkout lines from the quantity reserved of stocks.
+
+    Must be called before the checkout lines, along with their reservations, are
+    deleted. With reservation slots, stocks aren't updated, as their quantity
+    reserved is recalculated by the beat task.
+    """
+    if settings.STOCK_RESERVATION_SLOTS:
+        return
+    checkout_lines = list(checkout_lines)
+    reservations = Reservation.objects.filter(checkout_line__in=checkout_lines)
+    Stock.objects.filter(
+        Exists(reservations.filter(stock_id=OuterRef("pk")))
+    ).update_quantity_reserved(checkout_lines)
+
+
 def get_checkout_lines_to_reserve(
     lines: Iterable["CheckoutLine"],
     variants_map: Dict[int, "ProductVariant"],
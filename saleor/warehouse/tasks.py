@@ -1,10 +1,10 @@
 from celery.utils.log import get_task_logger
-from django.db.models import F, Sum
+from django.db.models import Exists, F, OuterRef, Q, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..celeryconf import app
-from .models import Allocation, PreorderReservation, Reservation, Stock
+from .models import Allocation, PreorderReservation, Reservation, ReservationSlot, Stock
 
 task_logger = get_task_logger(__name__)
 
@@ -33,6 +33,21 @@ def delete_expired_reservations_task():
         )
 
 
+@app.task
+def update_stocks_quantity_reserved_task():
+    """Recalculate the quantity reserved of stocks with outdated quantities.
+
+    These are stocks with expired reservations and stocks with reservation slots,
+    as reservations made in slots don't update the quantity reserved of stocks.
+    """
+    count = Stock.objects.filter(
+        Q(quantity_reserved_valid_until__lte=timezone.now())
+        | Exists(ReservationSlot.objects.filter(stock_id=OuterRef("pk")))
+    ).update_quantity_reserved()
+    if count:
+        task_logger.debug("Updated quantity reserved of %s stocks", count)
+
+
 @app.task
 def update_stocks_quantity_allocated_task():
     stocks_to_update = []
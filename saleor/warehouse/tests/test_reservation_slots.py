@@ -0,0 +1,198 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from ...checkout.models import Checkout
+from ...core.exceptions import InsufficientStock
+from ..models import Allocation, Reservation, ReservationSlot, Stock
+from ..reservation_slots import rebalance_reservation_slots
+from ..reservations import reserve_stocks
+from ..tasks import update_stocks_quantity_reserved_task
+
+COUNTRY_CODE = "US"
+RESERVATION_LENGTH = 5
+
+
+@pytest.fixture
+def reservation_slots_settings(settings):
+    settings.STOCK_RESERVATION_SLOTS = 4
+    return settings
+
+
+def _create_checkout_line(channel, variant, quantity=1):
+    checkout = Checkout.objects.create(currency=channel.currency_code, channel=channel)
+    return checkout.lines.create(variant=variant, quantity=quantity)
+
+
+def _reserve(line, channel):
+    reserve_stocks(
+        [line],
+        [line.variant],
+        COUNTRY_CODE,
+        channel,
+        timezone.now() + timedelta(minutes=RESERVATION_LENGTH),
+    )
+
+
+def test_reserve_stocks_distributes_stock_between_slots(
+    reservation_slots_settings, checkout_line, channel_USD
+):
+    # given
+    checkout_line.quantity = 2
+    checkout_line.save(update_fields=["quantity"])
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    stock.quantity = 12
+    stock.save(update_fields=["quantity"])
+
+    # when
+    _reserve(checkout_line, channel_USD)
+
+    # then
+    reservation = Reservation.objects.get(checkout_line=checkout_line)
+    assert reservation.slot is None
+    slots = ReservationSlot.objects.filter(stock=stock).order_by("number")
+    assert [slot.quantity for slot in slots] == [3, 3, 2, 2]
+    assert all(slot.stock_quantity == 12 for slot in slots)
+
+
+def test_reserve_stocks_in_slot(reservation_slots_settings, checkout_line, channel_USD):
+    # given
+    variant = checkout_line.variant
+    stock = Stock.objects.get(product_variant=variant)
+    stock.quantity = 12
+    stock.save(update_fields=["quantity"])
+    _reserve(checkout_line, channel_USD)
+    line = _create_checkout_line(channel_USD, variant)
+
+    # when
+    _reserve(line, channel_USD)
+
+    # then
+    reservation = Reservation.objects.get(checkout_line=line)
+    assert reservation.slot.stock == stock
+    assert reservation.quantity_reserved == 1
+
+
+def test_reserve_stocks_in_slot_quantity_reserved_updated_by_task(
+    reservation_slots_settings, checkout_line, channel_USD
+):
+    # given
+    variant = checkout_line.variant
+    stock = Stock.objects.get(product_variant=variant)
+    stock.quantity = 12
+    stock.save(update_fields=["quantity"])
+    _reserve(checkout_line, channel_USD)
+    line = _create_checkout_line(channel_USD, variant)
+    _reserve(line, channel_USD)
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
+
+    # when
+    update_stocks_quantity_reserved_task()
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == checkout_line.quantity + line.quantity
+
+
+def test_reserve_stocks_in_slots_cannot_exceed_stock_quantity(
+    reservation_slots_settings, checkout_line, channel_USD
+):
+    # given
+    variant = checkout_line.variant
+    stock = Stock.objects.get(product_variant=variant)
+    stock.quantity = 6
+    stock.save(update_fields=["quantity"])
+    _reserve(_create_checkout_line(channel_USD, variant), channel_USD)
+    for _ in range(5):
+        _reserve(_create_checkout_line(channel_USD, variant), channel_USD)
+    line = _create_checkout_line(channel_USD, variant)
+
+    # when
+    with pytest.raises(InsufficientStock):
+        _reserve(line, channel_USD)
+
+    # then
+    assert Reservation.objects.filter(stock=stock).count() == 6
+    assert not Reservation.objects.filter(checkout_line=line).exists()
+
+
+def test_reserve_stocks_falls_back_to_stock_lock_when_slots_are_full(
+    reservation_slots_settings, checkout_line, channel_USD
+):
+    # given
+    variant = checkout_line.variant
+    stock = Stock.objects.get(product_variant=variant)
+    stock.quantity = 10
+    stock.save(update_fields=["quantity"])
+    _reserve(_create_checkout_line(channel_USD, variant), channel_USD)
+    line = _create_checkout_line(channel_USD, variant, quantity=5)
+
+    # when
+    _reserve(line, channel_USD)
+
+    # then
+    reservation = Reservation.objects.get(checkout_line=line)
+    assert reservation.slot is None
+    assert reservation.quantity_reserved == 5
+    slots = ReservationSlot.objects.filter(stock=stock)
+    assert sum(slot.quantity for slot in slots) == 4
+
+
+def test_reserve_stocks_skips_slots_outdated_by_stock_change(
+    reservation_slots_settings, checkout_line, channel_USD
+):
+    # given
+    variant = checkout_line.variant
+    stock = Stock.objects.get(product_variant=variant)
+    stock.quantity = 12
+    stock.save(update_fields=["quantity"])
+    _reserve(_create_checkout_line(channel_USD, variant), channel_USD)
+    stock.quantity = 4
+    stock.save(update_fields=["quantity"])
+    line = _create_checkout_line(channel_USD, variant)
+
+    # when
+    _reserve(line, channel_USD)
+
+    # then
+    reservation = Reservation.objects.get(checkout_line=line)
+    assert reservation.slot is None
+    slots = ReservationSlot.objects.filter(stock=stock)
+    assert sum(slot.quantity for slot in slots) == 2
+    assert all(slot.stock_quantity == 4 for slot in slots)
+
+
+def test_rebalance_reservation_slots_keeps_reserved_quantity(
+    reservation_slots_settings, checkout_line, channel_USD, order_line
+):
+    # given
+    variant = checkout_line.variant
+    stock = Stock.objects.get(product_variant=variant)
+    stock.quantity = 12
+    stock.save(update_fields=["quantity"])
+    first_line = _create_checkout_line(channel_USD, variant)
+    _reserve(first_line, channel_USD)
+    line = _create_checkout_line(channel_USD, variant, quantity=2)
+    _reserve(line, channel_USD)
+    slot = Reservation.objects.get(checkout_line=line).slot
+    Allocation.objects.create(order_line=order_line, stock=stock, quantity_allocated=3)
+
+    # when
+    rebalance_reservation_slots([stock.pk], checkout_lines=[first_line])
+
+    # then
+    slots = ReservationSlot.objects.filter(stock=stock)
+    assert sum(slot.quantity for slot in slots) == 12 - 3
+    slot.refresh_from_db()
+    assert slot.quantity >= 2
+
+
+def test_reserve_stocks_without_slots_setting(checkout_line, channel_USD):
+    # when
+    _reserve(checkout_line, channel_USD)
+
+    # then
+    assert Reservation.objects.get(checkout_line=checkout_line).slot is None
+    assert not ReservationSlot.objects.exists()
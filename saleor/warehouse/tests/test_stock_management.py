@@ -300,6 +300,32 @@ def test_allocate_stock_with_reservations_prioritize_sorting_order_strategy(
     assert allocations[1].quantity_allocated == 1 == stock_1.quantity_allocated
 
 
+def test_allocate_stock_updates_quantity_reserved_of_replaced_reservations(
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+    checkout_line_with_one_reservation,
+):
+    # given
+    stocks = variant_with_many_stocks.stocks.all()
+    stocks.update_quantity_reserved()
+    assert stocks.aggregate(Sum("quantity_reserved"))["quantity_reserved__sum"] == 2
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=2)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(),
+        check_reservations=True,
+        checkout_lines=[checkout_line_with_one_reservation],
+    )
+
+    # then
+    assert stocks.aggregate(Sum("quantity_reserved"))["quantity_reserved__sum"] == 0
+
+
 def test_allocate_stock_insufficient_stock_due_to_reservations(
     order_line,
     variant_with_many_stocks,
@@ -7,7 +7,7 @@ from ...channel import AllocationStrategy
 from ...checkout.models import Checkout
 from ...core.exceptions import InsufficientStock
 from ..models import ChannelWarehouse, Reservation, Stock, Warehouse
-from ..reservations import reserve_stocks
+from ..reservations import release_stocks_reserved_by_lines, reserve_stocks
 
 COUNTRY_CODE = "US"
 RESERVATION_LENGTH = 5
@@ -34,6 +34,96 @@ def test_reserve_stocks(checkout_line, channel_USD):
     reservation = Reservation.objects.get(checkout_line=checkout_line, stock=stock)
     assert reservation.quantity_reserved == 5
     assert reservation.reserved_until > timezone.now() + timedelta(minutes=1)
+    assert stock.quantity_reserved == 5
+    assert stock.quantity_reserved_valid_until == reservation.reserved_until
+
+
+def test_reserve_stocks_updates_quantity_reserved_of_replaced_stock(
+    checkout_line, warehouse, shipping_zone, channel_USD
+):
+    # given
+    old_stock = Stock.objects.get(product_variant=checkout_line.variant)
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD,
+        timezone.now() + timedelta(minutes=RESERVATION_LENGTH),
+    )
+    old_stock.warehouse.channels.remove(channel_USD)
+    secondary_warehouse = Warehouse.objects.create(
+        address=warehouse.address,
+        name="Warehouse 2",
+        slug="warehouse-2",
+        email=warehouse.email,
+    )
+    secondary_warehouse.shipping_zones.add(shipping_zone)
+    secondary_warehouse.channels.add(channel_USD)
+    new_stock = Stock.objects.create(
+        warehouse=secondary_warehouse,
+        product_variant=checkout_line.variant,
+        quantity=10,
+    )
+
+    # when
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD,
+        timezone.now() + timedelta(minutes=RESERVATION_LENGTH),
+    )
+
+    # then
+    old_stock.refresh_from_db()
+    new_stock.refresh_from_db()
+    assert old_stock.quantity_reserved == 0
+    assert new_stock.quantity_reserved == checkout_line.quantity
+
+
+def test_release_stocks_reserved_by_lines(checkout_line, channel_USD):
+    # given
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD,
+        timezone.now() + timedelta(minutes=RESERVATION_LENGTH),
+    )
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == checkout_line.quantity
+
+    # when
+    release_stocks_reserved_by_lines([checkout_line])
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
+    assert stock.quantity_reserved_valid_until is None
+
+
+def test_release_stocks_reserved_by_lines_with_reservation_slots(
+    checkout_line, channel_USD, settings, django_assert_num_queries
+):
+    # given
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD,
+        timezone.now() + timedelta(minutes=RESERVATION_LENGTH),
+    )
+    settings.STOCK_RESERVATION_SLOTS = 4
+
+    # when
+    with django_assert_num_queries(0):
+        release_stocks_reserved_by_lines([checkout_line])
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == checkout_line.quantity
 
 
 def test_stocks_reservation_skips_prev_reservation_delete_if_replace_is_disabled(
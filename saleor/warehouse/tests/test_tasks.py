@@ -3,10 +3,11 @@ from datetime import timedelta
 import pytest
 from django.utils import timezone
 
-from ..models import PreorderReservation, Reservation
+from ..models import PreorderReservation, Reservation, Stock
 from ..tasks import (
     delete_expired_reservations_task,
     update_stocks_quantity_allocated_task,
+    update_stocks_quantity_reserved_task,
 )
 
 
@@ -85,3 +86,39 @@ def test_update_stocks_quantity_allocated_task_stock_without_allocations(stock):
 
     stock.refresh_from_db()
     assert stock.quantity_allocated == 0
+
+
+def test_update_stocks_quantity_reserved_task(checkout_line, stock):
+    # given
+    Reservation.objects.create(
+        checkout_line=checkout_line,
+        stock=stock,
+        quantity_reserved=5,
+        reserved_until=timezone.now() - timedelta(minutes=1),
+    )
+    stock.quantity_reserved = 5
+    stock.quantity_reserved_valid_until = timezone.now() - timedelta(minutes=1)
+    stock.save(update_fields=["quantity_reserved", "quantity_reserved_valid_until"])
+
+    # when
+    update_stocks_quantity_reserved_task()
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_reserved == 0
+    assert stock.quantity_reserved_valid_until is None
+
+
+def test_update_stocks_quantity_reserved_task_skips_valid_quantities(
+    checkout_line, stock
+):
+    # given
+    stock.quantity_reserved = 5
+    stock.quantity_reserved_valid_until = timezone.now() + timedelta(minutes=1)
+    stock.save(update_fields=["quantity_reserved", "quantity_reserved_valid_until"])
+
+    # when
+    update_stocks_quantity_reserved_task()
+
+    # then
+    assert Stock.objects.get(pk=stock.pk).quantity_reserved == 5
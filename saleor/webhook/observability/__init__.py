@@ -4,10 +4,12 @@ from .payloads import dump_payload
 from .tracing import opentracing_trace
 from .utils import (
     WebhookData,
+    get_api_call,
     get_buffer_name,
     get_webhooks,
     pop_events_with_remaining_size,
     report_api_call,
+    report_api_call_in_thread,
     report_event_delivery_attempt,
     report_gql_operation,
     report_view,
@@ -22,7 +24,9 @@ __all__ = [
     "WebhookData",
     "get_buffer_name",
     "get_webhooks",
+    "get_api_call",
     "report_api_call",
+    "report_api_call_in_thread",
     "report_gql_operation",
     "report_event_delivery_attempt",
     "task_next_retry_date",
@@ -1,5 +1,6 @@
 import json
 from datetime import datetime, timezone
+from threading import Thread
 from unittest.mock import patch
 
 import pytest
@@ -12,11 +13,13 @@ from ..payload_schema import JsonTruncText
 from ..payloads import CustomJsonEncoder
 from ..utils import (
     ApiCall,
+    get_api_call,
     get_webhooks,
     get_webhooks_clear_mem_cache,
     pop_events_with_remaining_size,
     put_event,
     report_api_call,
+    report_api_call_in_thread,
     report_event_delivery_attempt,
     report_gql_operation,
     task_next_retry_date,
@@ -166,6 +169,24 @@ def test_report_gql_operation_scope(test_request):
         assert api_call.gql_operations == [operation_a, operation_b]
 
 
+def test_report_gql_operation_in_thread(test_request):
+    with report_api_call(test_request) as api_call:
+        parent_api_call = get_api_call()
+        operations = []
+
+        def execute_operation():
+            with report_api_call_in_thread(parent_api_call):
+                with report_gql_operation() as operation:
+                    operations.append(operation)
+
+        thread = Thread(target=execute_operation)
+        thread.start()
+        thread.join()
+
+        assert parent_api_call == api_call
+        assert api_call.gql_operations == operations
+
+
 @patch("saleor.webhook.observability.utils.put_event")
 def test_api_call_report(
     mock_put_event,
@@ -163,6 +163,25 @@ def report_api_call(request: "HttpRequest") -> Generator[ApiCall, None, None]:
         del _context.api_call
 
 
+def get_api_call() -> Optional[ApiCall]:
+    return getattr(_context, "api_call", None)
+
+
+@contextmanager
+def report_api_call_in_thread(
+    api_call: Optional[ApiCall],
+) -> Generator[None, None, None]:
+    """Report GraphQL operations executed in a worker thread within the API call."""
+    if api_call is None or hasattr(_context, "api_call"):
+        yield
+        return
+    _context.api_call = api_call
+    try:
+        yield
+    finally:
+        del _context.api_call
+
+
 @contextmanager
 def report_gql_operation() -> Generator[GraphQLOperationResponse, None, None]:
     root = False
@@ -0,0 +1,132 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import DefaultDict, Dict, List, Optional, Set, Tuple
+
+from django.core.cache import cache
+from pytimeparse import parse
+
+from ..app.models import App
+from ..core.utils.cache_version import CacheVersion
+from .event_types import WebhookEventAsyncType, WebhookEventSyncType
+from .models import Webhook, WebhookEvent
+
+WEBHOOK_ROUTING_VERSION_KEY = "webhook_routing_version"
+WEBHOOK_ROUTING_TABLE_KEY = "webhook_routing_table"
+# Safety net for changes made without emitting model signals, e.g. bulk updates.
+WEBHOOK_ROUTING_TABLE_TIMEOUT = parse("5 minutes")
+
+webhook_routing_version = CacheVersion(WEBHOOK_ROUTING_VERSION_KEY)
+
+
+@dataclass(frozen=True)
+class WebhookRoute:
+    webhook_id: int
+    app_id: int
+    app_identifier: Optional[str]
+
+
+RoutingTable = Dict[str, Tuple[WebhookRoute, ...]]
+
+_routing_table: Dict[str, Tuple[str, RoutingTable, float]] = {}
+_routing_table_lock = Lock()
+
+
+def invalidate_webhook_routing_table(**_kwargs):
+    """Mark the routing table as outdated in all processes."""
+    webhook_routing_version.invalidate()
+
+
+def clear_webhook_routing_table():
+    with _routing_table_lock:
+        _routing_table.clear()
+
+
+def _get_required_permission(event_type: str) -> Optional[str]:
+    permission = WebhookEventAsyncType.PERMISSIONS.get(
+        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
+    )
+    return permission.value if permission else None
+
+
+def build_webhook_routing_table() -> RoutingTable:
+    """Map each event type to the active webhooks that should receive it.
+
+    A webhook is routed for an event when both the webhook and its app are active,
+    the webhook subscribes to the event directly or through `ANY_EVENTS` (async
+    events only), and the app has the permission required by the event.
+    """
+    webhooks = {
+        webhook_id: WebhookRoute(webhook_id, app_id, app_identifier)
+        for webhook_id, app_id, app_identifier in Webhook.objects.filter(
+            is_active=True, app__is_active=True
+        ).values_list("id", "app_id", "app__identifier")
+    }
+    app_permissions: DefaultDict[int, Set[str]] = defaultdict(set)
+    for app_id, app_label, codename in App.permissions.through.objects.filter(
+        app__is_active=True
+    ).values_list(
+        "app_id", "permission__content_type__app_label", "permission__codename"
+    ):
+        app_permissions[app_id].add(f"{app_label}.{codename}")
+
+    routes: DefaultDict[str, Set[WebhookRoute]] = defaultdict(set)
+    for webhook_id, event_type in WebhookEvent.objects.filter(
+        webhook_id__in=webhooks.keys()
+    ).values_list("webhook_id", "event_type"):
+        route = webhooks[webhook_id]
+        if event_type == WebhookEventAsyncType.ANY:
+            event_types = WebhookEventAsyncType.ALL
+        else:
+            event_types = [event_type]
+        for routed_event_type in event_types:
+            permission = _get_required_permission(routed_event_type)
+            if permission and permission not in app_permissions[route.app_id]:
+                continue
+            routes[routed_event_type].add(route)
+
+    return {
+        event_type: tuple(sorted(event_routes, key=lambda r: r.webhook_id))
+        for event_type, event_routes in routes.items()
+    }
+
+
+def get_webhook_routing_table() -> RoutingTable:
+    """Return the routing table for the current version.
+
+    The table is kept in process memory and in the cache shared between processes,
+    so it's built from the database only once per change of webhooks, apps or app
+    permissions.
+    """
+    version = webhook_routing_version.get()
+    if cached := _routing_table.get(WEBHOOK_ROUTING_TABLE_KEY):
+        cached_version, table, check_time = cached
+        if (
+            cached_version == version
+            and monotonic() - check_time <= WEBHOOK_ROUTING_TABLE_TIMEOUT
+        ):
+            return table
+
+    cache_key = f"{WEBHOOK_ROUTING_TABLE_KEY}:{version}"
+    table = cache.get(cache_key)
+    if table is None:
+        table = build_webhook_routing_table()
+        cache.set(cache_key, table, timeout=WEBHOOK_ROUTING_TABLE_TIMEOUT)
+    with _routing_table_lock:
+        _routing_table[WEBHOOK_ROUTING_TABLE_KEY] = (version, table, monotonic())
+    return table
+
+
+def get_webhook_routes(
+    event_type: str,
+    apps_ids: Optional[List[int]] = None,
+    apps_identifier: Optional[List[str]] = None,
+) -> List[WebhookRoute]:
+    routes = get_webhook_routing_table().get(event_type, ())
+    return [
+        route
+        for route in routes
+        if (not apps_ids or route.app_id in apps_ids)
+        and (not apps_identifier or route.app_identifier in apps_identifier)
+    ]
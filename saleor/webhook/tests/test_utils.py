@@ -1,4 +1,5 @@
 from typing import Type
+from unittest.mock import patch
 
 import pytest
 
@@ -11,6 +12,7 @@ from ..observability.exceptions import (
     TruncationError,
 )
 from ..observability.payload_schema import ObservabilityEventTypes
+from ..routing import clear_webhook_routing_table
 from ..utils import get_webhooks_for_event
 
 
@@ -116,6 +118,113 @@ def test_get_webhook_for_event_not_returning_any_webhook_for_sync_event_types(
     assert set(webhooks) == {sync_webhook}
 
 
+def test_get_webhooks_for_event_without_subscribers_makes_no_queries(
+    async_app_factory, async_type, django_assert_num_queries
+):
+    async_app_factory()
+    get_webhooks_for_event(async_type)
+
+    with django_assert_num_queries(0):
+        webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_UPDATED)
+        assert not webhooks
+
+
+def test_get_webhooks_for_event_uses_cached_routing_table(
+    async_app_factory, async_type
+):
+    _, async_webhook = async_app_factory()
+    get_webhooks_for_event(async_type)
+
+    with patch(
+        "saleor.webhook.routing.build_webhook_routing_table"
+    ) as mocked_build_table:
+        webhooks = get_webhooks_for_event(async_type)
+
+    mocked_build_table.assert_not_called()
+    assert set(webhooks) == {async_webhook}
+
+
+def test_get_webhooks_for_event_uses_routing_table_from_cache(
+    async_app_factory, async_type
+):
+    _, async_webhook = async_app_factory()
+    get_webhooks_for_event(async_type)
+    clear_webhook_routing_table()
+
+    with patch(
+        "saleor.webhook.routing.build_webhook_routing_table"
+    ) as mocked_build_table:
+        webhooks = get_webhooks_for_event(async_type)
+
+    mocked_build_table.assert_not_called()
+    assert set(webhooks) == {async_webhook}
+
+
+def test_get_webhooks_for_event_after_webhook_created(async_app_factory, async_type):
+    _, async_webhook = async_app_factory()
+    assert set(get_webhooks_for_event(async_type)) == {async_webhook}
+
+    _, new_webhook = async_app_factory()
+
+    assert set(get_webhooks_for_event(async_type)) == {async_webhook, new_webhook}
+
+
+def test_get_webhooks_for_event_after_webhook_deactivated(
+    async_app_factory, async_type
+):
+    _, async_webhook = async_app_factory()
+    assert set(get_webhooks_for_event(async_type)) == {async_webhook}
+
+    async_webhook.is_active = False
+    async_webhook.save(update_fields=["is_active"])
+
+    assert not get_webhooks_for_event(async_type)
+
+
+def test_get_webhooks_for_event_after_app_deactivated(async_app_factory, async_type):
+    app, async_webhook = async_app_factory()
+    assert set(get_webhooks_for_event(async_type)) == {async_webhook}
+
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    assert not get_webhooks_for_event(async_type)
+
+
+def test_get_webhooks_for_event_after_event_removed(async_app_factory, async_type):
+    _, async_webhook = async_app_factory()
+    assert set(get_webhooks_for_event(async_type)) == {async_webhook}
+
+    async_webhook.events.all().delete()
+
+    assert not get_webhooks_for_event(async_type)
+
+
+def test_get_webhooks_for_event_after_permission_removed(
+    async_app_factory, async_type, permission_manage_orders
+):
+    app, async_webhook = async_app_factory()
+    assert set(get_webhooks_for_event(async_type)) == {async_webhook}
+
+    app.permissions.remove(permission_manage_orders)
+
+    assert not get_webhooks_for_event(async_type)
+
+
+def test_get_webhooks_for_event_filtered_by_apps(async_app_factory, async_type):
+    app_a, async_webhook_a = async_app_factory()
+    app_b, async_webhook_b = async_app_factory()
+    app_b.identifier = "saleor.app.b"
+    app_b.save(update_fields=["identifier"])
+
+    assert set(get_webhooks_for_event(async_type, apps_ids=[app_a.id])) == {
+        async_webhook_a
+    }
+    assert set(
+        get_webhooks_for_event(async_type, apps_identifier=[app_b.identifier])
+    ) == {async_webhook_b}
+
+
 @pytest.mark.parametrize(
     "error,event_type",
     [
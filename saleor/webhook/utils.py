@@ -1,11 +1,7 @@
 from typing import TYPE_CHECKING, Optional
 
-from django.db.models import Q
-from django.db.models.expressions import Exists, OuterRef
-
-from ..app.models import App
-from .event_types import WebhookEventAsyncType, WebhookEventSyncType
-from .models import Webhook, WebhookEvent
+from .models import Webhook
+from .routing import get_webhook_routes
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -17,34 +13,18 @@ def get_webhooks_for_event(
     apps_ids: Optional["list[int]"] = None,
     apps_identifier: Optional[list[str]] = None,
 ) -> "QuerySet[Webhook]":
-    """Get active webhooks from the database for an event."""
-    permissions = {}
-    required_permission = WebhookEventAsyncType.PERMISSIONS.get(
-        event_type, WebhookEventSyncType.PERMISSIONS.get(event_type)
-    )
-    if required_permission:
-        app_label, codename = required_permission.value.split(".")
-        permissions["permissions__content_type__app_label"] = app_label
-        permissions["permissions__codename"] = codename
+    """Get active webhooks from the database for an event.
 
+    Webhooks are resolved with the cached routing table, so no query is made when
+    there are no webhooks for the event.
+    """
     if webhooks is None:
         webhooks = Webhook.objects.all()
-    app_kwargs: dict = {"is_active": True, **permissions}
-    if apps_ids:
-        app_kwargs["id__in"] = apps_ids
-    if apps_identifier:
-        app_kwargs["identifier__in"] = apps_identifier
-
-    apps = App.objects.filter(**app_kwargs)
-    event_types = [event_type]
-    if event_type in WebhookEventAsyncType.ALL:
-        event_types.append(WebhookEventAsyncType.ANY)
-    webhook_events = WebhookEvent.objects.filter(event_type__in=event_types)
+    routes = get_webhook_routes(event_type, apps_ids, apps_identifier)
+    if not routes:
+        return webhooks.none()
     return (
-        webhooks.filter(
-            Q(is_active=True, app__in=apps)
-            & Q(Exists(webhook_events.filter(webhook_id=OuterRef("id"))))
-        )
+        webhooks.filter(id__in=[route.webhook_id for route in routes])
         .select_related("app")
         .prefetch_related("app__permissions__content_type")
     )